@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from fastapi.responses import Response, StreamingResponse
 
 from api.deps import get_tenant
+from api.shared import audio_frames
 from api.errors import NotFoundError
 from api import store
 from api.characters import service, memory
@@ -86,6 +87,15 @@ async def speak_stream(char_id: str, body: SpeakStreamRequest, tenant_id: str =
     )
 
 
+@router.post("/{char_id}/speak/stream/binary")
+async def speak_stream_binary(char_id: str, body: SpeakStreamRequest, tenant_id: str = Depends(get_tenant)):
+    return StreamingResponse(
+        service.generate_speech_frames(tenant_id, char_id, body),
+        media_type=audio_frames.FRAMES_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{char_id}/react", response_model=ReactionResponse)
 async def react(char_id: str, body: ReactRequest, tenant_id: str = Depends(get_tenant)):
     return await service.generate_reaction(tenant_id, char_id, body)
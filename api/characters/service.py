@@ -7,15 +7,16 @@ import uuid
 from pathlib import Path
 
 import re
-import base64
 
-from fal_services import llm_generate, llm_stream, tts_stream
+from fal_services import llm_generate, llm_stream
 from api.config import get_api_settings
 from api.errors import NotFoundError, ServiceError
 from api.prompts.character_gen import ACTING_PROMPT_SYSTEM, VALIDATOR_SYSTEM
 from api.prompts.dialogue import CHARACTER_WRAPPER, REACTION_SYSTEM
 from api.prompts.moderation import MODERATOR_SYSTEM
 from api import store
+from api.shared import audio_frames, llm_classify, taboo, tts_cache
+from api.shared.audio_frames import AudioChunk
 from api.characters.schema import (
     CreateCharacterRequest,
     BatchCreateRequest,
@@ -120,17 +121,19 @@ async def create_character(tenant_id: str, req: CreateCharacterRequest) -> dict:
 
 
 async def _validate(acting_prompt: str, settings) -> tuple[bool, str]:
-    result = await llm_generate(
+    result = await llm_classify.classify(
         prompt=f"Acting prompt:\n\n{acting_prompt}",
         system_prompt=VALIDATOR_SYSTEM,
+        labels=("PASS", "FAIL"),
+        reason_labels=("FAIL",),
+        site="validate",
         model=settings.VALIDATION_MODEL,
         temperature=settings.VALIDATION_TEMPERATURE,
         max_tokens=50,
     )
-    text = result.output.strip()
-    if text.startswith("PASS"):
+    if result.label == "PASS":
         return True, ""
-    reason = text.removeprefix("FAIL:").strip() if text.startswith("FAIL") else text
+    reason = await result.reason()
     return False, reason
 
 
@@ -217,7 +220,10 @@ async def generate_speech(tenant_id: str, character_id: str, req: SpeakRequest)
             taboo = world.get("taboo_words", [])
             rules = world.get("rules")
             if taboo or rules:
-                mod_result = await moderate(message, taboo, rules)
+                mod_result = await moderate(
+                    message, taboo, rules,
+                    taboo_only=world.get("moderation") == "taboo_only",
+                )
 
     await store.add_exchange(tenant_id, character_id, {"role": "kullanici", "content": req.message})
     await store.add_exchange(tenant_id, character_id, {"role": "karakter", "content": message, "name": char["name"]})
@@ -267,25 +273,36 @@ async def generate_reaction(tenant_id: str, character_id: str, req: ReactRequest
     }
 
 
-async def moderate(text: str, taboo_words: list[str], rules: dict | None) -> dict:
+async def moderate(text: str, taboo_words: list[str], rules: dict | None, taboo_only: bool = False) -> dict:
+    # Yerel taboo otomati: net ihlal LLM'siz. Temiz metin yine LLM'e gider —
+    # karakter disi davranis kelime listesiyle yakalanmaz. Sadece dunya acikca
+    # moderation="taboo_only" istediyse yerel PASS yeterli sayilir.
+    verdict = taboo.classify(text, taboo_words)
+    if verdict.decision == taboo.VIOLATION:
+        return {"passed": False, "reason": verdict.reason}
+    if verdict.decision == taboo.PASS and taboo_only:
+        return {"passed": True, "reason": None}
+
     settings = get_api_settings()
     taboo_str = ", ".join(taboo_words) if taboo_words else "yok"
     rules_str = json.dumps(rules, ensure_ascii=False) if rules else "yok"
 
     system = MODERATOR_SYSTEM.format(taboo_words=taboo_str, rules=rules_str)
 
-    result = await llm_generate(
+    result = await llm_classify.classify(
         prompt=f"Kontrol edilecek konusma:\n\n{text}",
         system_prompt=system,
+        labels=("PASS", "VIOLATION"),
+        reason_labels=("VIOLATION",),
+        site="moderation",
         model=settings.VALIDATION_MODEL,
         temperature=settings.MODERATION_TEMPERATURE,
         max_tokens=100,
     )
-    output = result.output.strip()
-    passed = output.startswith("PASS")
+    passed = result.label == "PASS"
     reason = None
     if not passed:
-        reason = output.removeprefix("VIOLATION:").strip() if output.startswith("VIOLATION") else output
+        reason = await result.reason()
 
     return {"passed": passed, "reason": reason}
 
@@ -296,8 +313,8 @@ def _split_sentences(text: str) -> list[str]:
     return [p.strip() for p in parts if p.strip()]
 
 
-async def generate_speech_stream(tenant_id: str, character_id: str, req):
-    """SSE formatinda LLM→TTS pipeline. asyncio.Queue ile LLM ve TTS paralel calisir."""
+async def _speech_events(tenant_id: str, character_id: str, req):
+    """LLM→TTS pipeline olaylari (tuple + AudioChunk). asyncio.Queue ile LLM ve TTS paralel calisir."""
     settings = get_api_settings()
 
     try:
@@ -309,7 +326,7 @@ async def generate_speech_stream(tenant_id: str, character_id: str, req):
             system_prompt_override=req.system_prompt_override,
         )
     except NotFoundError:
-        yield f"event: error\ndata: {json.dumps({'code': 'CHAR_NOT_FOUND', 'message': 'Karakter bulunamadi'})}\n\n"
+        yield ("error", {'code': 'CHAR_NOT_FOUND', 'message': 'Karakter bulunamadi'})
         return
 
     system_prompt = req.system_prompt_override or char["acting_prompt"]
@@ -338,14 +355,14 @@ async def generate_speech_stream(tenant_id: str, character_id: str, req):
             msg_type, data = await queue.get()
 
             if msg_type == "error":
-                yield f"event: error\ndata: {json.dumps({'code': 'LLM_ERROR', 'message': data})}\n\n"
+                yield ("error", {'code': 'LLM_ERROR', 'message': data})
                 return
 
             if msg_type == "done":
                 break
 
             token = data
-            yield f"event: text_token\ndata: {json.dumps({'token': token})}\n\n"
+            yield ("text_token", {'token': token})
             full_text += token
             sentence_buffer += token
 
@@ -355,9 +372,9 @@ async def generate_speech_stream(tenant_id: str, character_id: str, req):
                 sentence_buffer = sentence_buffer[len(completed):]
 
                 for sent in _split_sentences(completed):
-                    yield f"event: sentence_ready\ndata: {json.dumps({'sentence': sent})}\n\n"
-                    async for pcm_chunk in tts_stream(sent, speed=req.speed, voice=req.voice):
-                        yield f"event: audio_chunk\ndata: {json.dumps({'chunk_index': audio_chunk_index, 'audio_base64': base64.b64encode(pcm_chunk).decode('ascii'), 'format': 'pcm16', 'sample_rate': 16000, 'channels': 1})}\n\n"
+                    yield ("sentence_ready", {'sentence': sent})
+                    async for pcm_chunk in tts_cache.stream(sent, speed=req.speed, voice=req.voice):
+                        yield AudioChunk(pcm_chunk)
                         audio_chunk_index += 1
 
             elif len(sentence_buffer) > 40:
@@ -366,16 +383,16 @@ async def generate_speech_stream(tenant_id: str, character_id: str, req):
                     chunk_to_speak = sentence_buffer[:last_space].strip()
                     sentence_buffer = sentence_buffer[last_space:].strip()
 
-                    yield f"event: sentence_ready\ndata: {json.dumps({'sentence': chunk_to_speak})}\n\n"
-                    async for pcm_chunk in tts_stream(chunk_to_speak, speed=req.speed, voice=req.voice):
-                        yield f"event: audio_chunk\ndata: {json.dumps({'chunk_index': audio_chunk_index, 'audio_base64': base64.b64encode(pcm_chunk).decode('ascii'), 'format': 'pcm16', 'sample_rate': 16000, 'channels': 1})}\n\n"
+                    yield ("sentence_ready", {'sentence': chunk_to_speak})
+                    async for pcm_chunk in tts_cache.stream(chunk_to_speak, speed=req.speed, voice=req.voice):
+                        yield AudioChunk(pcm_chunk)
                         audio_chunk_index += 1
 
         remaining = sentence_buffer.strip()
         if remaining:
-            yield f"event: sentence_ready\ndata: {json.dumps({'sentence': remaining})}\n\n"
-            async for pcm_chunk in tts_stream(remaining, speed=req.speed, voice=req.voice):
-                yield f"event: audio_chunk\ndata: {json.dumps({'chunk_index': audio_chunk_index, 'audio_base64': base64.b64encode(pcm_chunk).decode('ascii'), 'format': 'pcm16', 'sample_rate': 16000, 'channels': 1})}\n\n"
+            yield ("sentence_ready", {'sentence': remaining})
+            async for pcm_chunk in tts_cache.stream(remaining, speed=req.speed, voice=req.voice):
+                yield AudioChunk(pcm_chunk)
                 audio_chunk_index += 1
 
         full_message = full_text.strip()
@@ -386,18 +403,33 @@ async def generate_speech_stream(tenant_id: str, character_id: str, req):
                 taboo = world.get("taboo_words", [])
                 rules = world.get("rules")
                 if taboo or rules:
-                    mod_result = await moderate(full_message, taboo, rules)
+                    mod_result = await moderate(
+                        full_message, taboo, rules,
+                        taboo_only=world.get("moderation") == "taboo_only",
+                    )
 
         if mod_result is not None:
-            yield f"event: moderation\ndata: {json.dumps(mod_result)}\n\n"
+            yield ("moderation", mod_result)
 
         await store.add_exchange(tenant_id, character_id, {"role": "kullanici", "content": req.message})
         await store.add_exchange(tenant_id, character_id, {"role": "karakter", "content": full_message, "name": char["name"]})
 
-        yield f"event: done\ndata: {json.dumps({'character_id': character_id, 'character_name': char['name'], 'message': full_message, 'mood': req.mood, 'moderation': mod_result, 'total_audio_chunks': audio_chunk_index})}\n\n"
+        yield ("done", {'character_id': character_id, 'character_name': char['name'], 'message': full_message, 'mood': req.mood, 'moderation': mod_result, 'total_audio_chunks': audio_chunk_index})
 
     except Exception as e:
-        yield f"event: error\ndata: {json.dumps({'code': 'STREAM_ERROR', 'message': str(e)})}\n\n"
+        yield ("error", {'code': 'STREAM_ERROR', 'message': str(e)})
     finally:
         if not llm_task.done():
             llm_task.cancel()
+
+
+async def generate_speech_stream(tenant_id: str, character_id: str, req):
+    """SSE formatinda LLM→TTS pipeline (audio_chunk: base64 PCM16)."""
+    async for chunk in audio_frames.to_sse(_speech_events(tenant_id, character_id, req)):
+        yield chunk
+
+
+async def generate_speech_frames(tenant_id: str, character_id: str, req):
+    """Binary frame formatinda LLM→TTS pipeline (ham PCM16, bkz. audio_frames)."""
+    async for frame in audio_frames.to_frames(_speech_events(tenant_id, character_id, req)):
+        yield frame
@@ -31,6 +31,9 @@ class APISettings(BaseSettings):
     # Orchestrator
     ORCHESTRATOR_MODEL: str = "gemini-2.5-flash"
     ORCHESTRATOR_TEMPERATURE: float = 0.3
+    ORCHESTRATOR_MODE: str = "llm"  # "local" | "llm" | "hybrid" — yeni modlar opt-in
+    ORCHESTRATOR_MODES: dict[str, str] = {}  # tenant_id → mode (varsayilani ezer)
+    ORCHESTRATOR_TIE_MARGIN: float = 0.5  # hybrid: ilk iki skor bu kadar yakinsa LLM
 
     # Temperature config
     GENERATION_TEMPERATURE: float = 1.0
@@ -38,6 +41,12 @@ class APISettings(BaseSettings):
     VALIDATION_TEMPERATURE: float = 0.0
     MODERATION_TEMPERATURE: float = 0.1
 
+    # TTS cache (normalize metin + ses + hiz + format → ses)
+    TTS_CACHE_MEMORY_MB: int = 64
+    TTS_CACHE_DIR: str = ".cache/tts"  # bos → sadece bellek katmani
+    TTS_CACHE_DISK_MB: int = 512
+    TTS_CACHE_URL_TTL_HOURS: float = 24.0  # sync kayitlari fal CDN URL'i tasir
+
     # Job TTL
     JOB_TTL_HOURS: int = 24
 
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from fastapi.responses import Response, StreamingResponse
 
 from api.deps import get_tenant
+from api.shared import audio_frames
 from api.errors import NotFoundError
 from api import store
 from api.conversations import service
@@ -56,6 +57,15 @@ async def advance_turn_stream(conv_id: str, body: TurnRequest, tenant_id: str =
     )
 
 
+@router.post("/{conv_id}/turn/stream/binary")
+async def advance_turn_stream_binary(conv_id: str, body: TurnRequest, tenant_id: str = Depends(get_tenant)):
+    return StreamingResponse(
+        service.advance_turn_frames(tenant_id, conv_id, body),
+        media_type=audio_frames.FRAMES_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{conv_id}/inject", response_model=ConversationMessage)
 async def inject_message(conv_id: str, body: InjectRequest, tenant_id: str = Depends(get_tenant)):
     return await service.inject_message(tenant_id, conv_id, body)
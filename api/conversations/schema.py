@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -6,6 +8,9 @@ class CreateConversationRequest(BaseModel):
     world_id: str | None = Field(None, description="Dunya ID")
     topic: str | None = Field(None, description="Konusma konusu")
     max_turns: int = Field(20, ge=2, le=100, description="Maksimum tur sayisi")
+    orchestrator_mode: Literal["local", "llm", "hybrid"] | None = Field(
+        None, description="Konusmaci secimi. None ise tenant / sunucu varsayilani"
+    )
 
 
 class TurnRequest(BaseModel):
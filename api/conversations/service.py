@@ -3,16 +3,17 @@ from __future__ import annotations
 import asyncio
 import json
 import uuid
-import base64
 import re
 
-from fal_services import llm_generate, llm_stream, tts_stream
+from fal_services import llm_generate, llm_stream
 from api.config import get_api_settings
 from api.errors import NotFoundError, ValidationError
 from api.prompts.orchestrator import ORCHESTRATOR_SYSTEM
 from api import store
 from api.characters import service as char_service
 from api.characters.schema import ReactRequest, SpeakRequest
+from api.shared import audio_frames, taboo, tts_cache
+from api.shared.audio_frames import AudioChunk
 
 
 # ── Helpers ───────────────────────────────────────────
@@ -50,6 +51,7 @@ async def create_conversation(tenant_id: str, req) -> dict:
         "topic": req.topic,
         "world_id": req.world_id,
         "max_turns": req.max_turns,
+        "orchestrator_mode": req.orchestrator_mode,
         "status": "active",
         "turns": [],
     }
@@ -80,7 +82,81 @@ async def _collect_reactions(
 
 # ── 3. Orchestrator Pick ──────────────────────────────
 
-async def _orchestrator_pick(
+_REASON_CUES = ("suc", "yalan", "savun", "cevap", "itham", "suphe", "soru", "neden", "kanit", "?")
+
+ORCHESTRATOR_WEIGHTS = {
+    "wants": 3.0,        # tepkisinde konusmak istedi
+    "mentioned": 2.0,    # son konusmada adi gecti (suclama / soru)
+    "reason_cue": 1.0,   # tepki savunma / suclama / soru
+    "per_idle_turn": 0.5,  # son konustugundan beri gecen tur (max 4)
+    "turn_share": 0.5,   # ortalamanin altinda konustuysa tur basina
+    "just_spoke": -3.0,  # son konusan kendisi
+    "repeat": -2.0,      # son 3 konusmanin 2'si onun
+}
+
+
+def _score_candidates(
+    characters: list[dict], reactions: list[dict], history: list[dict]
+) -> list[tuple[float, str]]:
+    """Yerel orkestrator skoru — LLM'siz. (skor, character_id) yuksekten dusuge."""
+    w = ORCHESTRATOR_WEIGHTS
+    spoken = [t["character_id"] for t in history if t.get("role") == "karakter" and t.get("character_id")]
+    recent = spoken[-3:]
+    counts = {c["id"]: 0 for c in characters}
+    for cid in spoken:
+        if cid in counts:
+            counts[cid] += 1
+    mean_count = sum(counts.values()) / len(counts)
+    last_text = taboo.normalize(history[-1].get("content", "")) if history else ""
+    by_id = {r["character_id"]: r for r in reactions}
+
+    scored = []
+    for i, c in enumerate(characters):
+        cid = c["id"]
+        r = by_id.get(cid)
+        score = 0.0
+        if r and r["wants_to_speak"]:
+            score += w["wants"]
+            if any(cue in taboo.normalize(r.get("reaction", "")) for cue in _REASON_CUES):
+                score += w["reason_cue"]
+        if last_text and taboo.normalize(c["name"]) in last_text and recent[-1:] != [cid]:
+            score += w["mentioned"]
+        if recent[-1:] == [cid]:
+            score += w["just_spoke"]
+        if recent.count(cid) >= 2:
+            score += w["repeat"]
+        idle = next((n for n, s in enumerate(reversed(spoken)) if s == cid), len(spoken))
+        score += w["per_idle_turn"] * min(idle, 4)
+        score += w["turn_share"] * (mean_count - counts[cid])
+        scored.append((score, i, cid))
+    scored.sort(key=lambda s: (-s[0], s[1]))
+    return [(score, cid) for score, _, cid in scored]
+
+
+async def _orchestrator_pick_local(
+    characters: list[dict], reactions: list[dict], history: list[dict], settings
+) -> tuple[str, str]:
+    """Yerel skorla siradaki konusmaciyi sec (LLM cagrisi yok)."""
+    score, speaker_id = _score_candidates(characters, reactions, history)[0]
+    return speaker_id, f"Yerel skor ({score:.1f})"
+
+
+async def _orchestrator_pick_hybrid(
+    characters: list[dict], reactions: list[dict], history: list[dict], settings
+) -> tuple[str, str]:
+    """Yerel skor; sadece ilk siralar berabereyse LLM berabere kalanlar arasindan secer."""
+    ranked = _score_candidates(characters, reactions, history)
+    top_score, top_id = ranked[0]
+    tied_ids = {cid for score, cid in ranked if top_score - score < settings.ORCHESTRATOR_TIE_MARGIN}
+    if len(tied_ids) < 2:
+        return top_id, f"Yerel skor ({top_score:.1f})"
+
+    tied_chars = [c for c in characters if c["id"] in tied_ids]
+    tied_reactions = [r for r in reactions if r["character_id"] in tied_ids]
+    return await _orchestrator_pick_llm(tied_chars, tied_reactions, history, settings)
+
+
+async def _orchestrator_pick_llm(
     characters: list[dict], reactions: list[dict], history: list[dict], settings
 ) -> tuple[str, str]:
     """Meta-LLM ile siradaki konusmaciyi sec. (character_id, reason) doner."""
@@ -143,6 +219,26 @@ async def _orchestrator_pick(
     return characters[0]["id"], "Fallback — varsayilan karakter secildi"
 
 
+_ORCHESTRATORS = {
+    "local": _orchestrator_pick_local,
+    "llm": _orchestrator_pick_llm,
+    "hybrid": _orchestrator_pick_hybrid,
+}
+
+
+async def _orchestrator_pick(
+    tenant_id: str, conv: dict, characters: list[dict], reactions: list[dict], history: list[dict], settings
+) -> tuple[str, str]:
+    """Siradaki konusmaciyi sec. Mod: konusma → tenant → sunucu varsayilani."""
+    mode = (
+        conv.get("orchestrator_mode")
+        or settings.ORCHESTRATOR_MODES.get(tenant_id)
+        or settings.ORCHESTRATOR_MODE
+    )
+    strategy = _ORCHESTRATORS.get(mode, _orchestrator_pick_llm)
+    return await strategy(characters, reactions, history, settings)
+
+
 # ── 4. Advance Turn (sync) ───────────────────────────
 
 async def advance_turn(tenant_id: str, conv_id: str, req) -> dict:
@@ -185,7 +281,7 @@ async def advance_turn(tenant_id: str, conv_id: str, req) -> dict:
     reactions = await _collect_reactions(tenant_id, conv["character_ids"], last_message, exclude_id=last_speaker_id)
 
     # Orkestrator: siradaki konusmaciyi sec
-    speaker_id, reason = await _orchestrator_pick(characters, reactions, turns, settings)
+    speaker_id, reason = await _orchestrator_pick(tenant_id, conv, characters, reactions, turns, settings)
 
     # Secilen karakter konussun
     context_messages = _turns_to_context(turns[-20:])  # Son 20 turn
@@ -212,24 +308,24 @@ async def advance_turn(tenant_id: str, conv_id: str, req) -> dict:
     }
 
 
-# ── 5. Advance Turn Stream (SSE) ─────────────────────
+# ── 5. Advance Turn Stream (SSE / binary) ────────────
 
-async def advance_turn_stream(tenant_id: str, conv_id: str, req):
-    """SSE: reactions → speaker → text_token → sentence_ready → audio_chunk → done."""
+async def _turn_events(tenant_id: str, conv_id: str, req):
+    """Olaylar: reactions → speaker → text_token → sentence_ready → audio_chunk → done."""
     settings = get_api_settings()
 
     conv = await store.get_conversation(tenant_id, conv_id)
     if not conv:
-        yield f"event: error\ndata: {json.dumps({'code': 'CONV_NOT_FOUND', 'message': 'Konusma bulunamadi'})}\n\n"
+        yield ("error", {'code': 'CONV_NOT_FOUND', 'message': 'Konusma bulunamadi'})
         return
     if conv["status"] != "active":
-        yield f"event: error\ndata: {json.dumps({'code': 'CONV_ENDED', 'message': 'Konusma sona ermis'})}\n\n"
+        yield ("error", {'code': 'CONV_ENDED', 'message': 'Konusma sona ermis'})
         return
 
     turns = conv.get("turns", [])
     if len(turns) >= conv.get("max_turns", 20):
         await store.update_conversation(tenant_id, conv_id, {"status": "ended"})
-        yield f"event: error\ndata: {json.dumps({'code': 'MAX_TURNS', 'message': 'Maksimum tur sayisina ulasildi'})}\n\n"
+        yield ("error", {'code': 'MAX_TURNS', 'message': 'Maksimum tur sayisina ulasildi'})
         return
 
     try:
@@ -258,13 +354,13 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
         reactions = await _collect_reactions(tenant_id, conv["character_ids"], last_message, exclude_id=last_speaker_id)
 
         # Reactions event
-        yield f"event: reactions\ndata: {json.dumps({'reactions': reactions})}\n\n"
+        yield ("reactions", {'reactions': reactions})
 
         # Orkestrator
-        speaker_id, reason = await _orchestrator_pick(characters, reactions, turns, settings)
+        speaker_id, reason = await _orchestrator_pick(tenant_id, conv, characters, reactions, turns, settings)
         speaker_char = next((c for c in characters if c["id"] == speaker_id), characters[0])
 
-        yield f"event: speaker\ndata: {json.dumps({'character_id': speaker_id, 'character_name': speaker_char['name'], 'reason': reason})}\n\n"
+        yield ("speaker", {'character_id': speaker_id, 'character_name': speaker_char['name'], 'reason': reason})
 
         # LLM → TTS streaming pipeline (asyncio.Queue pattern)
         context_messages = _turns_to_context(turns[-20:])
@@ -302,7 +398,7 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
             while True:
                 msg_type, data = await queue.get()
                 if msg_type == "error":
-                    yield f"event: error\ndata: {json.dumps({'code': 'LLM_ERROR', 'message': data})}\n\n"
+                    yield ("error", {'code': 'LLM_ERROR', 'message': data})
                     return
                 if msg_type == "done":
                     break
@@ -310,7 +406,7 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
                 token = data
                 full_text += token
                 sentence_buffer += token
-                yield f"event: text_token\ndata: {json.dumps({'token': token})}\n\n"
+                yield ("text_token", {'token': token})
 
                 # Clause split
                 sentences = _split_clauses(sentence_buffer)
@@ -319,17 +415,9 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
                     sentence_buffer = sentences[-1]
                     for sent in ready:
                         sent_count += 1
-                        yield f"event: sentence_ready\ndata: {json.dumps({'sentence': sent, 'index': sent_count - 1})}\n\n"
-                        async for pcm_chunk in tts_stream(text=sent, speed=req.speed, voice=req.voice):
-                            chunk_payload = json.dumps({
-                                "chunk_index": audio_chunk_index,
-                                "audio_base64": base64.b64encode(pcm_chunk).decode("ascii"),
-                                "format": "pcm16",
-                                "sample_rate": 16000,
-                                "channels": 1,
-                                "sentence_index": sent_count - 1,
-                            })
-                            yield f"event: audio_chunk\ndata: {chunk_payload}\n\n"
+                        yield ("sentence_ready", {'sentence': sent, 'index': sent_count - 1})
+                        async for pcm_chunk in tts_cache.stream(text=sent, speed=req.speed, voice=req.voice):
+                            yield AudioChunk(pcm_chunk, {"sentence_index": sent_count - 1})
                             audio_chunk_index += 1
 
                 # 40 char limit
@@ -339,17 +427,9 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
                         chunk_to_speak = sentence_buffer[:last_space].strip()
                         sentence_buffer = sentence_buffer[last_space:].strip()
                         sent_count += 1
-                        yield f"event: sentence_ready\ndata: {json.dumps({'sentence': chunk_to_speak, 'index': sent_count - 1})}\n\n"
-                        async for pcm_chunk in tts_stream(text=chunk_to_speak, speed=req.speed, voice=req.voice):
-                            chunk_payload = json.dumps({
-                                "chunk_index": audio_chunk_index,
-                                "audio_base64": base64.b64encode(pcm_chunk).decode("ascii"),
-                                "format": "pcm16",
-                                "sample_rate": 16000,
-                                "channels": 1,
-                                "sentence_index": sent_count - 1,
-                            })
-                            yield f"event: audio_chunk\ndata: {chunk_payload}\n\n"
+                        yield ("sentence_ready", {'sentence': chunk_to_speak, 'index': sent_count - 1})
+                        async for pcm_chunk in tts_cache.stream(text=chunk_to_speak, speed=req.speed, voice=req.voice):
+                            yield AudioChunk(pcm_chunk, {"sentence_index": sent_count - 1})
                             audio_chunk_index += 1
         finally:
             if not llm_task.done():
@@ -358,17 +438,9 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
         # Kalan buffer
         if sentence_buffer.strip():
             sent_count += 1
-            yield f"event: sentence_ready\ndata: {json.dumps({'sentence': sentence_buffer.strip(), 'index': sent_count - 1})}\n\n"
-            async for pcm_chunk in tts_stream(text=sentence_buffer.strip(), speed=req.speed, voice=req.voice):
-                chunk_payload = json.dumps({
-                    "chunk_index": audio_chunk_index,
-                    "audio_base64": base64.b64encode(pcm_chunk).decode("ascii"),
-                    "format": "pcm16",
-                    "sample_rate": 16000,
-                    "channels": 1,
-                    "sentence_index": sent_count - 1,
-                })
-                yield f"event: audio_chunk\ndata: {chunk_payload}\n\n"
+            yield ("sentence_ready", {'sentence': sentence_buffer.strip(), 'index': sent_count - 1})
+            async for pcm_chunk in tts_cache.stream(text=sentence_buffer.strip(), speed=req.speed, voice=req.voice):
+                yield AudioChunk(pcm_chunk, {"sentence_index": sent_count - 1})
                 audio_chunk_index += 1
 
         # Turn kaydet (sadece store'a)
@@ -382,7 +454,7 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
 
         turn_number = len([t for t in conv.get("turns", []) if t.get("role") == "karakter"])
 
-        done_payload = json.dumps({
+        yield ("done", {
             "conversation_id": conv_id,
             "turn_number": turn_number,
             "speaker": speaker_turn,
@@ -391,10 +463,21 @@ async def advance_turn_stream(tenant_id: str, conv_id: str, req):
             "total_audio_chunks": audio_chunk_index,
             "total_sentences": sent_count,
         })
-        yield f"event: done\ndata: {done_payload}\n\n"
 
     except Exception as e:
-        yield f"event: error\ndata: {json.dumps({'code': 'TURN_STREAM_ERROR', 'message': str(e)})}\n\n"
+        yield ("error", {'code': 'TURN_STREAM_ERROR', 'message': str(e)})
+
+
+async def advance_turn_stream(tenant_id: str, conv_id: str, req):
+    """SSE: reactions → speaker → text_token → sentence_ready → audio_chunk (base64) → done."""
+    async for chunk in audio_frames.to_sse(_turn_events(tenant_id, conv_id, req)):
+        yield chunk
+
+
+async def advance_turn_frames(tenant_id: str, conv_id: str, req):
+    """Ayni olaylar binary frame'lerle — ses ham PCM16 (bkz. audio_frames)."""
+    async for frame in audio_frames.to_frames(_turn_events(tenant_id, conv_id, req)):
+        yield frame
 
 
 # ── 6. Inject Message ────────────────────────────────
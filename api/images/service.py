@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import fal_client
-
+from fal_services import fal_run
 from api.errors import ServiceError
 from api.images.schema import AvatarRequest, BackgroundRequest
 
@@ -82,8 +81,7 @@ async def _generate_image(
         args["negative_prompt"] = negative_prompt
 
     try:
-        handler = await fal_client.submit_async(endpoint, arguments=args)
-        result = await handler.get()
+        result = await fal_run(endpoint, arguments=args, timeout=180.0)
         return {
             "image_url": result["images"][0]["url"],
             "seed_used": result.get("seed", 0),
@@ -7,6 +7,7 @@ class LLMGenerateRequest(BaseModel):
     model: str = Field("gemini-2.5-flash", description="Model adi")
     temperature: float = Field(0.8, ge=0.0, le=2.0)
     max_tokens: int | None = Field(None, description="Maksimum output token sayisi")
+    stop: list[str] | None = Field(None, description="Stop sequence'lar (uretim bu metinde durur)")
     reasoning: bool | None = Field(None, description="Extended thinking aktif mi")
 
 
@@ -20,3 +21,4 @@ class LLMStreamRequest(BaseModel):
     model: str = Field("gemini-2.5-flash", description="Model adi")
     temperature: float = Field(0.8, ge=0.0, le=2.0)
     max_tokens: int | None = Field(None, description="Maksimum output token sayisi")
+    stop: list[str] | None = Field(None, description="Stop sequence'lar (uretim bu metinde durur)")
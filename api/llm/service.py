@@ -35,6 +35,7 @@ async def stream_sse(req: LLMStreamRequest):
             model=_strip_model_prefix(req.model),
             temperature=req.temperature,
             max_tokens=req.max_tokens,
+            stop=req.stop,
         ):
             full_text += token
             yield f"event: text_token\ndata: {json.dumps({'token': token})}\n\n"
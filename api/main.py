@@ -19,7 +19,6 @@ async def lifespan(app: FastAPI):
 
     import os
     if settings.FAL_KEY:
-        import fal_client
         os.environ["FAL_KEY"] = settings.FAL_KEY
         print("FAL_KEY configured")
 
@@ -27,8 +26,12 @@ async def lifespan(app: FastAPI):
         os.environ["GEMINI_API_KEY"] = settings.GEMINI_API_KEY
         print("GEMINI_API_KEY configured")
 
+    import fal_services
+    await fal_services.warmup()
+
     yield
 
+    await fal_services.aclose()
     cleaned = job_manager.cleanup_old(settings.JOB_TTL_HOURS)
     print(f"Shutdown — cleaned {cleaned} expired jobs")
 
@@ -85,6 +88,21 @@ def create_app() -> FastAPI:
     def health():
         return {"status": "ok", "app": settings.APP_NAME, "version": settings.VERSION}
 
+    @app.get("/health/providers", tags=["system"])
+    def provider_health():
+        import fal_services
+        return {"providers": fal_services.provider_stats()}
+
+    @app.get("/health/classifiers", tags=["system"])
+    def classifier_health():
+        from api.shared import llm_classify
+        return {"classifiers": llm_classify.metrics()}
+
+    @app.get("/health/tts-cache", tags=["system"])
+    def tts_cache_health():
+        from api.shared import tts_cache
+        return {"tts_cache": tts_cache.metrics()}
+
     @app.get("/", tags=["system"])
     def root():
         return {
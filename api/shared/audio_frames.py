@@ -0,0 +1,130 @@
+"""
+audio_frames.py — Binary Audio Stream Framing
+=============================================
+SSE stream'lerde her PCM16 chunk base64 → JSON → "data: ..." olarak
+gidiyordu: ~%33 byte sisme + iki tarafta encode / decode CPU'su. Binary
+varyantlar ayni olay akisini ham byte ile tasir:
+
+  - TTS (/v1/voice/tts/stream/pcm): sadece ses var — chunked `audio/L16`
+    govdesi, framing yok (PCM_MEDIA_TYPE).
+  - speak / turn (/stream/binary): ses + olaylar (text_token, sentence_ready,
+    done, ...) karisik — uzunluk onekli frame'ler (FRAMES_MEDIA_TYPE):
+
+        [kind: u8][length: u32 big-endian][payload]
+        EVENT (1): UTF-8 JSON {"event": ..., "data": ...}
+        AUDIO (2): ham PCM16 (16kHz, mono, little-endian)
+
+    Ses frame'leri kendinden onceki sentence_ready'ye aittir, chunk sirasi
+    frame sirasidir — SSE'deki chunk_index / sentence_index gerekmez.
+
+Servis tarafinda olay uretici tek: ("event", data) tuple'lari ve
+AudioChunk'lar yield eder; to_sse() eski SSE formatini birebir korur,
+to_frames() binary'yi uretir.
+
+Kullanim:
+    from api.shared import audio_frames
+
+    StreamingResponse(audio_frames.to_frames(events), media_type=audio_frames.FRAMES_MEDIA_TYPE)
+
+    reader = audio_frames.FrameReader()
+    for kind, payload in reader.feed(chunk): ...
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import struct
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, AsyncIterator, Union
+
+SAMPLE_RATE = 16000
+PCM_META = {"format": "pcm16", "sample_rate": SAMPLE_RATE, "channels": 1}
+PCM_MEDIA_TYPE = f"audio/L16; rate={SAMPLE_RATE}; channels=1"
+FRAMES_MEDIA_TYPE = "application/x-audio-frames"
+
+EVENT = 1
+AUDIO = 2
+_HEADER = struct.Struct(">BI")
+HEADER_BYTES = _HEADER.size
+
+
+@dataclass
+class AudioChunk:
+    pcm: bytes
+    meta: dict = field(default_factory=dict)  # SSE'de chunk_index'in yaninda gider (sentence_index, ...)
+
+
+StreamEvent = Union[tuple[str, dict], AudioChunk]
+
+
+# ── Encode ──────────────────────────────────────────
+def sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def frame(kind: int, payload: bytes) -> bytes:
+    return _HEADER.pack(kind, len(payload)) + payload
+
+
+def event_frame(event: str, data: dict) -> bytes:
+    return frame(EVENT, json.dumps({"event": event, "data": data}).encode("utf-8"))
+
+
+def audio_frame(pcm: bytes) -> bytes:
+    return frame(AUDIO, pcm)
+
+
+async def to_sse(events: AsyncIterator[StreamEvent]) -> AsyncGenerator[str, None]:
+    """Olay akisini SSE'ye cevir (audio_chunk: chunk_index + base64 + PCM_META + meta)."""
+    chunk_index = 0
+    try:
+        async for ev in events:
+            if isinstance(ev, AudioChunk):
+                yield sse("audio_chunk", {
+                    "chunk_index": chunk_index,
+                    "audio_base64": base64.b64encode(ev.pcm).decode("ascii"),
+                    **PCM_META,
+                    **ev.meta,
+                })
+                chunk_index += 1
+            else:
+                yield sse(*ev)
+    finally:
+        await events.aclose()
+
+
+async def to_frames(events: AsyncIterator[StreamEvent]) -> AsyncGenerator[bytes, None]:
+    """Olay akisini binary frame'lere cevir."""
+    try:
+        async for ev in events:
+            yield audio_frame(ev.pcm) if isinstance(ev, AudioChunk) else event_frame(*ev)
+    finally:
+        await events.aclose()
+
+
+# ── Decode ──────────────────────────────────────────
+class FrameReader:
+    """Chunked govdeden gelen byte'lari frame'lere ayir (chunk sinirlari frame sinirina denk gelmez)."""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> list[tuple[int, bytes]]:
+        self._buf += data
+        frames: list[tuple[int, bytes]] = []
+        pos = 0
+        while len(self._buf) - pos >= HEADER_BYTES:
+            kind, length = _HEADER.unpack_from(self._buf, pos)
+            end = pos + HEADER_BYTES + length
+            if len(self._buf) < end:
+                break
+            frames.append((kind, bytes(self._buf[pos + HEADER_BYTES:end])))
+            pos = end
+        del self._buf[:pos]
+        return frames
+
+    @property
+    def pending(self) -> int:
+        """Yarim kalan frame byte'i — stream bittiginde 0 olmali."""
+        return len(self._buf)
@@ -0,0 +1,305 @@
+"""
+tts_cache.py — Content-Addressed TTS Cache (memory LRU + disk)
+==============================================================
+Ayni cumleler tekrar tekrar sentezleniyordu: rituel cumleleri, diegetik
+moderasyon uyarilari, "[X sessiz kaldi]" fallback'leri, benchmark / test
+metinleri. Cache anahtari: sha256(format | ses | hiz | normalize edilmis metin).
+
+  - Bellek katmani: byte ile sinirli LRU (TTS_CACHE_MEMORY_MB)
+  - Disk katmani: TTS_CACHE_DIR altinda <anahtar[:2]>/<anahtar>.bin, toplam
+    boyut TTS_CACHE_DISK_MB'yi asinca en eski erisilen dosyalar silinir.
+    Diskten gelen kayit bellege terfi eder.
+  - pcm16 (stream): ham PCM saklanir, hit'te CHUNK_BYTES'lik parcalar halinde
+    aninda replay edilir. Stream yarida kalirsa (istemci koptu, hata) cache'e
+    yazilmaz.
+  - mp3 / wav (sync): fal CDN URL'i + sure saklanir (URL suresiz degil →
+    TTS_CACHE_URL_TTL_HOURS). Ayni anahtar icin eszamanli istekler tek
+    sentez bekler.
+
+Normalizasyon Turkce'ye dikkat eder: buyuk/kucuk harf katlanmaz (I/ı/İ/i
+farkli okunur, str.lower() Turkce'de yanlis), NFC ile birlesik noktali
+harfler tek karaktere iner, tipografik tirnak / uc nokta / tire tek bicime
+cekilir, bosluklar ve noktalama oncesi bosluk temizlenir. Sentezlenen metin
+de normalize edilmis metindir — anahtar tam olarak okunan icerigi temsil eder.
+
+Kullanim:
+    from api.shared import tts_cache
+
+    result = await tts_cache.generate(text, voice="alloy", speed=1.0)
+    async for pcm in tts_cache.stream(text, speed=1.0, voice="alloy"): ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncGenerator
+
+from fal_services import tts_generate, tts_stream
+from api.config import get_api_settings
+
+PCM_FORMAT = "pcm16"
+PCM_BYTES_PER_SEC = 32000  # 16kHz mono PCM16
+CHUNK_BYTES = 16000        # cache'ten replay: 0.5 sn'lik parcalar
+
+_CHAR_FOLD = (
+    ("’", "'"), ("‘", "'"), ("`", "'"), ("“", '"'), ("”", '"'), ("«", '"'), ("»", '"'),
+    ("–", "—"), ("...", "…"), ("*", ""),
+)
+_SPACE_BEFORE_PUNCT = re.compile(r"\s+([.,!?;:…])")
+
+
+def normalize(text: str) -> str:
+    """Cache anahtari + sentez icin metin (harf katlama yok, bkz. modul notu)."""
+    text = unicodedata.normalize("NFC", text)
+    for src, dst in _CHAR_FOLD:
+        text = text.replace(src, dst)
+    text = " ".join(text.split())
+    return _SPACE_BEFORE_PUNCT.sub(r"\1", text)
+
+
+def cache_key(text: str, voice: str, speed: float, fmt: str) -> str:
+    raw = f"{fmt}|{voice}|{round(speed, 2)}|{normalize(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ── Tiers ───────────────────────────────────────────
+class _MemoryTier:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        data = self._items.get(key)
+        if data is not None:
+            self._items.move_to_end(key)
+        return data
+
+    def put(self, key: str, data: bytes) -> int:
+        """Kaydi ekle, tasarsa en eskileri at. Donen: atilan kayit sayisi."""
+        if len(data) > self.max_bytes:
+            return 0
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old)
+        self._items[key] = data
+        self.bytes += len(data)
+        evicted = 0
+        while self.bytes > self.max_bytes:
+            _, dropped = self._items.popitem(last=False)
+            self.bytes -= len(dropped)
+            evicted += 1
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _DiskTier:
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._lock = threading.Lock()
+        # anahtar → boyut, en eski erisilen basta (acilista mtime sirasi)
+        self._index: OrderedDict[str, int] = OrderedDict()
+        if root.is_dir():
+            files = sorted(root.glob("*/*.bin"), key=lambda p: p.stat().st_mtime)
+            for path in files:
+                size = path.stat().st_size
+                self._index[path.stem] = size
+                self.bytes += size
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.bin"
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except OSError:
+            with self._lock:
+                self.bytes -= self._index.pop(key, 0)
+            return None
+
+    def put(self, key: str, data: bytes) -> int:
+        if len(data) > self.max_bytes:
+            return 0
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        evicted: list[str] = []
+        with self._lock:
+            self.bytes += len(data) - self._index.pop(key, 0)
+            self._index[key] = len(data)
+            while self.bytes > self.max_bytes:
+                old, size = self._index.popitem(last=False)
+                self.bytes -= size
+                evicted.append(old)
+        for old in evicted:
+            self._path(old).unlink(missing_ok=True)
+        return len(evicted)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class TTSCache:
+    """Bellek LRU + disk katmani; iki katman da byte ile sinirli."""
+
+    def __init__(self, memory_bytes: int, disk_dir: str | Path | None, disk_bytes: int):
+        self.memory = _MemoryTier(memory_bytes)
+        self.disk = _DiskTier(Path(disk_dir), disk_bytes) if disk_dir and disk_bytes > 0 else None
+        self.stats = {
+            "memory_hits": 0, "disk_hits": 0, "misses": 0, "expired": 0, "coalesced": 0,
+            "stores": 0, "evictions": 0, "bytes_saved": 0, "audio_sec_saved": 0.0,
+            "est_ms_saved": 0.0,
+        }
+
+    async def get(self, key: str) -> bytes | None:
+        data = self.memory.get(key)
+        if data is not None:
+            self.stats["memory_hits"] += 1
+            return data
+        if self.disk is not None:
+            data = await asyncio.to_thread(self.disk.get, key)
+            if data is not None:
+                self.stats["disk_hits"] += 1
+                self.stats["evictions"] += self.memory.put(key, data)
+                return data
+        self.stats["misses"] += 1
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        if not data:
+            return
+        self.stats["stores"] += 1
+        self.stats["evictions"] += self.memory.put(key, data)
+        if self.disk is not None:
+            try:
+                self.stats["evictions"] += await asyncio.to_thread(self.disk.put, key, data)
+            except OSError:
+                pass  # disk dolu / yazilamaz — bellek katmani yeter
+
+    def metrics(self) -> dict:
+        s = self.stats
+        hits = s["memory_hits"] + s["disk_hits"]
+        lookups = hits + s["misses"]
+        return {
+            **{k: (round(v, 1) if isinstance(v, float) else v) for k, v in s.items()},
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.bytes,
+            "disk_entries": len(self.disk) if self.disk is not None else 0,
+            "disk_bytes": self.disk.bytes if self.disk is not None else 0,
+        }
+
+
+_cache: TTSCache | None = None
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def get_cache() -> TTSCache:
+    global _cache
+    if _cache is None:
+        settings = get_api_settings()
+        _cache = TTSCache(
+            memory_bytes=settings.TTS_CACHE_MEMORY_MB * 1024 * 1024,
+            disk_dir=settings.TTS_CACHE_DIR or None,
+            disk_bytes=settings.TTS_CACHE_DISK_MB * 1024 * 1024,
+        )
+    return _cache
+
+
+# ── Cached TTS ──────────────────────────────────────
+async def generate(
+    text: str, voice: str = "alloy", speed: float = 1.0, response_format: str = "mp3",
+) -> dict:
+    """Sync TTS (audio_url + sure), cache'ten veya sentezleyip cache'e yazarak."""
+    cache = get_cache()
+    text = normalize(text)
+    key = cache_key(text, voice, speed, response_format)
+    pending = _inflight.get(key)
+    if pending is not None:
+        cache.stats["coalesced"] += 1
+        return await asyncio.shield(pending)
+
+    # Ilk await'ten once kaydol — disk okumasi sirasinda gelen ayni istek de beklesin
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        record = await _cached_record(cache, key)
+        if record is None:
+            result = await tts_generate(text=text, speed=speed, response_format=response_format, voice=voice)
+            record = {
+                "audio_url": result.audio_url,
+                "inference_time_ms": result.inference_time_ms,
+                "audio_duration_sec": result.audio_duration_sec,
+            }
+            await cache.put(key, json.dumps({**record, "created": time.time()}).encode("utf-8"))
+        future.set_result(record)
+        return record
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # bekleyen yoksa "never retrieved" uyarisi olmasin
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+async def _cached_record(cache: TTSCache, key: str) -> dict | None:
+    data = await cache.get(key)
+    if data is None:
+        return None
+    record = json.loads(data)
+    if time.time() - record["created"] >= get_api_settings().TTS_CACHE_URL_TTL_HOURS * 3600:
+        cache.stats["expired"] += 1
+        return None
+    cache.stats["audio_sec_saved"] += record.get("audio_duration_sec") or 0.0
+    cache.stats["est_ms_saved"] += record.get("inference_time_ms") or 0.0
+    return {k: record[k] for k in ("audio_url", "inference_time_ms", "audio_duration_sec")}
+
+
+async def stream(text: str, speed: float = 1.0, voice: str = "alloy") -> AsyncGenerator[bytes, None]:
+    """PCM16 chunk'lari: cache hit'te aninda replay, miss'te sentezle + tamamlaninca yaz."""
+    cache = get_cache()
+    text = normalize(text)
+    key = cache_key(text, voice, speed, PCM_FORMAT)
+    data = await cache.get(key)
+    if data is not None:
+        cache.stats["bytes_saved"] += len(data)
+        cache.stats["audio_sec_saved"] += len(data) / PCM_BYTES_PER_SEC
+        for i in range(0, len(data), CHUNK_BYTES):
+            yield data[i:i + CHUNK_BYTES]
+        return
+
+    chunks: list[bytes] = []
+    async for chunk in tts_stream(text=text, speed=speed, voice=voice):
+        chunks.append(chunk)
+        yield chunk
+    await cache.put(key, b"".join(chunks))
+
+
+def metrics() -> dict:
+    """Hit orani (bellek / disk), katman doluluklari, kazanilan byte / ses suresi / ms."""
+    return get_cache().metrics()
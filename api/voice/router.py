@@ -3,6 +3,7 @@ from fastapi.responses import StreamingResponse
 
 from api.deps import get_tenant
 from api.jobs import job_manager
+from api.shared.audio_frames import PCM_MEDIA_TYPE
 from api.voice import service
 from api.voice.schema import TTSRequest, STTRequest, VoiceListResponse, TTSStreamRequest, TTSSyncResponse
 
@@ -30,6 +31,16 @@ async def text_to_speech_stream(body: TTSStreamRequest, tenant_id: str = Depends
     )
 
 
+@router.post("/tts/stream/pcm")
+async def text_to_speech_stream_pcm(body: TTSStreamRequest, tenant_id: str = Depends(get_tenant)):
+    """Binary TTS stream — chunked audio/L16 (16kHz mono PCM16), base64 sismesi yok."""
+    return StreamingResponse(
+        service.tts_stream_pcm(body),
+        media_type=PCM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/stt")
 async def speech_to_text(body: STTRequest, tenant_id: str = Depends(get_tenant)):
     return await service.stt(body)
@@ -4,24 +4,20 @@ import base64
 import base64 as b64
 import json
 
-from fal_services import tts_generate, tts_stream, transcribe_audio, transcribe_audio_url
+from fal_services import transcribe_audio, transcribe_audio_url
 from api.errors import ValidationError, ServiceError
+from api.shared import tts_cache
 from api.voice.schema import TTSRequest, STTRequest, TTSStreamRequest
 
 
 async def tts(req: TTSRequest) -> dict:
     try:
-        result = await tts_generate(
+        return await tts_cache.generate(
             text=req.text,
+            voice=req.voice,
             speed=req.speed,
             response_format=req.response_format,
-            voice=req.voice,
         )
-        return {
-            "audio_url": result.audio_url,
-            "inference_time_ms": result.inference_time_ms,
-            "audio_duration_sec": result.audio_duration_sec,
-        }
     except Exception as e:
         raise ServiceError("TTS_ERROR", f"TTS servisi hatasi: {e}")
 
@@ -54,7 +50,7 @@ async def tts_stream_sse(req: TTSStreamRequest):
     """SSE formatinda PCM16 audio chunk yield eder."""
     try:
         chunk_index = 0
-        async for pcm_chunk in tts_stream(text=req.text, speed=req.speed, voice=req.voice):
+        async for pcm_chunk in tts_cache.stream(text=req.text, speed=req.speed, voice=req.voice):
             payload = json.dumps({
                 "chunk_index": chunk_index,
                 "audio_base64": b64.b64encode(pcm_chunk).decode("ascii"),
@@ -70,3 +66,9 @@ async def tts_stream_sse(req: TTSStreamRequest):
     except Exception as e:
         error_payload = json.dumps({"code": "TTS_STREAM_ERROR", "message": str(e)})
         yield f"event: error\ndata: {error_payload}\n\n"
+
+
+async def tts_stream_pcm(req: TTSStreamRequest):
+    """Ham PCM16 chunk'lari (chunked audio/L16 govdesi) — base64 / JSON / SSE yok."""
+    async for pcm_chunk in tts_cache.stream(text=req.text, speed=req.speed, voice=req.voice):
+        yield pcm_chunk
@@ -8,6 +8,7 @@ class CreateWorldRequest(BaseModel):
     setting: dict | None = Field(None, description="Serbest yapi — yerler, mevsim, atmosfer, harita")
     rules: dict | None = Field(None, description="Konusma kurallari, ritueller, sinirlamalar")
     taboo_words: list[str] | None = Field(None, description="Karakterlerin kullanmamasi gereken kelimeler")
+    moderation: str | None = Field(None, description="'taboo_only' ise temiz metin LLM moderasyonuna gitmez (karakter disi davranis kontrol edilmez)")
     metadata: dict | None = Field(None, description="Serbest ek veri (studyo bilgisi, proje adi vb.)")
 
 
@@ -19,5 +20,6 @@ class WorldResponse(BaseModel):
     setting: dict | None = None
     rules: dict | None = None
     taboo_words: list[str] | None = None
+    moderation: str | None = None
     metadata: dict | None = None
     created_at: str
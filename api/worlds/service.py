@@ -13,6 +13,7 @@ async def create_world(tenant_id: str, req: CreateWorldRequest) -> dict:
         "setting": req.setting or {},
         "rules": req.rules or {},
         "taboo_words": req.taboo_words or [],
+        "moderation": req.moderation,
         "metadata": req.metadata or {},
     }
     return await store.save_world(tenant_id, world_id, data)
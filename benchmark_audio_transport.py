@@ -0,0 +1,161 @@
+"""Audio Transport Benchmark — base64-in-JSON SSE vs binary stream'ler.
+
+Ayni PCM16 ses (16kHz mono, sentetik) uc tasima bicimiyle gonderilir:
+  - sse     : audio_chunk olaylari, base64 PCM (eski /stream endpoint'leri)
+  - frames  : uzunluk onekli binary frame'ler (/speak|/turn .../stream/binary)
+  - l16     : ham chunked audio/L16 govdesi (/v1/voice/tts/stream/pcm)
+
+Olculenler (ses saniyesi basina): teldeki byte, PCM'e gore sisme, sunucu
+encode CPU'su ve istemci decode CPU'su (api_client'in yaptigi parse).
+
+Ag cagrisi yok — encode / decode yolu api.shared.audio_frames ile birebir.
+
+Kullanim:
+    python benchmark_audio_transport.py
+    python benchmark_audio_transport.py --seconds 30 --chunk 3200 --repeat 20
+"""
+
+import asyncio
+import base64
+import json
+import math
+import struct
+import sys
+import time
+
+from api.shared import audio_frames
+from api.shared.audio_frames import AudioChunk
+
+
+def _arg(name: str, default: int) -> int:
+    return int(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+
+SECONDS = _arg("--seconds", 20)
+CHUNK = _arg("--chunk", 3200)      # 100ms PCM16 @ 16kHz
+REPEAT = _arg("--repeat", 10)
+NET_CHUNK = 16384                  # istemcinin aldigi TCP / chunked okuma boyu
+BYTES_PER_SEC = audio_frames.SAMPLE_RATE * 2
+
+
+def make_pcm(seconds: int) -> bytes:
+    """Konusmaya benzer genlik zarfli sentetik ses (base64'un sikistirilamazligi icin yeterli)."""
+    n = seconds * audio_frames.SAMPLE_RATE
+    samples = (
+        int(8000 * math.sin(i * 0.07) * (0.5 + 0.5 * math.sin(i / 1600)) + (i * 7919) % 2000 - 1000)
+        for i in range(n)
+    )
+    return struct.pack(f"<{n}h", *samples)
+
+
+def chunk_events(pcm: bytes) -> list:
+    events: list = [("sentence_ready", {"sentence": "Ben dun gece oradaydim.", "index": 0})]
+    events += [AudioChunk(pcm[i:i + CHUNK], {"sentence_index": 0}) for i in range(0, len(pcm), CHUNK)]
+    events.append(("done", {"total_audio_chunks": len(events) - 1}))
+    return events
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(gen) -> list:
+    return [item async for item in gen]
+
+
+def _net(body: bytes):
+    """Govdeyi chunk sinirlarindan bagimsiz parcalarla ver (gercek okuma gibi)."""
+    return [body[i:i + NET_CHUNK] for i in range(0, len(body), NET_CHUNK)]
+
+
+# ── Encoders (sunucu) ───────────────────────────────
+def encode_sse(events) -> bytes:
+    return "".join(asyncio.run(_collect(audio_frames.to_sse(_aiter(events))))).encode("utf-8")
+
+
+def encode_frames(events) -> bytes:
+    return b"".join(asyncio.run(_collect(audio_frames.to_frames(_aiter(events)))))
+
+
+def encode_l16(events) -> bytes:
+    return b"".join(ev.pcm for ev in events if isinstance(ev, AudioChunk))
+
+
+# ── Decoders (istemci) ──────────────────────────────
+def decode_sse(body: bytes) -> int:
+    """api_client._tts_stream_sse: satir satir data: → json → base64."""
+    total = 0
+    text = body.decode("utf-8")
+    for line in text.splitlines():
+        if line.startswith("data: "):
+            data = json.loads(line[6:])
+            if "audio_base64" in data:
+                total += len(base64.b64decode(data["audio_base64"]))
+    return total
+
+
+def decode_frames(body: bytes) -> int:
+    total = 0
+    reader = audio_frames.FrameReader()
+    for part in _net(body):
+        for kind, payload in reader.feed(part):
+            if kind == audio_frames.AUDIO:
+                total += len(payload)
+            else:
+                json.loads(payload)
+    return total
+
+
+def decode_l16(body: bytes) -> int:
+    """api_client._tts_stream_pcm: 2 byte ornek hizalamasi."""
+    total = 0
+    carry = b""
+    for part in _net(body):
+        data = carry + part
+        cut = len(data) - len(data) % 2
+        carry = data[cut:]
+        total += cut
+    return total
+
+
+def _cpu(fn, arg) -> tuple[float, object]:
+    start = time.process_time()
+    for _ in range(REPEAT):
+        out = fn(arg)
+    return (time.process_time() - start) / REPEAT, out
+
+
+def main():
+    print("╔══════════════════════════════════════════════════╗")
+    print("║  Audio Transport Benchmark — SSE vs binary       ║")
+    print("╚══════════════════════════════════════════════════╝")
+    pcm = make_pcm(SECONDS)
+    events = chunk_events(pcm)
+    print(f"  audio={SECONDS}s pcm={len(pcm)} bytes chunk={CHUNK} "
+          f"chunks={len(events) - 2} repeat={REPEAT}")
+
+    transports = [
+        ("sse (base64)", encode_sse, decode_sse),
+        ("frames", encode_frames, decode_frames),
+        ("l16 raw", encode_l16, decode_l16),
+    ]
+    print(f"\n  {'transport':<14} {'bytes/s':>10} {'overhead':>9} {'enc us/s':>9} {'dec us/s':>9}")
+    base = None
+    for name, encode, decode in transports:
+        enc_sec, body = _cpu(encode, events)
+        dec_sec, decoded = _cpu(decode, body)
+        assert decoded == len(pcm), f"{name}: {decoded} != {len(pcm)}"
+        per_sec = len(body) / SECONDS
+        cpu = (enc_sec + dec_sec) / SECONDS * 1e6
+        if base is None:
+            base = (per_sec, cpu)
+        print(f"  {name:<14} {per_sec:>10.0f} {(len(body) / len(pcm) - 1) * 100:>8.1f}% "
+              f"{enc_sec / SECONDS * 1e6:>9.1f} {dec_sec / SECONDS * 1e6:>9.1f}"
+              + ("" if per_sec == base[0] else
+                 f"   (⚡ {(1 - per_sec / base[0]) * 100:.0f}% bytes, {base[1] / cpu:.1f}x cpu)"))
+    print(f"\n  PCM16 @ {audio_frames.SAMPLE_RATE}Hz = {BYTES_PER_SEC} bytes per second of audio")
+
+
+if __name__ == "__main__":
+    main()
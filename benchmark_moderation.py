@@ -0,0 +1,121 @@
+"""Moderation Fast-Path Benchmark — taboo otomati vs her mesajda LLM.
+
+Korpus: src/prototypes/*_log.json icindeki gercek campfire / oda konusmalari
++ birkac sentetik ihlal. Olculenler:
+  - Matcher throughput: Aho-Corasick (tek gecis) vs kelime basina regex dongusu
+  - LLM'e gitmeden verilen karar orani (eskiden her mesaj = 1 moderasyon cagrisi)
+
+Ag cagrisi yok — LLM maliyeti sadece cagri sayisi olarak raporlanir.
+
+Kullanim:
+    python benchmark_moderation.py
+    python benchmark_moderation.py --repeat 500
+"""
+
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src" / "prototypes"))
+from world_gen import TABOO_CORE, TABOO_REAL_WORLD, TABOO_META  # noqa: E402
+
+from src.services import taboo  # noqa: E402
+
+TABOO_WORDS = TABOO_CORE + TABOO_REAL_WORLD + TABOO_META
+REPEAT = int(sys.argv[sys.argv.index("--repeat") + 1]) if "--repeat" in sys.argv else 200
+LOGS = ["src/prototypes/game_log.json", "src/prototypes/campfire_log.json"]
+
+SYNTHETIC = [
+    "Sen bir AI'sin, bunu herkes biliyor!",
+    "Dün gece İNTERNETTEN okudum bunu.",
+    "Telefonla haber verdim Ocak Bekçisi'ne.",
+    "Bu oyunu kazanmak için puan toplamamız lazım.",
+    "Ben gerçek insanım, bana güvenin.",
+    "Yapay zekâ gibi konuşuyorsun Fenris.",
+    "Sistemi bozan biri var aramızda.",
+    "ChatGPT ne derdi acaba bu duruma?",
+    "Bana oyun oynama Veyra, yüzünden okunuyor.",
+    "Robot gibi tekrar edip duruyorsun.",
+]
+
+
+def load_corpus() -> list[str]:
+    texts: list[str] = []
+    for path in LOGS:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        histories = [data.get("campfire_history", [])]
+        for rnd in data.get("rounds", []):
+            histories.append(rnd.get("campfire_history", []))
+            for visit in rnd.get("house_visits", []):
+                histories.append(visit.get("exchanges", []))
+        for history in histories:
+            texts.extend(m["content"] for m in history if m.get("content") and m.get("type", "speech") == "speech")
+    return texts + SYNTHETIC
+
+
+def naive_matcher(words: list[str]):
+    """Eski usul yerel kontrol: her taboo kelime icin ayri regex."""
+    compiled = [re.compile(rf"\b{re.escape(w)}", re.IGNORECASE) for w in words]
+
+    def check(text: str) -> bool:
+        return any(rx.search(text) for rx in compiled)
+    return check
+
+
+def bench(name: str, fn, corpus: list[str]) -> dict:
+    chars = sum(len(t) for t in corpus)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for text in corpus:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    n = len(corpus) * REPEAT
+    return {
+        "name": name,
+        "msgs_per_s": n / elapsed,
+        "mb_per_s": chars * REPEAT / elapsed / 1e6,
+        "us_per_msg": elapsed / n * 1e6,
+    }
+
+
+def main():
+    print("╔══════════════════════════════════════════════════╗")
+    print("║  Moderation Fast-Path Benchmark — taboo otomati  ║")
+    print("╚══════════════════════════════════════════════════╝")
+    corpus = load_corpus()
+    matcher = taboo.get_matcher(TABOO_WORDS)
+    print(f"  corpus={len(corpus)} msgs ({sum(len(t) for t in corpus)} chars) "
+          f"patterns={len(matcher)} repeat={REPEAT}")
+
+    rows = [
+        bench("regex per word", naive_matcher(TABOO_WORDS), corpus),
+        bench("aho-corasick", matcher.find, corpus),
+    ]
+    print(f"\n  {'matcher':<18} {'msgs/s':>10} {'MB/s':>8} {'us/msg':>8}")
+    for r in rows:
+        print(f"  {r['name']:<18} {r['msgs_per_s']:>10.0f} {r['mb_per_s']:>8.2f} {r['us_per_msg']:>8.1f}")
+
+    decisions = {taboo.PASS: 0, taboo.VIOLATION: 0, taboo.ESCALATE: 0}
+    escalated: list[str] = []
+    for text in corpus:
+        verdict = taboo.classify(text, TABOO_WORDS)
+        decisions[verdict.decision] += 1
+        if verdict.decision == taboo.ESCALATE:
+            escalated.append(f"{[h.term for h in verdict.hits]} {text[:60]}")
+
+    total = len(corpus)
+    llm_calls = decisions[taboo.ESCALATE]
+    print(f"\n  decisions: pass={decisions[taboo.PASS]} violation={decisions[taboo.VIOLATION]} "
+          f"escalate={llm_calls}")
+    print(f"  LLM moderation calls: {total} → {llm_calls} "
+          f"(⚡ {(total - llm_calls) / total * 100:.1f}% avoided)")
+    if escalated:
+        print("\n  escalated samples:")
+        for line in escalated[:8]:
+            print(f"    {line}")
+
+
+if __name__ == "__main__":
+    main()
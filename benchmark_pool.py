@@ -0,0 +1,110 @@
+"""Connection Pool Benchmark — api_client per-call vs pooled httpx client.
+
+20 eszamanli oyun simule edilir; her oyun bir campfire turu gibi arka arkaya
+istek atar. Once eski davranis (her cagrida yeni AsyncClient), sonra
+api_client'in paylasilan havuzu olculur.
+
+Kullanim:
+    python benchmark_pool.py            # ucuz endpoint (FAL cagrisi yok)
+    python benchmark_pool.py --llm      # gercek /v1/llm/generate (kisa prompt)
+"""
+
+import asyncio
+import sys
+import time
+import statistics
+import httpx
+
+from src.services import api_client
+
+BASE = "http://localhost:9000"
+AUTH = {"Authorization": "Bearer demo-key-123"}
+
+GAMES = 20
+CALLS_PER_GAME = 10
+USE_LLM = "--llm" in sys.argv
+
+LLM_BODY = {
+    "prompt": "Tek kelimeyle cevap ver: ates mi su mu?",
+    "system_prompt": "",
+    "model": "gemini-2.5-flash",
+    "temperature": 0.0,
+    "max_tokens": 5,
+}
+
+
+async def _call(client: httpx.AsyncClient):
+    if USE_LLM:
+        r = await client.post(f"{BASE}/v1/llm/generate", headers=AUTH, json=LLM_BODY)
+    else:
+        # Auth + routing + 404 — sadece baglanti/HTTP overhead'i
+        r = await client.get(f"{BASE}/v1/jobs/bench_nonexistent", headers=AUTH)
+    return r.status_code
+
+
+async def call_fresh() -> float:
+    """Eski davranis: her cagrida yeni client (TCP+TLS handshake)."""
+    start = time.perf_counter()
+    async with httpx.AsyncClient(timeout=api_client._TIMEOUT) as client:
+        await _call(client)
+    return (time.perf_counter() - start) * 1000
+
+
+async def call_pooled() -> float:
+    """Yeni davranis: process-wide havuzdan keep-alive baglanti."""
+    start = time.perf_counter()
+    await _call(api_client._get_client("llm" if USE_LLM else "jobs"))
+    return (time.perf_counter() - start) * 1000
+
+
+async def run_game(call) -> list[float]:
+    return [await call() for _ in range(CALLS_PER_GAME)]
+
+
+async def run_mode(name: str, call) -> dict:
+    start = time.perf_counter()
+    per_game = await asyncio.gather(*[run_game(call) for _ in range(GAMES)])
+    wall_ms = (time.perf_counter() - start) * 1000
+    lat = sorted(ms for game in per_game for ms in game)
+    return {
+        "name": name,
+        "calls": len(lat),
+        "wall_ms": wall_ms,
+        "mean": statistics.mean(lat),
+        "p50": lat[len(lat) // 2],
+        "p95": lat[int(len(lat) * 0.95) - 1],
+        "max": lat[-1],
+    }
+
+
+async def main():
+    print("╔══════════════════════════════════════════════════╗")
+    print("║  Connection Pool Benchmark — api_client          ║")
+    print("╚══════════════════════════════════════════════════╝")
+    api_client.configure(api_url=BASE, api_key=AUTH["Authorization"].split()[-1])
+    print(f"  target: {'/v1/llm/generate' if USE_LLM else '/v1/jobs/{id} (404)'}")
+    print(f"  games={GAMES} calls/game={CALLS_PER_GAME} pool={api_client.pool_info()}")
+
+    # Isinma — havuzu doldur, ilk baglanti maliyetini olcume katma
+    await asyncio.gather(*[call_pooled() for _ in range(GAMES)])
+
+    rows = [
+        await run_mode("before (fresh client)", call_fresh),
+        await run_mode("after (pooled client)", call_pooled),
+    ]
+    await api_client.aclose()
+
+    print(f"\n  {'mode':<24} {'calls':>6} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8} {'wall':>9}")
+    for r in rows:
+        print(
+            f"  {r['name']:<24} {r['calls']:>6} {r['mean']:>6.1f}ms {r['p50']:>6.1f}ms "
+            f"{r['p95']:>6.1f}ms {r['max']:>6.1f}ms {r['wall_ms']:>7.0f}ms"
+        )
+    before, after = rows
+    if after["mean"] > 0:
+        print(f"\n  ⚡ mean speedup: {before['mean'] / after['mean']:.2f}x "
+              f"(p95 {before['p95']:.1f}ms → {after['p95']:.1f}ms)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
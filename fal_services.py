@@ -5,7 +5,7 @@ Freya TTS/STT (fal.ai), Gemini LLM (Google API), FLUX Avatar (fal.ai)
 Tum fonksiyonlar async. Herhangi bir projeye kopyala-yapistir.
 
 Kurulum:
-    pip install fal-client httpx python-dotenv google-genai
+    pip install httpx python-dotenv google-genai
 
 Env:
     export FAL_KEY="your-fal-api-key"
@@ -18,12 +18,16 @@ Kullanim:
 from __future__ import annotations
 
 import os
+import json
+import time
+import asyncio
 import base64
+import weakref
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from collections.abc import AsyncGenerator
 
 import httpx
-import fal_client
 from google import genai
 from google.genai import types
 
@@ -58,6 +62,134 @@ class FalServiceError(Exception):
         super().__init__(f"[{service}] {message}")
 
 
+# ── Provider Transport ────────────────────────────────────
+# fal.ai ve Gemini icin uzun omurlu, havuzlanmis baglantilar. Her istek
+# yeni TCP+TLS handshake odemesin diye client'lar process boyunca yasar.
+# httpx / genai async client'lari olusturulduklari event loop'a baglidir;
+# bu yuzden her loop icin ayri instance tutulur (WeakKeyDictionary — loop
+# kapaninca kaydi kendiliginden duser).
+_FAL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+_FAL_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+_IMAGE_TIMEOUT = httpx.Timeout(180.0, connect=10.0)
+
+_fal_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_gemini_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class ProviderStats:
+    """Provider basina baglanti / istek sayaclari."""
+    clients_created: int = 0
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    total_ms: float = 0.0
+
+    def as_dict(self) -> dict:
+        done = self.requests - self.in_flight
+        return {
+            "clients_created": self.clients_created,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "avg_ms": round(self.total_ms / done, 1) if done > 0 else None,
+        }
+
+
+_stats: dict[str, ProviderStats] = {"fal": ProviderStats(), "gemini": ProviderStats()}
+
+
+@asynccontextmanager
+async def _track(provider: str):
+    st = _stats[provider]
+    st.requests += 1
+    st.in_flight += 1
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        st.errors += 1
+        raise
+    finally:
+        st.in_flight -= 1
+        st.total_ms += (time.perf_counter() - start) * 1000
+
+
+def _get_fal_client() -> httpx.AsyncClient:
+    """Mevcut event loop icin paylasilan fal.run client'i."""
+    loop = asyncio.get_running_loop()
+    client = _fal_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=_FAL_TIMEOUT, limits=_FAL_LIMITS)
+        _fal_clients[loop] = client
+        _stats["fal"].clients_created += 1
+    return client
+
+
+def _fal_url(endpoint: str, path: str = "") -> str:
+    url = f"{FAL_RUN_BASE}/{endpoint}"
+    if path:
+        url += "/" + path.lstrip("/")
+    return url
+
+
+async def fal_run(
+    endpoint: str,
+    arguments: dict,
+    path: str = "",
+    timeout: httpx.Timeout | float | None = None,
+) -> dict:
+    """
+    fal.run uzerinden senkron cagri — queue submit + poll round-trip'i yok.
+    Havuzlanmis client kullanir; Character API servisleri de bunu cagirir.
+    """
+    key = _get_key()
+    async with _track("fal"):
+        resp = await _get_fal_client().post(
+            _fal_url(endpoint, path),
+            headers={"Authorization": f"Key {key}"},
+            json=arguments,
+            timeout=timeout or _FAL_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+
+def provider_stats() -> dict:
+    """Provider basina baglanti istatistikleri (health endpoint'leri icin)."""
+    out = {}
+    for name, st in _stats.items():
+        out[name] = st.as_dict()
+    out["fal"]["open_clients"] = sum(1 for c in list(_fal_clients.values()) if not c.is_closed)
+    out["gemini"]["open_clients"] = len(_gemini_clients)
+    return out
+
+
+async def warmup() -> None:
+    """
+    Client'lari onceden olustur ve fal.run'a bir baglanti ac; ilk oyuncu
+    istegi TLS handshake beklemesin. Hata olursa sessizce gecer.
+    """
+    try:
+        await _get_fal_client().head(FAL_RUN_BASE, timeout=5.0)
+    except Exception:
+        pass
+    if os.environ.get("GEMINI_API_KEY"):
+        try:
+            _get_gemini_client()
+        except Exception:
+            pass
+
+
+async def aclose() -> None:
+    """Mevcut loop'a ait provider client'larini kapat (shutdown)."""
+    loop = asyncio.get_running_loop()
+    client = _fal_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    _gemini_clients.pop(loop, None)
+
+
 # ── Return Tipleri ────────────────────────────────────────
 @dataclass
 class TranscriptionResult:
@@ -91,12 +223,13 @@ async def transcribe_audio(audio_bytes: bytes, language: str = "tr") -> Transcri
     url = f"{FAL_RUN_BASE}/{STT_ENDPOINT}/audio/transcriptions"
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(
+        async with _track("fal"):
+            resp = await _get_fal_client().post(
                 url,
                 headers={"Authorization": f"Key {key}"},
                 files={"file": ("audio.wav", audio_bytes, "audio/wav")},
                 data={"language": language},
+                timeout=60.0,
             )
             resp.raise_for_status()
         return TranscriptionResult(text=resp.json().get("text", ""))
@@ -112,11 +245,10 @@ async def transcribe_audio_url(audio_url: str, language: str = "tr") -> Transcri
     Audio zaten fal storage veya public CDN'de ise bunu kullan.
     """
     try:
-        handler = await fal_client.submit_async(
+        result = await fal_run(
             f"{STT_ENDPOINT}/generate",
             arguments={"audio_url": audio_url, "language": language},
         )
-        result = await handler.get()
         text = result.get("text", "")
         if not text and "chunks" in result:
             text = " ".join(c.get("text", "") for c in result["chunks"])
@@ -133,13 +265,32 @@ _gemini_client: genai.Client | None = None
 
 
 def _get_gemini_client() -> genai.Client:
+    """
+    Mevcut event loop icin Gemini client'i. client.aio'nun HTTP oturumu loop'a
+    bagli oldugundan farkli loop'lar (uvicorn + asyncio.run script'leri) ayni
+    instance'i paylasmaz; ayni loop icinde ise tek instance tekrar kullanilir.
+    """
     global _gemini_client
-    if not _gemini_client:
-        api_key = os.environ.get("GEMINI_API_KEY", "")
-        if not api_key:
-            raise FalServiceError("gemini", "GEMINI_API_KEY tanimli degil")
-        _gemini_client = genai.Client(api_key=api_key)
-    return _gemini_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        client = _gemini_clients.get(loop)
+        if client is not None:
+            return client
+    elif _gemini_client:
+        return _gemini_client
+
+    api_key = os.environ.get("GEMINI_API_KEY", "")
+    if not api_key:
+        raise FalServiceError("gemini", "GEMINI_API_KEY tanimli degil")
+    client = genai.Client(api_key=api_key)
+    _stats["gemini"].clients_created += 1
+    if loop is not None:
+        _gemini_clients[loop] = client
+    _gemini_client = client
+    return client
 
 
 async def llm_generate(
@@ -149,6 +300,7 @@ async def llm_generate(
     temperature: float = 0.8,
     max_tokens: int | None = None,
     reasoning: bool | None = None,
+    stop: list[str] | None = None,
 ) -> LLMResult:
     """Gemini API ile tam yanit uret."""
     try:
@@ -161,13 +313,18 @@ async def llm_generate(
             config_kwargs["thinking_config"] = types.ThinkingConfig(thinking_budget=8192)
         if system_prompt:
             config_kwargs["system_instruction"] = system_prompt
+        if max_tokens:
+            config_kwargs["max_output_tokens"] = max_tokens
+        if stop:
+            config_kwargs["stop_sequences"] = stop
         config = types.GenerateContentConfig(**config_kwargs)
 
-        response = await client.aio.models.generate_content(
-            model=model,
-            contents=prompt,
-            config=config,
-        )
+        async with _track("gemini"):
+            response = await client.aio.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=config,
+            )
         return LLMResult(output=response.text or "")
     except Exception as e:
         raise FalServiceError("llm", str(e)) from e
@@ -179,6 +336,7 @@ async def llm_stream(
     model: str = "gemini-2.5-flash",
     temperature: float = 0.8,
     max_tokens: int | None = None,
+    stop: list[str] | None = None,
 ) -> AsyncGenerator[str, None]:
     """Gemini API ile token token yield et."""
     try:
@@ -189,15 +347,20 @@ async def llm_stream(
         }
         if system_prompt:
             config_kwargs["system_instruction"] = system_prompt
+        if max_tokens:
+            config_kwargs["max_output_tokens"] = max_tokens
+        if stop:
+            config_kwargs["stop_sequences"] = stop
         config = types.GenerateContentConfig(**config_kwargs)
 
-        async for chunk in await client.aio.models.generate_content_stream(
-            model=model,
-            contents=prompt,
-            config=config,
-        ):
-            if chunk.text:
-                yield chunk.text
+        async with _track("gemini"):
+            async for chunk in await client.aio.models.generate_content_stream(
+                model=model,
+                contents=prompt,
+                config=config,
+            ):
+                if chunk.text:
+                    yield chunk.text
     except Exception as e:
         raise FalServiceError("llm", str(e)) from e
 
@@ -215,23 +378,35 @@ async def tts_stream(text: str, speed: float = 1.0, voice: str = "alloy") -> Asy
         async for pcm_chunk in tts_stream("Merhaba"):
             await ws.send_bytes(pcm_chunk)
     """
+    key = _get_key()
     try:
-        stream = fal_client.stream_async(
-            TTS_ENDPOINT,
-            arguments={"input": text, "speed": speed, "voice": voice},
-            path="/stream",
-        )
-        async for event in stream:
-            if not isinstance(event, dict):
-                continue
-            if "audio" in event:
-                yield base64.b64decode(event["audio"])
-            if "error" in event:
-                msg = event["error"].get("message", "Unknown TTS error")
-                if not event.get("recoverable", False):
-                    raise FalServiceError("tts", msg)
-            if event.get("done"):
-                break
+        async with _track("fal"):
+            async with _get_fal_client().stream(
+                "POST", _fal_url(TTS_ENDPOINT, "/stream"),
+                headers={"Authorization": f"Key {key}", "Accept": "text/event-stream"},
+                json={"input": text, "speed": speed, "voice": voice},
+            ) as resp:
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    payload = line[5:].strip()
+                    if not payload:
+                        continue
+                    try:
+                        event = json.loads(payload)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(event, dict):
+                        continue
+                    if "audio" in event:
+                        yield base64.b64decode(event["audio"])
+                    if "error" in event:
+                        msg = event["error"].get("message", "Unknown TTS error")
+                        if not event.get("recoverable", False):
+                            raise FalServiceError("tts", msg)
+                    if event.get("done"):
+                        break
     except FalServiceError:
         raise
     except Exception as e:
@@ -248,7 +423,7 @@ async def tts_generate(
     voice: 'alloy' | 'zeynep' | 'ali'
     """
     try:
-        handler = await fal_client.submit_async(
+        result = await fal_run(
             TTS_ENDPOINT,
             arguments={
                 "input": text,
@@ -258,7 +433,6 @@ async def tts_generate(
             },
             path="/generate",
         )
-        result = await handler.get()
         return TTSResult(
             audio_url=result["audio"]["url"],
             inference_time_ms=result.get("inference_time_ms"),
@@ -283,15 +457,15 @@ async def generate_avatar(
         f"front-facing bust shot, detailed pixel art style"
     )
     try:
-        handler = await fal_client.submit_async(
+        result = await fal_run(
             FLUX_ENDPOINT,
             arguments={
                 "prompt": prompt,
                 "image_size": "square",
                 "num_images": 1,
             },
+            timeout=_IMAGE_TIMEOUT,
         )
-        result = await handler.get()
         return AvatarResult(image_url=result["images"][0]["url"])
     except Exception as e:
         raise FalServiceError("flux", str(e)) from e
@@ -305,15 +479,15 @@ class BackgroundResult:
 async def generate_background(prompt: str) -> BackgroundResult:
     """Sahne arka plani goruntusu uretir."""
     try:
-        handler = await fal_client.submit_async(
+        result = await fal_run(
             FLUX_ENDPOINT,
             arguments={
                 "prompt": prompt,
                 "image_size": "landscape_16_9",
                 "num_images": 1,
             },
+            timeout=_IMAGE_TIMEOUT,
         )
-        result = await handler.get()
         return BackgroundResult(image_url=result["images"][0]["url"])
     except Exception as e:
         raise FalServiceError("flux", str(e)) from e
@@ -428,7 +602,6 @@ async def _demo():
 
 
 if __name__ == "__main__":
-    import asyncio
     from dotenv import load_dotenv
     load_dotenv()
     _fal_key = os.environ.get("FAL_KEY", "")
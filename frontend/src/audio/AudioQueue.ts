@@ -1,12 +1,30 @@
+/** Konusma segmenti kimligi — bitince sunucuya audio_finished ack'i olarak doner */
+export interface AudioTag {
+  speechId: string
+  segment: number
+}
+
+interface QueueItem {
+  url: string
+  tag?: AudioTag
+}
+
 class AudioQueue {
-  private queue: string[] = []
+  private queue: QueueItem[] = []
   private currentAudio: HTMLAudioElement | null = null
+  private currentTag: AudioTag | undefined = undefined
   private playing = false
   private volume = 1.0
   private unlocked = false
   private maxQueueSize = 10  // Audio is synced with TTS, queue rarely fills up
   private fadeMs = 300  // Fade-in/out duration in ms
 
+  /**
+   * Called when a tagged segment finishes, fails, or is dropped without playing.
+   * Game loop bu ack ile sabit sure yerine hemen sonraki konusmaya gecer.
+   */
+  onFinished: ((tag: AudioTag) => void) | null = null
+
   /**
    * Unlock audio playback. Must be called from a user gesture (click/tap).
    * Creates and resumes an AudioContext to satisfy browser autoplay policy.
@@ -31,12 +49,12 @@ class AudioQueue {
    * If nothing is currently playing, playback starts automatically.
    * Drops oldest queued items if the queue gets too large.
    */
-  enqueue(url: string): void {
+  enqueue(url: string, tag?: AudioTag): void {
     // Drop old queued (not currently playing) items if queue is full
     while (this.queue.length >= this.maxQueueSize) {
-      this.queue.shift()
+      this.notifyFinished(this.queue.shift()!.tag)
     }
-    this.queue.push(url)
+    this.queue.push({ url, tag })
 
     // Auto-start if idle
     if (!this.playing) {
@@ -58,7 +76,9 @@ class AudioQueue {
    * Stops immediately (no fade) to prevent overlap.
    */
   stop(): void {
+    const dropped = this.queue
     this.queue = []
+    dropped.forEach((item) => this.notifyFinished(item.tag))
 
     if (this.currentAudio) {
       this.currentAudio.pause()
@@ -68,6 +88,8 @@ class AudioQueue {
       this.currentAudio.load()
       this.currentAudio = null
     }
+    this.notifyFinished(this.currentTag)
+    this.currentTag = undefined
     this.playing = false
   }
 
@@ -75,18 +97,27 @@ class AudioQueue {
    * Immediately stop any current audio + clear queue, then play this URL.
    * Ensures only one audio plays at a time — like voice_chat's single-audio approach.
    */
-  playNow(url: string): void {
+  playNow(url: string, tag?: AudioTag): void {
     this.stop()
-    this.queue.push(url)
+    this.queue.push({ url, tag })
     this.play()
   }
 
+  /**
+   * Segment bu istemcide calinmayacak (baska oda, vb.) — hemen bitmis say.
+   */
+  markSkipped(tag: AudioTag): void {
+    this.notifyFinished(tag)
+  }
+
   /**
    * Clear the pending queue but let the current audio finish naturally.
    * Useful for phase transitions — don't abruptly cut audio but stop queueing more.
    */
   clearQueue(): void {
+    const dropped = this.queue
     this.queue = []
+    dropped.forEach((item) => this.notifyFinished(item.tag))
   }
 
   /**
@@ -119,7 +150,8 @@ class AudioQueue {
     }
 
     this.playing = true
-    const url = this.queue.shift()!
+    const { url, tag } = this.queue.shift()!
+    this.currentTag = tag
 
     const audio = new Audio(url)
     audio.volume = 0  // Start silent for fade-in
@@ -144,6 +176,8 @@ class AudioQueue {
       this.currentAudio.removeEventListener('error', this.handleError)
       this.currentAudio = null
     }
+    this.notifyFinished(this.currentTag)
+    this.currentTag = undefined
 
     // Advance to next in queue
     this.playNext()
@@ -154,6 +188,12 @@ class AudioQueue {
     this.handleEnded()
   }
 
+  private notifyFinished(tag: AudioTag | undefined): void {
+    if (tag && this.onFinished) {
+      this.onFinished(tag)
+    }
+  }
+
   /** Fade audio volume from 0 to target over fadeMs */
   private fadeIn(audio: HTMLAudioElement): void {
     const target = this.volume
@@ -1,5 +1,6 @@
 import { useGameStore } from '../state/GameStore'
-import { HEARTBEAT_INTERVAL, RECONNECT_INTERVAL } from '../utils/constants'
+import { audioQueue } from '../audio/AudioQueue'
+import { HEARTBEAT_INTERVAL, RECONNECT_INTERVAL, SCENE_MIN_DWELL } from '../utils/constants'
 
 const MAX_RETRIES = 5
 
@@ -11,6 +12,7 @@ class WebSocketManager {
   private reconnectTimer: ReturnType<typeof setTimeout> | null = null
   private retryCount = 0
   private intentionalClose = false
+  private sceneAckTimers = new Set<ReturnType<typeof setTimeout>>()
 
   /**
    * Establish a WebSocket connection to the game server.
@@ -110,11 +112,33 @@ class WebSocketManager {
       const { event: eventName, data } = parsed
       console.log('[WS] Event received:', eventName, data)
       useGameStore.getState().handleEvent(eventName, data)
+      // Pacing: event_id tasiyan sahne gosterildikten sonra ack — game loop beklemeyi kissin
+      if (data && typeof data.event_id === 'string') {
+        this.ackSceneWhenShown(data.event_id)
+      }
     } catch (err) {
       console.error('[WS] Failed to parse message:', event.data, err)
     }
   }
 
+  /**
+   * scene_ready'yi mesaj gelir gelmez degil, sahne boyandiktan (iki frame)
+   * ve en az SCENE_MIN_DWELL ekranda kaldiktan sonra gonder.
+   */
+  private ackSceneWhenShown(eventId: string): void {
+    const shownAt = performance.now()
+    requestAnimationFrame(() => {
+      requestAnimationFrame(() => {
+        const remaining = Math.max(0, SCENE_MIN_DWELL - (performance.now() - shownAt))
+        const timer = setTimeout(() => {
+          this.sceneAckTimers.delete(timer)
+          this.send('scene_ready', { event_id: eventId })
+        }, remaining)
+        this.sceneAckTimers.add(timer)
+      })
+    })
+  }
+
   private handleClose = (event: CloseEvent): void => {
     console.log('[WS] Connection closed. Code:', event.code, 'Reason:', event.reason)
     this.stopHeartbeat()
@@ -166,6 +190,9 @@ class WebSocketManager {
   private cleanup(): void {
     this.stopHeartbeat()
 
+    this.sceneAckTimers.forEach((timer) => clearTimeout(timer))
+    this.sceneAckTimers.clear()
+
     if (this.reconnectTimer !== null) {
       clearTimeout(this.reconnectTimer)
       this.reconnectTimer = null
@@ -191,3 +218,8 @@ class WebSocketManager {
 }
 
 export const wsManager = new WebSocketManager()
+
+// Pacing: konusma segmenti bitince (veya atlaninca) sunucuya ack
+audioQueue.onFinished = (tag) => {
+  wsManager.send('audio_finished', { event_id: tag.speechId, seq: tag.segment })
+}
@@ -49,6 +49,9 @@ export interface GameStore {
   // Active speaker tracking (for spectator UI)
   currentSpeaker: string | null
 
+  // Live caption (speech_start / speech_token / speech_end)
+  liveCaption: { speech_id: string; speaker: string; text: string } | null
+
   // Pipeline metrics (live latency display)
   pipelineMetrics: {
     speaker: string
@@ -162,6 +165,7 @@ const initialState = {
   playerLocations: {} as Record<string, string>,
   sceneBackgrounds: {} as Record<string, string>,
   currentSpeaker: null as string | null,
+  liveCaption: null as { speech_id: string; speaker: string; text: string } | null,
   pipelineMetrics: null,
   inspectedPlayer: null as string | null,
   inputRequired: null,
@@ -462,6 +466,7 @@ export const useGameStore = create<GameStore>((set, get) => ({
           speaker: cfSpeaker,
           content: data.content as string,
           audio_url: cfAudioUrl,
+          speech_id: data.speech_id as string | undefined,
         })
         // Track current speaker + pipeline metrics for spectator UI
         const cfPipeline = data.pipeline as { llm_ms: number; tts_ms: number; total_ms: number; text_len: number; voice: string } | undefined
@@ -566,8 +571,20 @@ export const useGameStore = create<GameStore>((set, get) => ({
             shouldPlay = true
           }
 
+          // Streaming konusma: ilk segment playNow, sonrakiler siraya
+          const segment = (data.segment as number | undefined) ?? 0
+          const tag = data.speech_id
+            ? { speechId: data.speech_id as string, segment }
+            : undefined
           if (shouldPlay) {
-            audioQueue.playNow(audioUrl)
+            if (segment > 0) {
+              audioQueue.enqueue(audioUrl, tag)
+            } else {
+              audioQueue.playNow(audioUrl, tag)
+            }
+          } else if (tag) {
+            // Calinmayacak — game loop bizi beklemesin
+            audioQueue.markSkipped(tag)
           }
         }
         break
@@ -773,6 +790,43 @@ export const useGameStore = create<GameStore>((set, get) => ({
         audioQueue.stop()
         break
 
+      case 'speech_retracted':
+        // Gec moderasyon: konusma geri cekildi (ses speech_interrupted ile durdu)
+        set((s) => ({
+          speeches: s.speeches.filter((sp) => sp.speech_id !== data.speech_id),
+          currentSpeaker: s.currentSpeaker === data.speaker ? null : s.currentSpeaker,
+        }))
+        break
+
+      case 'speech_annotated':
+        set((s) => ({
+          speeches: s.speeches.map((sp) =>
+            sp.speech_id === data.speech_id ? { ...sp, moderated: data.reason as string } : sp
+          ),
+        }))
+        break
+
+      case 'speech_start':
+        set({
+          currentSpeaker: data.speaker as string,
+          liveCaption: { speech_id: data.speech_id as string, speaker: data.speaker as string, text: '' },
+        })
+        break
+
+      case 'speech_token': {
+        const caption = store.liveCaption
+        if (caption && caption.speech_id === data.speech_id) {
+          set({ liveCaption: { ...caption, text: caption.text + (data.text as string) } })
+        }
+        break
+      }
+
+      case 'speech_end':
+        if (store.liveCaption?.speech_id === data.speech_id) {
+          set({ liveCaption: null })
+        }
+        break
+
       case 'error':
         set({
           notification: {
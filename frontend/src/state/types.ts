@@ -46,6 +46,8 @@ export interface Speech {
   audio_url?: string
   timestamp?: number
   pending?: boolean  // true = user's immediate text, will be replaced by server rewrite
+  speech_id?: string
+  moderated?: string  // gec moderasyon notu (speech_annotated)
 }
 
 // ── Location decision ──
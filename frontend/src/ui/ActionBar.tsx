@@ -39,6 +39,7 @@ export const ActionBar: React.FC = () => {
   const playerId = useGameStore((s) => s.playerId)
   const playerLocations = useGameStore((s) => s.playerLocations)
   const currentSpeaker = useGameStore((s) => s.currentSpeaker)
+  const liveCaption = useGameStore((s) => s.liveCaption)
 
   const isSpectator = playerId === 'spectator' || myName === 'Seyirci'
 
@@ -209,9 +210,11 @@ export const ActionBar: React.FC = () => {
   if (isSpectator) {
     const phaseIcon = PHASE_ICONS[phase] ?? ''
     const phaseLabel = PHASE_LABELS[phase] ?? 'Izleniyor'
-    const narration = currentSpeaker
-      ? `${currentSpeaker} konuşuyor...`
-      : PHASE_NARRATIONS[phase] ?? 'İzleniyor...'
+    const narration = liveCaption?.text
+      ? `${liveCaption.speaker}: ${liveCaption.text.slice(-90)}`
+      : currentSpeaker
+        ? `${currentSpeaker} konuşuyor...`
+        : PHASE_NARRATIONS[phase] ?? 'İzleniyor...'
 
     return (
       <div
@@ -78,6 +78,7 @@ export const TRANSITION_DURATION = 1000 // ms
 export const FREE_ROAM_TIMEOUT = 30 // seconds
 export const HEARTBEAT_INTERVAL = 30000 // ms
 export const RECONNECT_INTERVAL = 3000 // ms
+export const SCENE_MIN_DWELL = 800 // ms — sahne en az bu kadar gorunmeden scene_ready gonderilmez
 
 // ── Building positions on the map (tile coordinates) ──
 export const BUILDING_POSITIONS: Record<string, { x: number; y: number; w: number; h: number; label: string }> = {
@@ -8,6 +8,7 @@ ENDPOINT'LER:
 POST   /api/game/          → Yeni oyun oluştur
 GET    /api/game/{id}      → Oyun durumunu getir
 POST   /api/game/{id}/start → Oyunu başlat (karakterleri üret)
+GET    /api/game/{id}/speech/{speech_id}/replay → Dikilmiş konuşma sesi
 
 FASTAPI ROUTER:
 ---------------
@@ -20,7 +21,7 @@ game_engine fonksiyonları direkt kullanılır.
 İleride WebSocket manager eklenince buraya inject edilecek.
 """
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 
 from src.apps.game.schema import (
     GameCreateRequest,
@@ -89,6 +90,7 @@ async def create_game_endpoint(request: GameCreateRequest):
             player_count=request.player_count,
             ai_count=request.ai_count,
             day_limit=request.day_limit,
+            orchestrator_mode=request.orchestrator_mode,
         )
         
         # Response oluştur
@@ -257,3 +259,24 @@ async def get_game_log_endpoint(game_id: str):
     
     return GameLogResponse(**log_data)
 
+
+@router.get(
+    "/{game_id}/speech/{speech_id}/replay",
+    summary="Konuşma sesini tek dosya olarak getir",
+    description="""
+    Çok segmentli bir konuşmanın tek sürekli ses dosyasına dikilmiş hali.
+
+    Canlı oyunda segmentler `speech_audio` ile sırayla gelir; dikiş hazır
+    olunca `speech_replay` olayı bu URL'i yayınlar.
+    """,
+)
+async def get_speech_replay_endpoint(game_id: str, speech_id: str):
+    from src.core import speech_replay
+
+    replay = speech_replay.get(game_id, speech_id)
+    if replay is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Speech replay not found: {speech_id}",
+        )
+    return Response(content=replay.data, media_type=replay.media_type)
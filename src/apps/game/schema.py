@@ -18,6 +18,8 @@ KULLANIM:
         # response otomatik serialize edilir
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -57,6 +59,10 @@ class GameCreateRequest(BaseModel):
         le=10,
         description="Maximum gün limiti"
     )
+    orchestrator_mode: Literal["local", "llm", "hybrid"] | None = Field(
+        default=None,
+        description="Konuşmacı seçim stratejisi. None ise sunucu varsayılanı (llm)."
+    )
 
 
 # ═══════════════════════════════════════════════════
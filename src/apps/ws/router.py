@@ -6,6 +6,7 @@ WebSocket bağlantılarını yöneten endpoint.
 ENDPOINT:
 ---------
 WS /ws/{game_id}/{player_id}
+WS /ws/{game_id}/{player_id}?audio=binary   → ses binary frame olarak (bkz. service.py)
 
 FLOW:
 -----
@@ -40,6 +41,7 @@ async def websocket_endpoint(
     websocket: WebSocket,
     game_id: str,
     player_id: str,
+    audio: Optional[str] = Query(None, description="'binary': sentezlenen ses binary WS frame'leri olarak"),
 ):
     """
     WebSocket bağlantı endpoint'i.
@@ -79,7 +81,8 @@ async def websocket_endpoint(
     # ═══ 1. BAĞLANTI KABUL ET ═══
     try:
         await manager.connect(game_id, player_id, websocket)
-        logger.info(f"✅ WebSocket connected: {game_id}/{player_id}")
+        audio_mode = manager.set_audio_mode(game_id, player_id, audio or "url")
+        logger.info(f"✅ WebSocket connected: {game_id}/{player_id} (audio={audio_mode})")
         
         # Hoş geldin mesajı gönder
         await websocket.send_json({
@@ -88,6 +91,7 @@ async def websocket_endpoint(
                 "message": f"Welcome {player_id}!",
                 "game_id": game_id,
                 "active_players": manager.get_active_players(game_id),
+                "audio_mode": audio_mode,
             }
         })
         
@@ -176,6 +180,7 @@ async def handle_client_event(
         - vote: Oylama
         - visit_request: Ev ziyareti isteği
         - visit_speak: Ev ziyaretinde konuşma
+        - audio_mode: Ses teslim modu (binary / url)
     """
     
     # ═══ HEARTBEAT ═══
@@ -280,6 +285,8 @@ async def handle_client_event(
             audio_bytes = base64.b64decode(audio_b64)
 
             from src.services.api_client import transcribe_audio
+            from src.services.scheduler import set_game
+            set_game(game_id)
 
             # STT retry — fast backoff (0.5s, 1s, 1.5s, 2s, 2.5s, 3s)
             content = ""
@@ -357,6 +364,20 @@ async def handle_client_event(
         signal_human_interrupt(game_id)
         logger.info(f"⚡ Interrupt signal from {player_id} in {game_id}")
 
+    # ═══ PACING ACK (audio_finished / scene_ready) ═══
+    elif event_type in ("audio_finished", "scene_ready"):
+        from src.core import pacing
+        pacing.ack(game_id, player_id, event_data.get("event_id", ""), int(event_data.get("seq", 0) or 0))
+
+    # ═══ AUDIO MODE (binary PCM frame / audio_url) ═══
+    elif event_type == "audio_mode":
+        mode = manager.set_audio_mode(game_id, player_id, event_data.get("mode", "url"))
+        await websocket.send_json({
+            "event": "audio_mode",
+            "data": {"mode": mode}
+        })
+        logger.info(f"🔊 {player_id} audio mode: {mode} in {game_id}")
+
     # ═══ UNKNOWN EVENT ═══
     else:
         await websocket.send_json({
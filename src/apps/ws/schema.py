@@ -75,14 +75,71 @@ class CampfireSpeechEvent(BaseModel):
     """
     Campfire konuşması (tüm oyuncular duyar).
     
-    Use Case: AI veya insan oyuncu konuştuğunda
+    Use Case: AI veya insan oyuncu konuştuğunda. Metin TTS'i beklemeden gelir;
+    ses aynı speech_id ile `speech_audio` olarak arkadan gelir.
     """
     event: str = "campfire_speech"
     data: dict = Field(description="""
     {
         "speaker": "Fenris",
         "role_title": "Demirci",
-        "content": "Ben dün gece bir şey gördüm..."
+        "content": "Ben dün gece bir şey gördüm...",
+        "speech_id": "3f2a9c1b7d4e"
+    }
+    """)
+
+
+class SpeechAudioEvent(BaseModel):
+    """
+    Bir konuşmanın ses segmenti (text-first, audio-follow).
+
+    Use Case: `segment` 0 hemen çalınır, sonrakiler sıraya eklenir.
+    `context`: "campfire" | "visit:<host>:<visitor>" | "institution:<id>"
+    Binary ses modundaki istemciler segmenti PCM binary frame olarak alır
+    (bkz. ws/service.py), onlara bu event gönderilmez.
+    """
+    event: str = "speech_audio"
+    data: dict = Field(description="""
+    {
+        "speech_id": "3f2a9c1b7d4e",
+        "speaker": "Fenris",
+        "audio_url": "https://.../seg0.mp3",
+        "duration": 2.4,
+        "segment": 0,
+        "context": "campfire"
+    }
+    """)
+
+
+class SpeechRetractedEvent(BaseModel):
+    """
+    Yayinlanmis bir konusma gec gelen moderasyon reddiyle geri cekildi.
+
+    Use Case: Siradaki konusma baslamadan red geldi — metni kaldir, sesi durdur.
+    Sonrasinda ayni sebeple `moderator_warning` gelir.
+    """
+    event: str = "speech_retracted"
+    data: dict = Field(description="""
+    {
+        "speech_id": "3f2a9c1b7d4e",
+        "speaker": "Fenris",
+        "reason": "Oyun disi ifade"
+    }
+    """)
+
+
+class SpeechAnnotatedEvent(BaseModel):
+    """
+    Moderasyon reddi konusma kesinlestikten sonra geldi.
+
+    Use Case: Konusma kalir, moderasyon notu ile isaretlenir.
+    """
+    event: str = "speech_annotated"
+    data: dict = Field(description="""
+    {
+        "speech_id": "3f2a9c1b7d4e",
+        "speaker": "Fenris",
+        "reason": "Oyun disi ifade"
     }
     """)
 
@@ -148,6 +205,55 @@ class YourTurnEvent(BaseModel):
     """)
 
 
+class SpeechStartEvent(BaseModel):
+    """
+    AI konuşması üretilmeye başladı (canlı altyazı başlangıcı).
+
+    Use Case: İlk LLM token'ı geldiğinde — istemci boş bir konuşma balonu açar
+    """
+    event: str = "speech_start"
+    data: dict = Field(description="""
+    {
+        "speech_id": "3f2a9c1b7d4e",
+        "speaker": "Fenris",
+        "role_title": "Demirci",
+        "context": "campfire"
+    }
+    """)
+
+
+class SpeechTokenEvent(BaseModel):
+    """
+    Canlı altyazı parçası. Token'lar ~50ms'lik frame'lerde birleştirilir.
+
+    Use Case: İstemci `text`'i aynı speech_id'li balona ekler (seq sırasıyla)
+    """
+    event: str = "speech_token"
+    data: dict = Field(description="""
+    {
+        "speech_id": "3f2a9c1b7d4e",
+        "seq": 3,
+        "text": " dün gece bir"
+    }
+    """)
+
+
+class SpeechEndEvent(BaseModel):
+    """
+    Konuşma metni tamamlandı. `content` temizlenmiş final metindir ve
+    altyazının yerine geçer; `cancelled` ise balon kaldırılır.
+    """
+    event: str = "speech_end"
+    data: dict = Field(description="""
+    {
+        "speech_id": "3f2a9c1b7d4e",
+        "speaker": "Fenris",
+        "content": "Ben dün gece bir şey gördüm...",
+        "cancelled": false
+    }
+    """)
+
+
 # ═══════════════════════════════════════════════════
 # CLIENT → SERVER EVENTS (Oyunculardan Sunucuya)
 # ═══════════════════════════════════════════════════
@@ -226,6 +332,50 @@ class HeartbeatEvent(BaseModel):
     data: Optional[dict] = None
 
 
+class AudioFinishedEvent(BaseModel):
+    """
+    Konusma sesinin bir segmenti istemcide bitti (veya calinmadan atlandi).
+
+    Use Case: Game loop sabit sure yerine bu ack ile sonraki konusmaya gecer
+    """
+    event: str = "audio_finished"
+    data: dict = Field(description="""
+    {
+        "event_id": "a1b2c3d4e5f6",   # speech_audio.speech_id
+        "seq": 2                      # speech_audio.segment
+    }
+    """)
+
+
+class AudioModeEvent(BaseModel):
+    """
+    Ses teslim modunu seç (bağlantıda ?audio=binary ile de seçilebilir).
+
+    Use Case: "binary" → sentezlenen PCM, sentez sürerken binary WS frame'leri
+    olarak gelir; "url" → speech_audio + audio_url (varsayılan)
+    """
+    event: str = "audio_mode"
+    data: dict = Field(description="""
+    {
+        "mode": "binary"
+    }
+    """)
+
+
+class SceneReadyEvent(BaseModel):
+    """
+    event_id tasiyan bir sahne (sabah olayi, gece, ...) istemcide gosterildi.
+
+    Use Case: Game loop sahne bekleme suresini erken bitirir
+    """
+    event: str = "scene_ready"
+    data: dict = Field(description="""
+    {
+        "event_id": "a1b2c3d4e5f6"
+    }
+    """)
+
+
 # ═══════════════════════════════════════════════════
 # ERROR EVENTS
 # ═══════════════════════════════════════════════════
@@ -255,10 +405,16 @@ SERVER_EVENTS = {
     "player_disconnected": PlayerDisconnectedEvent,
     "phase_change": GamePhaseChangeEvent,
     "campfire_speech": CampfireSpeechEvent,
+    "speech_audio": SpeechAudioEvent,
+    "speech_retracted": SpeechRetractedEvent,
+    "speech_annotated": SpeechAnnotatedEvent,
     "vote_phase": VotePhaseEvent,
     "vote_result": VoteResultEvent,
     "game_over": GameOverEvent,
     "your_turn": YourTurnEvent,
+    "speech_start": SpeechStartEvent,
+    "speech_token": SpeechTokenEvent,
+    "speech_end": SpeechEndEvent,
     "error": ErrorEvent,
 }
 
@@ -269,4 +425,7 @@ CLIENT_EVENTS = {
     "visit_request": VisitRequestEvent,
     "visit_speak": VisitSpeakEvent,
     "heartbeat": HeartbeatEvent,
+    "audio_finished": AudioFinishedEvent,
+    "scene_ready": SceneReadyEvent,
+    "audio_mode": AudioModeEvent,
 }
@@ -9,6 +9,7 @@ SORUMLULUKLAR:
 ✅ Broadcast (tüm oyunculara mesaj)
 ✅ Unicast (tek oyuncuya mesaj)
 ✅ Game-based grouping
+✅ Binary ses modu (opsiyonel, istemci basina)
 
 KULLANIM:
 ---------
@@ -22,14 +23,57 @@ KULLANIM:
     
     # Tek oyuncuya mesaj
     await manager.send_to("game123", "P0", {"event": "your_turn", ...})
+
+    # Binary ses modu (istemci {"event": "audio_mode", "data": {"mode": "binary"}} gonderir)
+    manager.set_audio_mode("game123", "P0", "binary")
+    await manager.send_audio("game123", manager.binary_audio_players("game123"), frame)
+
+BINARY SES FRAME'I:
+-------------------
+JSON `speech_audio` (audio_url) yerine sentezlenen PCM, sentez surerken
+binary WS frame'leri olarak itilir — istemci CDN'den ayrica indirmez:
+
+    [version: u8][flags: u8][segment: u16][seq: u16][speech_id: 6 byte][payload]
+
+    flags bit0 = segmentin son frame'i (payload bos), bit4-7 = format (1 = pcm16)
+    seq: konusma icinde artan frame sirasi, speech_id: 12 hex → 6 byte
+    payload: 16kHz mono PCM16 little-endian
+
+Segmentler sirayla gelir; istemci segment bitince
+{"event": "audio_finished", "data": {"event_id": speech_id, "seq": segment}} ack'ler.
+
+Maliyet: oyunda hem binary hem url modunda istemci varsa her segment iki
+kez sentezlenir (PCM stream + audio_url icin TTS). Hepsi binary ise tek
+sentez. PCM stream hic ses vermeden koparsa segment audio_url ile uretilir
+ve binary istemcilere de normal `speech_audio` olarak gider (sessiz kalmaz).
 """
 
 import logging
+import struct
 from typing import Dict, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 
+from src.core.config import get_settings
+
 logger = logging.getLogger(__name__)
 
+AUDIO_FRAME_VERSION = 1
+AUDIO_FLAG_FINAL = 0x01
+AUDIO_FORMAT_PCM16 = 1
+_AUDIO_HEADER = struct.Struct(">BBHH6s")
+AUDIO_HEADER_BYTES = _AUDIO_HEADER.size
+
+
+def pack_audio_frame(
+    speech_id: str, segment: int, seq: int, payload: bytes = b"",
+    final: bool = False, fmt: int = AUDIO_FORMAT_PCM16,
+) -> bytes:
+    """Binary ses frame'i: kucuk header (speech_id + segment + seq) + ses byte'lari."""
+    flags = (fmt << 4) | (AUDIO_FLAG_FINAL if final else 0)
+    return _AUDIO_HEADER.pack(
+        AUDIO_FRAME_VERSION, flags, segment & 0xFFFF, seq & 0xFFFF, bytes.fromhex(speech_id)[:6],
+    ) + payload
+
 
 class ConnectionManager:
     """
@@ -53,6 +97,9 @@ class ConnectionManager:
         """Initialize connection manager."""
         # game_id → {player_id → WebSocket}
         self.active_connections: Dict[str, Dict[str, WebSocket]] = {}
+        # game_id → binary ses modundaki player_id'ler
+        self.binary_audio: Dict[str, set[str]] = {}
+        self.audio_stats = {"frames": 0, "bytes": 0, "failed": 0}
         logger.info("ConnectionManager initialized")
     
     async def connect(self, game_id: str, player_id: str, websocket: WebSocket):
@@ -108,6 +155,7 @@ class ConnectionManager:
             1. Player'ı game grubundan çıkar
             2. Game grubu boşaldıysa sil
         """
+        self.binary_audio.get(game_id, set()).discard(player_id)
         if game_id in self.active_connections:
             if player_id in self.active_connections[game_id]:
                 del self.active_connections[game_id][player_id]
@@ -116,6 +164,7 @@ class ConnectionManager:
             # Game grubu boşsa sil
             if not self.active_connections[game_id]:
                 del self.active_connections[game_id]
+                self.binary_audio.pop(game_id, None)
                 logger.info(f"🗑️  Game {game_id} group deleted (no active players)")
     
     async def send_to(self, game_id: str, player_id: str, message: dict):
@@ -208,6 +257,64 @@ class ConnectionManager:
         for player_id in disconnected_players:
             self.disconnect(game_id, player_id)
     
+    def set_audio_mode(self, game_id: str, player_id: str, mode: str) -> str:
+        """
+        Oyuncunun ses teslim modunu ayarla.
+        
+        Args:
+            game_id: Oyun ID'si
+            player_id: Oyuncu ID'si
+            mode: "binary" (PCM binary frame) | "url" (speech_audio + audio_url)
+            
+        Returns:
+            str: Gecerli mod (WS_BINARY_AUDIO kapaliysa her zaman "url")
+        """
+        players = self.binary_audio.setdefault(game_id, set())
+        if mode == "binary" and get_settings().WS_BINARY_AUDIO and self.is_connected(game_id, player_id):
+            players.add(player_id)
+            return "binary"
+        players.discard(player_id)
+        return "url"
+    
+    def binary_audio_players(self, game_id: str) -> list[str]:
+        """Binary ses modundaki bagli oyuncular."""
+        return [p for p in self.binary_audio.get(game_id, ()) if self.is_connected(game_id, p)]
+    
+    async def send_audio(self, game_id: str, player_ids: list[str], frame: bytes):
+        """
+        Binary ses frame'ini oyunculara gonder (send_bytes).
+        
+        Args:
+            game_id: Oyun ID'si
+            player_ids: Hedef oyuncular (binary_audio_players)
+            frame: pack_audio_frame ciktisi
+        """
+        disconnected_players = []
+        
+        for player_id in player_ids:
+            websocket = self.active_connections.get(game_id, {}).get(player_id)
+            if websocket is None:
+                continue
+            try:
+                await websocket.send_bytes(frame)
+                self.audio_stats["frames"] += 1
+                self.audio_stats["bytes"] += len(frame)
+            except Exception as e:
+                logger.error(f"❌ Failed to send audio to {player_id}: {e}")
+                self.audio_stats["failed"] += 1
+                disconnected_players.append(player_id)
+        
+        for player_id in disconnected_players:
+            self.disconnect(game_id, player_id)
+    
+    def audio_metrics(self) -> dict:
+        """Binary ses modu: oyun basina dinleyici, gonderilen frame / byte."""
+        return {
+            **self.audio_stats,
+            "enabled": get_settings().WS_BINARY_AUDIO,
+            "listeners": {g: len(self.binary_audio_players(g)) for g in self.binary_audio if self.binary_audio[g]},
+        }
+    
     def get_active_players(self, game_id: str) -> list[str]:
         """
         Oyundaki aktif oyuncuların listesini döndür.
@@ -0,0 +1,174 @@
+"""
+audio_bank.py — Per-Game Audio Pre-Render Bank
+==============================================
+generate_world_seed surgun rituel cumlesini bastan sabitler; diegetik
+moderasyon uyarilari ve beraberlik duyurusu da hep ayni metin. Game loop'un
+anlatici sesiyle okudugu bu satirlar oyun ortasinda TTS beklemek yerine
+create_new_game aninda arka planda sentezlenir:
+
+  - bank_lines(world_seed, moderator_lines): sadece game loop'ta anlatilan
+    satirlar (NARRATED_RITUALS, moderasyon, beraberlik). Calinmayan satir
+    (el kaldirma / yemin, soylenti, alametler, oyuncu sesli varyantlar)
+    on-sentezlenmez — anlatim noktasi eklenince buraya eklenir.
+  - start(game_id, lines, synthesize): arka plan task'i, PRERENDER_CONCURRENCY
+    ile sinirli, "summary" lane'inde (canli konusmalarin onune gecmez).
+    Bitince banka oyun kaydina da yazilir (db GAMES.audio_bank).
+  - lookup(game_id, text, voice, speed): game loop'un TTS'inden once —
+    hazir satir sifir gecikmeyle doner, yoksa None (normal TTS).
+  - line(game_id, key): anahtarla anlatici satiri (surgun rituel cumlesi,
+    moderasyon uyarisi) — hazir degilse None, oyun beklemez.
+
+Kullanim:
+    from src.core import audio_bank
+
+    audio_bank.start(game_id, audio_bank.bank_lines(ws, DIEGETIC_MESSAGES), _generate_audio_url)
+    hit = audio_bank.lookup(game_id, text, voice="zeynep", speed=1.0)
+    entry = audio_bank.line(game_id, "ritual.exile_phrase")
+    audio_bank.stop(game_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from src.core.database import db, GAMES
+from src.services.scheduler import lane, set_game
+
+logger = logging.getLogger(__name__)
+
+NARRATED_RITUALS = ("exile_phrase",)  # game loop'ta _narrate_banked ile okunan rituel cumleleri
+NARRATOR_VOICE = "alloy"
+NARRATOR_SPEED = 0.9
+PRERENDER_CONCURRENCY = 3
+TIE_MESSAGE = "Beraberlik! Kimse sürgün edilmedi."
+
+Synthesize = Callable[..., Awaitable[tuple[str | None, float]]]
+
+
+@dataclass(frozen=True)
+class BankLine:
+    key: str        # "ritual.exile_phrase", "moderator.<reason>", "exile.tie"
+    text: str
+    voice: str = NARRATOR_VOICE
+    speed: float = NARRATOR_SPEED
+
+
+def _text_key(text: str, voice: str, speed: float) -> tuple[str, float, str]:
+    return voice, round(speed, 2), " ".join(text.split())
+
+
+def bank_lines(world_seed: dict, moderator_lines: dict[str, str] | None = None) -> list[BankLine]:
+    """World seed'den (+ sabit moderasyon mesajlari) on-sentezlenecek, anlatilan satirlar."""
+    lines: list[BankLine] = []
+    rituals = world_seed.get("rituals", {})
+    for name in NARRATED_RITUALS:
+        if rituals.get(name):
+            lines.append(BankLine(f"ritual.{name}", rituals[name]))
+    for name, text in (moderator_lines or {}).items():
+        lines.append(BankLine(f"moderator.{name}", text))
+    lines.append(BankLine("exile.tie", TIE_MESSAGE))
+    return lines
+
+
+class AudioBank:
+    """Tek oyunun on-sentezlenmis satirlari: anahtar → {text, voice, speed, audio_url, duration}."""
+
+    def __init__(self, game_id: str, lines: list[BankLine]):
+        self.game_id = game_id
+        self.lines = lines
+        self.entries: dict[str, dict] = {}
+        self._by_text: dict[tuple[str, float, str], str] = {}
+        self.task: asyncio.Task | None = None
+        self.stats = {"lines": len(lines), "rendered": 0, "failed": 0, "hits": 0, "render_sec": 0.0}
+
+    @property
+    def ready(self) -> bool:
+        return self.task is not None and self.task.done()
+
+    def lookup(self, text: str, voice: str, speed: float) -> tuple[str, float] | None:
+        key = self._by_text.get(_text_key(text, voice, speed))
+        if key is None:
+            return None
+        self.stats["hits"] += 1
+        entry = self.entries[key]
+        return entry["audio_url"], entry["duration"]
+
+    def line(self, key: str) -> dict | None:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+        return entry
+
+    async def render(self, synthesize: Synthesize) -> None:
+        set_game(self.game_id)
+        start = time.perf_counter()
+        sem = asyncio.Semaphore(PRERENDER_CONCURRENCY)
+
+        async def _one(line: BankLine) -> None:
+            async with sem, lane("summary"):
+                url, duration = await synthesize(line.text, voice=line.voice, speed=line.speed)
+            if not url:
+                self.stats["failed"] += 1
+                return
+            self.entries[line.key] = {
+                "text": line.text, "voice": line.voice, "speed": line.speed,
+                "audio_url": url, "duration": duration,
+            }
+            self._by_text[_text_key(line.text, line.voice, line.speed)] = line.key
+            self.stats["rendered"] += 1
+
+        await asyncio.gather(*(_one(line) for line in self.lines), return_exceptions=True)
+        self.stats["render_sec"] = round(time.perf_counter() - start, 2)
+        db.update(GAMES, self.game_id, {"audio_bank": dict(self.entries)})
+        logger.warning(
+            f"[AUDIO-BANK] {self.game_id}: {self.stats['rendered']}/{self.stats['lines']} lines "
+            f"in {self.stats['render_sec']}s"
+        )
+
+    def metrics(self) -> dict:
+        return {**self.stats, "ready": self.ready}
+
+
+# ── Registry ────────────────────────────────────────
+_banks: dict[str, AudioBank] = {}
+
+
+def start(game_id: str, lines: list[BankLine], synthesize: Synthesize) -> AudioBank:
+    """Oyun icin on-sentezi arka planda baslat (varsa eskisini durdur)."""
+    stop(game_id)
+    bank = AudioBank(game_id, lines)
+    bank.task = asyncio.create_task(bank.render(synthesize))
+    _banks[game_id] = bank
+    return bank
+
+
+def get(game_id: str) -> AudioBank | None:
+    return _banks.get(game_id)
+
+
+def lookup(game_id: str | None, text: str, voice: str, speed: float) -> tuple[str, float] | None:
+    bank = _banks.get(game_id) if game_id else None
+    return bank.lookup(text, voice, speed) if bank else None
+
+
+def line(game_id: str, key: str) -> dict | None:
+    bank = _banks.get(game_id)
+    return bank.line(key) if bank else None
+
+
+def stop(game_id: str) -> dict:
+    """Bankayi birak (yarim kalan on-sentez iptal), son metrikleri dondur."""
+    bank = _banks.pop(game_id, None)
+    if bank is None:
+        return {}
+    if bank.task is not None and not bank.task.done():
+        bank.task.cancel()
+    return bank.metrics()
+
+
+def all_metrics() -> dict:
+    return {game_id: bank.metrics() for game_id, bank in _banks.items()}
@@ -12,6 +12,11 @@ class Settings(BaseSettings):
     # ═══════════════════════════════════════════════════
     CHARACTER_API_URL: str = "http://localhost:9000"
     CHARACTER_API_KEY: str = "demo-key-123"
+    CHARACTER_API_HTTP2: bool = False  # h2 paketi kuruluysa HTTP/2 multiplexing
+    # Endpoint ailesi basina max baglanti — orn. '{"llm": 64, "images": 4}'
+    CHARACTER_API_POOL_LIMITS: dict[str, int] = {}
+    # Provider scheduler baslangic concurrency'si — orn. '{"llm": 32, "voice": 16}'
+    PROVIDER_CONCURRENCY: dict[str, int] = {}
     
     # ═══════════════════════════════════════════════════
     # Database Configuration
@@ -47,6 +52,7 @@ class Settings(BaseSettings):
     # ═══════════════════════════════════════════════════
     WS_HEARTBEAT_INTERVAL: int = 30  # saniye
     WS_MESSAGE_MAX_SIZE: int = 10000  # bytes
+    WS_BINARY_AUDIO: bool = True  # istemci audio_mode=binary ile sesi binary frame olarak alabilir
     
     # ═══════════════════════════════════════════════════
     # CORS Configuration
@@ -12,4 +12,15 @@ def init_fal():
     configure(
         api_url=settings.CHARACTER_API_URL,
         api_key=settings.CHARACTER_API_KEY,
+        http2=settings.CHARACTER_API_HTTP2,
+        pool_limits=settings.CHARACTER_API_POOL_LIMITS,
     )
+
+    from src.services import scheduler
+    scheduler.configure(settings.PROVIDER_CONCURRENCY)
+
+
+async def close_api_client():
+    """Character AI API connection pool'unu kapat. App shutdown'da cagirilir."""
+    from src.services.api_client import aclose
+    await aclose()
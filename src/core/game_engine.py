@@ -79,6 +79,7 @@ from game import (
     orchestrator_pick,
     check_moderation,
     # Constants
+    DIEGETIC_MESSAGES,
     MAX_CAMPFIRE_TURNS,
     INITIAL_CAMPFIRE_TURNS,
     FREE_ROAM_ROUNDS,
@@ -91,6 +92,7 @@ from game import (
 # DATABASE IMPORTS
 # ═══════════════════════════════════════════════════
 from src.core.database import db, GAMES
+from src.core import audio_bank
 from src.services.api_client import generate_background
 
 
@@ -149,6 +151,7 @@ async def create_new_game(
     player_count: int = 6,
     ai_count: int = 4,
     day_limit: int = 5,
+    orchestrator_mode: str | None = None,
 ) -> dict:
     """
     Yeni oyun oluştur ve database'e kaydet.
@@ -161,6 +164,7 @@ async def create_new_game(
         player_count: Toplam oyuncu sayısı (AI + İnsan)
         ai_count: AI oyuncu sayısı
         day_limit: Maximum gün limiti
+        orchestrator_mode: Konuşmacı seçimi ("local" | "llm" | "hybrid"), None = varsayılan
         
     Returns:
         dict: {
@@ -196,6 +200,8 @@ async def create_new_game(
         raise ValueError("En az 1 AI oyuncu olmalı")
     if day_limit < 1:
         raise ValueError("Gün limiti en az 1 olmalı")
+    if orchestrator_mode not in (None, "local", "llm", "hybrid"):
+        raise ValueError(f"Gecersiz orchestrator_mode: {orchestrator_mode}")
     
     # ═══ 3. World Seed Üret (Deterministik) ═══
     """
@@ -218,6 +224,7 @@ async def create_new_game(
             "player_count": player_count,
             "ai_count": ai_count,
             "day_limit": day_limit,
+            "orchestrator_mode": orchestrator_mode,
         },
         "state": None,  # Oyun başlayınca dolar
         "winner": None,
@@ -225,6 +232,15 @@ async def create_new_game(
     }
     
     db.insert(GAMES, game_id, game_data)
+
+    # ═══ 5. Ses Bankası (arka plan) ═══
+    # Anlatilan rituel / moderasyon / beraberlik satirlari oyun baslamadan sentezlenir
+    from src.core.game_loop import _generate_audio_url
+    audio_bank.start(
+        game_id,
+        audio_bank.bank_lines(game_data["world_seed"], DIEGETIC_MESSAGES),
+        _generate_audio_url,
+    )
     
     print(f"✅ Oyun oluşturuldu: {game_id}")
     print(f"   Köy: {world_seed.place_variants.settlement_name}")
@@ -370,6 +386,8 @@ async def start_game(game_id: str) -> dict:
 
     # Arka planlari state'e ekle
     state["scene_backgrounds"] = scene_backgrounds
+    if config.get("orchestrator_mode"):
+        state["orchestrator_mode"] = config["orchestrator_mode"]
 
     # ═══ 6. Database Güncelle ═══
     """
@@ -13,22 +13,28 @@ Akis:
           - Campfire tartismasi (sadece orada olanlar)
           - Oda gorusmeleri (1v1, unicast)
        c. Closing Campfire (CLOSING_CAMPFIRE_TURNS)
-    3. CAMPFIRE SUMMARY — summarize_campfire()
+    3. CAMPFIRE SUMMARY — rolling summary'den round ozeti (summarizer)
     4. VOTE — Her oyuncu oy verir → broadcast exile
     5. WIN CHECK → broadcast game_over veya sonraki gune gec
 """
 
 import asyncio
+import copy
 import logging
 import random as random_module
+import time as _time_mod
 import uuid as _uuid
-from typing import Dict, Optional, Any
+from typing import Awaitable, Callable, Dict, Optional, Any
 from collections import Counter
+from dataclasses import dataclass
 import sys
 from pathlib import Path
 
-from src.apps.ws.service import manager
+from src.apps.ws.service import manager, pack_audio_frame
+from src.core import audio_bank, pacing, speech_replay, summarizer
 from src.core.database import db, GAMES, GAME_LOGS
+from src.services import prompt_cache
+from src.services.scheduler import lane
 
 logger = logging.getLogger(__name__)
 
@@ -57,45 +63,20 @@ def _clean_text_for_tts(text: str) -> str:
 _tts_path_added = False
 
 
-def _split_sentences(text: str) -> list[str]:
-    """Metni cumlelere bol. Kisa cumleleri birlestir."""
-    # Split on sentence-ending punctuation
-    parts = _re.split(r'(?<=[.!?…])\s+', text.strip())
-    parts = [p.strip() for p in parts if p.strip()]
-    if not parts:
-        return [text.strip()] if text.strip() else []
-
-    # Merge very short fragments (< 20 chars) with the next sentence
-    merged = []
-    buf = ""
-    for p in parts:
-        if buf:
-            buf += " " + p
-            if len(buf) >= 20:
-                merged.append(buf)
-                buf = ""
-        elif len(p) < 20 and p != parts[-1]:
-            buf = p
-        else:
-            merged.append(p)
-    if buf:
-        if merged:
-            merged[-1] += " " + buf
-        else:
-            merged.append(buf)
-
-    return merged
-
-
 async def _generate_audio_url(
     content: str,
     voice: str = "alloy",
     speed: float = 1.0,
+    game_id: str | None = None,
 ) -> tuple[str | None, float]:
     """TTS uret, (audio_url, duration_sec) don. Hata → (None, 0).
     B2B API sync endpoint kullanir — job poll yok, direkt sonuc.
+    game_id verilirse once oyunun ses bankasina bakar (on-sentezli satir → TTS yok).
     voice: 'alloy' | 'zeynep' | 'ali'
     """
+    banked = audio_bank.lookup(game_id, content, voice, speed)
+    if banked is not None:
+        return banked
     try:
         global _tts_path_added
         if not _tts_path_added:
@@ -114,42 +95,6 @@ async def _generate_audio_url(
         return None, 0.0
 
 
-async def _generate_audio_parallel(
-    content: str,
-    voice: str = "alloy",
-    speed: float = 1.0,
-) -> list[tuple[str | None, float]]:
-    """Metni 2 parcaya bolup paralel TTS uret. [(url, duration), ...] dondurur.
-    Max 2 segment — daha fazlasi ses karismasi yapiyor.
-    """
-    clean = _clean_text_for_tts(content)
-    if not clean or len(clean) < 3:
-        return [(None, 0.0)]
-
-    # Kisa metinleri bolme — tek TTS yeterli
-    if len(clean) < 100:
-        result = await _generate_audio_url(content, voice=voice, speed=speed)
-        return [result]
-
-    sentences = _split_sentences(clean)
-    if len(sentences) <= 1:
-        result = await _generate_audio_url(content, voice=voice, speed=speed)
-        return [result]
-
-    # Max 2 gruba bol (ses karismasi onleme)
-    mid = len(sentences) // 2
-    group1 = " ".join(sentences[:mid])
-    group2 = " ".join(sentences[mid:])
-    chunks = [group1, group2]
-
-    # Paralel TTS — 2 parca concurrent
-    import asyncio as _aio
-    tasks = [_generate_audio_url(s, voice=voice, speed=speed) for s in chunks]
-    results = await _aio.gather(*tasks)
-    logger.warning(f"[TTS-PARALLEL] 2 groups from {len(sentences)} sentences, chars={[len(s) for s in chunks]}")
-    return list(results)
-
-
 async def _rewrite_human_speech(text: str, character, state: dict) -> str:
     """Insan metnini direkt dondur — rewrite yok, STT → TTS direkt."""
     return text
@@ -197,6 +142,835 @@ async def _generate_and_broadcast_audio(
         })
 
 
+async def _narrate_banked(game_id: str, key: str, context: str = "narrator") -> None:
+    """Ses bankasindaki anlatici satirini yayinla — hazir degilse sessiz gec (TTS beklenmez)."""
+    entry = audio_bank.line(game_id, key)
+    if entry:
+        await manager.broadcast(game_id, {
+            "event": "speech_audio",
+            "data": {
+                "speaker": "Ocak Bekçisi",
+                "audio_url": entry["audio_url"],
+                "duration": entry["duration"],
+                "context": context,
+                "text": entry["text"],
+            }
+        })
+
+
+async def _narrate_warning(game_id: str, reason: str) -> None:
+    """Diegetik moderasyon uyarisinin sabit kismini (Ocak Yemini titredi...) seslendir."""
+    bank = audio_bank.get(game_id)
+    if bank is None:
+        return
+    for line in bank.lines:
+        if line.key.startswith("moderator.") and reason.startswith(line.text):
+            await _narrate_banked(game_id, line.key, context="moderator")
+            return
+
+
+# ═══════════════════════════════════════════════════
+# Streaming Speech — LLM token → cumle → TTS → speech_audio
+# ═══════════════════════════════════════════════════
+
+STREAMING_SPEECH = True
+
+# Cumle sonu: noktalama (+ kapanan tirnak/parantez) ve ardindan bosluk
+_SENTENCE_END_RE = _re.compile(r'[.!?…]+["\'”’)\]]*\s+')
+# Segment boyu: ilk segment kisa (ilk ses erken calsin), sonrakiler buyur —
+# onceki segment calarken sentezlenirler, az TTS cagrisi + daha az prozodi kirilmasi.
+# Cumle bu esikten kisaysa sonrakine eklenir; son eleman sonraki tum segmentler icin.
+SEGMENT_MIN_CHARS = (20, 60, 120)
+TTS_SEGMENT_CONCURRENCY = 3  # konusma basina ayni anda sentezlenen segment
+STITCH_REPLAY = False  # True: cok segmentli konusmalar replay icin tek dosyaya dikilir
+PCM_BYTES_PER_SEC = 32000  # api tts_stream: 16kHz mono PCM16 (binary ses modu)
+CAPTION_FRAME_SEC = 0.05  # canli altyazi: token'lari ~50ms'lik frame'lerde birlestir
+
+
+def _is_balanced(text: str) -> bool:
+    """Acik kalan *sahne yonergesi*, (parantez) veya [tag] varsa cumleyi kesme."""
+    return (
+        text.count("*") % 2 == 0
+        and text.count("(") <= text.count(")")
+        and text.count("[") <= text.count("]")
+    )
+
+
+# Altyazi: TTS'e gitmeyen *sahne yonergesi*, [tag] ve kisa (parantez) ekranda da gorunmez
+_CAPTION_DIRECTION_RE = _re.compile(r'\*[^*]*\*|\[[^\]]*\]|\([^)]{1,50}\)')
+
+
+def _split_caption(text: str) -> tuple[str, str]:
+    """
+    Altyazi tamponunu (yayinlanabilir, bekleyen) diye bol: frame sinirinda acik
+    kalan *, [ veya kisa ( span'i kapanana kadar bekler. Uzun parantez sahne
+    yonergesi sayilmaz (_clean_text_for_tts ile ayni esik), beklemez.
+    """
+    star = square = paren = None
+    for i, ch in enumerate(text):
+        if ch == "*":
+            star = i if star is None else None
+        elif ch == "[" and square is None:
+            square = i
+        elif ch == "]":
+            square = None
+        elif ch == "(" and paren is None:
+            paren = i
+        elif ch == ")":
+            paren = None
+    if paren is not None and len(text) - paren > 51:
+        paren = None
+    cut = min((i for i in (star, square, paren) if i is not None), default=len(text))
+    return text[:cut], text[cut:]
+
+
+class _SpeechStream:
+    """
+    Tek bir konusmanin streaming TTS hatti.
+
+    feed(token) ile LLM token'lari gelir; bir cumle tamamlaninca TTS'i hemen
+    baslar (ilk segment kisa, sonrakiler SEGMENT_MIN_CHARS ile buyur; en fazla
+    TTS_SEGMENT_CONCURRENCY segment ayni anda sentezlenir). Segmentler hazir
+    oldukca SIRAYLA `speech_audio` (speech_id + segment) olarak yayinlanir —
+    ilk ses LLM bitmeden istemcide calar. Binary ses modundaki istemcilere
+    (manager.set_audio_mode) segment PCM'i sentez surerken binary frame
+    olarak itilir; onlara audio_url gonderilmez (stream ses vermeden
+    koparsa gonderilir).
+    captions=True iken token'lar ayrica speech_start / speech_token /
+    speech_end ile canli altyazi olarak gider. Altyazi frame'lerinden de
+    *sahne yonergesi* / [tag] / (kisa parantez) ayiklanir, TTS'teki gibi.
+    Not: stream edilen konusma _sanitize_speech ve moderasyon gate()'inden
+    ONCE yayinlanir — altyazi ve ilk ses segmentleri moderasyonu beklemez.
+    Grace icinde gelen red stream'i iptal eder (speech_end cancelled),
+    sonradan gelen red _TurnChecks retract / annotate ile isler.
+    end(content) altyaziyi final metinle kapatir, close() kalan metni TTS'e
+    flush eder, wait() tum segmentleri bekler.
+    """
+
+    def __init__(
+        self,
+        game_id: str,
+        speaker: str,
+        context: str = "campfire",
+        voice: str = "alloy",
+        speed: float = 1.0,
+        role_title: str = "",
+        captions: bool = True,
+    ):
+        self.game_id = game_id
+        self.speaker = speaker
+        self.role_title = role_title
+        self.context = context
+        self.voice = voice
+        self.speed = speed
+        self.captions = captions
+        self.speech_id = _uuid.uuid4().hex[:12]
+        self.segments: list[tuple[str | None, float]] = []
+        self.segment_chars: list[int] = []  # TTS'e giden segment uzunluklari (sirayla)
+        self.started_at = _time_mod.perf_counter()
+        self.first_token_at: float | None = None
+        self.first_audio_at: float | None = None
+        self.published = 0  # yayinlanan speech_audio segment sayisi (ack seq'i)
+        self.binary_frames = 0  # binary dinleyicilere itilen PCM frame sayisi (frame seq'i)
+        self.tokens = 0
+        self._buf = ""
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._tts_sem = asyncio.Semaphore(TTS_SEGMENT_CONCURRENCY)
+        self._pcm_segments: list[bytes | None] = []  # STITCH_REPLAY icin segment PCM'leri
+        self._publisher: asyncio.Task | None = None
+        self._closed = False
+        self._caption_buf = ""
+        self._caption_seq = 0
+        self._caption_task: asyncio.Task | None = None
+
+    @classmethod
+    def for_player(
+        cls, game_id: str, player, context: str = "campfire", captions: bool = True,
+    ) -> "_SpeechStream":
+        return cls(
+            game_id, player.name, context,
+            voice=getattr(player, "voice_id", "alloy"),
+            speed=getattr(player, "voice_speed", 1.0),
+            role_title=getattr(player, "role_title", ""),
+            captions=captions,
+        )
+
+    # ── Public ──
+    async def feed(self, token: str) -> None:
+        """LLM token'i (veya hazir metin) ekle."""
+        if self._closed:
+            return
+        self.tokens += 1
+        if self.first_token_at is None:
+            self.first_token_at = _time_mod.perf_counter()
+            if self.captions:
+                await self._send("speech_start", {
+                    "speech_id": self.speech_id,
+                    "speaker": self.speaker,
+                    "role_title": self.role_title,
+                    "context": self.context,
+                })
+        if self.captions:
+            self._caption_buf += token
+            if self._caption_task is None:
+                self._caption_task = asyncio.create_task(self._flush_captions_later())
+        self.add_text(token)
+
+    def add_text(self, text: str) -> None:
+        """Metni TTS hattina ekle (altyazi yok) — hazir metinler icin."""
+        if self._closed:
+            return
+        self._buf += text
+        self._cut_sentences()
+
+    def add_ready(self, url: str | None, duration: float) -> None:
+        """Onceden sentezlenmis sesi (orn. spekulatif tur) siradaki segment yap."""
+        if self._closed:
+            return
+        fut = asyncio.get_running_loop().create_future()
+        fut.set_result((url, duration))
+        self._pending.put_nowait((fut, None))
+        self._ensure_publisher()
+
+    async def end(self, content: str, cancelled: bool = False) -> None:
+        """Altyaziyi kapat (speech_end + final metin) ve kalan metni TTS'e ver."""
+        if self.captions and self.first_token_at is not None:
+            if self._caption_task is not None and not cancelled:
+                try:
+                    await self._caption_task
+                except asyncio.CancelledError:
+                    pass
+            if not cancelled:
+                await self._flush_captions(final=True)
+            await self._send("speech_end", {
+                "speech_id": self.speech_id,
+                "speaker": self.speaker,
+                "content": content,
+                "cancelled": cancelled,
+            })
+        self.captions = False
+        if not cancelled:
+            self.close()
+
+    def close(self) -> None:
+        """Metin bitti — kalan kismi son segment olarak TTS'e ver."""
+        if self._closed:
+            return
+        self._closed = True
+        rest, self._buf = self._buf.strip(), ""
+        if rest:
+            self._submit(rest)
+        self._ensure_publisher()
+        self._pending.put_nowait(None)
+
+    async def wait(self) -> dict:
+        """Tum segmentler uretilip yayinlanana kadar bekle."""
+        self.close()
+        if self._publisher is not None:
+            try:
+                await self._publisher
+            except asyncio.CancelledError:
+                pass
+        return self.summary()
+
+    def abort(self) -> None:
+        """Konusma iptal (interrupt / moderasyon) — bekleyen TTS'leri birak."""
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        if self._publisher:
+            self._publisher.cancel()
+        if self._caption_task:
+            self._caption_task.cancel()
+
+    @property
+    def audio_duration(self) -> float:
+        return sum(d for _, d in self.segments)
+
+    def playback_wait(self) -> float:
+        """Istemcide kalan calma suresi + 1s nefes; ses yoksa 3s."""
+        if self.first_audio_at is None or self.audio_duration <= 0:
+            return 3.0
+        remaining = self.first_audio_at + self.audio_duration - _time_mod.perf_counter()
+        return max(remaining, 0.0) + 1.0
+
+    def summary(self) -> dict:
+        def _since_start(t: float | None) -> int | None:
+            return round((t - self.started_at) * 1000) if t is not None else None
+
+        return {
+            "speech_id": self.speech_id,
+            "segments": sum(1 for u, d in self.segments if u or d),
+            "audio_duration": round(self.audio_duration, 2),
+            "first_token_ms": _since_start(self.first_token_at),
+            "first_audio_ms": _since_start(self.first_audio_at),
+            "tokens": self.tokens,
+            "caption_frames": self._caption_seq,
+            "segment_chars": list(self.segment_chars),
+            "binary_frames": self.binary_frames,
+        }
+
+    # ── Internal ──
+    async def _send(self, event: str, data: dict) -> None:
+        await manager.broadcast(self.game_id, {"event": event, "data": data})
+
+    async def _flush_captions_later(self) -> None:
+        await asyncio.sleep(CAPTION_FRAME_SEC)
+        self._caption_task = None
+        await self._flush_captions()
+
+    async def _flush_captions(self, final: bool = False) -> None:
+        if not self._caption_buf:
+            return
+        text, self._caption_buf = _split_caption(self._caption_buf)
+        if final:
+            # Hic kapanmayan span: yildiz atilir, metin kalir
+            text, self._caption_buf = text + self._caption_buf.replace("*", ""), ""
+        text = _CAPTION_DIRECTION_RE.sub("", text)
+        if not text:
+            return
+        self._caption_seq += 1
+        await self._send("speech_token", {
+            "speech_id": self.speech_id,
+            "seq": self._caption_seq,
+            "text": text,
+        })
+
+    def _cut_sentences(self) -> None:
+        search_from = 0
+        while True:
+            m = _SENTENCE_END_RE.search(self._buf, search_from)
+            if not m:
+                return
+            head = self._buf[:m.end()]
+            min_chars = SEGMENT_MIN_CHARS[min(len(self.segment_chars), len(SEGMENT_MIN_CHARS) - 1)]
+            if len(head.strip()) < min_chars or not _is_balanced(head):
+                search_from = m.end()
+                continue
+            self._buf = self._buf[m.end():]
+            search_from = 0
+            self._submit(head.strip())
+
+    def _submit(self, text: str) -> None:
+        text = _re.sub(r'\*[^*]+\*', '', text)  # sahne yonergesi seslendirilmez
+        if len(_clean_text_for_tts(text)) < 3:
+            return
+        self.segment_chars.append(len(text))
+        pcm: asyncio.Queue | None = None
+        listeners = manager.binary_audio_players(self.game_id)
+        if listeners and audio_bank.lookup(self.game_id, text, self.voice, self.speed) is None:
+            # Bankada yoksa PCM'i binary dinleyicilere sentez surerken it;
+            # url modunda dinleyici kaldiysa audio_url de uretilir.
+            pcm = asyncio.Queue()
+            want_url = len(listeners) < manager.get_connection_count(self.game_id)
+            task = asyncio.create_task(self._synthesize_pcm(text, pcm, want_url))
+        else:
+            task = asyncio.create_task(self._synthesize(text))
+        self._tasks.append(task)
+        self._pending.put_nowait((task, pcm))
+        self._ensure_publisher()
+
+    async def _synthesize(self, text: str) -> tuple[str | None, float]:
+        """Sinirli paralellik — task'lar metin sirasiyla olusur, slotu once erken segment alir."""
+        async with self._tts_sem:
+            return await _generate_audio_url(
+                text, voice=self.voice, speed=self.speed, game_id=self.game_id,
+            )
+
+    async def _synthesize_pcm(
+        self, text: str, pcm: asyncio.Queue, want_url: bool,
+    ) -> tuple[str | None, float]:
+        """
+        PCM chunk'larini geldikce kuyruga akit (None = segment bitti); istenirse
+        paralel audio_url. Stream hic PCM vermediyse audio_url'e duser — _push_pcm
+        bos doner, speech_audio binary dinleyicilere de gider.
+        """
+        from src.services.api_client import tts_stream
+
+        async with self._tts_sem:
+            url_task = asyncio.create_task(_generate_audio_url(
+                text, voice=self.voice, speed=self.speed, game_id=self.game_id,
+            )) if want_url else None
+            pcm_bytes = 0
+            try:
+                async for chunk in tts_stream(_clean_text_for_tts(text), speed=self.speed, voice=self.voice):
+                    pcm.put_nowait(chunk)
+                    pcm_bytes += len(chunk)
+            except asyncio.CancelledError:
+                if url_task is not None:
+                    url_task.cancel()
+                raise
+            except Exception as e:
+                logger.warning(f"TTS stream failed: {e}")
+            finally:
+                pcm.put_nowait(None)
+            if url_task is None and not pcm_bytes:
+                url_task = asyncio.create_task(_generate_audio_url(
+                    text, voice=self.voice, speed=self.speed, game_id=self.game_id,
+                ))
+            url, duration = await url_task if url_task is not None else (None, 0.0)
+            return url, duration or pcm_bytes / PCM_BYTES_PER_SEC
+
+    def _ensure_publisher(self) -> None:
+        if self._publisher is None:
+            self._publisher = asyncio.create_task(self._publish())
+
+    async def _publish(self) -> None:
+        """TTS'ler paralel calisir ama segmentler metin sirasiyla yayinlanir."""
+        while True:
+            item = await self._pending.get()
+            if item is None:
+                self._schedule_replay()
+                return
+            task, pcm = item
+            pushed_to = await self._push_pcm(pcm) if pcm is not None else None
+            url, duration = await task
+            self.segments.append((url, duration))
+            if not url and not pushed_to:
+                continue
+            if self.first_audio_at is None:
+                self.first_audio_at = _time_mod.perf_counter()
+            if url:
+                await manager.broadcast(self.game_id, {"event": "speech_audio", "data": {
+                    "speaker": self.speaker,
+                    "audio_url": url,
+                    "duration": duration,
+                    "context": self.context,
+                    "speech_id": self.speech_id,
+                    "segment": self.published,
+                }}, exclude=pushed_to)
+            self.published += 1
+
+    async def _push_pcm(self, pcm: asyncio.Queue) -> list[str]:
+        """
+        Segmentin PCM'ini sentez surerken binary dinleyicilere it (sirayla —
+        sonraki segmentler bu sirada kuyrukta birikir), son frame'i final
+        isaretiyle kapat. Donen: PCM alan oyuncular (audio_url'den hariç tutulur).
+        """
+        players = manager.binary_audio_players(self.game_id)
+        parts: list[bytes] = []
+        sent = 0
+        while True:
+            chunk = await pcm.get()
+            if chunk is None:
+                break
+            if self.first_audio_at is None:
+                self.first_audio_at = _time_mod.perf_counter()
+            if STITCH_REPLAY:
+                parts.append(chunk)
+            await manager.send_audio(self.game_id, players, pack_audio_frame(
+                self.speech_id, self.published, self.binary_frames, chunk,
+            ))
+            self.binary_frames += 1
+            sent += 1
+        self._pcm_segments.append(b"".join(parts) if parts else None)
+        if not sent or not players:
+            return []
+        await manager.send_audio(self.game_id, players, pack_audio_frame(
+            self.speech_id, self.published, self.binary_frames, final=True,
+        ))
+        self.binary_frames += 1
+        return players
+
+    def _schedule_replay(self) -> None:
+        if not STITCH_REPLAY:
+            return
+        voiced = [(url, d) for url, d in self.segments if url or d]
+        if len(voiced) < 2:
+            return
+        if len(self._pcm_segments) == len(self.segments) and all(self._pcm_segments):
+            speech_replay.schedule(
+                self.game_id, self.speech_id, self.speaker, [], self.audio_duration,
+                pcm=list(self._pcm_segments),
+            )
+        elif all(url for url, _ in voiced):
+            speech_replay.schedule(
+                self.game_id, self.speech_id, self.speaker, [url for url, _ in voiced], self.audio_duration,
+            )
+
+
+async def _finish_speech_stream(stream: _SpeechStream) -> float:
+    """Stream'i kapat, kalan segmentleri bekle, logla. Playback bekleme suresini dondur."""
+    info = await stream.wait()
+    logger.warning(
+        f"[STREAM] {stream.speaker}: first_token={info['first_token_ms']}ms "
+        f"first_audio={info['first_audio_ms']}ms segs={info['segments']} "
+        f"audio={info['audio_duration']}s chars={info['segment_chars']} "
+        f"frames={info['caption_frames']}/{info['tokens']} tokens"
+    )
+    return stream.playback_wait()
+
+
+def _text_speech_stream(
+    game_id: str,
+    player,
+    text: str,
+    context: str = "campfire",
+    ready_audio: tuple[str | None, float] | None = None,
+) -> _SpeechStream:
+    """
+    Metni zaten hazir konusma (human, spekulatif tur, non-streaming AI) icin
+    stream. TTS arka planda baslar; cagiran metni HEMEN yayinlar, ses ayni
+    speech_id ile speech_audio olarak arkadan gelir.
+    """
+    stream = _SpeechStream.for_player(game_id, player, context=context, captions=False)
+    if ready_audio is not None:
+        stream.add_ready(*ready_audio)
+    else:
+        stream.add_text(text)
+    stream.close()
+    return stream
+
+
+def _pipeline_metrics(stream: _SpeechStream, turn_start: float, llm_ms: float, message: str) -> dict:
+    """
+    campfire_speech icin latency ozeti. first_audio_ms tur basindan ilk sese
+    (metin yayinlandiginda ses henuz cikmadiysa None); tts_ms metnin ustune
+    eklenen ses gecikmesi — streaming'de ses metinden once cikarsa 0.
+    """
+    first_audio_ms = (
+        (stream.first_audio_at - turn_start) * 1000
+        if stream.first_audio_at is not None else None
+    )
+    tts_ms = max(0.0, first_audio_ms - llm_ms) if first_audio_ms is not None else 0.0
+    return {
+        "llm_ms": round(llm_ms),
+        "tts_ms": round(tts_ms),
+        "total_ms": round(llm_ms + tts_ms),
+        "text_len": len(message),
+        "voice": stream.voice,
+        "first_audio_ms": round(first_audio_ms) if first_audio_ms is not None else None,
+    }
+
+
+async def _abort_speech_stream(game_id: str, stream: _SpeechStream) -> None:
+    """Yayindaki stream'i iptal et; altyaziyi kaldir, ses baslamissa istemcilere durdur de."""
+    stream.abort()
+    await stream.end("", cancelled=True)
+    if stream.first_audio_at is not None:
+        await manager.broadcast(game_id, {
+            "event": "speech_interrupted",
+            "data": {"speech_id": stream.speech_id},
+        })
+
+# ═══════════════════════════════════════════════════
+# HELPER: Pipelined Turn Checks (moderasyon + ocak tepki)
+# ═══════════════════════════════════════════════════
+
+MODERATION_GRACE_SEC = 0.25   # metni yayinlamadan once moderasyona taninan sure
+MODERATION_COMMIT_SEC = 4.0   # sonraki konusma uretilmeden gec moderasyonu bekleme siniri
+CHECK_DRAIN_SEC = 8.0         # campfire biterken yolda kalan kontrolleri bekleme siniri
+
+# game_id → check → {runs, total_ms, max_ms, blocking_ms, errors, rejected, late_fail, retracted, annotated}
+_check_metrics: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+
+def _record_check(game_id: str, check: str, **values: float) -> None:
+    m = _check_metrics.setdefault(game_id, {}).setdefault(check, {
+        "runs": 0, "total_ms": 0.0, "max_ms": 0.0, "blocking_ms": 0.0, "errors": 0,
+        "rejected": 0, "late_fail": 0, "retracted": 0, "annotated": 0,
+    })
+    latency_ms = values.pop("latency_ms", None)
+    if latency_ms is not None:
+        m["runs"] += 1
+        m["total_ms"] += latency_ms
+        m["max_ms"] = max(m["max_ms"], latency_ms)
+    for key, value in values.items():
+        m[key] += value
+
+
+def get_check_metrics(game_id: str) -> dict:
+    """Kontrol basina latency, konusmayi bloklayan kisim ve gec red sonuclari."""
+    m = _check_metrics.get(game_id)
+    if not m:
+        return {}
+    return {
+        check: {
+            "runs": int(c["runs"]),
+            "avg_ms": round(c["total_ms"] / c["runs"]) if c["runs"] else 0,
+            "max_ms": round(c["max_ms"]),
+            "blocking_ms": round(c["blocking_ms"]),
+            "hidden_ms": round(max(0.0, c["total_ms"] - c["blocking_ms"])),
+            **{k: int(c[k]) for k in ("errors", "rejected", "late_fail", "retracted", "annotated")},
+        }
+        for check, c in m.items()
+    }
+
+
+def _speech_entry(speaker, message: str, participant_names: list[str]) -> tuple[dict, bool]:
+    """
+    Konusmanin history kaydi + kaydedilsin mi. Stream'de tekrar tespit edilen
+    konusma (StreamedSpeech.duplicate) yayinlanir ama history'ye yazilmaz;
+    yarida kesilen konusma "truncated" ile yazilir (prompt'ta isaretli gorunur).
+    """
+    entry = {
+        "type": "speech", "name": speaker.name,
+        "role_title": speaker.role_title, "content": str(message),
+        "present": list(participant_names),
+    }
+    if getattr(message, "truncated", False):
+        entry["truncated"] = True
+    return entry, not getattr(message, "duplicate", False)
+
+
+class _TurnChecks:
+    """
+    Bir campfire konusmasinin moderasyon + ocak tepki kontrolleri.
+
+    Iki kontrol de uretim biter bitmez task olarak baslar; TTS, playback ve
+    siradaki turun tepki toplamasi ile paralel calisir. Kurallar:
+      - gate(): moderasyon MODERATION_GRACE_SEC icinde reddederse konusma hic
+        yayinlanmaz (eski akis).
+      - Yayindan sonra gelen red, tur commit edilmeden (siradaki konusma
+        uretilmeden) once geldiyse RETRACT: ses durur, speech_retracted,
+        history'deki konusma yerinde moderator kaydiyla degisir.
+      - commit()'ten sonra gelen red ANNOTATE: konusma kalir, moderated
+        isaretlenir, speech_annotated + moderator kaydi.
+      - Ocak tepki, moderasyon gecip playback bitince yayinlanir; siradaki
+        turu beklemez.
+    """
+
+    def __init__(
+        self,
+        game_id: str,
+        state: Any,
+        speaker,
+        message: str,
+        participant_names: list[str],
+        check_moderation=None,
+        check_ocak_tepki=None,
+        state_lock: asyncio.Lock | None = None,
+    ):
+        self.game_id = game_id
+        self.state = state
+        self.speaker = speaker
+        self.message = message
+        self.participant_names = list(participant_names)
+        self.stream: _SpeechStream | None = None
+        self.entry: dict | None = None
+        self.committed = False
+        self.retracted = False
+        self._lock = state_lock
+        self._playback_done = asyncio.Event()
+        self._resolved = asyncio.Event()
+        self._watcher: asyncio.Task | None = None
+        self._moderation = self._spawn(
+            "moderation", check_moderation(speaker.name, message, state.get("world_seed")),
+        ) if check_moderation else None
+        self._tepki = self._spawn(
+            "ocak_tepki", check_ocak_tepki(speaker.name, message, state),
+        ) if check_ocak_tepki else None
+
+    # ── Public ──
+    async def gate(self) -> tuple[bool, str]:
+        """Yayin oncesi kisa bekleme. Grace icinde red gelirse (False, reason)."""
+        if self._moderation is None:
+            return True, ""
+        start = _time_mod.perf_counter()
+        await asyncio.wait({self._moderation}, timeout=MODERATION_GRACE_SEC)
+        _record_check(self.game_id, "moderation", blocking_ms=(_time_mod.perf_counter() - start) * 1000)
+        if not self._moderation.done():
+            return True, ""
+        ok, reason = await self._verdict()
+        if not ok:
+            _record_check(self.game_id, "moderation", rejected=1)
+            self.cancel()
+            self._drop_tepki()
+        return ok, reason
+
+    def published(self, stream: _SpeechStream, entry: dict) -> None:
+        """Konusma yayinlandi — gec moderasyon ve tepki izleyicisini baslat."""
+        self.stream = stream
+        self.entry = entry
+        self._watcher = asyncio.create_task(self._watch())
+
+    def playback_done(self) -> None:
+        self._playback_done.set()
+
+    async def commit(self, timeout: float = MODERATION_COMMIT_SEC) -> bool:
+        """
+        Siradaki konusmadan once cagrilir. Moderasyon en fazla timeout kadar
+        beklenir; bundan sonraki red annotate olur. Konusma geri cekildiyse False.
+        """
+        if not self.committed and self._watcher is not None:
+            start = _time_mod.perf_counter()
+            try:
+                await asyncio.wait_for(self._resolved.wait(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"[CHECKS] {self.speaker.name}: moderation still pending, committing")
+            _record_check(self.game_id, "moderation", blocking_ms=(_time_mod.perf_counter() - start) * 1000)
+        self.committed = True
+        return not self.retracted
+
+    async def drain(self, timeout: float = CHECK_DRAIN_SEC) -> None:
+        """Campfire sonu — yolda kalan moderasyon / tepki sonucunu bekle, kalani birak."""
+        self.playback_done()
+        await self.commit()
+        if self._watcher is not None:
+            await asyncio.wait({self._watcher}, timeout=timeout)
+        self.cancel()
+
+    def cancel(self) -> None:
+        for task in (self._watcher, self._moderation, self._tepki):
+            if task is not None and not task.done():
+                task.cancel()
+
+    # ── Internal ──
+    def _spawn(self, check: str, coro) -> asyncio.Task:
+        async def _timed():
+            start = _time_mod.perf_counter()
+            try:
+                result = await coro
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _record_check(self.game_id, check, errors=1)
+                raise
+            _record_check(self.game_id, check, latency_ms=(_time_mod.perf_counter() - start) * 1000)
+            return result
+        return asyncio.create_task(_timed())
+
+    async def _verdict(self) -> tuple[bool, str]:
+        try:
+            return await self._moderation
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[CHECKS] moderation failed for {self.speaker.name}, allowing: {e}")
+            return True, ""
+
+    async def _watch(self) -> None:
+        try:
+            if self._moderation is not None:
+                ok, reason = await self._verdict()
+                if not ok:
+                    _record_check(self.game_id, "moderation", late_fail=1)
+                    if self.committed:
+                        await self._annotate(reason)
+                    else:
+                        await self._retract(reason)
+                        return
+        finally:
+            self._resolved.set()
+
+        if self._tepki is None:
+            return
+        await self._playback_done.wait()
+        try:
+            tepki = await self._tepki
+        except Exception as e:
+            logger.warning(f"Ocak tepki check failed: {e}")
+            return
+        if tepki:
+            await self._emit_tepki(tepki)
+
+    async def _edit_history(self, fn) -> None:
+        if self._lock is None:
+            fn(self.state["campfire_history"])
+            return
+        async with self._lock:
+            fn(self.state["campfire_history"])
+
+    async def _retract(self, reason: str) -> None:
+        self.retracted = True
+        self._drop_tepki()
+        if self.stream is not None:
+            await _abort_speech_stream(self.game_id, self.stream)
+
+        moderator = {
+            "type": "moderator", "content": reason,
+            "present": list(self.participant_names),
+        }
+
+        def _replace(history: list) -> None:
+            # Yerinde degistir — index'ler (summary cursor) kaymasin
+            for i in range(len(history) - 1, -1, -1):
+                if history[i] is self.entry:
+                    history[i] = moderator
+                    return
+            history.append(moderator)
+
+        await self._edit_history(_replace)
+        chat = getattr(self.speaker, "chat_history", None)
+        if chat is not None:
+            for i in range(len(chat) - 1, -1, -1):
+                if chat[i].get("role") == "assistant" and chat[i].get("content") == self.message:
+                    del chat[i]
+                    break
+
+        _record_check(self.game_id, "moderation", retracted=1)
+        logger.warning(f"[CHECKS] {self.speaker.name}: speech retracted by late moderation")
+        await manager.broadcast(self.game_id, {
+            "event": "speech_retracted",
+            "data": {
+                "speech_id": self.stream.speech_id if self.stream else None,
+                "speaker": self.speaker.name,
+                "reason": reason,
+            },
+        })
+        await manager.broadcast(self.game_id, {
+            "event": "moderator_warning",
+            "data": {"speaker": self.speaker.name, "reason": reason},
+        })
+        await _narrate_warning(self.game_id, reason)
+
+    async def _annotate(self, reason: str) -> None:
+        if self.entry is not None:
+            self.entry["moderated"] = True
+        await self._edit_history(lambda history: history.append({
+            "type": "moderator", "content": reason,
+            "present": list(self.participant_names),
+        }))
+        _record_check(self.game_id, "moderation", annotated=1)
+        logger.warning(f"[CHECKS] {self.speaker.name}: late moderation, speech annotated")
+        await manager.broadcast(self.game_id, {
+            "event": "speech_annotated",
+            "data": {
+                "speech_id": self.stream.speech_id if self.stream else None,
+                "speaker": self.speaker.name,
+                "reason": reason,
+            },
+        })
+
+    async def _emit_tepki(self, tepki: dict) -> None:
+        await self._edit_history(lambda history: history.append({
+            "type": "narrator", "content": tepki["message"],
+        }))
+        await manager.broadcast(self.game_id, {
+            "event": "ocak_tepki",
+            "data": tepki,
+        })
+        # Kul Kaymasi ise ozel flash broadcast
+        if tepki.get("type") == "kul_kaymasi":
+            await manager.broadcast(self.game_id, {
+                "event": "kul_kaymasi",
+                "data": {
+                    "speaker": tepki["speaker"],
+                    "question": tepki.get("forced_question", ""),
+                },
+            })
+
+    def _drop_tepki(self) -> None:
+        """Konusma gecersiz — tepkiyi iptal et; kul kaymasi kuyruga girdiyse geri al."""
+        task = self._tepki
+        if task is None:
+            return
+        if not task.done():
+            task.cancel()
+            return
+        if task.cancelled() or task.exception() is not None:
+            return
+        tepki = task.result()
+        if tepki and tepki.get("type") == "kul_kaymasi":
+            queue = self.state.get("_kul_kaymasi_queue", [])
+            queue[:] = [
+                q for q in queue
+                if not (q.get("speaker") == tepki["speaker"] and q.get("question") == tepki.get("forced_question"))
+            ]
+
+
+
 # ═══════════════════════════════════════════════════
 # GLOBAL: Game-Specific Input Queues
 # ═══════════════════════════════════════════════════
@@ -239,6 +1013,62 @@ async def _interruptible_sleep(game_id: str, duration: float) -> bool:
         return False
 
 
+async def _await_playback(
+    game_id: str,
+    stream: _SpeechStream,
+    deadline: float,
+    interruptible: bool = True,
+) -> bool:
+    """
+    Konusma sesinin istemcilerde bitmesini bekle.
+    Dinleyiciler son segment icin audio_finished ack'i verince erken doner;
+    ses yayinlanmadiysa ack gelmeyecegi icin duz bekleme.
+    Returns True if interrupted.
+    """
+    if stream.published == 0:
+        if interruptible:
+            return await _interruptible_sleep(game_id, deadline)
+        await asyncio.sleep(deadline)
+        return False
+    if not interruptible:
+        await pacing.wait(
+            game_id, stream.speech_id, deadline,
+            min_seq=stream.published - 1, kind="audio_finished",
+        )
+        return False
+    return await _paced_wait(
+        game_id, stream.speech_id, deadline,
+        min_seq=stream.published - 1, kind="audio_finished",
+    )
+
+
+async def _paced_wait(
+    game_id: str,
+    event_id: str,
+    deadline: float,
+    min_seq: int = 0,
+    kind: str = "scene_ready",
+) -> bool:
+    """pacing.wait + human interrupt. Returns True if interrupted."""
+    event = get_interrupt_event(game_id)
+    if event.is_set():
+        event.clear()
+        return True
+    result = await pacing.wait(game_id, event_id, deadline, min_seq=min_seq, interrupt=event, kind=kind)
+    return result == "interrupt"
+
+
+async def _broadcast_scene(game_id: str, event: str, data: dict, hold: float) -> None:
+    """
+    Sahne event'ini event_id ile yayinla; istemciler scene_ready diyene kadar
+    (en fazla hold saniye, en az pacing.SCENE_MIN_HOLD_SEC) bekle. Eski sabit
+    sleep'lerin yerine gecer.
+    """
+    event_id = pacing.new_event_id()
+    await manager.broadcast(game_id, {"event": event, "data": {**data, "event_id": event_id}})
+    await pacing.wait(game_id, event_id, hold, min_hold=pacing.SCENE_MIN_HOLD_SEC)
+
+
 async def _race_ai_generation(game_id: str, coro) -> tuple:
     """Race an AI generation coroutine against human interrupt event.
     Returns (result, False) on normal completion, (None, True) if interrupted.
@@ -280,6 +1110,64 @@ async def _race_ai_generation(game_id: str, coro) -> tuple:
         return None, False
 
 
+# ═══════════════════════════════════════════════════
+# HELPER: Reaction Collection (batched + metrics)
+# ═══════════════════════════════════════════════════
+
+# game_id → {turns, players, provider_calls, total_ms}
+_reaction_metrics: Dict[str, Dict[str, float]] = {}
+
+
+def get_reaction_metrics(game_id: str) -> dict:
+    """Oyun icin reaction toplama metrikleri — batch'in kazandirdigi cagrilar."""
+    m = _reaction_metrics.get(game_id)
+    if not m:
+        return {}
+    return {
+        "turns": int(m["turns"]),
+        "provider_calls": int(m["provider_calls"]),
+        "calls_saved": int(m["players"] - m["provider_calls"]),
+        "avg_ms": round(m["total_ms"] / m["turns"]) if m["turns"] else 0,
+    }
+
+
+async def _collect_reactions(
+    game_id: str, state: Any, others: list, last_speech: dict,
+    get_reaction, get_reactions=None,
+) -> list[dict]:
+    """Tum AI katilimcilardan tepki topla. get_reactions varsa tek batch cagri."""
+    if not others:
+        return []
+    import time as _time
+    start = _time.perf_counter()
+    if get_reactions is not None:
+        try:
+            reactions, calls = await get_reactions(others, last_speech, state)
+        except Exception as e:
+            logger.warning(f"[REACTIONS] Batch failed, per-player fallback: {e}")
+            get_reactions = None
+    if get_reactions is None:
+        raw = await asyncio.gather(
+            *[get_reaction(p, last_speech, state) for p in others], return_exceptions=True,
+        )
+        reactions = [r for r in raw if isinstance(r, dict)]
+        calls = len(others)
+    elapsed_ms = (_time.perf_counter() - start) * 1000
+
+    m = _reaction_metrics.setdefault(
+        game_id, {"turns": 0, "players": 0, "provider_calls": 0, "total_ms": 0.0},
+    )
+    m["turns"] += 1
+    m["players"] += len(others)
+    m["provider_calls"] += calls
+    m["total_ms"] += elapsed_ms
+    logger.info(
+        f"[REACTIONS] {len(others)} players, {calls} calls, {elapsed_ms:.0f}ms "
+        f"(game saved {int(m['players'] - m['provider_calls'])} calls so far)"
+    )
+    return reactions
+
+
 def get_input_queue(game_id: str, player_id: str) -> asyncio.Queue:
     """
     Oyuncu icin input queue getir/olustur.
@@ -397,11 +1285,8 @@ async def _process_human_interjection(
     })
     human_player.add_message("assistant", message)
 
-    # TTS
-    audio_url, audio_duration = await _generate_audio_url(
-        message, voice=getattr(human_player, 'voice_id', 'alloy'),
-        speed=getattr(human_player, 'voice_speed', 1.0),
-    )
+    # TTS arka planda (cumle cumle) — metin hemen, ses speech_audio ile arkadan
+    stream = _text_speech_stream(game_id, human_player, message)
 
     # Broadcast
     await manager.broadcast(game_id, {
@@ -413,14 +1298,13 @@ async def _process_human_interjection(
             "turn": turns_done,
             "max_turns": max_turns,
             "participants": participant_names,
-            "audio_url": audio_url,
-            "audio_duration": audio_duration,
+            "speech_id": stream.speech_id,
         }
     })
 
-    # Wait for audio (interruptible)
-    wait_time = max(audio_duration + 1.0, 3.0) if audio_duration > 0 else 3.0
-    interrupted = await _interruptible_sleep(game_id, wait_time)
+    # Wait for audio (interruptible) — ilk speech_audio'dan itibaren kalan sure
+    wait_time = await _finish_speech_stream(stream)
+    interrupted = await _await_playback(game_id, stream, wait_time)
     if interrupted:
         logger.warning(f"[INTERRUPT] Human interjection audio wait interrupted")
 
@@ -482,6 +1366,283 @@ async def _wait_for_human_input(
             await asyncio.sleep(0.1)
 
 
+# ═══════════════════════════════════════════════════
+# PHASE DAG — bagimsiz faz adimlari paralel, yayin anlati sirasinda
+# ═══════════════════════════════════════════════════
+
+@dataclass
+class _PhaseStep:
+    """
+    Faz DAG'inin bir adimi. run(state) hesaplar (LLM), emit(result) yayinlar.
+    reads / writes: adimin dokundugu state anahtarlari — cakisma yoksa paralel.
+    prefetch: adim state kopyasi uzerinde onceden (bir onceki gece) calisabilir.
+    """
+    name: str
+    run: Callable[[Any], Awaitable[Any]]
+    emit: Optional[Callable[[Any], Awaitable[None]]] = None
+    reads: frozenset = frozenset()
+    writes: frozenset = frozenset()
+    prefetch: bool = False
+
+
+def _step_deps(steps: list[_PhaseStep]) -> list[list[int]]:
+    """Adim j, kendinden onceki i ile state cakismasi varsa (RAW / WAW / WAR) i'yi bekler."""
+    deps = []
+    for j, sj in enumerate(steps):
+        deps.append([
+            i for i, si in enumerate(steps[:j])
+            if si.writes & (sj.reads | sj.writes) or sj.writes & si.reads
+        ])
+    return deps
+
+
+async def _run_phase_dag(
+    game_id: str,
+    phase: str,
+    steps: list[_PhaseStep],
+    state: Any,
+    prefetcher: "_RoundPrefetcher | None" = None,
+) -> dict[str, Any]:
+    """
+    Adimlari bagimlilik grafina gore calistir.
+    Hesaplama: bagimsiz adimlar ayni anda baslar (duvar suresi ~ en yavas adim).
+    Onceden hazirlanmis (prefetch) ve hala gecerli sonuc varsa adim hic calismaz.
+    Yayin: her zaman liste sirasinda — adim k, hazir oldugunda ve k-1
+    yayinlandiktan sonra emit edilir. Hata veren adim None dondurur, digerlerini durdurmaz.
+    """
+    start = _time_mod.perf_counter()
+    deps = _step_deps(steps)
+    tasks: list[asyncio.Task] = []
+    durations: dict[str, float] = {}
+    done_at: list[float] = []
+
+    async def _run(i: int) -> Any:
+        step = steps[i]
+        if deps[i]:
+            await asyncio.gather(*(tasks[d] for d in deps[i]))
+        t0 = _time_mod.perf_counter()
+        try:
+            if prefetcher and step.prefetch:
+                hit, result = await prefetcher.take(step.name, state)
+                if hit:
+                    return result
+            return await step.run(state)
+        except Exception as e:
+            logger.warning(f"[DAG] {phase}/{step.name} failed: {e}")
+            return None
+        finally:
+            durations[step.name] = _time_mod.perf_counter() - t0
+            done_at.append(_time_mod.perf_counter())
+
+    for i in range(len(steps)):
+        tasks.append(asyncio.create_task(_run(i)))
+
+    results: dict[str, Any] = {}
+    try:
+        for step, task in zip(steps, tasks):
+            result = await task
+            results[step.name] = result
+            if result and step.emit:
+                try:
+                    await step.emit(result)
+                except Exception as e:
+                    logger.warning(f"[DAG] {phase}/{step.name} emit failed: {e}")
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    compute_wall = (max(done_at) - start) if done_at else 0.0
+    logger.warning(
+        f"[DAG] {phase}: compute {compute_wall:.1f}s (serial {sum(durations.values()):.1f}s), "
+        f"total {_time_mod.perf_counter() - start:.1f}s — "
+        + ", ".join(f"{k}={v:.1f}s" for k, v in durations.items())
+    )
+    return results
+
+
+_MORNING_SEED = frozenset({"round_number", "world_seed", "_day_omens"})
+
+
+def _morning_steps(
+    game_id: str,
+    *,
+    generate_sinama_event,
+    generate_morning_crisis,
+    generate_public_mini_event,
+    generate_spotlight_cards,
+    generate_omen_interpretations,
+    get_alive_players,
+) -> list[_PhaseStep]:
+    """run_morning sonrasi adimlar, anlati sirasinda."""
+
+    def scene(event: str, hold: float, wrap: Callable[[Any], dict] | None = None):
+        async def emit(result):
+            await _broadcast_scene(game_id, event, wrap(result) if wrap else result, hold=hold)
+        return emit
+
+    async def soz_borcu(state):
+        forced_speakers = state.get("_forced_speakers", [])
+        if not forced_speakers:
+            return None
+        state["_forced_speakers"] = []  # reset
+        return {"forced_speakers": forced_speakers, "damgali": state.get("_ocak_damgasi", [])}
+
+    async def omen_interpretation(state):
+        day_omens = state.get("_day_omens", [])
+        if not day_omens or state.get("round_number", 1) < 2:
+            return None
+        chosen_omen = day_omens[0]  # ilk alamet
+        # AI yorumlari — tek batch cagri
+        ai_interp_players = [p for p in get_alive_players(state) if not p.is_human]
+        if not ai_interp_players:
+            return None
+        ai_results = await generate_omen_interpretations(ai_interp_players, state, chosen_omen)
+        omen_interps = [
+            {"speaker": p.name, "text": interp}
+            for p, interp in zip(ai_interp_players, ai_results)
+            if isinstance(interp, str)
+        ]
+        if not omen_interps:
+            return None
+        return {
+            "omen": {"id": chosen_omen["id"], "label": chosen_omen["label"], "icon": chosen_omen["icon"]},
+            "interpretations": omen_interps,
+        }
+
+    return [
+        # Katman 1
+        _PhaseStep(
+            "sinama", generate_sinama_event, scene("sinama", 1.0),
+            reads=_MORNING_SEED, writes=frozenset({"_sinama"}), prefetch=True,
+        ),
+        # Katman 4
+        _PhaseStep(
+            "morning_crisis", generate_morning_crisis, scene("morning_crisis", 2.0),
+            reads=_MORNING_SEED | {"_ui_objects", "exiled_today", "_night_effects"},
+            writes=frozenset({"_ui_objects", "_public_canon", "_morning_crisis"}), prefetch=True,
+        ),
+        # Katman 2
+        _PhaseStep(
+            "mini_event", generate_public_mini_event, scene("mini_event", 1.0),
+            reads=_MORNING_SEED, writes=frozenset({"_mini_events"}), prefetch=True,
+        ),
+        # Katman 1
+        _PhaseStep(
+            "spotlight_cards", generate_spotlight_cards,
+            scene("spotlight_cards", 1.0, lambda cards: {"cards": cards}),
+            reads=_MORNING_SEED | {"players", "_spotlight_history"},
+            writes=frozenset({"_spotlight_cards", "_spotlight_history"}), prefetch=True,
+        ),
+        # Katman 4 — gun icinde dolan borc, onceden hesaplanmaz
+        _PhaseStep(
+            "soz_borcu", soz_borcu, scene("soz_borcu", 1.0),
+            reads=frozenset({"_forced_speakers", "_ocak_damgasi"}),
+            writes=frozenset({"_forced_speakers"}),
+        ),
+        # Katman 4
+        _PhaseStep(
+            "omen_interpretation", omen_interpretation, scene("omen_interpretation", 2.0),
+            reads=_MORNING_SEED | {"players", "_institution_visits"}, prefetch=True,
+        ),
+    ]
+
+
+# ═══════════════════════════════════════════════════
+# CROSS-PHASE PREFETCH — sonraki round'un sabahi gece uretilir
+# ═══════════════════════════════════════════════════
+
+# resolve_night_phase / resolve_omen_choice'in yazdiklari — bunlari okuyan
+# adimlar gece cozulene kadar baslatilmaz
+_NIGHT_WRITES = frozenset({
+    "_night_effects", "_ui_objects", "_kamu_baskisi", "_itibar_kirigi_target", "_chosen_omen",
+})
+
+
+def _alive_key(state: Any) -> tuple:
+    return tuple(p.name for p in state["players"] if p.alive)
+
+
+class _RoundPrefetcher:
+    """
+    Sonraki round'un sabah icerigini (duyuru, sinama, mini event, spotlight,
+    alamet yorumu, kriz) gece fazi sirasinda uretir.
+
+    Her is state'in sig bir kopyasinda (view) calisir: round_number yarin,
+    exiled_today None (loop gun gecisinde sifirlar), _day_omens yarinin
+    alametleri; adimin yazdigi anahtarlar derin kopyalanir, gercek state'e
+    dokunulmaz. Sabah take() girdiler hala ayniysa (round + hayattakiler)
+    yazilan anahtarlari state'e tasir; degilse isi iptal eder ve adim normal calisir.
+    """
+
+    def __init__(self, game_id: str, state: Any, round_n: int, day_omens: list[dict]):
+        self.game_id = game_id
+        self.round_n = round_n
+        self.day_omens = day_omens
+        self.alive = _alive_key(state)
+        self.started_at = _time_mod.perf_counter()
+        self.hits = 0
+        self.misses = 0
+        self._jobs: dict[str, tuple[asyncio.Task, dict, frozenset]] = {}
+
+    def start(self, name: str, state: Any, fn: Callable[[Any], Awaitable[Any]], writes: frozenset = frozenset()) -> None:
+        view = dict(state)
+        view["round_number"] = self.round_n
+        view["exiled_today"] = None
+        view["_day_omens"] = self.day_omens
+        prompt_cache.detach(view)
+        for key in writes:
+            if key in view:
+                view[key] = copy.deepcopy(view[key])
+
+        async def _job():
+            # Gecenin karar cagrilarinin onune gecmesin
+            async with lane("summary"):
+                return await fn(view)
+
+        self._jobs[name] = (asyncio.create_task(_job()), view, writes)
+
+    def start_steps(self, state: Any, steps: list[_PhaseStep], after_night: bool) -> None:
+        """Gece sonucuna bagli olmayan adimlari (after_night=False) veya kalanlari baslat."""
+        for step in steps:
+            if not step.prefetch or step.name in self._jobs:
+                continue
+            if bool(step.reads & _NIGHT_WRITES) == after_night:
+                self.start(step.name, state, step.run, step.writes)
+
+    def valid(self, state: Any) -> bool:
+        return state.get("round_number") == self.round_n and _alive_key(state) == self.alive
+
+    async def take(self, name: str, state: Any) -> tuple[bool, Any]:
+        """(hit, result). Gecersiz / hatali is → (False, None), adim normal calisir."""
+        job = self._jobs.pop(name, None)
+        if job is None:
+            return False, None
+        task, view, writes = job
+        if not self.valid(state):
+            task.cancel()
+            self.misses += 1
+            logger.warning(f"[PREFETCH] {name} invalidated (round {self.round_n})")
+            return False, None
+        try:
+            result = await task
+        except Exception as e:
+            self.misses += 1
+            logger.warning(f"[PREFETCH] {name} failed: {e}")
+            return False, None
+        for key in writes:
+            if key in view:
+                state[key] = view[key]
+        if writes:
+            prompt_cache.invalidate(state, *writes)
+        self.hits += 1
+        return True, result
+
+    def cancel(self) -> None:
+        for task, _, _ in self._jobs.values():
+            task.cancel()
+        self._jobs.clear()
+
+
 # ═══════════════════════════════════════════════════
 # MAIN: Game Loop Runner
 # ═══════════════════════════════════════════════════
@@ -492,6 +1653,10 @@ async def _game_loop_runner(game_id: str, state: Any):
     """
     logger.warning(f"🟢 GAME LOOP STARTING: {game_id}")
 
+    # Provider scheduler — bu task ve alt task'larin cagrilari bu oyuna yazilir
+    from src.services.scheduler import set_game
+    set_game(game_id)
+
     # ═══ Lazy Import Game Engine ═══
     try:
         sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src" / "prototypes"))
@@ -499,23 +1664,28 @@ async def _game_loop_runner(game_id: str, state: Any):
             Phase, get_alive_players, get_alive_names, find_player,
             check_win_condition, count_by_type,
         )
+        from campfire_index import CampfireHistory  # type: ignore
         from game import (  # type: ignore
-            run_morning, exile_player, summarize_campfire,
-            generate_campfire_speech, generate_vote,
+            prepare_morning, apply_morning, pick_day_omens,
+            exile_player,
+            generate_campfire_speech,
             generate_1v1_speech, generate_location_decision,
-            maybe_update_campfire_summary, update_cumulative_summary,
-            get_reaction, orchestrator_pick, check_moderation,
+            generate_campfire_speech_stream, generate_1v1_speech_stream,
+            update_cumulative_summary,
+            update_rolling_summary, summary_window, format_round_summary,
+            get_reaction, get_reactions, orchestrator_pick, check_moderation,
             generate_spotlight_cards, generate_sinama_event, check_ocak_tepki,
             generate_institution_scene, generate_public_mini_event,
             generate_private_mini_event,
-            # Katman 3
-            generate_night_move, generate_omen_vote,
+            # Batched decisions
+            generate_votes, generate_night_moves, generate_omen_votes,
+            generate_omen_interpretations, generate_location_decisions,
             resolve_night_phase, resolve_omen_choice,
             apply_kamu_baskisi_to_votes, use_kalkan,
             # Katman 4
             generate_morning_crisis, generate_campfire_proposal,
             resolve_proposal_vote, check_soz_borcu, check_soz_borcu_verdict,
-            generate_omen_interpretation, generate_house_entry_event,
+            generate_house_entry_event,
             generate_sinama_echo, generate_proposal_speech, generate_proposal_vote_ai,
             INITIAL_CAMPFIRE_TURNS, FREE_ROAM_ROUNDS,
             CAMPFIRE_TURNS_PER_ROUND, CLOSING_CAMPFIRE_TURNS,
@@ -548,8 +1718,10 @@ async def _game_loop_runner(game_id: str, state: Any):
     except Exception as e:
         logger.warning(f"[WARMUP] STT pre-warm failed to start: {e}")
 
-    # ═══ WS Bağlantı Bekleme — client'ların bağlanması için kısa süre ═══
-    await asyncio.sleep(3.0)
+    # ═══ WS Bağlantı Bekleme — human'lar bağlanınca hemen devam (en fazla 3s) ═══
+    await pacing.wait_for_connections(
+        game_id, [p.slot_id for p in state["players"] if p.is_human], deadline=3.0,
+    )
 
     # ═══ Character Reveal — broadcast ile gonder (send_to zamanlama sorunu yaratiyordu) ═══
     for p in state["players"]:
@@ -668,16 +1840,38 @@ async def _game_loop_runner(game_id: str, state: Any):
         ],
     }
 
+    morning_steps = _morning_steps(
+        game_id,
+        generate_sinama_event=generate_sinama_event,
+        generate_morning_crisis=generate_morning_crisis,
+        generate_public_mini_event=generate_public_mini_event,
+        generate_spotlight_cards=generate_spotlight_cards,
+        generate_omen_interpretations=generate_omen_interpretations,
+        get_alive_players=get_alive_players,
+    )
+    prefetcher: _RoundPrefetcher | None = None  # onceki gece hazirlanan sabah
+
+    # Ozetler arka planda — konusma akisi rolling / kumulatif ozeti beklemez
+    summary_worker = summarizer.start(
+        game_id, state,
+        update_rolling_summary=update_rolling_summary,
+        update_cumulative_summary=update_cumulative_summary,
+        summary_window=summary_window,
+        format_round_summary=format_round_summary,
+    )
+
     try:
         while True:
             round_n = state.get("round_number", 1)
+            pacing.begin_round(game_id, round_n)
 
             logger.info(f"Round {round_n}/{day_limit} — Game {game_id}")
 
             et, yanki = count_by_type(state)
 
             # Round icin temizlik (prototype ile ayni)
-            state["campfire_history"] = []
+            state["campfire_history"] = CampfireHistory()
+            prompt_cache.invalidate(state)
             state["house_visits"] = []
             state["campfire_rolling_summary"] = ""
             state["_summary_cursor"] = 0
@@ -698,7 +1892,11 @@ async def _game_loop_runner(game_id: str, state: Any):
                 }
             })
 
-            state = await run_morning(state)
+            # Sabah duyurusu — onceki gece hazirlandiysa ve hala gecerliyse hazir
+            hit, morning = await prefetcher.take("morning", state) if prefetcher else (False, None)
+            if not hit:
+                morning = await prepare_morning(state)
+            state = await apply_morning(state, morning)
 
             morning_msg = ""
             if state["campfire_history"]:
@@ -721,108 +1919,21 @@ async def _game_loop_runner(game_id: str, state: Any):
 
             logger.info(f"Morning phase completed — Round {round_n}")
 
-            # ── SINAMA EVENT (Katman 1) ──
-            try:
-                sinama = await generate_sinama_event(state)
-                if sinama:
-                    await manager.broadcast(game_id, {
-                        "event": "sinama",
-                        "data": sinama,
-                    })
-                    await asyncio.sleep(1)
-            except Exception as e:
-                logger.warning(f"Sinama generation failed: {e}")
-
-            # ── BUYUK KRIZ EVENT (Katman 4) ──
-            try:
-                crisis = await generate_morning_crisis(state)
-                if crisis:
-                    await manager.broadcast(game_id, {
-                        "event": "morning_crisis",
-                        "data": crisis,
-                    })
-                    await asyncio.sleep(2)
-            except Exception as e:
-                logger.warning(f"Crisis generation failed: {e}")
-
-            # ── KAMU MINI EVENT (Katman 2) ──
-            try:
-                mini_event = await generate_public_mini_event(state)
-                if mini_event:
-                    await manager.broadcast(game_id, {
-                        "event": "mini_event",
-                        "data": mini_event,
-                    })
-                    await asyncio.sleep(1)
-            except Exception as e:
-                logger.warning(f"Mini event generation failed: {e}")
-
-            # ── SPOTLIGHT KARTLARI (Katman 1) ──
-            try:
-                spotlight_cards = await generate_spotlight_cards(state)
-                if spotlight_cards:
-                    await manager.broadcast(game_id, {
-                        "event": "spotlight_cards",
-                        "data": {"cards": spotlight_cards},
-                    })
-                    await asyncio.sleep(1)
-            except Exception as e:
-                logger.warning(f"Spotlight generation failed: {e}")
+            # ── SABAH ADIMLARI (sinama, kriz, mini event, spotlight, soz borcu, alamet yorumu) ──
+            # Bagimsiz LLM adimlari paralel; yayinlar yine bu sirada
+            await _run_phase_dag(game_id, f"morning_r{round_n}", morning_steps, state, prefetcher)
+            if prefetcher:
+                logger.warning(
+                    f"[PREFETCH] Round {round_n}: {prefetcher.hits} hit / {prefetcher.misses} miss"
+                )
+                prefetcher.cancel()
+                prefetcher = None
 
             # ═══════════════════════════════════════
             # 2. SERBEST DOLASIM FAZI (Free Phase)
             # ═══════════════════════════════════════
             state["phase"] = Phase.CAMPFIRE.value
 
-            # ── 2a-pre. SOZ BORCU KONTROLU (Katman 4) ──
-            forced_speakers = state.get("_forced_speakers", [])
-            if forced_speakers:
-                damgali = state.get("_ocak_damgasi", [])
-                await manager.broadcast(game_id, {
-                    "event": "soz_borcu",
-                    "data": {
-                        "forced_speakers": forced_speakers,
-                        "damgali": damgali,
-                    }
-                })
-                await asyncio.sleep(1)
-                state["_forced_speakers"] = []  # reset
-
-            # ── 2a-pre. ALAMET YORUMU TURU (Katman 4) ──
-            try:
-                day_omens = state.get("_day_omens", [])
-                if day_omens and round_n >= 2:
-                    chosen_omen = day_omens[0]  # ilk alamet
-                    omen_interps = []
-                    alive = get_alive_players(state)
-
-                    # AI yorumlari concurrent
-                    ai_interp_tasks = []
-                    ai_interp_players = []
-                    for p in alive:
-                        if not p.is_human:
-                            ai_interp_tasks.append(generate_omen_interpretation(p, state, chosen_omen))
-                            ai_interp_players.append(p)
-
-                    if ai_interp_tasks:
-                        ai_results = await asyncio.gather(*ai_interp_tasks, return_exceptions=True)
-                        for p, interp in zip(ai_interp_players, ai_results):
-                            if isinstance(interp, str):
-                                omen_interps.append({"speaker": p.name, "text": interp})
-
-                    if omen_interps:
-                        await manager.broadcast(game_id, {
-                            "event": "omen_interpretation",
-                            "data": {
-                                "omen": {"id": chosen_omen["id"], "label": chosen_omen["label"], "icon": chosen_omen["icon"]},
-                                "interpretations": omen_interps,
-                            }
-                        })
-                        await asyncio.sleep(2)
-                        logger.info(f"Omen interpretation round completed — {len(omen_interps)} speeches")
-            except Exception as e:
-                logger.warning(f"Omen interpretation failed: {e}")
-
             # ── 2a. OPENING CAMPFIRE ──
             await manager.broadcast(game_id, {
                 "event": "phase_change",
@@ -843,11 +1954,13 @@ async def _game_loop_runner(game_id: str, state: Any):
                 generate_campfire_speech=generate_campfire_speech,
                 get_alive_players=get_alive_players,
                 find_player=find_player,
-                maybe_update_campfire_summary=maybe_update_campfire_summary,
+                maybe_update_campfire_summary=summary_worker.maybe_update,
                 get_reaction=get_reaction,
+                get_reactions=get_reactions,
                 orchestrator_pick=orchestrator_pick,
                 check_moderation=check_moderation,
                 check_ocak_tepki=check_ocak_tepki,
+                generate_campfire_speech_stream=generate_campfire_speech_stream,
             )
 
             logger.info(f"Opening campfire completed — {INITIAL_CAMPFIRE_TURNS} turns")
@@ -856,11 +1969,7 @@ async def _game_loop_runner(game_id: str, state: Any):
             try:
                 sinama_echo = await generate_sinama_echo(state)
                 if sinama_echo:
-                    await manager.broadcast(game_id, {
-                        "event": "sinama_echo",
-                        "data": {"content": sinama_echo},
-                    })
-                    await asyncio.sleep(1)
+                    await _broadcast_scene(game_id, "sinama_echo", {"content": sinama_echo}, hold=1.0)
             except Exception as e:
                 logger.warning(f"Sinama echo failed: {e}")
 
@@ -884,14 +1993,18 @@ async def _game_loop_runner(game_id: str, state: Any):
                     state_lock=_fluid_state_lock,
                     generate_campfire_speech=generate_campfire_speech,
                     generate_location_decision=generate_location_decision,
+                    generate_location_decisions=generate_location_decisions,
+                    generate_campfire_speech_stream=generate_campfire_speech_stream,
+                    generate_1v1_speech_stream=generate_1v1_speech_stream,
                     generate_1v1_speech=generate_1v1_speech,
                     generate_institution_scene=generate_institution_scene,
                     generate_private_mini_event=generate_private_mini_event,
                     generate_house_entry_event=generate_house_entry_event,
                     get_alive_players=get_alive_players,
                     find_player=find_player,
-                    maybe_update_campfire_summary=maybe_update_campfire_summary,
+                    maybe_update_campfire_summary=summary_worker.maybe_update,
                     get_reaction=get_reaction,
+                    get_reactions=get_reactions,
                     orchestrator_pick=orchestrator_pick,
                     check_moderation=check_moderation,
                     check_ocak_tepki=check_ocak_tepki,
@@ -909,11 +2022,7 @@ async def _game_loop_runner(game_id: str, state: Any):
             try:
                 proposal = await generate_campfire_proposal(state)
                 if proposal:
-                    await manager.broadcast(game_id, {
-                        "event": "proposal",
-                        "data": proposal,
-                    })
-                    await asyncio.sleep(1)
+                    await _broadcast_scene(game_id, "proposal", proposal, hold=1.0)
 
                     # AI onerge konusmalari (concurrent)
                     alive = get_alive_players(state)
@@ -934,22 +2043,18 @@ async def _game_loop_runner(game_id: str, state: Any):
                                     "role_title": p.role_title,
                                     "content": speech,
                                 })
-                                # Sync TTS for proposal speeches too
-                                p_audio_url, p_audio_dur = await _generate_audio_url(
-                                    speech, voice=getattr(p, 'voice_id', 'alloy'),
-                                    speed=getattr(p, 'voice_speed', 1.0),
-                                )
+                                # Text-first: onerge konusmasi hemen, ses speech_audio ile arkadan
+                                p_stream = _text_speech_stream(game_id, p, speech)
                                 await manager.broadcast(game_id, {
                                     "event": "campfire_speech",
                                     "data": {
                                         "speaker": p.name,
                                         "content": speech,
-                                        "audio_url": p_audio_url,
-                                        "audio_duration": p_audio_dur,
+                                        "speech_id": p_stream.speech_id,
                                     },
                                 })
-                                wait_time = min(max(p_audio_dur * 0.95, 2.0), 10.0) if p_audio_dur > 0 else 2.0
-                                await asyncio.sleep(wait_time)
+                                wait_time = min(await _finish_speech_stream(p_stream), 10.0)
+                                await _await_playback(game_id, p_stream, wait_time, interruptible=False)
 
                     # Insan onerge oyu bekle
                     human_proposal_tasks = []
@@ -989,11 +2094,7 @@ async def _game_loop_runner(game_id: str, state: Any):
                         proposal_votes[p.name] = v if v in ("a", "b") else "a"
 
                     proposal_result = resolve_proposal_vote(state, proposal_votes)
-                    await manager.broadcast(game_id, {
-                        "event": "proposal_result",
-                        "data": proposal_result,
-                    })
-                    await asyncio.sleep(2)
+                    await _broadcast_scene(game_id, "proposal_result", proposal_result, hold=2.0)
                     logger.info(f"Proposal vote completed — {proposal_result['winner_text']}")
 
             except Exception as e:
@@ -1028,11 +2129,13 @@ async def _game_loop_runner(game_id: str, state: Any):
                 generate_campfire_speech=generate_campfire_speech,
                 get_alive_players=get_alive_players,
                 find_player=find_player,
-                maybe_update_campfire_summary=maybe_update_campfire_summary,
+                maybe_update_campfire_summary=summary_worker.maybe_update,
                 get_reaction=get_reaction,
+                get_reactions=get_reactions,
                 orchestrator_pick=orchestrator_pick,
                 check_moderation=check_moderation,
                 check_ocak_tepki=check_ocak_tepki,
+                generate_campfire_speech_stream=generate_campfire_speech_stream,
             )
 
             logger.info(f"Closing campfire completed")
@@ -1040,7 +2143,8 @@ async def _game_loop_runner(game_id: str, state: Any):
             # ═══════════════════════════════════════
             # 3. CAMPFIRE OZETI
             # ═══════════════════════════════════════
-            campfire_summary = await summarize_campfire(state["campfire_history"], round_n)
+            # Rolling summary'ye kalan kuyrugu ekle, round ozeti ondan (tum logu bastan ozetlemek yerine)
+            campfire_summary = await summary_worker.round_summary(round_n)
             logger.info(f"Campfire summary ready ({len(campfire_summary)} chars)")
 
             # ═══════════════════════════════════════
@@ -1073,13 +2177,8 @@ async def _game_loop_runner(game_id: str, state: Any):
                 }
             })
 
-            # AI oylar (concurrent)
-            ai_vote_tasks = []
-            ai_vote_players = []
-            for p in alive:
-                if not p.is_human:
-                    ai_vote_tasks.append(generate_vote(state, p, campfire_summary))
-                    ai_vote_players.append(p)
+            # AI oylar (tek batch cagri, gecersizler tek tek)
+            ai_vote_players = [p for p in alive if not p.is_human]
 
             # Insan oylar (concurrent)
             human_vote_tasks = []
@@ -1099,11 +2198,11 @@ async def _game_loop_runner(game_id: str, state: Any):
 
             # Hepsini paralel
             vote_results = await asyncio.gather(
-                asyncio.gather(*ai_vote_tasks) if ai_vote_tasks else asyncio.sleep(0),
+                generate_votes(state, ai_vote_players, campfire_summary) if ai_vote_players else asyncio.sleep(0),
                 asyncio.gather(*human_vote_tasks) if human_vote_tasks else asyncio.sleep(0),
             )
 
-            ai_votes = list(vote_results[0]) if ai_vote_tasks else []
+            ai_votes = list(vote_results[0]) if ai_vote_players else []
             human_votes = list(vote_results[1]) if human_vote_tasks else []
 
             # Oylari ata
@@ -1167,6 +2266,7 @@ async def _game_loop_runner(game_id: str, state: Any):
                         "message": f"{exiled_name} sürgün edildi!",
                     }
                 })
+                await _narrate_banked(game_id, "ritual.exile_phrase")
 
                 logger.info(f"{exiled_name} exiled ({player.player_type.value if player else 'unknown'})")
             else:
@@ -1175,19 +2275,15 @@ async def _game_loop_runner(game_id: str, state: Any):
                     "data": {
                         "exiled": None,
                         "votes": vote_map,
-                        "message": "Beraberlik! Kimse sürgün edilmedi.",
+                        "message": audio_bank.TIE_MESSAGE,
                     }
                 })
+                await _narrate_banked(game_id, "exile.tie")
 
-            # Cumulative summary guncelle (cross-round memory)
+            # Cumulative summary guncelle (cross-round memory) — arka planda;
+            # ilk okuyan gece AI hamleleri, onlar bunu bekler
             vote_result_text = f"Sürgün: {exiled_name}" if exiled_name else "Kimse sürgün edilmedi (berabere)"
-            state["cumulative_summary"] = await update_cumulative_summary(
-                state.get("cumulative_summary", ""),
-                round_n,
-                campfire_summary,
-                vote_result_text,
-            )
-            logger.info(f"Cumulative summary updated")
+            cumulative_task = summary_worker.update_cumulative(round_n, campfire_summary, vote_result_text)
 
             game_log["rounds"].append(round_data)
 
@@ -1230,6 +2326,7 @@ async def _game_loop_runner(game_id: str, state: Any):
                 })
 
                 logger.info(f"Game over: {winner} wins!")
+                await cumulative_task
 
                 game_log["winner"] = winner
                 game_log["total_rounds"] = round_n
@@ -1249,6 +2346,12 @@ async def _game_loop_runner(game_id: str, state: Any):
             state["phase"] = Phase.NIGHT.value
             alive = get_alive_players(state)
 
+            # Yarinin sabahi simdiden — hayattakiler artik belli, gece sonucuna
+            # bagli olmayan adimlar gece boyunca uretilir (kriz gece cozulunce)
+            prefetcher = _RoundPrefetcher(game_id, state, round_n + 1, pick_day_omens(state, round_n + 1))
+            prefetcher.start("morning", state, prepare_morning)
+            prefetcher.start_steps(state, morning_steps, after_night=False)
+
             # Gunun 3 alameti (gece secimi icin)
             day_omens = state.get("_day_omens", [])
 
@@ -1266,13 +2369,12 @@ async def _game_loop_runner(game_id: str, state: Any):
                 }
             })
 
-            # AI gece hamleleri (concurrent)
-            ai_night_tasks = []
-            ai_night_players = []
-            for p in alive:
-                if not p.is_human:
-                    ai_night_tasks.append(generate_night_move(p, state))
-                    ai_night_players.append(p)
+            # AI gece hamleleri (tek batch cagri) — guncel cumulative summary ile
+            ai_night_players = [p for p in alive if not p.is_human]
+
+            async def _ai_night_moves():
+                await cumulative_task
+                return await generate_night_moves(ai_night_players, state)
 
             # Insan gece hamlesi (WS)
             human_night_tasks = []
@@ -1289,11 +2391,8 @@ async def _game_loop_runner(game_id: str, state: Any):
                     )
                     human_night_players.append(p)
 
-            # AI alamet oylamasi (concurrent)
-            ai_omen_tasks = []
-            for p in alive:
-                if not p.is_human and day_omens:
-                    ai_omen_tasks.append(generate_omen_vote(p, state, day_omens))
+            # AI alamet oylamasi (tek batch cagri)
+            ai_omen_players = [p for p in alive if not p.is_human] if day_omens else []
 
             # Insan alamet secimi (WS)
             human_omen_tasks = []
@@ -1310,15 +2409,16 @@ async def _game_loop_runner(game_id: str, state: Any):
 
             # Hepsini paralel calistir
             night_results = await asyncio.gather(
-                asyncio.gather(*ai_night_tasks) if ai_night_tasks else asyncio.sleep(0),
+                _ai_night_moves() if ai_night_players else asyncio.sleep(0),
                 asyncio.gather(*human_night_tasks) if human_night_tasks else asyncio.sleep(0),
-                asyncio.gather(*ai_omen_tasks) if ai_omen_tasks else asyncio.sleep(0),
+                generate_omen_votes(ai_omen_players, state, day_omens) if ai_omen_players else asyncio.sleep(0),
                 asyncio.gather(*human_omen_tasks) if human_omen_tasks else asyncio.sleep(0),
             )
 
-            ai_night_decisions = list(night_results[0]) if ai_night_tasks else []
+            ai_night_decisions = list(night_results[0]) if ai_night_players else []
+            await cumulative_task
             human_night_choices = list(night_results[1]) if human_night_tasks else []
-            ai_omen_choices = list(night_results[2]) if ai_omen_tasks else []
+            ai_omen_choices = list(night_results[2]) if ai_omen_players else []
             human_omen_choices = list(night_results[3]) if human_omen_tasks else []
 
             # Insan gece hamlesini parse et
@@ -1350,23 +2450,25 @@ async def _game_loop_runner(game_id: str, state: Any):
             if day_omens and all_omen_votes:
                 omen_result = resolve_omen_choice(state, all_omen_votes, day_omens)
 
-            # Broadcast gece sonucu
-            await manager.broadcast(game_id, {
-                "event": "night_result",
-                "data": {
-                    "winning_move": night_result.get("winning_move"),
-                    "target": night_result.get("target"),
-                    "effect_text": night_result.get("effect_text", "Gece sessiz gecti."),
-                    "chosen_omen": omen_result.get("chosen_omen") if omen_result else None,
-                    "ui_update": {
-                        "object_id": night_result.get("target"),
-                    } if night_result.get("winning_move") == "sahte_iz" else None,
-                }
-            })
+            # Gece cozuldu — gece sonucunu okuyan sabah adimlari (kriz) simdi baslar
+            prefetcher.start_steps(state, morning_steps, after_night=True)
 
-            await asyncio.sleep(3)  # Gece sahnesini gostermek icin bekle
+            # Broadcast gece sonucu
+            # Gece sahnesini goster — istemciler scene_ready diyene kadar (en fazla 3s)
+            await _broadcast_scene(game_id, "night_result", {
+                "winning_move": night_result.get("winning_move"),
+                "target": night_result.get("target"),
+                "effect_text": night_result.get("effect_text", "Gece sessiz gecti."),
+                "chosen_omen": omen_result.get("chosen_omen") if omen_result else None,
+                "ui_update": {
+                    "object_id": night_result.get("target"),
+                } if night_result.get("winning_move") == "sahte_iz" else None,
+            }, hold=3.0)
 
             logger.info(f"Night phase completed — Move: {night_result.get('winning_move')}")
+            round_pacing = pacing.metrics(game_id).get("rounds", {}).get(round_n)
+            if round_pacing:
+                logger.warning(f"[PACING] Round {round_n}: {round_pacing}")
 
             # State kaydet
             _save_state(game_id, state)
@@ -1403,6 +2505,33 @@ async def _game_loop_runner(game_id: str, state: Any):
         if game_id in _running_games:
             del _running_games[game_id]
 
+        reaction_stats = get_reaction_metrics(game_id)
+        if reaction_stats:
+            logger.warning(f"[REACTIONS] {game_id}: {reaction_stats}")
+        _reaction_metrics.pop(game_id, None)
+        _speculation_metrics.pop(game_id, None)
+
+        check_stats = get_check_metrics(game_id)
+        if check_stats:
+            logger.warning(f"[CHECKS] {game_id}: {check_stats}")
+        _check_metrics.pop(game_id, None)
+
+        if prefetcher:
+            prefetcher.cancel()
+
+        summary_stats = summarizer.stop(game_id)
+        if summary_stats:
+            logger.warning(f"[SUMMARY] {game_id}: {summary_stats}")
+
+        bank_stats = audio_bank.stop(game_id)
+        if bank_stats:
+            logger.warning(f"[AUDIO-BANK] {game_id}: {bank_stats}")
+
+        pacing_stats = pacing.metrics(game_id)
+        if pacing_stats:
+            logger.warning(f"[PACING] {game_id}: saved {pacing_stats['saved_sec']}s total")
+        pacing.clear(game_id)
+
         logger.warning(f"🔴 GAME LOOP ENDED: {game_id}")
 
 
@@ -1410,6 +2539,12 @@ async def _game_loop_runner(game_id: str, state: Any):
 # HELPER: Campfire Segment (WS broadcast per speech)
 # ═══════════════════════════════════════════════════
 
+def _history(state: Any):
+    """Index'li campfire history (prototypes/campfire_index — game loop path'i ekledikten sonra)."""
+    from campfire_index import indexed_history  # type: ignore
+    return indexed_history(state)
+
+
 async def _run_campfire_segment_ws(
     game_id: str,
     state: Any,
@@ -1420,9 +2555,11 @@ async def _run_campfire_segment_ws(
     find_player,
     maybe_update_campfire_summary=None,
     get_reaction=None,
+    get_reactions=None,
     orchestrator_pick=None,
     check_moderation=None,
     check_ocak_tepki=None,
+    generate_campfire_speech_stream=None,
 ) -> None:
     """
     Campfire tartisma segmenti — prototype akisinin birebir WS versiyonu.
@@ -1444,24 +2581,22 @@ async def _run_campfire_segment_ws(
     if len(participants) < 2:
         return
 
-    ws_dict = state.get("world_seed")
     use_orchestrator = get_reaction is not None and orchestrator_pick is not None
     turns_done = 0
+    prev_checks: _TurnChecks | None = None  # onceki konusmanin yoldaki kontrolleri
 
     human_names = [p.name for p in participants if p.is_human]
     logger.warning(f"[CAMPFIRE] Starting segment: max_turns={max_turns}, participants={participant_names}, humans={human_names}")
 
     # ── Ilk konusmaci (onceki konusma yoksa random sec) ──
-    recent_speeches = [m for m in state["campfire_history"]
-                       if m.get("type") == "speech" and m.get("name") in participant_names]
-
-    if not recent_speeches:
+    if not _history(state).last_speech(participant_names):
         # AI olmayan (human) ilk konusmaci olabilir
         ai_participants = [p for p in participants if not p.is_human]
         first = random_module.choice(ai_participants) if ai_participants else participants[0]
 
         import time as _time
         _first_llm_start = _time.perf_counter()
+        stream: _SpeechStream | None = None
         if first.is_human:
             message = await _wait_for_human_input(
                 game_id=game_id,
@@ -1473,46 +2608,50 @@ async def _run_campfire_segment_ws(
                 message = f"[{first.name} sessiz kaldi]"
             else:
                 message = await _rewrite_human_speech(message, first, state)
+        elif STREAMING_SPEECH and generate_campfire_speech_stream:
+            stream = _SpeechStream.for_player(game_id, first)
+            message = await generate_campfire_speech_stream(
+                state, first, stream.feed, participant_names=participant_names,
+            )
         else:
             message = await generate_campfire_speech(state, first, participant_names=participant_names)
         _first_llm_ms = (_time.perf_counter() - _first_llm_start) * 1000
 
-        # Moderator check
-        mod_ok = True
-        if check_moderation:
-            mod_ok, mod_reason = await check_moderation(first.name, message, ws_dict)
-            if not mod_ok:
-                state["campfire_history"].append({
-                    "type": "moderator", "content": mod_reason,
-                    "present": list(participant_names),
-                })
-                await manager.broadcast(game_id, {
-                    "event": "moderator_warning",
-                    "data": {"speaker": first.name, "reason": mod_reason}
-                })
+        # Moderasyon + ocak tepki arka planda; TTS onlarla paralel baslar
+        checks = _TurnChecks(
+            game_id, state, first, message, participant_names,
+            check_moderation, check_ocak_tepki,
+        )
+        # Text-first: metin hemen, ses speech_audio ile arkadan (streaming'de zaten yolda)
+        if stream:
+            stream.close()
+        else:
+            stream = _text_speech_stream(game_id, first, message)
 
-        if mod_ok:
+        # Moderator check — sadece grace icinde gelen red yayini durdurur
+        mod_ok, mod_reason = await checks.gate()
+        if not mod_ok:
+            await _abort_speech_stream(game_id, stream)
             state["campfire_history"].append({
-                "type": "speech", "name": first.name,
-                "role_title": first.role_title, "content": message,
+                "type": "moderator", "content": mod_reason,
                 "present": list(participant_names),
             })
-            first.add_message("assistant", message)
+            await manager.broadcast(game_id, {
+                "event": "moderator_warning",
+                "data": {"speaker": first.name, "reason": mod_reason}
+            })
+            await _narrate_warning(game_id, mod_reason)
 
-            # TTS paralel cumle bazli — kisa cumle = hizli TTS
-            _first_tts_start = _time.perf_counter()
-            audio_segments = await _generate_audio_parallel(
-                message, voice=getattr(first, 'voice_id', 'alloy'),
-                speed=getattr(first, 'voice_speed', 1.0),
-            )
-            _first_tts_ms = (_time.perf_counter() - _first_tts_start) * 1000
-            _first_total_ms = _first_llm_ms + _first_tts_ms
+        if mod_ok:
+            entry, record = _speech_entry(first, message, participant_names)
+            if record:
+                state["campfire_history"].append(entry)
+                first.add_message("assistant", message)
 
-            # Ilk segment = ana audio, toplam duration = sum
-            audio_url = audio_segments[0][0] if audio_segments else None
-            audio_duration = sum(d for _, d in audio_segments)
+            await stream.end(message)
+            pipeline = _pipeline_metrics(stream, _first_llm_start, _first_llm_ms, message)
 
-            logger.warning(f"[PIPELINE] {first.name} (first): LLM={_first_llm_ms:.0f}ms TTS={_first_tts_ms:.0f}ms Total={_first_total_ms:.0f}ms segs={len(audio_segments)}")
+            logger.warning(f"[PIPELINE] {first.name} (first): LLM={_first_llm_ms:.0f}ms first_audio={pipeline['first_audio_ms']}ms")
 
             await manager.broadcast(game_id, {
                 "event": "campfire_speech",
@@ -1523,22 +2662,17 @@ async def _run_campfire_segment_ws(
                     "turn": 1,
                     "max_turns": max_turns,
                     "participants": participant_names,
-                    "audio_url": audio_url,
-                    "audio_duration": audio_segments[0][1] if audio_segments else 0,
-                    "audio_segments": [{"url": u, "duration": d} for u, d in audio_segments if u],
-                    "pipeline": {
-                        "llm_ms": round(_first_llm_ms),
-                        "tts_ms": round(_first_tts_ms),
-                        "total_ms": round(_first_total_ms),
-                        "text_len": len(message),
-                        "voice": getattr(first, 'voice_id', 'alloy'),
-                    },
+                    "speech_id": stream.speech_id,
+                    "pipeline": pipeline,
                 }
             })
+            checks.published(stream, entry)
+            prev_checks = checks
 
             # Audio suresi kadar bekle — interruptible (human aninda soz alabilsin)
-            wait_time = max(audio_duration + 1.0, 3.0) if audio_duration > 0 else 3.0
-            interrupted = await _interruptible_sleep(game_id, wait_time)
+            wait_time = await _finish_speech_stream(stream)
+            interrupted = await _await_playback(game_id, stream, wait_time)
+            checks.playback_done()
             if interrupted:
                 logger.warning(f"[INTERRUPT] Sleep interrupted by human input (first speaker)")
 
@@ -1551,30 +2685,7 @@ async def _run_campfire_segment_ws(
                 if interjected:
                     turns_done += 1
 
-            # Ocak Tepki kontrolu (Katman 1+2)
-            if check_ocak_tepki:
-                try:
-                    tepki = await check_ocak_tepki(first.name, message, state)
-                    if tepki:
-                        state["campfire_history"].append({
-                            "type": "narrator",
-                            "content": tepki["message"],
-                        })
-                        await manager.broadcast(game_id, {
-                            "event": "ocak_tepki",
-                            "data": tepki,
-                        })
-                        # Kul Kaymasi ise ozel flash broadcast
-                        if tepki.get("type") == "kul_kaymasi":
-                            await manager.broadcast(game_id, {
-                                "event": "kul_kaymasi",
-                                "data": {
-                                    "speaker": tepki["speaker"],
-                                    "question": tepki.get("forced_question", ""),
-                                },
-                            })
-                except Exception as e:
-                    logger.warning(f"Ocak tepki check failed: {e}")
+            # Ocak Tepki (Katman 1+2) — _TurnChecks hazir olunca yayinlar
 
         turns_done = max(turns_done, 1)
 
@@ -1582,12 +2693,10 @@ async def _run_campfire_segment_ws(
     while turns_done < max_turns:
         turns_done += 1
 
-        last_speeches = [m for m in state["campfire_history"]
-                         if m.get("type") == "speech" and m.get("name") in participant_names]
-        if not last_speeches:
+        last_speech = _history(state).last_speech(participant_names)
+        if not last_speech:
             logger.warning(f"No speeches in campfire_history yet (turn {turns_done}), continuing anyway")
-            last_speeches = [{"name": participants[0].name if participants else "unknown", "content": "..."}]
-        last_speech = last_speeches[-1]
+            last_speech = {"name": participants[0].name if participants else "unknown", "content": "..."}
 
         # Konusmaci secimi
         if use_orchestrator:
@@ -1595,12 +2704,9 @@ async def _run_campfire_segment_ws(
             others = [p for p in participants
                       if p.name != last_speech["name"] and not p.is_human]
 
-            if others:
-                import asyncio as _aio
-                reaction_tasks = [get_reaction(p, last_speech, state) for p in others]
-                reactions = list(await _aio.gather(*reaction_tasks))
-            else:
-                reactions = []
+            reactions = await _collect_reactions(
+                game_id, state, others, last_speech, get_reaction, get_reactions,
+            )
 
             # Human'lar orchestrator'a dahil DEGIL — interrupt ile konusurlar (voice_chat pattern)
             # Sadece AI oyunculardan reaction topla
@@ -1632,10 +2738,15 @@ async def _run_campfire_segment_ws(
             else:
                 speaker = participants[turns_done % len(participants)]
 
+        # Tepki toplama onceki konusmanin kontrolleriyle paralel kostu; uretimden once commit
+        if prev_checks is not None:
+            await prev_checks.commit()
+
         # Konusma uret — human asla buraya dusmez, interrupt ile _process_human_interjection'dan girer
         logger.warning(f"[CAMPFIRE] Turn {turns_done}/{max_turns}: speaker={speaker.name} is_human={speaker.is_human}")
         import time as _time
         _llm_start = _time.perf_counter()
+        stream = None
         if speaker.is_human:
             # Edge case: tum oyuncular human (olmamali ama guvenlik)
             message = await _wait_for_human_input(
@@ -1647,10 +2758,16 @@ async def _run_campfire_segment_ws(
             if not message:
                 message = f"[{speaker.name} sessiz kaldi]"
         else:
-            message, gen_cancelled = await _race_ai_generation(
-                game_id,
-                generate_campfire_speech(state, speaker, participant_names=participant_names),
-            )
+            if STREAMING_SPEECH and generate_campfire_speech_stream:
+                stream = _SpeechStream.for_player(game_id, speaker)
+                gen = generate_campfire_speech_stream(
+                    state, speaker, stream.feed, participant_names=participant_names,
+                )
+            else:
+                gen = generate_campfire_speech(state, speaker, participant_names=participant_names)
+            message, gen_cancelled = await _race_ai_generation(game_id, gen)
+            if stream and (gen_cancelled or not message):
+                await _abort_speech_stream(game_id, stream)
             if gen_cancelled:
                 logger.warning(f"[INTERRUPT] AI generation cancelled (campfire loop)")
                 human_p = next((p for p in participants if p.is_human), None)
@@ -1661,44 +2778,44 @@ async def _run_campfire_segment_ws(
                 continue
         _llm_ms = (_time.perf_counter() - _llm_start) * 1000
 
-        # Moderator check
-        mod_ok = True
-        if check_moderation:
-            mod_ok, mod_reason = await check_moderation(speaker.name, message, ws_dict)
-            if not mod_ok:
-                state["campfire_history"].append({
-                    "type": "moderator", "content": mod_reason,
-                    "present": list(participant_names),
-                })
-                await manager.broadcast(game_id, {
-                    "event": "moderator_warning",
-                    "data": {"speaker": speaker.name, "reason": mod_reason}
-                })
-                continue  # Bu tur sayilmaz, tekrar dene
+        # Moderasyon + ocak tepki arka planda; TTS onlarla paralel baslar
+        checks = _TurnChecks(
+            game_id, state, speaker, message, participant_names,
+            check_moderation, check_ocak_tepki,
+        )
+        # Text-first: metin hemen, ses speech_audio ile arkadan (streaming'de zaten yolda)
+        if stream:
+            stream.close()
+        else:
+            stream = _text_speech_stream(game_id, speaker, message)
 
-        # History'ye ekle
-        state["campfire_history"].append({
-            "type": "speech", "name": speaker.name,
-            "role_title": speaker.role_title, "content": message,
-            "present": list(participant_names),
-        })
-        speaker.add_message("assistant", message)
+        # Moderator check — sadece grace icinde gelen red yayini durdurur
+        mod_ok, mod_reason = await checks.gate()
+        if not mod_ok:
+            await _abort_speech_stream(game_id, stream)
+            state["campfire_history"].append({
+                "type": "moderator", "content": mod_reason,
+                "present": list(participant_names),
+            })
+            await manager.broadcast(game_id, {
+                "event": "moderator_warning",
+                "data": {"speaker": speaker.name, "reason": mod_reason}
+            })
+            await _narrate_warning(game_id, mod_reason)
+            continue  # Bu tur sayilmaz, tekrar dene
 
-        # TTS paralel cumle bazli
-        _tts_start = _time.perf_counter()
-        audio_segments = await _generate_audio_parallel(
-            message, voice=getattr(speaker, 'voice_id', 'alloy'),
-            speed=getattr(speaker, 'voice_speed', 1.0),
-        )
-        _tts_ms = (_time.perf_counter() - _tts_start) * 1000
-        _total_ms = _llm_ms + _tts_ms
+        # History'ye ekle (stream'de tekrar tespit edildiyse eklenmez)
+        entry, record = _speech_entry(speaker, message, participant_names)
+        if record:
+            state["campfire_history"].append(entry)
+            speaker.add_message("assistant", message)
 
-        audio_url = audio_segments[0][0] if audio_segments else None
-        audio_duration = sum(d for _, d in audio_segments)
+        await stream.end(message)
+        pipeline = _pipeline_metrics(stream, _llm_start, _llm_ms, message)
 
-        logger.warning(f"[PIPELINE] {speaker.name}: LLM={_llm_ms:.0f}ms TTS={_tts_ms:.0f}ms Total={_total_ms:.0f}ms segs={len(audio_segments)}")
+        logger.warning(f"[PIPELINE] {speaker.name}: LLM={_llm_ms:.0f}ms first_audio={pipeline['first_audio_ms']}ms")
 
-        # Broadcast text + audio together (with pipeline metrics)
+        # Broadcast text (with pipeline metrics) — audio follows as speech_audio
         await manager.broadcast(game_id, {
             "event": "campfire_speech",
             "data": {
@@ -1708,22 +2825,17 @@ async def _run_campfire_segment_ws(
                 "turn": turns_done,
                 "max_turns": max_turns,
                 "participants": participant_names,
-                "audio_url": audio_url,
-                "audio_duration": audio_segments[0][1] if audio_segments else 0,
-                "audio_segments": [{"url": u, "duration": d} for u, d in audio_segments if u],
-                "pipeline": {
-                    "llm_ms": round(_llm_ms),
-                    "tts_ms": round(_tts_ms),
-                    "total_ms": round(_total_ms),
-                    "text_len": len(message),
-                    "voice": getattr(speaker, 'voice_id', 'alloy'),
-                },
+                "speech_id": stream.speech_id,
+                "pipeline": pipeline,
             }
         })
+        checks.published(stream, entry)
+        prev_checks = checks
 
         # Audio suresi kadar bekle — interruptible (human aninda soz alabilsin)
-        wait_time = max(audio_duration + 1.0, 3.0) if audio_duration > 0 else 3.0
-        interrupted = await _interruptible_sleep(game_id, wait_time)
+        wait_time = await _finish_speech_stream(stream)
+        interrupted = await _await_playback(game_id, stream, wait_time)
+        checks.playback_done()
         if interrupted:
             logger.warning(f"[INTERRUPT] Sleep interrupted by human input (campfire loop)")
 
@@ -1737,35 +2849,15 @@ async def _run_campfire_segment_ws(
                 if interjected:
                     turns_done += 1
 
-        # Ocak Tepki kontrolu (Katman 1+2)
-        if check_ocak_tepki:
-            try:
-                tepki = await check_ocak_tepki(speaker.name, message, state)
-                if tepki:
-                    state["campfire_history"].append({
-                        "type": "narrator",
-                        "content": tepki["message"],
-                    })
-                    await manager.broadcast(game_id, {
-                        "event": "ocak_tepki",
-                        "data": tepki,
-                    })
-                    # Kul Kaymasi ise ozel flash broadcast
-                    if tepki.get("type") == "kul_kaymasi":
-                        await manager.broadcast(game_id, {
-                            "event": "kul_kaymasi",
-                            "data": {
-                                "speaker": tepki["speaker"],
-                                "question": tepki.get("forced_question", ""),
-                            },
-                        })
-            except Exception as e:
-                logger.warning(f"Ocak tepki check failed: {e}")
+        # Ocak Tepki (Katman 1+2) — _TurnChecks hazir olunca yayinlar, siradaki turu beklemez
 
         # Rolling summary guncelle
         if maybe_update_campfire_summary:
             await maybe_update_campfire_summary(state)
 
+    if prev_checks is not None:
+        await prev_checks.drain()
+
     logger.info(f"Campfire segment done: {turns_done} turns, {len(participants)} participants")
 
 
@@ -1781,6 +2873,7 @@ async def _run_room_conversation_ws(
     max_exchanges: int,
     generate_1v1_speech,
     generate_house_entry_event=None,
+    generate_1v1_speech_stream=None,
 ) -> None:
     """
     1v1 oda gorusmesi — her exchange ilgili 2 oyuncuya unicast edilir.
@@ -1818,9 +2911,12 @@ async def _run_room_conversation_ws(
     except Exception as e:
         logger.warning(f"House entry event failed: {e}")
 
+    visit_context = f"visit:{owner.name}:{visitor.name}"
+
     for turn in range(max_exchanges):
         current = speakers[turn % 2]
         opponent = speakers[(turn + 1) % 2]
+        stream: _SpeechStream | None = None
 
         # Insan oyuncu ise WS'den bekle
         if current.is_human:
@@ -1835,10 +2931,16 @@ async def _run_room_conversation_ws(
             else:
                 speech_content = await _rewrite_human_speech(speech_content, current, state)
         else:
-            speech_content, gen_cancelled = await _race_ai_generation(
-                game_id,
-                generate_1v1_speech(state, current, opponent, exchanges, campfire_summary),
-            )
+            if STREAMING_SPEECH and generate_1v1_speech_stream:
+                stream = _SpeechStream.for_player(game_id, current, context=visit_context)
+                gen = generate_1v1_speech_stream(
+                    state, current, opponent, exchanges, campfire_summary, stream.feed,
+                )
+            else:
+                gen = generate_1v1_speech(state, current, opponent, exchanges, campfire_summary)
+            speech_content, gen_cancelled = await _race_ai_generation(game_id, gen)
+            if stream and (gen_cancelled or not speech_content):
+                await _abort_speech_stream(game_id, stream)
             if gen_cancelled:
                 logger.warning(f"[INTERRUPT] AI generation cancelled (room visit)")
                 # Human interrupted during AI generation — skip rest, interjection handled after sleep
@@ -1864,10 +2966,7 @@ async def _run_room_conversation_ws(
                         h_msg = await _rewrite_human_speech(h_content, human_in_visit, state)
                         exchanges.append({"speaker": human_in_visit.name, "role_title": human_in_visit.role_title, "content": h_msg})
                         human_in_visit.add_message("assistant", h_msg)
-                        h_audio_url, h_audio_dur = await _generate_audio_url(
-                            h_msg, voice=getattr(human_in_visit, 'voice_id', 'alloy'),
-                            speed=getattr(human_in_visit, 'voice_speed', 1.0),
-                        )
+                        h_stream = _text_speech_stream(game_id, human_in_visit, h_msg, context=visit_context)
                         await manager.broadcast(game_id, {
                             "event": "house_visit_exchange",
                             "data": {
@@ -1879,30 +2978,31 @@ async def _run_room_conversation_ws(
                                 "max_exchanges": max_exchanges,
                                 "visitor": visitor.name,
                                 "host": owner.name,
-                                "audio_url": h_audio_url,
-                                "audio_duration": h_audio_dur,
-                                "context": f"visit:{owner.name}:{visitor.name}",
+                                "context": visit_context,
+                                "speech_id": h_stream.speech_id,
                             }
                         })
+                        await _finish_speech_stream(h_stream)
                 continue
 
         exchange_entry = {
             "speaker": current.name,
             "role_title": current.role_title,
-            "content": speech_content,
+            "content": str(speech_content),
         }
-        exchanges.append(exchange_entry)
-        current.add_message("assistant", speech_content)
-
-        # TTS senkron — text + audio birlikte gonder (herkes icin)
-        audio_url, audio_duration = await _generate_audio_url(
-            speech_content, voice=getattr(current, 'voice_id', 'alloy'),
-            speed=getattr(current, 'voice_speed', 1.0),
-        )
-
-        visit_context = f"visit:{owner.name}:{visitor.name}"
+        if getattr(speech_content, "truncated", False):
+            exchange_entry["truncated"] = True
+        if not getattr(speech_content, "duplicate", False):
+            exchanges.append(exchange_entry)
+            current.add_message("assistant", speech_content)
+
+        # Text-first: metin hemen, ses speech_audio ile arkadan (streaming'de zaten yolda)
+        if stream:
+            await stream.end(speech_content)
+        else:
+            stream = _text_speech_stream(game_id, current, speech_content, context=visit_context)
 
-        # Broadcast: herkes gorur (spectator dahil), audio dahil
+        # Broadcast: herkes gorur (spectator dahil), audio speech_id ile arkadan
         await manager.broadcast(game_id, {
             "event": "house_visit_exchange",
             "data": {
@@ -1914,15 +3014,14 @@ async def _run_room_conversation_ws(
                 "max_exchanges": max_exchanges,
                 "visitor": visitor.name,
                 "host": owner.name,
-                "audio_url": audio_url,
-                "audio_duration": audio_duration,
                 "context": visit_context,
+                "speech_id": stream.speech_id,
             }
         })
 
         # Audio suresi kadar bekle — interruptible (human aninda soz alabilsin)
-        wait_time = max(audio_duration + 1.0, 3.0) if audio_duration > 0 else 3.0
-        interrupted = await _interruptible_sleep(game_id, wait_time)
+        wait_time = await _finish_speech_stream(stream)
+        interrupted = await _await_playback(game_id, stream, wait_time)
         if interrupted:
             logger.warning(f"[INTERRUPT] Sleep interrupted by human input (room visit)")
 
@@ -1953,10 +3052,7 @@ async def _run_room_conversation_ws(
                 h_entry = {"speaker": human_in_visit.name, "role_title": human_in_visit.role_title, "content": h_msg}
                 exchanges.append(h_entry)
                 human_in_visit.add_message("assistant", h_msg)
-                h_audio_url, h_audio_dur = await _generate_audio_url(
-                    h_msg, voice=getattr(human_in_visit, 'voice_id', 'alloy'),
-                    speed=getattr(human_in_visit, 'voice_speed', 1.0),
-                )
+                h_stream = _text_speech_stream(game_id, human_in_visit, h_msg, context=visit_context)
                 await manager.broadcast(game_id, {
                     "event": "house_visit_exchange",
                     "data": {
@@ -1968,13 +3064,12 @@ async def _run_room_conversation_ws(
                         "max_exchanges": max_exchanges,
                         "visitor": visitor.name,
                         "host": owner.name,
-                        "audio_url": h_audio_url,
-                        "audio_duration": h_audio_dur,
                         "context": visit_context,
+                        "speech_id": h_stream.speech_id,
                     }
                 })
-                h_wait = min(max(h_audio_dur * 0.95, 2.0), 10.0) if h_audio_dur > 0 else 2.0
-                await _interruptible_sleep(game_id, h_wait)
+                h_wait = min(await _finish_speech_stream(h_stream), 10.0)
+                await _await_playback(game_id, h_stream, h_wait)
 
     # Visit data kaydet
     visit_data = {
@@ -2194,6 +3289,157 @@ class _FluidSessionManager:
 # players join / leave dynamically between turns
 # ───────────────────────────────────────────────────
 
+# ───────────────────────────────────────────────────
+# Speculative Next Turn — playback sirasinda siradaki turu hazirla
+# ───────────────────────────────────────────────────
+
+SPECULATIVE_CAMPFIRE = True
+
+# game_id → {hits, misses, saved_sec}
+_speculation_metrics: Dict[str, Dict[str, float]] = {}
+
+
+def _record_speculation(game_id: str, hit: bool, saved_sec: float = 0.0) -> None:
+    m = _speculation_metrics.setdefault(game_id, {"hits": 0, "misses": 0, "saved_sec": 0.0})
+    if hit:
+        m["hits"] += 1
+        m["saved_sec"] += max(0.0, saved_sec)
+    else:
+        m["misses"] += 1
+
+
+def get_speculation_metrics(game_id: str) -> dict:
+    """Spekulatif tur hit/miss sayilari ve kazanilan toplam sure."""
+    m = _speculation_metrics.get(game_id)
+    if not m:
+        return {}
+    total = m["hits"] + m["misses"]
+    return {
+        "hits": int(m["hits"]),
+        "misses": int(m["misses"]),
+        "hit_rate": round(m["hits"] / total, 2) if total else 0.0,
+        "saved_sec": round(m["saved_sec"], 1),
+    }
+
+
+async def _pick_campfire_speaker(
+    game_id: str, state: Any, participants: list, participant_names: list[str],
+    find_player, get_reaction, get_reactions, orchestrator_pick,
+) -> tuple:
+    """Tepki topla → orkestrator sec → AI konusmaci dondur. (speaker, ended)"""
+    speaker = None
+    use_orchestrator = get_reaction is not None and orchestrator_pick is not None
+    last_speech = _history(state).last_speech(participant_names)
+
+    if use_orchestrator and last_speech:
+        others = [p for p in participants
+                  if p.name != last_speech["name"] and not p.is_human]
+
+        reactions = await _collect_reactions(
+            game_id, state, others, last_speech, get_reaction, get_reactions,
+        )
+
+        # Human'lar orchestrator'a dahil DEGIL — interrupt ile konusurlar (voice_chat pattern)
+        action, name = await orchestrator_pick(state, reactions)
+
+        if action == "END":
+            return None, True
+
+        if name in participant_names:
+            speaker = find_player(state, name)
+        else:
+            wanters = [r for r in reactions
+                       if r.get("wants") and r["name"] in participant_names]
+            if wanters:
+                speaker = find_player(state, wanters[0]["name"])
+
+    if not speaker:
+        ai_parts = [p for p in participants if not p.is_human]
+        speaker = random_module.choice(ai_parts) if ai_parts else participants[0]
+
+    # Human orchestrator tarafindan secilmemeli — AI'lar konusur, human interrupt ile girer
+    if speaker and speaker.is_human:
+        ai_parts = [p for p in participants if not p.is_human and p.alive]
+        speaker = random_module.choice(ai_parts) if ai_parts else speaker
+
+    return speaker, False
+
+
+async def _speculate_campfire_turn(
+    game_id: str, state: Any, participant_names: list[str], find_player,
+    generate_campfire_speech, get_reaction, get_reactions, orchestrator_pick,
+) -> dict | None:
+    """
+    Siradaki turu (tepki → orkestrator → konusma → TTS) simdiden uret.
+    Sonuc state'e YAZILMAZ — _resolve_speculation commit ya da discard eder.
+    """
+    start = _time_mod.perf_counter()
+    participants = [find_player(state, n) for n in participant_names]
+    participants = [p for p in participants if p and p.alive]
+    if len(participants) < 2:
+        return None
+
+    speaker, ended = await _pick_campfire_speaker(
+        game_id, state, participants, participant_names, find_player,
+        get_reaction, get_reactions, orchestrator_pick,
+    )
+    if ended or not speaker or not speaker.alive or speaker.is_human:
+        return None
+
+    message = await generate_campfire_speech(state, speaker, participant_names=participant_names)
+    if not message:
+        return None
+    audio_url, audio_duration = await _generate_audio_url(
+        message,
+        voice=getattr(speaker, "voice_id", "alloy"),
+        speed=getattr(speaker, "voice_speed", 1.0),
+    )
+    return {
+        "speaker": speaker,
+        "message": message,
+        "audio_url": audio_url,
+        "audio_duration": audio_duration,
+        "work_sec": _time_mod.perf_counter() - start,
+    }
+
+
+async def _resolve_speculation(
+    game_id: str, speculation: dict, state: Any, participant_names: list[str],
+) -> dict | None:
+    """
+    Spekulatif turu dogrula. Playback sirasinda history degistiyse (human
+    interjection, ocak tepki, moderator) veya katilimcilar degistiyse discard.
+    """
+    task: asyncio.Task = speculation["task"]
+    valid = (
+        len(state["campfire_history"]) == speculation["history_len"]
+        and set(participant_names) == set(speculation["participants"])
+    )
+    if not valid:
+        task.cancel()
+        _record_speculation(game_id, hit=False)
+        logger.info(f"[SPECULATION] discarded — context changed during playback")
+        return None
+
+    wait_start = _time_mod.perf_counter()
+    try:
+        result = await task
+    except (asyncio.CancelledError, Exception) as e:
+        logger.warning(f"[SPECULATION] failed: {e}")
+        result = None
+    waited = _time_mod.perf_counter() - wait_start
+
+    if not result or result["speaker"].name not in participant_names or not result["speaker"].alive:
+        _record_speculation(game_id, hit=False)
+        return None
+
+    # Kazanc: playback ile ortusen uretim suresi (bitmesini bekledigimiz kisim haric)
+    saved = result["work_sec"] - waited
+    _record_speculation(game_id, hit=True, saved_sec=saved)
+    logger.info(f"[SPECULATION] hit — {result['speaker'].name}, saved {saved:.1f}s")
+    return result
+
+
 async def _run_persistent_campfire_ws(
     game_id: str,
     state: Any,
@@ -2208,17 +3454,19 @@ async def _run_persistent_campfire_ws(
     find_player,
     maybe_update_campfire_summary=None,
     get_reaction=None,
+    get_reactions=None,
     orchestrator_pick=None,
     check_moderation=None,
     check_ocak_tepki=None,
+    generate_campfire_speech_stream=None,
 ) -> None:
     """Persistent campfire that runs until *phase_done* is set or the turn budget
     is exhausted.  Participants are re-evaluated each turn so players can join or
     leave between turns."""
 
-    ws_dict = state.get("world_seed")
-    use_orchestrator = get_reaction is not None and orchestrator_pick is not None
     total_turns = 0
+    speculation: dict | None = None  # {task, history_len, participants}
+    prev_checks: _TurnChecks | None = None  # onceki konusmanin yoldaki kontrolleri
 
     while not phase_done.is_set() and total_turns < max_total_turns:
         # ── refresh participant list every turn ──
@@ -2239,55 +3487,44 @@ async def _run_persistent_campfire_ws(
 
         total_turns += 1
 
-        # ── pick speaker ──
-        speaker = None
-        recent_speeches = [
-            m for m in state["campfire_history"]
-            if m.get("type") == "speech" and m.get("name") in participant_names
-        ]
-
-        if use_orchestrator and recent_speeches:
-            last_speech = recent_speeches[-1]
-            others = [p for p in participants
-                      if p.name != last_speech["name"] and not p.is_human]
-
-            reactions = []
-            if others:
-                reaction_tasks = [get_reaction(p, last_speech, state) for p in others]
-                raw = await asyncio.gather(*reaction_tasks, return_exceptions=True)
-                reactions = [r for r in raw if isinstance(r, dict)]
-
-            # Human'lar orchestrator'a dahil DEGIL — interrupt ile konusurlar (voice_chat pattern)
-            action, name = await orchestrator_pick(state, reactions)
+        # ── spekulatif tur hazir mi? (onceki konusmanin playback'i sirasinda uretildi) ──
+        spec = None
+        if speculation is not None:
+            # Spekulasyon onceki konusmayi baz aliyor — once onun moderasyonu kesinlessin
+            if prev_checks is not None and not await prev_checks.commit():
+                speculation["task"].cancel()
+                _record_speculation(game_id, hit=False)
+                logger.info(f"[SPECULATION] discarded — previous speech retracted")
+            else:
+                spec = await _resolve_speculation(game_id, speculation, state, participant_names)
+            speculation = None
 
-            if action == "END":
+        if spec:
+            speaker = spec["speaker"]
+        else:
+            # ── pick speaker ──
+            speaker, ended = await _pick_campfire_speaker(
+                game_id, state, participants, participant_names, find_player,
+                get_reaction, get_reactions, orchestrator_pick,
+            )
+            if ended:
                 # orchestrator says stop — skip turn, don't break the loop
                 await asyncio.sleep(1)
                 continue
 
-            if name in participant_names:
-                speaker = find_player(state, name)
-            else:
-                wanters = [r for r in reactions
-                           if r.get("wants") and r["name"] in participant_names]
-                if wanters:
-                    speaker = find_player(state, wanters[0]["name"])
-
-        if not speaker:
-            ai_parts = [p for p in participants if not p.is_human]
-            speaker = random_module.choice(ai_parts) if ai_parts else participants[0]
-
-        # Human orchestrator tarafindan secilmemeli — AI'lar konusur, human interrupt ile girer
-        if speaker and speaker.is_human:
-            ai_parts = [p for p in participants if not p.is_human and p.alive]
-            speaker = random_module.choice(ai_parts) if ai_parts else speaker
+            if not speaker or not speaker.alive:
+                continue
 
-        if not speaker or not speaker.alive:
-            continue
+        # Tepki toplama onceki konusmanin kontrolleriyle paralel kostu; uretimden once commit
+        if prev_checks is not None:
+            await prev_checks.commit()
 
         # ── generate speech — human asla buraya dusmez, interrupt ile girer ──
-        logger.warning(f"[PERSISTENT-CF] Turn {total_turns}: speaker={speaker.name} is_human={speaker.is_human}")
-        if speaker.is_human:
+        logger.warning(f"[PERSISTENT-CF] Turn {total_turns}: speaker={speaker.name} is_human={speaker.is_human} speculative={bool(spec)}")
+        stream: _SpeechStream | None = None
+        if spec:
+            message = spec["message"]
+        elif speaker.is_human:
             # Edge case: tum oyuncular human
             message = await _wait_for_human_input(
                 game_id=game_id,
@@ -2298,10 +3535,17 @@ async def _run_persistent_campfire_ws(
             if not message:
                 message = f"[{speaker.name} sessiz kaldi]"
         else:
-            message, gen_cancelled = await _race_ai_generation(
-                game_id,
-                generate_campfire_speech(state, speaker, participant_names=participant_names),
-            )
+            if STREAMING_SPEECH and generate_campfire_speech_stream:
+                # Token'lar geldikce cumle cumle TTS — ilk ses LLM bitmeden yayinda
+                stream = _SpeechStream.for_player(game_id, speaker)
+                gen = generate_campfire_speech_stream(
+                    state, speaker, stream.feed, participant_names=participant_names,
+                )
+            else:
+                gen = generate_campfire_speech(state, speaker, participant_names=participant_names)
+            message, gen_cancelled = await _race_ai_generation(game_id, gen)
+            if stream and (gen_cancelled or not message):
+                await _abort_speech_stream(game_id, stream)
             if gen_cancelled:
                 logger.warning(f"[INTERRUPT] AI generation cancelled (persistent campfire)")
                 human_p = next((p for p in participants if p.is_human), None)
@@ -2311,38 +3555,47 @@ async def _run_persistent_campfire_ws(
                     )
                 continue
 
-        # moderator
-        mod_ok = True
-        if check_moderation:
-            mod_ok, mod_reason = await check_moderation(speaker.name, message, ws_dict)
-            if not mod_ok:
-                async with state_lock:
-                    state["campfire_history"].append({
-                        "type": "moderator", "content": mod_reason,
-                        "present": list(participant_names),
-                    })
-                await manager.broadcast(game_id, {
-                    "event": "moderator_warning",
-                    "data": {"speaker": speaker.name, "reason": mod_reason},
-                })
-                continue
+        # Moderasyon + ocak tepki arka planda; TTS onlarla paralel baslar
+        checks = _TurnChecks(
+            game_id, state, speaker, message, participant_names,
+            check_moderation, check_ocak_tepki, state_lock,
+        )
+        # Text-first: metin hemen, ses ayni speech_id ile speech_audio olarak arkadan
+        # (streaming'de zaten yolda, spekulatif turda hazir)
+        if stream:
+            stream.close()
+        elif spec:
+            stream = _text_speech_stream(
+                game_id, speaker, message,
+                ready_audio=(spec["audio_url"], spec["audio_duration"]),
+            )
+        else:
+            stream = _text_speech_stream(game_id, speaker, message)
 
-        # record
-        async with state_lock:
-            state["campfire_history"].append({
-                "type": "speech", "name": speaker.name,
-                "role_title": speaker.role_title, "content": message,
-                "present": list(participant_names),
+        # moderator — sadece grace icinde gelen red yayini durdurur
+        mod_ok, mod_reason = await checks.gate()
+        if not mod_ok:
+            await _abort_speech_stream(game_id, stream)
+            async with state_lock:
+                state["campfire_history"].append({
+                    "type": "moderator", "content": mod_reason,
+                    "present": list(participant_names),
+                })
+            await manager.broadcast(game_id, {
+                "event": "moderator_warning",
+                "data": {"speaker": speaker.name, "reason": mod_reason},
             })
-        speaker.add_message("assistant", message)
+            await _narrate_warning(game_id, mod_reason)
+            continue
 
-        # TTS senkron (herkes icin)
-        audio_url, audio_duration = await _generate_audio_url(
-            message,
-            voice=getattr(speaker, "voice_id", "alloy"),
-            speed=getattr(speaker, "voice_speed", 1.0),
-        )
+        # record (stream'de tekrar tespit edildiyse history'ye yazilmaz)
+        entry, record = _speech_entry(speaker, message, participant_names)
+        if record:
+            async with state_lock:
+                state["campfire_history"].append(entry)
+            speaker.add_message("assistant", message)
 
+        await stream.end(message)
         await manager.broadcast(game_id, {
             "event": "campfire_speech",
             "data": {
@@ -2352,13 +3605,26 @@ async def _run_persistent_campfire_ws(
                 "turn": total_turns,
                 "max_turns": max_total_turns,
                 "participants": participant_names,
-                "audio_url": audio_url,
-                "audio_duration": audio_duration,
+                "speech_id": stream.speech_id,
             },
         })
+        checks.published(stream, entry)
+        prev_checks = checks
+
+        # ── Spekulasyon: siradaki turu playback sirasinda hazirla ──
+        if SPECULATIVE_CAMPFIRE and not phase_done.is_set() and total_turns < max_total_turns:
+            speculation = {
+                "task": asyncio.create_task(_speculate_campfire_turn(
+                    game_id, state, list(participant_names), find_player,
+                    generate_campfire_speech, get_reaction, get_reactions, orchestrator_pick,
+                )),
+                "history_len": len(state["campfire_history"]),
+                "participants": list(participant_names),
+            }
 
-        wait_time = max(audio_duration + 1.0, 3.0) if audio_duration > 0 else 3.0
-        interrupted = await _interruptible_sleep(game_id, wait_time)
+        wait_time = await _finish_speech_stream(stream)
+        interrupted = await _await_playback(game_id, stream, wait_time)
+        checks.playback_done()
         if interrupted:
             logger.warning(f"[INTERRUPT] Sleep interrupted by human input (persistent campfire)")
 
@@ -2372,28 +3638,7 @@ async def _run_persistent_campfire_ws(
                 if interjected:
                     total_turns += 1
 
-        # ocak tepki
-        if check_ocak_tepki:
-            try:
-                tepki = await check_ocak_tepki(speaker.name, message, state)
-                if tepki:
-                    async with state_lock:
-                        state["campfire_history"].append({
-                            "type": "narrator", "content": tepki["message"],
-                        })
-                    await manager.broadcast(game_id, {
-                        "event": "ocak_tepki", "data": tepki,
-                    })
-                    if tepki.get("type") == "kul_kaymasi":
-                        await manager.broadcast(game_id, {
-                            "event": "kul_kaymasi",
-                            "data": {
-                                "speaker": tepki["speaker"],
-                                "question": tepki.get("forced_question", ""),
-                            },
-                        })
-            except Exception as e:
-                logger.warning(f"Persistent campfire ocak tepki failed: {e}")
+        # ocak tepki — _TurnChecks hazir olunca yayinlar, siradaki turu beklemez
 
         # rolling summary
         if maybe_update_campfire_summary:
@@ -2409,7 +3654,18 @@ async def _run_persistent_campfire_ws(
             await sm.reset_campfire_turns(vet)
             logger.info(f"Campfire veteran ejected: {vet} (after {veteran_threshold} turns)")
 
-    logger.info(f"Persistent campfire finished: {total_turns} total turns")
+    if speculation is not None and not speculation["task"].done():
+        speculation["task"].cancel()
+        _record_speculation(game_id, hit=False)
+
+    if prev_checks is not None:
+        await prev_checks.drain()
+
+    spec_stats = get_speculation_metrics(game_id)
+    logger.info(
+        f"Persistent campfire finished: {total_turns} total turns, speculation={spec_stats}, "
+        f"checks={get_check_metrics(game_id)}"
+    )
 
 
 # ───────────────────────────────────────────────────
@@ -2431,9 +3687,13 @@ async def _run_fluid_free_phase(
     find_player,
     maybe_update_campfire_summary=None,
     get_reaction=None,
+    get_reactions=None,
     orchestrator_pick=None,
     check_moderation=None,
     check_ocak_tepki=None,
+    generate_location_decisions=None,
+    generate_campfire_speech_stream=None,
+    generate_1v1_speech_stream=None,
     # constants
     free_roam_rounds: int = 3,
     campfire_turns_per_round: int = 3,
@@ -2497,6 +3757,7 @@ async def _run_fluid_free_phase(
                     max_exchanges=room_exchanges,
                     generate_1v1_speech=generate_1v1_speech,
                     generate_house_entry_event=generate_house_entry_event,
+                    generate_1v1_speech_stream=generate_1v1_speech_stream,
                 )
             except Exception as e:
                 logger.warning(f"Room session {visitor_name}→{host_name} failed: {e}")
@@ -2567,15 +3828,22 @@ async def _run_fluid_free_phase(
                 )
                 human_players.append(p)
             else:
-                ai_tasks.append(generate_location_decision(p, state, locations_ctx))
+                if generate_location_decisions is None:
+                    ai_tasks.append(generate_location_decision(p, state, locations_ctx))
                 ai_players.append(p)
 
+        if generate_location_decisions is not None and ai_players:
+            # Tum AI kararlari tek batch cagri
+            ai_gather = generate_location_decisions(ai_players, state, locations_ctx)
+        else:
+            ai_gather = asyncio.gather(*ai_tasks) if ai_tasks else asyncio.sleep(0)
+
         all_results = await asyncio.gather(
-            asyncio.gather(*ai_tasks) if ai_tasks else asyncio.sleep(0),
+            ai_gather,
             asyncio.gather(*human_tasks) if human_tasks else asyncio.sleep(0),
         )
 
-        ai_decisions = list(all_results[0]) if ai_tasks else []
+        ai_decisions = list(all_results[0]) if ai_players else []
         human_choices = list(all_results[1]) if human_tasks else []
 
         # ── apply decisions ──
@@ -2776,9 +4044,11 @@ async def _run_fluid_free_phase(
             find_player=find_player,
             maybe_update_campfire_summary=maybe_update_campfire_summary,
             get_reaction=get_reaction,
+            get_reactions=get_reactions,
             orchestrator_pick=orchestrator_pick,
             check_moderation=check_moderation,
             check_ocak_tepki=check_ocak_tepki,
+            generate_campfire_speech_stream=generate_campfire_speech_stream,
         )
     )
 
@@ -0,0 +1,203 @@
+"""
+pacing.py — Ack-Driven Pacing
+=============================
+Game loop eskiden sabit sureler bekliyordu (baglanti icin 3s, her konusmada
+audio_duration + 1s, sabah event'lerinden sonra 1-2s, geceden sonra 3s).
+Artik bekleme bir deadline'dir: bagli istemciler event_id ile ack gonderir,
+dinleyicilerin tamami (veya ACK_QUORUM orani) ack verince loop hemen devam
+eder. Deadline eski sabit sure oldugu icin en kotu durumda davranis ayni.
+Sahne bekleyislerinde min_hold tabandir: ack ne kadar erken gelirse gelsin
+sahne en az o kadar ekranda kalir (istemci ack'i mesaji aldigi an degil,
+sahneyi gosterdikten sonra yollar ama eski / bozuk istemciye guvenilmez).
+
+Client → Server:
+    {"event": "audio_finished", "data": {"event_id": "<speech_id>", "seq": 2}}
+    {"event": "scene_ready",    "data": {"event_id": "<event_id>"}}
+
+Kullanim:
+    event_id = pacing.new_event_id()
+    await manager.broadcast(game_id, {"event": "sinama", "data": {..., "event_id": event_id}})
+    await pacing.wait(game_id, event_id, deadline=1.0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+import uuid
+from collections import OrderedDict
+
+from src.apps.ws.service import manager
+
+logger = logging.getLogger(__name__)
+
+ACK_QUORUM = 1.0          # dinleyicilerin ne kadari ack vermeli (0-1]
+_RECHECK_SEC = 0.5        # disconnect olan dinleyiciyi quorum'dan dusurmek icin
+_MAX_TRACKED_EVENTS = 256  # oyun basina tutulan ack kaydi
+SCENE_MIN_HOLD_SEC = 0.8  # scene_ready ack'i ne kadar erken gelirse gelsin sahne tabani
+
+# game_id → event_id → player_id → en yuksek seq
+_acks: dict[str, OrderedDict[str, dict[str, int]]] = {}
+# game_id → event_id → ack geldiginde uyandirilan event
+_waiters: dict[str, dict[str, asyncio.Event]] = {}
+# game_id → {round, rounds: {round: {...}}}
+_metrics: dict[str, dict] = {}
+
+
+def new_event_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def ack(game_id: str, player_id: str, event_id: str, seq: int = 0) -> None:
+    """Istemciden gelen ack'i kaydet (wait'ten once gelse de saklanir)."""
+    if not event_id:
+        return
+    events = _acks.setdefault(game_id, OrderedDict())
+    players = events.setdefault(event_id, {})
+    events.move_to_end(event_id)
+    players[player_id] = max(seq, players.get(player_id, seq))
+    while len(events) > _MAX_TRACKED_EVENTS:
+        events.popitem(last=False)
+
+    waiter = _waiters.get(game_id, {}).get(event_id)
+    if waiter:
+        waiter.set()
+
+
+def begin_round(game_id: str, round_n: int) -> None:
+    _game_metrics(game_id)["round"] = round_n
+
+
+async def wait(
+    game_id: str,
+    event_id: str,
+    deadline: float,
+    min_seq: int = 0,
+    interrupt: asyncio.Event | None = None,
+    kind: str = "scene_ready",
+    min_hold: float = 0.0,
+) -> str:
+    """
+    Dinleyiciler ack verene, deadline dolana veya interrupt set edilene kadar bekle.
+    Ack min_hold'dan once gelirse kalan sure yine beklenir (interrupt haric).
+    Dinleyen yoksa deadline beklenir — ack verecek kimse yok diye sahne atlanmaz.
+
+    Returns: "ack" | "idle" (deadline boyunca dinleyen yok) | "timeout" | "interrupt"
+    """
+    start = time.perf_counter()
+    listeners = set(manager.get_active_players(game_id))
+    waiter = asyncio.Event()
+    _waiters.setdefault(game_id, {})[event_id] = waiter
+
+    try:
+        while True:
+            # Bekleme sirasinda kopanlar quorum'dan duser; kimse kalmadiysa
+            # (yeniden) baglanan istemci quorum'a girer ve ack verebilir
+            active = set(manager.get_active_players(game_id))
+            listeners = listeners & active if listeners else active
+            acked = {
+                p for p, seq in _acks.get(game_id, {}).get(event_id, {}).items()
+                if seq >= min_seq and p in listeners
+            }
+            if listeners and len(acked) >= math.ceil(ACK_QUORUM * len(listeners)):
+                result = "ack"
+                break
+
+            remaining = deadline - (time.perf_counter() - start)
+            if remaining <= 0:
+                result = "timeout" if listeners else "idle"
+                break
+
+            waiter.clear()
+            tasks = [asyncio.create_task(waiter.wait())]
+            if interrupt is not None:
+                tasks.append(asyncio.create_task(interrupt.wait()))
+            await asyncio.wait(
+                tasks, timeout=min(remaining, _RECHECK_SEC),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for t in tasks:
+                t.cancel()
+            if interrupt is not None and interrupt.is_set():
+                result = "interrupt"
+                break
+    finally:
+        _waiters.get(game_id, {}).pop(event_id, None)
+
+    hold_left = min(min_hold, deadline) - (time.perf_counter() - start)
+    if result == "ack" and hold_left > 0:
+        if interrupt is None:
+            await asyncio.sleep(hold_left)
+        else:
+            try:
+                await asyncio.wait_for(interrupt.wait(), timeout=hold_left)
+                result = "interrupt"
+            except asyncio.TimeoutError:
+                pass
+
+    _record(game_id, kind, result, deadline, time.perf_counter() - start)
+    return result
+
+
+async def wait_for_connections(game_id: str, player_ids: list[str], deadline: float) -> str:
+    """
+    Beklenen oyuncular baglanana kadar bekle. player_ids bossa (AI-only oyun)
+    en az bir izleyicinin baglanmasi yeterli. Returns: "ack" | "timeout"
+    """
+    start = time.perf_counter()
+    result = "timeout"
+    while time.perf_counter() - start < deadline:
+        active = set(manager.get_active_players(game_id))
+        if (player_ids and set(player_ids) <= active) or (not player_ids and active):
+            result = "ack"
+            break
+        await asyncio.sleep(0.1)
+    _record(game_id, "connect", result, deadline, time.perf_counter() - start)
+    return result
+
+
+# ── Metrics ─────────────────────────────────────────
+def _game_metrics(game_id: str) -> dict:
+    return _metrics.setdefault(game_id, {"round": 0, "rounds": {}})
+
+
+def _record(game_id: str, kind: str, result: str, deadline: float, elapsed: float) -> None:
+    m = _game_metrics(game_id)
+    rnd = m["rounds"].setdefault(m["round"], {
+        "waits": 0, "ack": 0, "idle": 0, "timeout": 0, "interrupt": 0,
+        "waited_sec": 0.0, "saved_sec": 0.0,
+    })
+    rnd["waits"] += 1
+    rnd[result] += 1
+    rnd["waited_sec"] += elapsed
+    # Interrupt'ta kazanc human'a ait, pacing'e yazma; idle deadline'i doldurur
+    if result == "ack":
+        rnd["saved_sec"] += max(0.0, deadline - elapsed)
+    logger.debug(f"[PACING] {game_id} {kind}: {result} after {elapsed:.2f}s (deadline {deadline:.1f}s)")
+
+
+def metrics(game_id: str) -> dict:
+    """Round bazinda bekleme sayisi, ack / timeout dagilimi ve kazanilan sure."""
+    m = _metrics.get(game_id)
+    if not m:
+        return {}
+    rounds = {
+        rnd: {k: round(v, 1) if isinstance(v, float) else v for k, v in data.items()}
+        for rnd, data in sorted(m["rounds"].items())
+    }
+    return {
+        "rounds": rounds,
+        "saved_sec": round(sum(r["saved_sec"] for r in m["rounds"].values()), 1),
+    }
+
+
+def all_metrics() -> dict:
+    return {game_id: metrics(game_id) for game_id in _metrics}
+
+
+def clear(game_id: str) -> None:
+    _acks.pop(game_id, None)
+    _waiters.pop(game_id, None)
+    _metrics.pop(game_id, None)
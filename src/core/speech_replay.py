@@ -0,0 +1,229 @@
+"""
+speech_replay.py — Stitched Speech Replay Assets
+================================================
+Streaming konusma hatti (_SpeechStream) bir konusmayi birden fazla TTS
+segmentine boler; canli calmada istemci segmentleri sirayla calar. Replay
+(oyun logu, tekrar dinleme) icin ayni konusmanin segmentleri tek surekli
+ses dosyasina dikilir:
+
+  - stitch(parts, fmt): "mp3" → ID3 etiketleri ve her segmentin basindaki
+    Xing/Info/VBRI frame'i ayiklanip MPEG frame'leri ard arda eklenir
+    (frame'ler bagimsiz, yeniden kodlama yok; Xing kalirsa tarayici sureyi
+    o segmentin frame sayisindan okur);
+    "pcm16" → ham PCM birlestirilip tek WAV header'i ile sarilir.
+  - schedule(game_id, speech_id, speaker, urls, duration, pcm=None): arka
+    planda segmentleri indirir (binary ses modunda PCM zaten eldeyse
+    indirmez), diker, saklar ve `speech_replay` olayini yayinlar.
+  - Saklama: byte ile sinirli LRU (REPLAY_CACHE_MB), GET
+    /api/game/{game_id}/speech/{speech_id}/replay ile servis edilir.
+
+Kullanim:
+    from src.core import speech_replay
+
+    speech_replay.schedule(game_id, speech_id, "Fenris", [url1, url2, url3], 7.4)
+    replay = speech_replay.get(game_id, speech_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+REPLAY_CACHE_MB = 64
+PCM_SAMPLE_RATE = 16000  # api tts_stream: 16kHz mono PCM16
+MEDIA_TYPES = {"mp3": "audio/mpeg", "pcm16": "audio/wav"}
+
+
+@dataclass
+class Replay:
+    game_id: str
+    speech_id: str
+    speaker: str
+    data: bytes
+    media_type: str
+    duration: float
+    segments: int
+
+
+# ── Stitching ───────────────────────────────────────
+def _strip_id3(part: bytes) -> bytes:
+    """MP3 parcasinin basindaki ID3v2 ve sonundaki ID3v1 etiketini at."""
+    if part[:3] == b"ID3" and len(part) >= 10:
+        size = (part[6] << 21) | (part[7] << 14) | (part[8] << 7) | part[9]
+        footer = 10 if part[5] & 0x10 else 0
+        part = part[10 + size + footer:]
+    if len(part) >= 128 and part[-128:-125] == b"TAG":
+        part = part[:-128]
+    return part
+
+
+# MPEG audio Layer III bitrate tablolari (kbps), index 1-14
+_MP3_BITRATES = {
+    1: (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # MPEG-1
+    2: (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),     # MPEG-2 / 2.5
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _strip_vbr_header(part: bytes) -> bytes:
+    """Ilk MPEG frame Xing / Info / VBRI etiket frame'iyse (ses yok, sure bilgisi) at."""
+    if len(part) < 4 or part[0] != 0xFF or part[1] & 0xE0 != 0xE0:
+        return part
+    version = (part[1] >> 3) & 0x03      # 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+    layer = (part[1] >> 1) & 0x03        # 1 = Layer III
+    bitrate_idx = part[2] >> 4
+    rate_idx = (part[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or not 1 <= bitrate_idx <= 14 or rate_idx == 3:
+        return part
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[1 if mpeg1 else 2][bitrate_idx - 1] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_idx]
+    padding = (part[2] >> 1) & 0x01
+    frame_len = (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+
+    mono = (part[3] >> 6) == 3
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    crc = 0 if part[1] & 0x01 else 2
+    xing_at = 4 + crc + side_info
+    if part[xing_at:xing_at + 4] in (b"Xing", b"Info") or part[36:40] == b"VBRI":
+        return part[frame_len:]
+    return part
+
+
+def _wav_header(data_len: int, sample_rate: int = PCM_SAMPLE_RATE) -> bytes:
+    byte_rate = sample_rate * 2
+    return (
+        b"RIFF" + struct.pack("<I", 36 + data_len) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, sample_rate, byte_rate, 2, 16)
+        + b"data" + struct.pack("<I", data_len)
+    )
+
+
+def stitch(parts: list[bytes], fmt: str = "mp3") -> bytes:
+    """Segmentleri tek surekli ses dosyasina dik."""
+    if fmt == "pcm16":
+        pcm = b"".join(parts)
+        if len(pcm) % 2:
+            pcm = pcm[:-1]
+        return _wav_header(len(pcm)) + pcm
+    if fmt == "mp3":
+        return b"".join(_strip_vbr_header(_strip_id3(p)) for p in parts)
+    raise ValueError(f"stitch: desteklenmeyen format {fmt!r}")
+
+
+# ── Store ───────────────────────────────────────────
+class _ReplayStore:
+    """(game_id, speech_id) → Replay, toplam byte ile sinirli LRU."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items: OrderedDict[tuple[str, str], Replay] = OrderedDict()
+
+    def get(self, game_id: str, speech_id: str) -> Replay | None:
+        replay = self._items.get((game_id, speech_id))
+        if replay is not None:
+            self._items.move_to_end((game_id, speech_id))
+        return replay
+
+    def put(self, replay: Replay) -> int:
+        """Kaydi ekle, tasarsa en eskileri at. Donen: atilan kayit sayisi."""
+        if len(replay.data) > self.max_bytes:
+            return 0
+        key = (replay.game_id, replay.speech_id)
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old.data)
+        self._items[key] = replay
+        self.bytes += len(replay.data)
+        evicted = 0
+        while self.bytes > self.max_bytes:
+            _, dropped = self._items.popitem(last=False)
+            self.bytes -= len(dropped.data)
+            evicted += 1
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_store = _ReplayStore(REPLAY_CACHE_MB * 1024 * 1024)
+_tasks: set[asyncio.Task] = set()
+_stats = {"stitched": 0, "failed": 0, "segments": 0, "evictions": 0, "stitch_ms": 0.0}
+
+
+def store(replay: Replay) -> None:
+    _stats["stitched"] += 1
+    _stats["segments"] += replay.segments
+    _stats["evictions"] += _store.put(replay)
+
+
+def get(game_id: str, speech_id: str) -> Replay | None:
+    return _store.get(game_id, speech_id)
+
+
+def replay_url(game_id: str, speech_id: str) -> str:
+    return f"/api/game/{game_id}/speech/{speech_id}/replay"
+
+
+async def _stitch(
+    game_id: str, speech_id: str, speaker: str, urls: list[str], duration: float,
+    pcm: list[bytes] | None,
+) -> None:
+    from src.apps.ws.service import manager
+    from src.services.api_client import fetch_audio
+
+    start = time.perf_counter()
+    fmt = "pcm16" if pcm else "mp3"
+    try:
+        parts = pcm or await asyncio.gather(*(fetch_audio(url) for url in urls))
+        data = stitch(list(parts), fmt)
+    except Exception as e:
+        _stats["failed"] += 1
+        logger.warning(f"[REPLAY] {speech_id} stitch failed: {e}")
+        return
+    _stats["stitch_ms"] += (time.perf_counter() - start) * 1000
+    segments = len(parts)
+    store(Replay(game_id, speech_id, speaker, data, MEDIA_TYPES[fmt], duration, segments))
+    await manager.broadcast(game_id, {
+        "event": "speech_replay",
+        "data": {
+            "speech_id": speech_id,
+            "speaker": speaker,
+            "replay_url": replay_url(game_id, speech_id),
+            "duration": round(duration, 2),
+            "segments": segments,
+        },
+    })
+
+
+def schedule(
+    game_id: str, speech_id: str, speaker: str, urls: list[str], duration: float,
+    pcm: list[bytes] | None = None,
+) -> asyncio.Task:
+    """Segmentleri arka planda dik (oyun akisi beklemez). pcm verilirse URL indirilmez."""
+    task = asyncio.create_task(_stitch(game_id, speech_id, speaker, urls, duration, pcm))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+def metrics() -> dict:
+    """Dikilen / basarisiz replay, ortalama segment ve dikme suresi, depo dolulugu."""
+    stitched = _stats["stitched"]
+    return {
+        "stitched": stitched,
+        "failed": _stats["failed"],
+        "avg_segments": round(_stats["segments"] / stitched, 1) if stitched else 0.0,
+        "avg_stitch_ms": round(_stats["stitch_ms"] / stitched, 1) if stitched else 0.0,
+        "entries": len(_store),
+        "bytes": _store.bytes,
+        "evictions": _stats["evictions"],
+        "pending": len(_tasks),
+    }
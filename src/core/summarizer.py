@@ -0,0 +1,192 @@
+"""
+summarizer.py — Per-Game Background Summarizer
+==============================================
+Campfire rolling summary, round ozeti ve kumulatif ozet artik konusma
+akisini bloklamaz. Her oyunun tek bir worker'i var:
+
+  - maybe_update(state): her konusmadan sonra cagrilir, HEMEN doner. Yeterli
+    yeni mesaj varsa (game.summary_window) arka planda rolling summary
+    guncellenir.
+  - Her guncelleme versiyonlu bir snapshot olarak state'e yazilir:
+    campfire_rolling_summary + _summary_cursor (kapsadigi history uzunlugu)
+    + _summary_version. Prompt'lar son TAMAMLANMIS snapshot'i ve cursor'dan
+    sonraki raw mesajlari kullanir (_format_campfire_context) — ozet geride
+    kalsa da bilgi kaybolmaz.
+  - round_summary(round_n): tum raw kuyrugu rolling summary'ye ekler ve round
+    ozetini ondan uretir (tum logu bastan ozetlemek yerine).
+  - update_cumulative(...): kumulatif ozet task'i; bitince state'e yazilir,
+    ilk okuyan (gece AI hamleleri) task'i bekler.
+
+Round basinda campfire_history yeni listeyle degisir; eski round'un yolda
+olan sonucu liste kimligi tutmadigi icin atilir.
+
+Kullanim:
+    worker = summarizer.start(game_id, state, update_rolling_summary=..., ...)
+    await worker.maybe_update(state)          # non-blocking
+    summary = await worker.round_summary(round_n)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryWorker:
+    """Tek oyunun ozet worker'i. Rolling guncellemeler sirali (her biri bir oncekinin ustune)."""
+
+    def __init__(
+        self,
+        game_id: str,
+        state: Any,
+        update_rolling_summary: Callable[[str, list[dict]], Awaitable[str]],
+        update_cumulative_summary: Callable[[str, int, str, str], Awaitable[str]],
+        summary_window: Callable[..., tuple[int, int] | None],
+        format_round_summary: Callable[[int, str], str],
+    ):
+        self.game_id = game_id
+        self.state = state
+        self._update_rolling = update_rolling_summary
+        self._update_cumulative = update_cumulative_summary
+        self._window = summary_window
+        self._format_round = format_round_summary
+        self._rolling_task: asyncio.Task | None = None
+        self._cumulative_task: asyncio.Task | None = None
+        self.stats = {
+            "rolling_updates": 0,
+            "discarded": 0,
+            "failed": 0,
+            "rolling_ms_total": 0.0,
+            "max_backlog": 0,
+            "round_flush_ms": [],
+        }
+
+    # ── Public ──
+    async def maybe_update(self, state: Any = None) -> None:
+        """Konusma sonrasi — guncelleme gerekiyorsa arka planda baslat, beklemeden don."""
+        if self._rolling_task is None or self._rolling_task.done():
+            if self._window(self.state):
+                self._rolling_task = asyncio.create_task(self._drain())
+
+    async def round_summary(self, round_n: int) -> str:
+        """Kalan raw mesajlari ozete ekle, round ozetini rolling summary'den uret."""
+        start = time.perf_counter()
+        await self._wait_rolling()
+        while self._window(self.state, final=True):
+            if not await self._step(final=True):
+                break
+        flush_ms = (time.perf_counter() - start) * 1000
+        self.stats["round_flush_ms"].append(round(flush_ms))
+        return self._format_round(round_n, self.state.get("campfire_rolling_summary", ""))
+
+    def update_cumulative(
+        self, round_n: int, campfire_summary: str, vote_result: str,
+    ) -> asyncio.Task:
+        """Kumulatif ozeti arka planda guncelle. Task bittiginde state'e yazilmistir."""
+        previous = self._cumulative_task
+
+        async def _run() -> str:
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+            text = await self._update_cumulative(
+                self.state.get("cumulative_summary", ""), round_n, campfire_summary, vote_result,
+            )
+            self.state["cumulative_summary"] = text
+            self.state["_cumulative_version"] = round_n
+            logger.info(f"[SUMMARY] {self.game_id}: cumulative v{round_n} ready")
+            return text
+
+        self._cumulative_task = asyncio.create_task(_run())
+        return self._cumulative_task
+
+    def metrics(self) -> dict:
+        updates = self.stats["rolling_updates"]
+        return {
+            "rolling_version": self.state.get("_summary_version", 0),
+            "cumulative_version": self.state.get("_cumulative_version", 0),
+            "rolling_updates": updates,
+            "discarded": self.stats["discarded"],
+            "failed": self.stats["failed"],
+            "avg_rolling_ms": round(self.stats["rolling_ms_total"] / updates) if updates else 0,
+            "max_backlog": self.stats["max_backlog"],
+            "round_flush_ms": list(self.stats["round_flush_ms"]),
+        }
+
+    def stop(self) -> None:
+        for task in (self._rolling_task, self._cumulative_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+    # ── Internal ──
+    async def _wait_rolling(self) -> None:
+        if self._rolling_task is not None and not self._rolling_task.done():
+            await asyncio.gather(self._rolling_task, return_exceptions=True)
+
+    async def _drain(self) -> None:
+        # Yazarken yeni mesaj geldiyse ayni task icinde devam et
+        while self._window(self.state):
+            if not await self._step(final=False):
+                return
+
+    async def _step(self, final: bool) -> bool:
+        """Tek guncelleme: snapshot al, ozetle, history degismediyse commit et."""
+        window = self._window(self.state, final=final)
+        if not window:
+            return False
+        cursor, end = window
+        history = self.state["campfire_history"]
+        base = self.state.get("campfire_rolling_summary", "")
+        self.stats["max_backlog"] = max(self.stats["max_backlog"], len(history) - cursor)
+
+        start = time.perf_counter()
+        try:
+            text = await self._update_rolling(base, history[cursor:end])
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning(f"[SUMMARY] {self.game_id}: rolling update failed: {e}")
+            return False
+        self.stats["rolling_ms_total"] += (time.perf_counter() - start) * 1000
+
+        # Round degistiyse (yeni history listesi) veya baska biri commit ettiyse at
+        if self.state["campfire_history"] is not history or self.state.get("_summary_cursor", 0) != cursor:
+            self.stats["discarded"] += 1
+            return False
+
+        self.state["campfire_rolling_summary"] = text
+        self.state["_summary_cursor"] = end
+        self.state["_summary_version"] = self.state.get("_summary_version", 0) + 1
+        self.stats["rolling_updates"] += 1
+        logger.info(
+            f"[SUMMARY] {self.game_id}: rolling v{self.state['_summary_version']} "
+            f"covers {end} msgs ({len(history) - end} raw tail)"
+        )
+        return True
+
+
+# ── Registry ────────────────────────────────────────
+_workers: dict[str, SummaryWorker] = {}
+
+
+def start(game_id: str, state: Any, **summarize_fns) -> SummaryWorker:
+    """Oyun icin worker olustur (varsa eskisini durdur)."""
+    stop(game_id)
+    worker = SummaryWorker(game_id, state, **summarize_fns)
+    _workers[game_id] = worker
+    return worker
+
+
+def get(game_id: str) -> SummaryWorker | None:
+    return _workers.get(game_id)
+
+
+def stop(game_id: str) -> dict:
+    """Worker'i durdur, son metrikleri dondur."""
+    worker = _workers.pop(game_id, None)
+    if worker is None:
+        return {}
+    worker.stop()
+    return worker.metrics()
@@ -60,6 +60,9 @@ async def lifespan(app: FastAPI):
     # SHUTDOWN
     # ═══════════════════════════════════════════════════
     print("👋 Shutting down gracefully...")
+    from src.core.dependencies import close_api_client
+    await close_api_client()
+    print("✅ Character API connection pool closed")
 
 
 def create_app() -> FastAPI:
@@ -180,6 +183,87 @@ def create_app() -> FastAPI:
             "db_mode": "in-memory" if settings.USE_IN_MEMORY_DB else "redis",
         }
     
+    @app.get("/health/scheduler", tags=["system"])
+    def scheduler_health():
+        """
+        Provider scheduler metrikleri.
+        Lane basina queue depth, bekleme suresi ve AIMD concurrency limiti.
+        """
+        from src.services import scheduler
+        return {"scheduler": scheduler.metrics()}
+
+    @app.get("/health/pacing", tags=["system"])
+    def pacing_health():
+        """
+        Ack-driven pacing metrikleri (calisan oyunlar).
+        Round basina ack / timeout dagilimi ve sabit bekleme yerine kazanilan sure.
+        """
+        from src.core import pacing
+        return {"pacing": pacing.all_metrics()}
+
+    @app.get("/health/moderation", tags=["system"])
+    def moderation_health():
+        """
+        Yerel taboo moderasyonu metrikleri.
+        LLM'e gitmeden verilen PASS / ihlal kararlari ve ortalama tarama suresi.
+        """
+        from src.services import taboo
+        return {"moderation": taboo.metrics()}
+
+    @app.get("/health/classifiers", tags=["system"])
+    def classifier_health():
+        """
+        Early-exit siniflandirici metrikleri (tepki, moderasyon, orkestrator, soz borcu).
+        Cagri noktasi basina erken cikis ve tahmini kazanilan token / ms.
+        """
+        from src.services import llm_classify
+        return {"classifiers": llm_classify.metrics()}
+
+    @app.get("/health/prompts", tags=["system"])
+    def prompt_health():
+        """
+        Prompt kurulum profili (campfire / visit).
+        Ortalama / max prompt boyutu, kurulum suresi ve parca cache isabet orani.
+        """
+        from src.services import prompt_cache
+        return {"prompts": prompt_cache.metrics()}
+
+    @app.get("/health/budgets", tags=["system"])
+    def budget_health():
+        """
+        Token butcesi metrikleri (campfire / visit / ozetler).
+        Prompt token'i, kirpma ve overrun sayisi, cap'e dayanan cikti, p50 / p95 uretim suresi.
+        """
+        from src.services import token_budget
+        return {"budgets": token_budget.metrics()}
+
+    @app.get("/health/audio-bank", tags=["system"])
+    def audio_bank_health():
+        """
+        Oyun basina on-sentezlenmis ses bankasi (rituel / alamet / moderasyon satirlari).
+        Sentezlenen / basarisiz satir, sifir gecikmeli isabet sayisi, on-sentez suresi.
+        """
+        from src.core import audio_bank
+        return {"audio_bank": audio_bank.all_metrics()}
+
+    @app.get("/health/replays", tags=["system"])
+    def replay_health():
+        """
+        Konusma replay dikme metrikleri (cok segmentli TTS → tek dosya).
+        Dikilen / basarisiz konusma, ortalama segment ve dikme suresi, depo dolulugu.
+        """
+        from src.core import speech_replay
+        return {"replays": speech_replay.metrics()}
+
+    @app.get("/health/ws-audio", tags=["system"])
+    def ws_audio_health():
+        """
+        Binary WebSocket ses modu metrikleri.
+        Oyun basina binary dinleyici, itilen PCM frame / byte ve basarisiz gonderim.
+        """
+        from src.apps.ws.service import manager
+        return {"ws_audio": manager.audio_metrics()}
+
     @app.get("/", tags=["system"])
     def root():
         """Ana endpoint - API bilgisi döner."""
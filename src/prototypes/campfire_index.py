@@ -0,0 +1,269 @@
+"""
+campfire_index.py — Indexed Campfire History
+============================================
+state["campfire_history"] duz bir dict listesiydi; her mesaj kendi "present"
+kopyasini tasiyordu ve _format_campfire_context, _build_speak_prompt,
+check_ocak_tepki, recent_speeches her oyuncu / her turda listeyi bastan
+tariyordu.
+
+CampfireHistory list'in alt sinifi: disari ayni dict'ler gorunur (JSON,
+slicing, summarizer, oyun logu), yaninda append ile artimli guncellenen
+bir index tutar:
+
+  - _Rec (slotted): mesaj tipi kodu, konusmaci id'si, presence bitmask
+  - Isimler int id'ye intern edilir; "present" listesi bitmask olur, ayni
+    katilimci kumesi tek bir tuple'i paylasir (mesaj basina kopya yok)
+  - Konusmaci basina konusma pozisyonlari; izleyici basina gorunur context
+    mesaji pozisyonlari (ilk sorguda kurulur, sonra append'te eklenir)
+  - Her context mesajinin satiri bir kez render edilir, pencere metni
+    history degisene kadar cache'te kalir
+
+Sorgular O(1) / O(k): son konusma, son k kendi sozu, [i, j) araligindaki
+konusma sayisi (bisect), izleyici penceresi.
+
+append disindaki mutasyonlar (retract: history[i] = moderator) index'i kirli
+isaretler; ilk sorguda bastan kurulur.
+
+Kullanim:
+    from campfire_index import CampfireHistory, indexed_history
+
+    state["campfire_history"] = CampfireHistory()
+    history = indexed_history(state)
+    last = history.last_speech(participant_names)
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+CONTEXT_TYPES = ("speech", "moderator", "narrator")
+_KINDS = {"speech": 0, "moderator": 1, "narrator": 2}
+_OTHER = 3
+_EVERYONE = -1  # "present" alani yok → herkes duyar
+_MAX_WINDOWS = 64  # cache'lenen (izleyici, cursor) penceresi
+TRUNCATED_NOTE = " [sozu yarida kesildi]"  # "truncated" konusmalar prompt'ta boyle isaretlenir
+
+
+class _Rec:
+    __slots__ = ("kind", "speaker", "mask")
+
+    def __init__(self, kind: int, speaker: int, mask: int):
+        self.kind = kind
+        self.speaker = speaker
+        self.mask = mask
+
+
+def render_line(msg: dict) -> str:
+    """Prompt'lardaki tek mesaj satiri (speech / moderator / narrator)."""
+    if msg["type"] == "speech":
+        note = TRUNCATED_NOTE if msg.get("truncated") else ""
+        return f"[{msg['name']}] ({msg.get('role_title', '?')}): {msg['content']}{note}"
+    if msg["type"] == "moderator":
+        return f"[Ocak Bekçisi]: {msg['content']}"
+    return f"[Anlatici]: {msg['content']}"
+
+
+class CampfireHistory(list):
+    """Campfire mesaj listesi + artimli index (konusmaci, izleyici, render cache)."""
+
+    def __init__(self, entries=()):
+        super().__init__()
+        self._ids: dict[str, int] = {}
+        self._presence: dict[tuple, tuple] = {}
+        self._reset_index()
+        for entry in entries:
+            self.append(entry)
+
+    def __reduce__(self):
+        # copy / deepcopy / pickle index'i degil mesajlari tasir
+        return (self.__class__, (list(self),))
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
+
+    # ── Mutations ──
+    def append(self, entry: dict) -> None:
+        present = entry.get("present")
+        if present is not None and not isinstance(present, tuple):
+            key = tuple(present)
+            entry["present"] = self._presence.setdefault(key, key)
+        super().append(entry)
+        if not self._dirty:
+            self._index(len(self) - 1, entry)
+
+    def extend(self, entries) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def __iadd__(self, entries):
+        self.extend(entries)
+        return self
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._dirty = True
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._dirty = True
+
+    def insert(self, index, entry) -> None:
+        super().insert(index, entry)
+        self._dirty = True
+
+    def pop(self, index=-1):
+        self._dirty = True
+        return super().pop(index)
+
+    def remove(self, entry) -> None:
+        super().remove(entry)
+        self._dirty = True
+
+    def clear(self) -> None:
+        super().clear()
+        self._dirty = True
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._dirty = True
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._dirty = True
+
+    # ── Queries ──
+    def speech_count(self, start: int = 0, end: int | None = None) -> int:
+        """[start, end) araligindaki konusma sayisi."""
+        speeches = self._fresh()._speeches
+        end = len(self) if end is None else end
+        return bisect_left(speeches, end) - bisect_left(speeches, start)
+
+    def speeches(self) -> list[dict]:
+        return [self[i] for i in self._fresh()._speeches]
+
+    def speakers(self) -> set[str]:
+        by_speaker = self._fresh()._by_speaker
+        names = {i: name for name, i in self._ids.items()}
+        return {names[s] for s, positions in by_speaker.items() if positions}
+
+    def last_speech(self, names=None) -> dict | None:
+        """Son konusma (names verilirse sadece o konusmacilardan)."""
+        self._fresh()
+        if names is None:
+            return self[self._speeches[-1]] if self._speeches else None
+        wanted = {self._ids[n] for n in names if n in self._ids}
+        recs = self._recs
+        for i in reversed(self._speeches):
+            if recs[i].speaker in wanted:
+                return self[i]
+        return None
+
+    def own_speeches(self, name: str, n: int | None = None) -> list[dict]:
+        """Konusmacinin son n konusmasi (eskiden yeniye)."""
+        self._fresh()
+        positions = self._by_speaker.get(self._ids.get(name, -1), [])
+        if n is not None:
+            positions = positions[-n:] if n else []
+        return [self[i] for i in positions]
+
+    def context_window(
+        self, viewer: str | None, cursor: int, min_tail: int, max_tail: int,
+    ) -> list[str]:
+        """
+        Izleyicinin duyabildigi context mesajlarinin son satirlari: cursor'dan
+        sonraki (ozetlenmemis) mesajlar, en az min_tail, en fazla max_tail.
+        """
+        key = (viewer, cursor, min_tail, max_tail)
+        cached = self._windows.get(key)
+        if cached is not None and cached[0] == len(self) and not self._dirty:
+            return cached[1]
+        positions = self._visible_positions(viewer)
+        unsummarized = len(positions) - bisect_left(positions, cursor)
+        tail = min(max(unsummarized, min_tail), max_tail)
+        lines = [self._line(i) for i in positions[-tail:]]
+        if len(self._windows) >= _MAX_WINDOWS:
+            self._windows.clear()
+        self._windows[key] = (len(self), lines)
+        return lines
+
+    def context_lines(self, last_n: int | None = None) -> list[str]:
+        """Tum context mesajlarinin satirlari (izleyici filtresi yok)."""
+        positions = self._visible_positions(None)
+        if last_n:
+            positions = positions[-last_n:]
+        return [self._line(i) for i in positions]
+
+    # ── Internal ──
+    def _reset_index(self) -> None:
+        self._recs: list[_Rec] = []
+        self._speeches: list[int] = []
+        self._by_speaker: dict[int, list[int]] = {}
+        self._visible: dict[int | None, list[int]] = {}
+        self._lines: dict[int, str] = {}
+        self._windows: dict[tuple, tuple[int, list[str]]] = {}
+        self._dirty = False
+
+    def _fresh(self) -> "CampfireHistory":
+        if self._dirty:
+            self._reset_index()
+            for i, entry in enumerate(self):
+                self._index(i, entry)
+        return self
+
+    def _id(self, name: str) -> int:
+        sid = self._ids.get(name)
+        if sid is None:
+            sid = self._ids[name] = len(self._ids)
+        return sid
+
+    def _mask(self, present) -> int:
+        if present is None:
+            return _EVERYONE
+        mask = 0
+        for name in present:
+            mask |= 1 << self._id(name)
+        return mask
+
+    def _index(self, pos: int, entry: dict) -> None:
+        kind = _KINDS.get(entry.get("type"), _OTHER)
+        speaker = self._id(entry["name"]) if kind == 0 and "name" in entry else -1
+        rec = _Rec(kind, speaker, self._mask(entry.get("present")))
+        self._recs.append(rec)
+        if kind == 0:
+            self._speeches.append(pos)
+            self._by_speaker.setdefault(speaker, []).append(pos)
+        if kind != _OTHER:
+            for viewer, positions in self._visible.items():
+                if self._can_see(viewer, rec):
+                    positions.append(pos)
+
+    @staticmethod
+    def _can_see(viewer: int | None, rec: _Rec) -> bool:
+        return viewer is None or rec.mask == _EVERYONE or bool(rec.mask >> viewer & 1)
+
+    def _visible_positions(self, viewer: str | None) -> list[int]:
+        self._fresh()
+        vid = None if viewer is None else self._id(viewer)
+        positions = self._visible.get(vid)
+        if positions is None:
+            positions = [
+                i for i, rec in enumerate(self._recs)
+                if rec.kind != _OTHER and self._can_see(vid, rec)
+            ]
+            self._visible[vid] = positions
+        return positions
+
+    def _line(self, pos: int) -> str:
+        line = self._lines.get(pos)
+        if line is None:
+            line = self._lines[pos] = render_line(self[pos])
+        return line
+
+
+def indexed_history(state) -> CampfireHistory:
+    """state["campfire_history"]'yi index'li haliyle dondur (duz liste ise bir kez donusturur)."""
+    history = state["campfire_history"]
+    if not isinstance(history, CampfireHistory):
+        history = CampfireHistory(history)
+        state["campfire_history"] = history
+    return history
@@ -16,17 +16,24 @@ import os
 import random as random_module
 import re
 import sys
+import time
 import uuid
 from collections import Counter
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
-from src.services.api_client import llm_generate, configure, tts_stream, generate_avatar
+from src.services.api_client import llm_generate, llm_stream, configure, tts_stream, generate_avatar
+from src.services.scheduler import priority
+from src.services import taboo
+from src.services import llm_classify
+from src.services import prompt_cache
+from src.services import token_budget
 from game_state import (
     Player, PlayerType, Phase, GameState,
     get_alive_players, get_alive_names, find_player,
     check_win_condition, count_by_type,
 )
+from campfire_index import TRUNCATED_NOTE, CampfireHistory, indexed_history
 from world_gen import (
     WorldSeed, generate_world_seed, render_world_brief,
     render_scene_cards, _make_rng,
@@ -48,6 +55,33 @@ MAX_VISIT_EXCHANGES = 6          # 3 kisi icin kisaltildi
 # ── Memory ayarlari ──
 CAMPFIRE_BUFFER = 5    # Son N mesaj raw gosterilir
 SUMMARY_INTERVAL = 3   # Her N yeni mesajda ozet guncelle
+MAX_RAW_TAIL = 20      # Ozet geride kaldiginda gosterilecek max ozetlenmemis mesaj
+BATCH_REACTIONS = True # Tepkiler gorunurluk grubu basina tek LLM cagrisinda toplanir (parse hatasinda tek tek)
+
+# ── Orkestrator ayarlari ──
+ORCHESTRATOR_MODE = "llm"       # "local" | "llm" | "hybrid" — oyun basina state["orchestrator_mode"] ile acilir
+ORCHESTRATOR_TIE_MARGIN = 0.5   # hybrid: ilk iki skor bu kadar yakinsa LLM karar verir
+ORCHESTRATOR_WEIGHTS = {
+    "human": 5.0,        # insan oyuncu soz istiyorsa sira ona
+    "forced": 3.0,       # soz borcu / kul kaymasi sorusu bekleyen
+    "mentioned": 2.0,    # son konusmada adi gecti (suclama / soru)
+    "spotlight": 1.0,    # bu gunun spotlight karti onda
+    "reason_cue": 1.0,   # WANT sebebi savunma / suclama / soru
+    "per_idle_turn": 0.5,  # son konustugundan beri gecen tur (max 4)
+    "turn_share": 0.5,   # ortalamanin altinda konustuysa tur basina
+    "just_spoke": -3.0,  # son konusan kendisi
+    "repeat": -2.0,      # son 3 konusmanin 2'si onun
+}
+_REASON_CUES = ("suc", "yalan", "savun", "cevap", "itham", "suphe", "soru", "neden", "kanit", "?")
+
+# ── Token butceleri ──
+# site → prompt tavani (system + user) / cikti cap'i. Tavan asilirsa once en
+# eski raw mesajlar, sonra ozet detayi kirpilir. "\n[" = model baska bir
+# konusmacinin satirini yazmaya basladi.
+token_budget.register("campfire", input_tokens=2800, max_tokens=220, stop=("\n[",))
+token_budget.register("visit", input_tokens=2800, max_tokens=220, stop=("\n[",))
+token_budget.register("rolling_summary", input_tokens=2000, max_tokens=400)
+token_budget.register("cumulative_summary", input_tokens=2500, max_tokens=600)
 
 # ── Free Phase ayarlari ──
 INITIAL_CAMPFIRE_TURNS = 4    # 3 kisi icin — herkesin 1+ konuşma sansi
@@ -179,6 +213,7 @@ Mevcut ozet ve yeni konuşmalari alacaksin. Ozeti guncelle:
 Türkçe, madde madde yaz. Kısa ve net. Her madde 1 cümle."""
 
 
+@priority("summary")
 async def _update_rolling_summary(current_summary: str, new_messages: list[dict]) -> str:
     """Yeni mesajlarla rolling summary'yi guncelle."""
     if not new_messages:
@@ -203,55 +238,64 @@ async def _update_rolling_summary(current_summary: str, new_messages: list[dict]
         system_prompt=ROLLING_SUMMARY_SYSTEM,
         model=MODEL,
         temperature=0.2,
+        **token_budget.limits("rolling_summary"),
     )
     return result.output.strip()
 
 
-async def _maybe_update_campfire_summary(state: GameState) -> None:
-    """Yeterli yeni mesaj varsa rolling summary guncelle."""
-    speeches = [m for m in state["campfire_history"] if m["type"] == "speech"]
+def summary_window(state: GameState, final: bool = False) -> tuple[int, int] | None:
+    """
+    Rolling summary'ye eklenecek campfire_history araligi [cursor, end).
+    _summary_cursor = ozetin kapsadigi history uzunlugu. Normalde son
+    CAMPFIRE_BUFFER mesaj raw kalir ve en az SUMMARY_INTERVAL konusma birikmeli;
+    final=True (round ozeti) kalan her seyi alir.
+    """
+    history = indexed_history(state)
     cursor = state.get("_summary_cursor", 0)
+    end = len(history) if final else len(history) - CAMPFIRE_BUFFER
+    if end <= cursor:
+        return None
+    speeches = history.speech_count(cursor, end)
+    if speeches == 0 or (not final and speeches < SUMMARY_INTERVAL):
+        return None
+    return cursor, end
+
 
-    # Buffer disindaki mesaj sayisi
-    beyond_buffer = len(speeches) - CAMPFIRE_BUFFER
-    if beyond_buffer > cursor and (beyond_buffer - cursor) >= SUMMARY_INTERVAL:
-        to_summarize = speeches[cursor:beyond_buffer]
+async def _maybe_update_campfire_summary(state: GameState) -> None:
+    """Yeterli yeni mesaj varsa rolling summary guncelle."""
+    window = summary_window(state)
+    if window:
+        cursor, end = window
         state["campfire_rolling_summary"] = await _update_rolling_summary(
             state.get("campfire_rolling_summary", ""),
-            to_summarize,
+            state["campfire_history"][cursor:end],
         )
-        state["_summary_cursor"] = beyond_buffer
-        print(f"  [Memory] Ozet guncellendi ({beyond_buffer} mesaj ozetlendi)")
+        state["_summary_cursor"] = end
+        print(f"  [Memory] Ozet guncellendi ({end} mesaj ozetlendi)")
 
 
 def _format_campfire_context(state: GameState, viewer: str | None = None) -> str:
-    """Rolling summary + son CAMPFIRE_BUFFER raw mesaj.
+    """Rolling summary + ozetin kapsamadigi raw mesajlar (en az son CAMPFIRE_BUFFER).
+    Ozet arka planda guncellenir; geride kalirsa aradaki mesajlar raw gosterilir.
     viewer verilirse sadece o oyuncunun duyabilecegi mesajlar gosterilir."""
-    summary = state.get("campfire_rolling_summary", "")
-    all_msgs = [m for m in state["campfire_history"]
-                if m["type"] in ("speech", "moderator", "narrator")]
+    return _render_campfire_context(*_campfire_context_parts(state, viewer))
+
 
-    # Viewer filtresi: "present" alani varsa ve viewer icinde degilse gosterme
-    if viewer:
-        all_msgs = [m for m in all_msgs
-                    if "present" not in m or viewer in m["present"]]
+def _campfire_context_parts(state: GameState, viewer: str | None = None) -> tuple[str, list[str]]:
+    """(rolling summary, raw mesaj satirlari) — token butcesi kirpmadan once."""
+    cursor = state.get("_summary_cursor", 0)
+    # Viewer filtresi: "present" alani varsa ve viewer icinde degilse gosterme (bitmask index)
+    lines = indexed_history(state).context_window(
+        viewer or None, cursor, CAMPFIRE_BUFFER, MAX_RAW_TAIL,
+    )
+    return state.get("campfire_rolling_summary", ""), lines
 
-    recent = all_msgs[-CAMPFIRE_BUFFER:] if len(all_msgs) > CAMPFIRE_BUFFER else all_msgs
 
+def _render_campfire_context(summary: str, lines: list[str]) -> str:
     parts = []
     if summary:
         parts.append(f"[ONCEKI KONUSMALARIN OZETI]\n{summary}")
 
-    lines = []
-    for msg in recent:
-        if msg["type"] == "speech":
-            role = msg.get('role_title', '?')
-            lines.append(f"[{msg['name']}] ({role}): {msg['content']}")
-        elif msg["type"] == "moderator":
-            lines.append(f"[Ocak Bekçisi]: {msg['content']}")
-        elif msg["type"] == "narrator":
-            lines.append(f"[Anlatici]: {msg['content']}")
-
     if lines:
         parts.append("[SON KONUSMALAR]\n" + "\n".join(lines))
 
@@ -271,6 +315,7 @@ Mevcut kumulatif ozet ve bu gunun bilgilerini alacaksin. Birlesik bir ozet yaz:
 Türkçe, madde madde yaz. Kısa ve net."""
 
 
+@priority("summary")
 async def _update_cumulative_summary(
     cumulative: str,
     round_number: int,
@@ -289,6 +334,7 @@ async def _update_cumulative_summary(
         system_prompt=CUMULATIVE_SUMMARY_SYSTEM,
         model=MODEL,
         temperature=0.2,
+        **token_budget.limits("cumulative_summary"),
     )
     return result.output.strip()
 
@@ -639,35 +685,54 @@ DIEGETIC_MESSAGES = {
 }
 
 
+DEFAULT_TABOO_WORDS = ["AI", "LLM", "model", "prompt", "sistem"]
+
+
+def _moderation_warning(speaker_name: str, reason: str) -> str:
+    """Uyari sayisina gore diegetic mesaj (WARN → HARD_WARN → SILENCE)."""
+    count = _warning_counts.get(speaker_name, 0) + 1
+    _warning_counts[speaker_name] = count
+
+    if count >= 3:
+        diegetic = DIEGETIC_MESSAGES["SILENCE"]
+    elif count >= 2:
+        diegetic = DIEGETIC_MESSAGES["HARD_WARN"]
+    else:
+        diegetic = DIEGETIC_MESSAGES["WARN"]
+
+    return f"{diegetic} ({reason})"
+
+
+@priority("moderation")
 async def moderator_check(
     speaker_name: str,
     message: str,
     world_seed: WorldSeed | None = None,
 ) -> tuple[bool, str]:
-    """Mesaji kontrol et. False donerse mesaj engellenir."""
-    taboo = ", ".join(world_seed.taboo_words[:10]) if world_seed else "AI, LLM, model, prompt, sistem"
-
-    result = await llm_generate(
+    """Mesaji kontrol et. False donerse mesaj engellenir.
+    Once yerel taboo otomati: net PASS / ihlal LLM'e gitmez, sadece belirsiz metin gider."""
+    taboo_words = world_seed.taboo_words if world_seed else DEFAULT_TABOO_WORDS
+
+    verdict = taboo.classify(message, taboo_words)
+    if verdict.decision == taboo.PASS:
+        return True, ""
+    if verdict.decision == taboo.VIOLATION:
+        print(f"  [Moderator] {speaker_name}: {verdict.reason} (yerel)")
+        return False, _moderation_warning(speaker_name, verdict.reason)
+
+    result = await llm_classify.classify(
         prompt=f"[{speaker_name}]: {message}",
-        system_prompt=MODERATOR_SYSTEM.format(taboo_words=taboo),
+        system_prompt=MODERATOR_SYSTEM.format(taboo_words=", ".join(taboo_words[:10])),
+        labels=("OK", "REMOVE"),
+        reason_labels=("REMOVE",),
+        site="moderation",
         model=MODEL,
         temperature=0.1,
     )
-    text = result.output.strip()
 
-    if text.startswith("REMOVE"):
-        reason = text.split("|", 1)[1].strip() if "|" in text else "Kural ihlali."
-        count = _warning_counts.get(speaker_name, 0) + 1
-        _warning_counts[speaker_name] = count
-
-        if count >= 3:
-            diegetic = DIEGETIC_MESSAGES["SILENCE"]
-        elif count >= 2:
-            diegetic = DIEGETIC_MESSAGES["HARD_WARN"]
-        else:
-            diegetic = DIEGETIC_MESSAGES["WARN"]
-
-        return False, f"{diegetic} ({reason})"
+    if result.label == "REMOVE":
+        reason = await result.reason() or "Kural ihlali."
+        return False, _moderation_warning(speaker_name, reason)
 
     return True, ""
 
@@ -785,38 +850,40 @@ Simdi sen konus ({name}, {role_title}):"""
 
 
 def _format_campfire_history(state: GameState, last_n: int | None = None) -> str:
-    speeches = [m for m in state["campfire_history"] if m["type"] in ("speech", "moderator", "narrator")]
-    if last_n:
-        speeches = speeches[-last_n:]
-    lines = []
-    for msg in speeches:
-        if msg["type"] == "speech":
-            role = msg.get('role_title', '?')
-            lines.append(f"[{msg['name']}] ({role}): {msg['content']}")
-        elif msg["type"] == "moderator":
-            lines.append(f"[Ocak Bekçisi]: {msg['content']}")
-        elif msg["type"] == "narrator":
-            lines.append(f"[Anlatici]: {msg['content']}")
-    return "\n".join(lines)
+    return "\n".join(indexed_history(state).context_lines(last_n))
+
+
+# ── Prompt parcalari (cache'li) ──
+# Parca → uretildigi state anahtari. O anahtari degistiren olay
+# prompt_cache.invalidate cagirir: surgun (messages), spotlight karti,
+# kurum ziyareti, yeni round (hepsi).
+prompt_cache.register("world", "world_seed")
+prompt_cache.register("exiled", "messages")
+prompt_cache.register("card", "_institution_visits")
+prompt_cache.register("spotlight", "_spotlight_cards")
 
 
 def _get_exiled_context(state: GameState) -> str:
-    exiles = [m for m in state.get("messages", []) if isinstance(m, dict) and m.get("type") == "exile"]
-    if exiles:
-        lines = [f"- Gun {e['round']}: {e['name']} ({e['role_title']}) sürgün edildi" for e in exiles]
-        return "Önceki sürgünler:\n" + "\n".join(lines)
-    return "(Henuz kimse sürgün edilmedi)"
+    def _render() -> str:
+        exiles = [m for m in state.get("messages", []) if isinstance(m, dict) and m.get("type") == "exile"]
+        if exiles:
+            lines = [f"- Gun {e['round']}: {e['name']} ({e['role_title']}) sürgün edildi" for e in exiles]
+            return "Önceki sürgünler:\n" + "\n".join(lines)
+        return "(Henuz kimse sürgün edilmedi)"
+    return prompt_cache.fragment(state, "exiled", _render)
 
 
 def _get_world_context(state: GameState) -> str:
-    ws = state.get("world_seed")
-    if not ws:
-        return ""
-    return (
-        f"[{ws['place_variants']['settlement_name']}] "
-        f"Ocak {ws['ocak_rengi'].replace('_', ' ')} renkte. "
-        f"{ws['myth_variant']['rumor']}\n\n"
-    )
+    def _render() -> str:
+        ws = state.get("world_seed")
+        if not ws:
+            return ""
+        return (
+            f"[{ws['place_variants']['settlement_name']}] "
+            f"Ocak {ws['ocak_rengi'].replace('_', ' ')} renkte. "
+            f"{ws['myth_variant']['rumor']}\n\n"
+        )
+    return prompt_cache.fragment(state, "world", _render)
 
 
 async def _get_reaction(player: Player, last_speech: dict, state: GameState) -> dict:
@@ -826,27 +893,198 @@ async def _get_reaction(player: Player, last_speech: dict, state: GameState) ->
         f"Son konusan: [{last_speech['name']}]: {last_speech['content']}\n\n"
         f"Sen {player.name} ({player.role_title}) olarak tepki vermek istiyor musun?"
     )
-    result = await llm_generate(
+    result = await llm_classify.classify(
         prompt=prompt,
         system_prompt=REACTION_SYSTEM.format(name=player.name, role_title=player.role_title),
+        labels=("WANT", "PASS"),
+        reason_labels=("WANT",),
+        site="reaction",
         model=MODEL,
         temperature=0.7,
     )
-    text = result.output.strip()
-    if text.startswith("WANT"):
-        reason = text.split("|", 1)[1].strip() if "|" in text else "konuşmak istiyor"
+    if result.label == "WANT":
+        reason = await result.reason() or "konuşmak istiyor"
         return {"name": player.name, "wants": True, "reason": reason}
     return {"name": player.name, "wants": False, "reason": ""}
 
 
+REACTION_BATCH_SYSTEM = """Tartisma fazinda birden fazla karakterin ic tepkisini ayni anda belirliyorsun.
+
+Az once birisi konustu. Listedeki karakterlerin hepsi ayni "Duyduklari"
+blogundaki konuşmalari bilir. HER karakter icin ayri ayri, kendi
+kisiligiyle karar ver: konuşmak istiyor mu?
+
+Her karakter icin TEK satir yaz, baska hicbir sey yazma:
+<isim>|WANT|<neden konuşmak istiyor — 1 kisa cümle>
+veya
+<isim>|PASS
+
+Karakter olarak dusun — herkes her mesaja tepki vermek zorunda degil."""
+
+
+def _parse_reaction_batch(text: str, names: list[str]) -> dict[str, dict]:
+    """Batch cevabini parse et. Sadece gecerli isimler ve WANT/PASS kabul edilir."""
+    by_lower = {n.lower(): n for n in names}
+    parsed: dict[str, dict] = {}
+    for line in text.splitlines():
+        parts = [x.strip() for x in line.strip().strip("-*").split("|")]
+        if len(parts) < 2:
+            continue
+        name = by_lower.get(parts[0].strip("[]").lower())
+        decision = parts[1].upper()
+        if not name or name in parsed:
+            continue
+        if decision.startswith("WANT"):
+            reason = parts[2] if len(parts) > 2 and parts[2] else "konuşmak istiyor"
+            parsed[name] = {"name": name, "wants": True, "reason": reason}
+        elif decision.startswith("PASS"):
+            parsed[name] = {"name": name, "wants": False, "reason": ""}
+    return parsed
+
+
+async def _get_reactions_batch(
+    players: list[Player], last_speech: dict, state: GameState,
+) -> tuple[list[dict], int]:
+    """
+    Oyuncularin WANT/PASS kararini gorunurluk grubu basina tek LLM cagrisinda al.
+    Sadece ayni seyi duyan oyuncular (ayni viewer context'i) ayni istege girer;
+    bir grubun duydugu, baska grubun prompt'una hic girmez. Tek kisilik grup
+    dogrudan _get_reaction'a gider; parse edilemeyen / eksik oyuncular da
+    tek tek ona duser. (reactions, provider_call_sayisi) doner.
+    """
+    if not players:
+        return [], 0
+
+    # Viewer bazli context — ayni gorunumu paylasanlari grupla
+    groups: dict[str, list[Player]] = {}
+    for p in players:
+        groups.setdefault(_format_campfire_context(state, viewer=p.name), []).append(p)
+
+    async def _run_group(ctx: str, members: list[Player]) -> dict[str, dict]:
+        names = [p.name for p in members]
+        prompt = (
+            f"Duyduklari:\n{ctx}\n\n"
+            + "\n".join(f"- {p.name} ({p.role_title})" for p in members)
+            + f"\n\nSon konusan: [{last_speech['name']}]: {last_speech['content']}\n\n"
+            + f"Karar verilecek karakterler: {', '.join(names)}"
+        )
+        try:
+            result = await llm_generate(
+                prompt=prompt,
+                system_prompt=REACTION_BATCH_SYSTEM,
+                model=MODEL,
+                temperature=0.7,
+            )
+            return _parse_reaction_batch(result.output, names)
+        except Exception:
+            return {}
+
+    batched = [(ctx, members) for ctx, members in groups.items() if len(members) > 1]
+    calls = len(batched)
+    parsed: dict[str, dict] = {}
+    for part in await asyncio.gather(*[_run_group(ctx, members) for ctx, members in batched]):
+        parsed.update(part)
+
+    missing = [p for p in players if p.name not in parsed]
+    if missing:
+        calls += len(missing)
+        fallback = await asyncio.gather(
+            *[_get_reaction(p, last_speech, state) for p in missing],
+            return_exceptions=True,
+        )
+        for p, r in zip(missing, fallback):
+            parsed[p.name] = r if isinstance(r, dict) else {"name": p.name, "wants": False, "reason": ""}
+
+    return [parsed[p.name] for p in players], calls
+
+
 async def _broadcast_and_collect(state: GameState, last_speech: dict) -> list[dict]:
     alive = get_alive_players(state)
     others = [p for p in alive if p.name != last_speech["name"]]
+    if BATCH_REACTIONS:
+        reactions, _ = await _get_reactions_batch(others, last_speech, state)
+        return reactions
     tasks = [_get_reaction(p, last_speech, state) for p in others]
     return list(await asyncio.gather(*tasks))
 
 
+def _score_wanters(state: GameState, wanters: list[dict]) -> list[tuple[float, dict]]:
+    """Yerel orkestrator skoru — LLM'siz, mikro saniyeler. Yuksekten dusuge (esitlikte tepki sirasi)."""
+    w = ORCHESTRATOR_WEIGHTS
+    speeches = indexed_history(state).speeches()
+    recent = [m["name"] for m in speeches[-3:]]
+    counts = Counter(m["name"] for m in speeches)
+    mean_count = sum(counts[r["name"]] for r in wanters) / len(wanters)
+    last_text = taboo.normalize(speeches[-1]["content"]) if speeches else ""
+    round_n = state.get("round_number", 1)
+    forced = set(state.get("_forced_speakers", [])) | {
+        q["speaker"] for q in state.get("_kul_kaymasi_queue", []) if q.get("round") == round_n
+    }
+    spotlight = {c["player_name"] for c in state.get("_spotlight_cards") or []}
+
+    scored = []
+    for r in wanters:
+        name = r["name"]
+        player = find_player(state, name)
+        score = 0.0
+        if player and player.is_human:
+            score += w["human"]
+        if name in forced:
+            score += w["forced"]
+        if name in spotlight:
+            score += w["spotlight"]
+        if last_text and taboo.normalize(name) in last_text and recent[-1:] != [name]:
+            score += w["mentioned"]
+        reason = taboo.normalize(r.get("reason", ""))
+        if any(cue in reason for cue in _REASON_CUES):
+            score += w["reason_cue"]
+        # Recency: son konusan / ust uste konusan geri, uzun susan one
+        if recent[-1:] == [name]:
+            score += w["just_spoke"]
+        if recent.count(name) >= 2:
+            score += w["repeat"]
+        idle = next((i for i, m in enumerate(reversed(speeches)) if m["name"] == name), len(speeches))
+        score += w["per_idle_turn"] * min(idle, 4)
+        score += w["turn_share"] * (mean_count - counts[name])
+        scored.append((score, r))
+
+    order = {id(r): i for i, r in enumerate(wanters)}
+    return sorted(scored, key=lambda sr: (-sr[0], order[id(sr[1])]))
+
+
+async def _orchestrator_pick_local(state: GameState, reactions: list[dict]) -> tuple[str, str]:
+    wanters = [r for r in reactions if r["wants"]]
+    if not wanters:
+        return "END", ""
+    return "NEXT", _score_wanters(state, wanters)[0][1]["name"]
+
+
+async def _orchestrator_pick_hybrid(state: GameState, reactions: list[dict]) -> tuple[str, str]:
+    """Yerel skor; sadece ilk siralar berabereyse LLM berabere kalanlar arasindan secer."""
+    wanters = [r for r in reactions if r["wants"]]
+    if not wanters:
+        return "END", ""
+    ranked = _score_wanters(state, wanters)
+    top_score = ranked[0][0]
+    tied = [r for score, r in ranked if top_score - score < ORCHESTRATOR_TIE_MARGIN]
+    if len(tied) < 2:
+        return "NEXT", ranked[0][1]["name"]
+
+    print(f"  [Orkestrator] beraberlik ({', '.join(r['name'] for r in tied)}) — LLM'e soruluyor")
+    action, name = await _orchestrator_pick_llm(state, tied)
+    if action == "NEXT" and name in {r["name"] for r in tied}:
+        return "NEXT", name
+    return "NEXT", ranked[0][1]["name"]
+
+
 async def _orchestrator_pick(state: GameState, reactions: list[dict]) -> tuple[str, str]:
+    """Siradaki konusmaciyi sec. Strateji state["orchestrator_mode"] (yoksa ORCHESTRATOR_MODE)."""
+    mode = state.get("orchestrator_mode") or ORCHESTRATOR_MODE
+    strategy = _ORCHESTRATORS.get(mode, _orchestrator_pick_llm)
+    return await strategy(state, reactions)
+
+
+async def _orchestrator_pick_llm(state: GameState, reactions: list[dict]) -> tuple[str, str]:
     wanters = [r for r in reactions if r["wants"]]
     if not wanters:
         return "END", ""
@@ -867,19 +1105,20 @@ async def _orchestrator_pick(state: GameState, reactions: list[dict]) -> tuple[s
         f"Soz hakki isteyenler:\n{reactions_text}\n\n"
         f"Kimi seciyorsun?"
     )
-    result = await llm_generate(
+    result = await llm_classify.classify(
         prompt=prompt,
         system_prompt=ORCHESTRATOR_SYSTEM.format(reactions_text=reactions_text),
+        labels=("NEXT", "END"),
+        reason_labels=("NEXT",),
+        site="orchestrator",
         model=MODEL,
         temperature=0.5,
     )
-    text = result.output.strip()
-    parts = text.split("|", 1)
 
-    if parts[0].strip() == "END":
+    if result.label == "END":
         return "END", ""
-    if len(parts) >= 2 and parts[0].strip() == "NEXT":
-        name = parts[1].strip()
+    if result.label == "NEXT":
+        name = await result.reason()
         alive_names = get_alive_names(state)
         if name not in alive_names:
             name = wanters[0]["name"]
@@ -887,8 +1126,23 @@ async def _orchestrator_pick(state: GameState, reactions: list[dict]) -> tuple[s
     return "NEXT", wanters[0]["name"]
 
 
+_ORCHESTRATORS = {
+    "local": _orchestrator_pick_local,
+    "llm": _orchestrator_pick_llm,
+    "hybrid": _orchestrator_pick_hybrid,
+}
+
+
 def _build_card_context(player: Player, state: GameState | None = None) -> str:
     """Karakter kartindan campfire prompt'una eklenecek context."""
+    if state is None:
+        return _render_card_context(player, None)
+    return prompt_cache.fragment(
+        state, "card", lambda: _render_card_context(player, state), player=player.name,
+    )
+
+
+def _render_card_context(player: Player, state: GameState | None) -> str:
     parts = []
     if player.institution_label:
         parts.append(f"Kurumun: {player.institution_label}")
@@ -905,6 +1159,12 @@ def _build_card_context(player: Player, state: GameState | None = None) -> str:
 
 def _build_spotlight_context(player: Player, state: GameState) -> str:
     """Spotlight kart bilgisini campfire prompt'una ekle."""
+    return prompt_cache.fragment(
+        state, "spotlight", lambda: _render_spotlight_context(player, state), player=player.name,
+    )
+
+
+def _render_spotlight_context(player: Player, state: GameState) -> str:
     cards = state.get("_spotlight_cards", [])
     if not cards:
         return ""
@@ -929,21 +1189,31 @@ def _build_spotlight_context(player: Player, state: GameState) -> str:
     return "\n".join(parts) if parts else ""
 
 
-async def _character_speak(player: Player, state: GameState, visible_names: list[str] | None = None) -> str:
-    history_text = _format_campfire_context(state, viewer=player.name)
+def _build_speak_prompt(
+    player: Player, state: GameState, visible_names: list[str] | None = None,
+) -> tuple[str, list[str]]:
+    """Campfire konusma prompt'u + tekrar kontrolu icin son kendi mesajlari."""
+    with prompt_cache.profile("campfire") as prof:
+        prompt, own_recent = _assemble_speak_prompt(player, state, visible_names)
+        prof.size = len(prompt)
+    return prompt, own_recent
+
+
+def _assemble_speak_prompt(
+    player: Player, state: GameState, visible_names: list[str] | None,
+) -> tuple[str, list[str]]:
+    summary, lines = _campfire_context_parts(state, viewer=player.name)
     # Use visible_names (campfire participants) if provided, otherwise all alive
     alive_names = ", ".join(visible_names) if visible_names else ", ".join(get_alive_names(state))
 
-    own_msgs = [
-        m["content"] for m in state["campfire_history"]
-        if m["type"] == "speech" and m["name"] == player.name
-    ][-2:]
+    own_recent = [m["content"] for m in indexed_history(state).own_speeches(player.name, 3)]
+    own_msgs = own_recent[-2:]
     own_last = "\n".join(own_msgs) if own_msgs else "(henuz konuşmadın)"
 
     cumulative = state.get("cumulative_summary", "")
     cumulative_context = f"ONCEKI GUNLERIN OZETI:\n{cumulative}" if cumulative else ""
 
-    prompt = CHARACTER_WRAPPER.format(
+    fields = dict(
         world_context=_get_world_context(state),
         round_number=state.get("round_number", 1),
         day_limit=state.get("day_limit", 5),
@@ -952,23 +1222,97 @@ async def _character_speak(player: Player, state: GameState, visible_names: list
         cumulative_context=cumulative_context,
         card_context=_build_card_context(player, state),
         spotlight_context=_build_spotlight_context(player, state),
-        history=history_text,
         own_last=own_last,
         name=player.name,
         role_title=player.role_title,
     )
+    # Token butcesi: history disindaki kisim sabit, taşan baglam kirpilir
+    fit = token_budget.fit(
+        "campfire", CHARACTER_WRAPPER.format(history="", **fields),
+        lines, summary, player.acting_prompt,
+    )
+    if fit.over:
+        print(f"  [Budget] campfire prompt butceyi asiyor ({player.name}): ~{fit.tokens} token")
+    prompt = CHARACTER_WRAPPER.format(history=_render_campfire_context(fit.summary, fit.lines), **fields)
 
-    # Onceki mesajlar (tekrar kontrolu icin)
-    own_recent = [m["content"] for m in state["campfire_history"]
-                  if m["type"] == "speech" and m["name"] == player.name][-3:]
+    # own_recent: onceki mesajlar (tekrar kontrolu icin)
+    return prompt, own_recent
+
+
+class StreamedSpeech(str):
+    """
+    _stream_speech sonucu — str gibi kullanilir, yaninda durum bayraklari:
+      duplicate: kendi son sozlerinin tekrari (ses zaten yayinda) — history'ye yazilmaz
+      truncated: stream yarida koptu, eldeki metin — history'ye "truncated" ile yazilir
+    """
+    duplicate = False
+    truncated = False
+
+
+async def _stream_speech(
+    player: Player, prompt: str, own_recent: list[str], on_token, site: str = "campfire",
+) -> StreamedSpeech:
+    """
+    Konusmayi llm_stream ile token token uret, her token'i on_token'a ver.
+    Stream hic token vermeden koparsa llm_generate'e duser. Donen metin
+    sanitize edilmis final metindir (history / moderasyon / tekrar kontrolu);
+    tekrar / yarida kesilme StreamedSpeech bayraklariyla bildirilir.
+    site: token butcesi (max_tokens + stop) ve gecikme metrigi.
+    """
+    truncated = False
+    parts: list[str] = []
+    start = time.perf_counter()
+    try:
+        async for token in llm_stream(
+            prompt=prompt,
+            system_prompt=player.acting_prompt,
+            model=MODEL,
+            temperature=0.75,
+            **token_budget.limits(site),
+        ):
+            parts.append(token)
+            await on_token(token)
+    except Exception as e:
+        if parts:
+            print(f"  [{player.name}] stream yarida kesildi, eldeki metin kullaniliyor: {e}")
+            truncated = True
+        else:
+            print(f"  [{player.name}] stream basarisiz, generate'e donuluyor: {e}")
+            result = await llm_generate(
+                prompt=prompt,
+                system_prompt=player.acting_prompt,
+                model=MODEL,
+                temperature=0.75,
+                **token_budget.limits(site),
+            )
+            parts.append(result.output)
+            await on_token(result.output)
+
+    raw = "".join(parts)
+    token_budget.observe(site, raw, (time.perf_counter() - start) * 1000)
+    speech = StreamedSpeech(_sanitize_speech(raw))
+    speech.truncated = truncated
+    if _is_duplicate(speech, own_recent):
+        # Ses zaten yayinda — yeniden uretmek yerine isaretle, history'ye yazilmaz
+        print(f"  [{player.name}] tekrar tespit edildi (stream)")
+        speech.duplicate = True
+    return speech
+
+
+@priority("speech")
+async def _character_speak(player: Player, state: GameState, visible_names: list[str] | None = None) -> str:
+    prompt, own_recent = _build_speak_prompt(player, state, visible_names)
 
     for attempt in range(2):
+        start = time.perf_counter()
         result = await llm_generate(
             prompt=prompt,
             system_prompt=player.acting_prompt,
             model=MODEL,
             temperature=0.75 + (attempt * 0.1),
+            **token_budget.limits("campfire"),
         )
+        token_budget.observe("campfire", result.output, (time.perf_counter() - start) * 1000)
         speech = _sanitize_speech(result.output)
         if not _is_duplicate(speech, own_recent):
             return speech
@@ -977,6 +1321,14 @@ async def _character_speak(player: Player, state: GameState, visible_names: list
     return speech  # 2. denemede de benzer ciktiysa yine de dondur
 
 
+@priority("speech")
+async def _character_speak_stream(
+    player: Player, state: GameState, visible_names: list[str] | None, on_token,
+) -> str:
+    prompt, own_recent = _build_speak_prompt(player, state, visible_names)
+    return await _stream_speech(player, prompt, own_recent, on_token)
+
+
 async def run_campfire(state: GameState) -> GameState:
     """Tartisma fazini calistir."""
     round_n = state.get("round_number", 1)
@@ -1013,10 +1365,9 @@ async def run_campfire(state: GameState) -> GameState:
     while turn < MAX_CAMPFIRE_TURNS:
         turn += 1
 
-        last_speeches = [m for m in state["campfire_history"] if m["type"] == "speech"]
-        if not last_speeches:
+        last_speech = indexed_history(state).last_speech()
+        if not last_speech:
             break
-        last_speech = last_speeches[-1]
 
         print(f"\n  Tepkiler toplanıyor...")
         reactions = await _broadcast_and_collect(state, last_speech)
@@ -1053,8 +1404,9 @@ async def run_campfire(state: GameState) -> GameState:
         # Rolling summary guncelle
         await _maybe_update_campfire_summary(state)
 
-    speech_count = sum(1 for m in state["campfire_history"] if m["type"] == "speech")
-    speakers = set(m["name"] for m in state["campfire_history"] if m["type"] == "speech")
+    history = indexed_history(state)
+    speech_count = history.speech_count()
+    speakers = history.speakers()
     print(f"\n  Tartisma ozeti: {speech_count} konuşma, {len(speakers)} konuşmaci")
 
     return state
@@ -1079,6 +1431,7 @@ Türkçe yaz. Duz, sade dil. Madde madde yaz."""
 _campfire_summary_cache: dict[int, str] = {}
 
 
+@priority("summary")
 async def summarize_campfire(campfire_history: list[dict], round_number: int = 1) -> str:
     """Campfire logunu LLM ile ozetle, cachele."""
     if round_number in _campfire_summary_cache:
@@ -1249,13 +1602,27 @@ def _match_visit_pairs(requests: list[dict]) -> list[tuple[str, str, str]]:
     return pairs
 
 
-async def _character_speak_1v1(
+def _build_visit_prompt(
     player: Player,
     opponent: Player,
     exchanges: list[dict],
     state: GameState,
     campfire_summary: str,
-) -> str:
+) -> tuple[str, list[str]]:
+    """1v1 gorusme prompt'u + tekrar kontrolu icin son kendi mesajlari."""
+    with prompt_cache.profile("visit") as prof:
+        prompt, own_recent = _assemble_visit_prompt(player, opponent, exchanges, state, campfire_summary)
+        prof.size = len(prompt)
+    return prompt, own_recent
+
+
+def _assemble_visit_prompt(
+    player: Player,
+    opponent: Player,
+    exchanges: list[dict],
+    state: GameState,
+    campfire_summary: str,
+) -> tuple[str, list[str]]:
     # Visit icinde de son 5 raw + ozet pattern
     if len(exchanges) > CAMPFIRE_BUFFER:
         old_lines = [f"[{ex['speaker']}]: {ex['content'][:150]}" for ex in exchanges[:-CAMPFIRE_BUFFER]]
@@ -1265,10 +1632,10 @@ async def _character_speak_1v1(
         old_summary = ""
         recent = exchanges
 
-    visit_lines = [f"[{ex['speaker']}] ({ex['role_title']}): {ex['content']}" for ex in recent]
-    visit_history = "\n".join(visit_lines) if visit_lines else "(henuz konuşmadın)"
-    if old_summary:
-        visit_history = f"{old_summary}\n\n{visit_history}"
+    visit_lines = [
+        f"[{ex['speaker']}] ({ex['role_title']}): {ex['content']}{TRUNCATED_NOTE if ex.get('truncated') else ''}"
+        for ex in recent
+    ]
 
     own_msgs = [ex["content"] for ex in exchanges if ex["speaker"] == player.name][-2:]
     own_last = "\n".join(own_msgs) if own_msgs else "(henuz konuşmadın)"
@@ -1276,7 +1643,7 @@ async def _character_speak_1v1(
     cumulative = state.get("cumulative_summary", "")
     cumulative_context = f"ONCEKI GUNLERIN OZETI:\n{cumulative}" if cumulative else ""
 
-    prompt = VISIT_WRAPPER.format(
+    fields = dict(
         world_context=_get_world_context(state),
         opponent_name=opponent.name,
         opponent_role=opponent.role_title,
@@ -1286,22 +1653,47 @@ async def _character_speak_1v1(
         cumulative_context=cumulative_context,
         card_context=_build_card_context(player, state),
         campfire_summary=campfire_summary,
-        visit_history=visit_history,
         own_last=own_last,
         name=player.name,
         role_title=player.role_title,
     )
+    fit = token_budget.fit(
+        "visit", VISIT_WRAPPER.format(visit_history="", **fields),
+        visit_lines, old_summary, player.acting_prompt,
+    )
+    if fit.over:
+        print(f"  [Budget] visit prompt butceyi asiyor ({player.name}): ~{fit.tokens} token")
+    visit_history = "\n".join(fit.lines) if fit.lines else "(henuz konuşmadın)"
+    if fit.summary:
+        visit_history = f"{fit.summary}\n\n{visit_history}"
+
+    prompt = VISIT_WRAPPER.format(visit_history=visit_history, **fields)
 
     # Onceki mesajlar (tekrar kontrolu icin)
     own_recent = [ex["content"] for ex in exchanges if ex["speaker"] == player.name][-3:]
+    return prompt, own_recent
+
+
+@priority("speech")
+async def _character_speak_1v1(
+    player: Player,
+    opponent: Player,
+    exchanges: list[dict],
+    state: GameState,
+    campfire_summary: str,
+) -> str:
+    prompt, own_recent = _build_visit_prompt(player, opponent, exchanges, state, campfire_summary)
 
     for attempt in range(2):
+        start = time.perf_counter()
         result = await llm_generate(
             prompt=prompt,
             system_prompt=player.acting_prompt,
             model=MODEL,
             temperature=0.75 + (attempt * 0.1),
+            **token_budget.limits("visit"),
         )
+        token_budget.observe("visit", result.output, (time.perf_counter() - start) * 1000)
         speech = _sanitize_speech(result.output)
         if not _is_duplicate(speech, own_recent):
             return speech
@@ -1310,6 +1702,19 @@ async def _character_speak_1v1(
     return speech
 
 
+@priority("speech")
+async def _character_speak_1v1_stream(
+    player: Player,
+    opponent: Player,
+    exchanges: list[dict],
+    state: GameState,
+    campfire_summary: str,
+    on_token,
+) -> str:
+    prompt, own_recent = _build_visit_prompt(player, opponent, exchanges, state, campfire_summary)
+    return await _stream_speech(player, prompt, own_recent, on_token, site="visit")
+
+
 async def _run_single_visit(
     visitor: Player,
     host: Player,
@@ -1491,9 +1896,18 @@ async def _get_location_decision(
     )
 
     text = result.output.strip().split("\n")[0].strip()
+    parsed = _parse_location_decision(player.name, text, alive_names)
+    return parsed or {"name": player.name, "decision": "campfire", "target": None}
+
+
+def _parse_location_decision(name: str, text: str, alive_names: list[str]) -> dict | None:
+    """CAMPFIRE / HOME / VISIT|x / INSTITUTION|id satirini dogrula. Gecersizse None."""
+    text = text.strip()
+    if text.startswith("CAMPFIRE"):
+        return {"name": name, "decision": "campfire", "target": None}
     if text == "HOME":
-        return {"name": player.name, "decision": "home", "target": None}
-    elif text.startswith("VISIT") and "|" in text:
+        return {"name": name, "decision": "home", "target": None}
+    if text.startswith("VISIT") and "|" in text:
         target = text.split("|", 1)[1].strip()
         if target not in alive_names:
             for n in alive_names:
@@ -1501,16 +1915,14 @@ async def _get_location_decision(
                     target = n
                     break
             else:
-                return {"name": player.name, "decision": "campfire", "target": None}
-        return {"name": player.name, "decision": "visit", "target": target}
-    elif text.startswith("INSTITUTION") and "|" in text:
+                return None
+        return {"name": name, "decision": "visit", "target": target}
+    if text.startswith("INSTITUTION") and "|" in text:
         loc_id = text.split("|", 1)[1].strip().lower()
         valid_ids = [l["id"] for l in INSTITUTION_LOCATIONS]
         if loc_id in valid_ids:
-            return {"name": player.name, "decision": "institution", "target": loc_id}
-        return {"name": player.name, "decision": "campfire", "target": None}
-    else:
-        return {"name": player.name, "decision": "campfire", "target": None}
+            return {"name": name, "decision": "institution", "target": loc_id}
+    return None
 
 
 async def _run_campfire_segment(
@@ -1534,11 +1946,9 @@ async def _run_campfire_segment(
         return
 
     # Son konuşmaci yoksa random sec
-    recent_speeches = [m for m in state["campfire_history"]
-                       if m["type"] == "speech" and m["name"] in participant_names]
     turns_done = 0
 
-    if not recent_speeches:
+    if not indexed_history(state).last_speech(participant_names):
         first = random_module.choice(participants)
         print(f"  [{first.name}] dusunuyor...")
         message = await _character_speak(first, state)
@@ -1563,11 +1973,9 @@ async def _run_campfire_segment(
     while turns_done < max_turns:
         turns_done += 1
 
-        last_speeches = [m for m in state["campfire_history"]
-                         if m["type"] == "speech" and m["name"] in participant_names]
-        if not last_speeches:
+        last_speech = indexed_history(state).last_speech(participant_names)
+        if not last_speech:
             break
-        last_speech = last_speeches[-1]
 
         others = [p for p in participants if p.name != last_speech["name"]]
         if not others:
@@ -1805,8 +2213,9 @@ async def run_free_phase(state: GameState) -> GameState:
     await _run_campfire_segment(state, CLOSING_CAMPFIRE_TURNS)
 
     # Istatistik
-    speech_count = sum(1 for m in state["campfire_history"] if m["type"] == "speech")
-    speakers = set(m["name"] for m in state["campfire_history"] if m["type"] == "speech")
+    history = indexed_history(state)
+    speech_count = history.speech_count()
+    speakers = history.speakers()
     visit_count = len(state.get("house_visits", []))
     print(f"\n  Faz ozeti: {speech_count} campfire konuşma, {len(speakers)} konuşmaci, {visit_count} oda gorusmesi")
 
@@ -1871,16 +2280,19 @@ async def _player_vote(player: Player, state: GameState, campfire_summary: str)
         temperature=0.5,
     )
 
-    vote = result.output.strip().split("\n")[0].strip()
-    if vote not in others:
-        for n in others:
-            if n.lower() in vote.lower():
-                vote = n
-                break
-        else:
-            vote = random_module.choice(others)
+    vote = _parse_vote(result.output.strip().split("\n")[0].strip(), others)
+    return vote or random_module.choice(others)
+
 
-    return vote
+def _parse_vote(text: str, candidates: list[str]) -> str | None:
+    """Oy satirini gecerli bir isme esle. Eslesmezse None."""
+    text = text.strip().strip(".\"'[]")
+    if text in candidates:
+        return text
+    for n in candidates:
+        if n.lower() in text.lower():
+            return n
+    return None
 
 
 async def run_vote(state: GameState, campfire_summary: str) -> str | None:
@@ -1929,6 +2341,7 @@ def exile_player(state: GameState, name: str) -> Player | None:
             "role_title": player.role_title,
             "was_echo_born": player.is_echo_born,
         })
+        prompt_cache.invalidate(state, "messages")
 
         tag = "YANKI-DOGMUS" if player.is_echo_born else "ET-CAN"
         ws = state.get("world_seed")
@@ -1953,8 +2366,24 @@ KURALLAR:
 - Sadece bilgi ver: kaç kişi kaldı, dün ne oldu, bugünün alameti."""
 
 
+def pick_day_omens(state: GameState, round_n: int) -> list[dict]:
+    """Gunun 3 alameti (12'lik havuzdan) — seed + round ile deterministik."""
+    if not OMENS:
+        return []
+    rng_omen = random_module.Random(f"omen_{state.get('world_seed', {}).get('seed', '')}_{round_n}")
+    return rng_omen.sample(OMENS, min(3, len(OMENS)))
+
+
 async def run_morning(state: GameState) -> GameState:
     """Sabah duyurusu — narrator broadcast."""
+    return await apply_morning(state, await prepare_morning(state))
+
+
+async def prepare_morning(state: GameState) -> dict:
+    """
+    Sabah duyurusunu uret, state'e dokunmadan. Girdiler (round, hayattakiler,
+    surgun) sonuca eklenir — onceden hazirlanan sabah bunlarla dogrulanir.
+    """
     round_n = state.get("round_number", 1)
     ws = state.get("world_seed")
     alive = get_alive_players(state)
@@ -1974,13 +2403,8 @@ async def run_morning(state: GameState) -> GameState:
         exile_text = "Gece sessiz geçti. Kimse sürgün edilmedi."
 
     # Omen — her gun 3 alamet sec (12'lik havuzdan)
-    day_omens = []
-    if OMENS:
-        rng_omen = random_module.Random(f"omen_{state.get('world_seed', {}).get('seed', '')}_{round_n}")
-        day_omens = rng_omen.sample(OMENS, min(3, len(OMENS)))
+    day_omens = pick_day_omens(state, round_n)
     omen = ", ".join(o["label"] for o in day_omens) if day_omens else ""
-    # State'e kaydet (game_loop broadcast icin)
-    state["_day_omens"] = day_omens
 
     settlement = ws["place_variants"]["settlement_name"] if ws else "Yerlesim"
     scene_cards = render_scene_cards(WorldSeed(**ws)) if ws else {}
@@ -2035,13 +2459,25 @@ async def run_morning(state: GameState) -> GameState:
         temperature=0.6,
     )
 
-    morning_msg = result.output.strip()
+    return {
+        "round": round_n,
+        "alive": tuple(p.name for p in alive),
+        "exiled": last_exile,
+        "day_omens": day_omens,
+        "message": result.output.strip(),
+    }
+
+
+async def apply_morning(state: GameState, morning: dict) -> GameState:
+    """prepare_morning sonucunu state'e yaz + narrator."""
+    # State'e kaydet (game_loop broadcast icin)
+    state["_day_omens"] = morning["day_omens"]
     state["campfire_history"].append({
         "type": "narrator",
-        "content": morning_msg,
+        "content": morning["message"],
     })
 
-    await _emit_narrator(morning_msg)
+    await _emit_narrator(morning["message"])
     return state
 
 
@@ -2061,7 +2497,7 @@ def init_state(
         round_number=1,
         day_limit=day_limit,
         current_speaker=None,
-        campfire_history=[],
+        campfire_history=CampfireHistory(),
         house_visits=[],
         exiled_today=None,
         winner=None,
@@ -2121,7 +2557,8 @@ async def run_full_game(state: GameState) -> GameState:
         print(f"{'#' * 60}")
 
         # Round icin temizlik
-        state["campfire_history"] = []
+        state["campfire_history"] = CampfireHistory()
+        prompt_cache.invalidate(state)
         state["house_visits"] = []
         state["campfire_rolling_summary"] = ""
         state["_summary_cursor"] = 0
@@ -2323,6 +2760,7 @@ async def generate_spotlight_cards(state: GameState) -> list[dict]:
 
     # State'e kaydet
     state["_spotlight_cards"] = cards
+    prompt_cache.invalidate(state, "_spotlight_cards")
     # Spotlight gecmisine ekle
     history = state.get("_spotlight_history", [])
     history.extend(c["player_name"] for c in cards)
@@ -2374,6 +2812,7 @@ async def generate_sinama_event(state: GameState) -> dict | None:
     return sinama
 
 
+@priority("moderation")
 async def check_ocak_tepki(speaker_name: str, speech: str, state: GameState) -> dict | None:
     """Campfire konuşmasi sonrasi çelişki kontrolu (Flash LLM). T1 + T2 + Kul Kaymasi."""
     # Kamu canon ozeti: son sürgünler + onceki iddialar
@@ -2390,10 +2829,7 @@ async def check_ocak_tepki(speaker_name: str, speech: str, state: GameState) ->
         canon_parts.append(f"Campfire ozeti: {summary[:500]}")
 
     # Konusanin onceki sozleri
-    own_speeches = [
-        m["content"] for m in state["campfire_history"]
-        if m.get("type") == "speech" and m.get("name") == speaker_name
-    ][-3:]
+    own_speeches = [m["content"] for m in indexed_history(state).own_speeches(speaker_name, 3)]
     if own_speeches:
         canon_parts.append(f"{speaker_name}'in onceki sozleri: " + " | ".join(own_speeches))
 
@@ -2576,6 +3012,7 @@ async def generate_institution_scene(
                 "round": state.get("round_number", 1),
                 "narrative": narrative,
             })
+            prompt_cache.invalidate(state, "_institution_visits", player=player.name)
 
             return {"narrative": narrative, "ui_update": ui_update}
     except (json.JSONDecodeError, KeyError):
@@ -2588,6 +3025,7 @@ async def generate_institution_scene(
         "round": state.get("round_number", 1),
         "narrative": fallback,
     })
+    prompt_cache.invalidate(state, "_institution_visits", player=player.name)
     return {"narrative": fallback, "ui_update": None}
 
 
@@ -2733,26 +3171,33 @@ async def generate_night_decision(player: Player, state: GameState) -> dict:
     )
 
     text = result.output.strip().split("\n")[0].strip()
+    parsed = _parse_night_move(player.name, text, alive_names)
+    if parsed:
+        return parsed
 
-    # Parse
+    # Fallback: rastgele itibar kirigi
+    rng = random_module.Random(f"night_{player.name}_{round_n}")
+    return {"name": player.name, "move": "itibar_kirigi", "target": rng.choice(alive_names)}
+
+
+def _parse_night_move(name: str, text: str, alive_names: list[str]) -> dict | None:
+    """HAMLE|hedef satirini dogrula. Gecersizse None."""
+    text = text.strip()
     if text.startswith("ITIBAR_KIRIGI") and "|" in text:
         target = text.split("|", 1)[1].strip()
         if target in alive_names:
-            return {"name": player.name, "move": "itibar_kirigi", "target": target}
+            return {"name": name, "move": "itibar_kirigi", "target": target}
     elif text.startswith("GUNDEM_KAYDIRMA") and "|" in text:
         sinama_tip = text.split("|", 1)[1].strip().lower()
         valid_types = [s["id"] for s in SINAMA_TYPES]
         if sinama_tip in valid_types:
-            return {"name": player.name, "move": "gundem_kaydirma", "target": sinama_tip}
+            return {"name": name, "move": "gundem_kaydirma", "target": sinama_tip}
     elif text.startswith("SAHTE_IZ") and "|" in text:
         obj_id = text.split("|", 1)[1].strip().lower()
         valid_objs = [o["id"] for o in ALL_UI_OBJECTS_DEF]
         if obj_id in valid_objs:
-            return {"name": player.name, "move": "sahte_iz", "target": obj_id}
-
-    # Fallback: rastgele itibar kirigi
-    rng = random_module.Random(f"night_{player.name}_{round_n}")
-    return {"name": player.name, "move": "itibar_kirigi", "target": rng.choice(alive_names)}
+            return {"name": name, "move": "sahte_iz", "target": obj_id}
+    return None
 
 
 def resolve_night_phase(state: GameState, decisions: list[dict]) -> dict:
@@ -2906,11 +3351,34 @@ async def generate_campfire_speech(state: GameState, player: Player, participant
     return await _character_speak(player, state, visible_names=participant_names)
 
 
+async def generate_campfire_speech_stream(
+    state: GameState,
+    player: Player,
+    on_token,
+    participant_names: list[str] | None = None,
+) -> str:
+    """generate_campfire_speech'in streaming hali — her token `await on_token(tok)` ile
+    iletilir, donus degeri sanitize edilmis final metin."""
+    return await _character_speak_stream(player, state, participant_names, on_token)
+
+
 async def get_reaction(player: Player, last_speech: dict, state: GameState) -> dict:
     """Bir oyuncunun son konuşmaya tepkisini al. {name, wants, reason}"""
     return await _get_reaction(player, last_speech, state)
 
 
+async def get_reactions(
+    players: list[Player], last_speech: dict, state: GameState,
+) -> tuple[list[dict], int]:
+    """Birden fazla oyuncunun tepkisini gorunurluk grubu basina tek cagrida al. ([{name, wants, reason}], provider_calls)"""
+    if not BATCH_REACTIONS:
+        raw = await asyncio.gather(
+            *[_get_reaction(p, last_speech, state) for p in players], return_exceptions=True,
+        )
+        return [r for r in raw if isinstance(r, dict)], len(players)
+    return await _get_reactions_batch(players, last_speech, state)
+
+
 async def orchestrator_pick(state: GameState, reactions: list[dict]) -> tuple[str, str]:
     """Orkestrator: tepkiler arasından kimi sececegine karar verir. ("NEXT"|"END", name)"""
     return await _orchestrator_pick(state, reactions)
@@ -2944,6 +3412,18 @@ async def generate_1v1_speech(
     return await _character_speak_1v1(speaker, opponent, exchanges, state, campfire_summary)
 
 
+async def generate_1v1_speech_stream(
+    state: GameState,
+    speaker: Player,
+    opponent: Player,
+    exchanges: list[dict],
+    campfire_summary: str,
+    on_token,
+) -> str:
+    """generate_1v1_speech'in streaming hali — token'lar on_token'a, donus final metin."""
+    return await _character_speak_1v1_stream(speaker, opponent, exchanges, state, campfire_summary, on_token)
+
+
 async def generate_location_decision(
     player: Player,
     state: GameState,
@@ -2969,6 +3449,18 @@ async def maybe_update_campfire_summary(state: GameState) -> None:
     await _maybe_update_campfire_summary(state)
 
 
+async def update_rolling_summary(current_summary: str, new_messages: list[dict]) -> str:
+    """Rolling summary'yi yeni mesajlarla guncelle (state'e yazmaz)."""
+    return await _update_rolling_summary(current_summary, new_messages)
+
+
+def format_round_summary(round_number: int, rolling_summary: str) -> str:
+    """Rolling summary'den round ozeti (summarize_campfire ile ayni baslik)."""
+    if not rolling_summary:
+        return "(Onceki tartisma yok)"
+    return f"[Gun {round_number} Ozeti]\n{rolling_summary}"
+
+
 async def update_cumulative_summary(
     cumulative: str,
     round_number: int,
@@ -3006,6 +3498,8 @@ KURALLAR:
 JSON dondur:
 {"proposal_text": "...", "option_a": "...", "option_b": "..."}"""
 
+_SOZ_BORCU_VERDICT = re.compile(r'"verdict"\s*:\s*"(\w+)"')
+
 SOZ_BORCU_SYSTEM = """Bir konuşmayi analiz et: Kul Kaymasi sorusuna net cevap verdi mi, yoksa kacamak mi yapti?
 
 KURALLAR:
@@ -3180,6 +3674,7 @@ def check_soz_borcu(state: GameState, player_name: str) -> None:
     print(f"  [SozBorcu] {player_name} — toplam: {count + 1}")
 
 
+@priority("moderation")
 async def check_soz_borcu_verdict(player_name: str, response: str, question: str) -> bool:
     """Kul Kaymasi sorusuna verilen cevabin kacamak olup olmadigini kontrol et. True = kacamak."""
     prompt = (
@@ -3189,22 +3684,22 @@ async def check_soz_borcu_verdict(player_name: str, response: str, question: str
     )
 
     try:
-        result = await llm_generate(
+        result = await llm_classify.classify(
             prompt=prompt,
             system_prompt=SOZ_BORCU_SYSTEM,
+            labels=("clear", "evasive"),
+            pattern=_SOZ_BORCU_VERDICT,
+            site="soz_borcu",
             model=MODEL,
             temperature=0.1,
         )
-        text = result.output.strip()
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            verdict = json.loads(json_match.group())
-            return verdict.get("verdict") == "evasive"
+        return result.label == "evasive"
     except Exception:
         pass
     return False
 
 
+@priority("speech")
 async def generate_omen_interpretation(player: Player, state: GameState, omen: dict) -> str:
     """AI oyuncu icin alamet yorumu (campfire basinda 1 cümle)."""
     card_ctx = _build_card_context(player, state)
@@ -3281,6 +3776,7 @@ async def generate_sinama_echo(state: GameState) -> str | None:
         return None
 
 
+@priority("speech")
 async def generate_proposal_speech(player: Player, state: GameState, proposal: dict) -> str:
     """AI oyuncu icin onerge hakkinda konuşma (kisa, 1-2 cümle)."""
     card_ctx = _build_card_context(player, state)
@@ -3330,6 +3826,256 @@ async def generate_proposal_vote_ai(player: Player, state: GameState, proposal:
         return "a"
 
 
+# ══════════════════════════════════════════════════════
+#  12. BATCHED DECISIONS — faz basina tek (veya birkac) LLM cagrisi
+# ══════════════════════════════════════════════════════
+# Oylama, gece hamlesi, alamet oyu/yorumu ve konum kararlari her AI oyuncu
+# icin ayri istek atiyordu; faz gecisi en yavas cagriyi bekliyordu. Burada
+# DECISION_BATCH_SIZE oyuncu tek istekte karar verir. Donen her isim ve
+# secim dogrulanir; eksik / gecersiz olan oyuncu tek-oyunculu fonksiyona duser.
+# Ortak prompt'a sadece herkesin bildigi girer: kisilik ozeti karttaki acik
+# alanlardan gelir (acting_prompt gizli kimligi tasir), ozel bilgi
+# (1v1 notlari, kart, duyduklari) private_block ile verilir ve sadece o
+# bilgiyi birebir paylasan oyuncular ayni istekte toplanir.
+
+DECISION_BATCH_SIZE = 6  # Bir istekte en fazla N oyuncu (prompt boyu sinirli kalsin)
+
+BATCH_DECISION_SYSTEM = """Birden fazla karakter icin ayni anda karar veriyorsun.
+Her karakter SADECE kendi blogundaki bilgiyi bilir ve kendi kisiligiyle karar verir;
+baska bir karakterin ozel bilgisini ona mal etme.
+
+{rules}
+
+Her karakter icin TEK satir yaz, baska hicbir sey yazma:
+<karakter_ismi>|{answer_format}"""
+
+
+def _persona_line(player: Player) -> str:
+    """Batch prompt'u icin kisa kisilik ozeti — sadece herkesin gordugu kart alanlari."""
+    parts = [player.archetype_label, player.speech_color or "", player.public_tick or ""]
+    return " / ".join(x.strip().replace("\n", " ") for x in parts if x and x.strip())[:300]
+
+
+async def _batch_decide(
+    players: list[Player],
+    shared_context: str,
+    build_block,
+    rules: str,
+    answer_format: str,
+    parse,
+    fallback,
+    temperature: float = 0.5,
+    private_block=None,
+) -> list:
+    """
+    Genel batch karar motoru.
+
+    build_block(player)   → o oyuncunun blogu (herkese acik bilgi: hedef listesi vs.)
+    private_block(player) → o oyuncunun ozel bilgisi; ayni metni paylasan
+                            oyuncular ayni istekte, digerleri ayri istekte
+    parse(player, raw)    → dogrulanmis sonuc veya None
+    fallback(player)      → tek-oyunculu eski yol (coroutine)
+    Sonuclar players sirasiyla doner.
+    """
+    if not players:
+        return []
+    system = BATCH_DECISION_SYSTEM.format(rules=rules, answer_format=answer_format)
+
+    async def _run_chunk(private: str, chunk: list[Player]) -> dict[str, object]:
+        blocks = [
+            f"### {p.name} ({p.role_title})\nKisilik: {_persona_line(p)}\n{build_block(p)}"
+            for p in chunk
+        ]
+        prompt = (
+            (f"{shared_context}\n\n" if shared_context else "")
+            + (f"{private}\n\n" if private else "")
+            + "\n\n".join(blocks)
+            + f"\n\nKarar verecek karakterler: {', '.join(p.name for p in chunk)}"
+        )
+        try:
+            result = await llm_generate(
+                prompt=prompt, system_prompt=system, model=MODEL, temperature=temperature,
+            )
+        except Exception:
+            return {}
+        by_lower = {p.name.lower(): p for p in chunk}
+        out: dict[str, object] = {}
+        for line in result.output.splitlines():
+            head, sep, raw = line.strip().strip("-*").partition("|")
+            player = by_lower.get(head.strip().strip("[]").lower())
+            if not sep or not player or player.name in out:
+                continue
+            value = parse(player, raw.strip())
+            if value is not None:
+                out[player.name] = value
+        return out
+
+    groups: dict[str, list[Player]] = {}
+    for p in players:
+        groups.setdefault(private_block(p) if private_block else "", []).append(p)
+    chunks = [
+        (private, group[i:i + DECISION_BATCH_SIZE])
+        for private, group in groups.items()
+        for i in range(0, len(group), DECISION_BATCH_SIZE)
+    ]
+    merged: dict[str, object] = {}
+    for part in await asyncio.gather(*[_run_chunk(private, c) for private, c in chunks]):
+        merged.update(part)
+
+    missing = [p for p in players if p.name not in merged]
+    if missing:
+        print(f"  [BATCH] {len(missing)}/{len(players)} karar gecersiz — tek tek yeniden soruluyor")
+        for p, value in zip(missing, await asyncio.gather(*[fallback(p) for p in missing])):
+            merged[p.name] = value
+    return [merged[p.name] for p in players]
+
+
+async def generate_votes(
+    state: GameState, players: list[Player], campfire_summary: str | None = None,
+) -> list[str]:
+    """Tum AI oyuncularin oylarini batch olarak uret. players sirasiyla isim listesi."""
+    if campfire_summary is None:
+        campfire_summary = state.get("campfire_rolling_summary", "")
+    alive_names = get_alive_names(state)
+    ws = state.get("world_seed")
+    cumulative = state.get("cumulative_summary", "")
+    shared = "\n\n".join(x for x in [
+        f"Surgun sozu: \"{ws['rituals']['exile_phrase']}\"" if ws else "",
+        f"ONCEKI GUNLERIN OZETI:\n{cumulative}" if cumulative else "",
+        f"Bugunun tartisma ozeti:\n{campfire_summary}",
+    ] if x)
+
+    def notes(p: Player) -> str:
+        visit_lines = []
+        for v in state.get("house_visits", []):
+            if v.get("visitor") == p.name or v.get("host") == p.name:
+                for ex in v.get("exchanges", []):
+                    visit_lines.append(f"[1v1 {ex['speaker']}]: {ex['content'][:150]}")
+        return "Ozel gorusme notlari:\n" + "\n".join(visit_lines[-8:]) if visit_lines else ""
+
+    return await _batch_decide(
+        players, shared,
+        lambda p: f"Oy verebilecegi kisiler: {', '.join(n for n in alive_names if n != p.name)}",
+        rules=(
+            "Oylama zamani. Her karakter birini sürgün etmek icin oy verir — tartismada ve\n"
+            "ozel gorusmelerde en suphe ceken, en tutarsiz kisiyi secer. Kendine oy veremez."
+        ),
+        answer_format="<oy_verilen_isim>",
+        parse=lambda p, raw: _parse_vote(raw, [n for n in alive_names if n != p.name]),
+        fallback=lambda p: _player_vote(p, state, campfire_summary),
+        temperature=0.5,
+        private_block=notes,
+    )
+
+
+async def generate_night_moves(players: list[Player], state: GameState) -> list[dict]:
+    """Tum AI oyuncularin gece hamlelerini batch olarak uret."""
+    alive_names = get_alive_names(state)
+    baskisi = state.get("_kamu_baskisi")
+    shared = (
+        f"Gun: {state.get('round_number', 1)}\n"
+        f"Ozet: {state.get('cumulative_summary', '')[:300]}"
+        + (f"\nSu an {baskisi['target']} kamu baskisi altinda." if baskisi else "")
+    )
+    return await _batch_decide(
+        players, shared,
+        lambda p: f"Hedef alabilecekleri: {', '.join(n for n in alive_names if n != p.name)}",
+        rules=NIGHT_DECISION_SYSTEM.split("SADECE bir satir yaz.", 1)[0].strip(),
+        answer_format="<HAMLE>|<hedef>",
+        parse=lambda p, raw: _parse_night_move(p.name, raw, [n for n in alive_names if n != p.name]),
+        fallback=lambda p: generate_night_decision(p, state),
+        temperature=0.5,
+    )
+
+
+async def generate_omen_votes(
+    players: list[Player], state: GameState, omen_options: list[dict],
+) -> list[str]:
+    """Tum AI oyuncularin alamet secimini batch olarak uret (omen id listesi)."""
+    options_text = "\n".join(
+        f"{i+1}. {o['label']} ({o['icon']}) — {o.get('atmosphere', '')}"
+        for i, o in enumerate(omen_options)
+    )
+
+    def parse(p: Player, raw: str) -> str | None:
+        m = re.search(r"\d+", raw)
+        if m and 1 <= int(m.group()) <= len(omen_options):
+            return omen_options[int(m.group()) - 1]["id"]
+        return None
+
+    return await _batch_decide(
+        players, f"Alametler:\n{options_text}",
+        lambda p: "",
+        rules="Her karakter ertesi gunun tonunu belirleyecek alametlerden birini secer.",
+        answer_format="<alamet_numarasi>",
+        parse=parse,
+        fallback=lambda p: generate_omen_choice(p, state, omen_options),
+        temperature=0.3,
+    )
+
+
+@priority("speech")
+async def generate_omen_interpretations(
+    players: list[Player], state: GameState, omen: dict,
+) -> list[str]:
+    """
+    Tum AI oyuncularin alamet yorumlarini (1'er cümle) batch olarak uret.
+    Kart context'i (kurum, alibi) oyuncuya ozel oldugu icin her oyuncuyu ayri
+    istege boluyordu; yorum tek cümlelik ton meselesi, ortak context + acik
+    kisilik ozeti yeter. Karti isteyen tek-oyunculu fallback'te hala var.
+    """
+    def parse(p: Player, raw: str) -> str | None:
+        text = raw.strip().strip('"')
+        return text if 3 <= len(text) <= 300 else None
+
+    return await _batch_decide(
+        players,
+        f"Alamet: {omen['label']} ({omen.get('icon', '')})\nAtmosfer: {omen.get('atmosphere', '')}",
+        lambda p: "",
+        rules=OMEN_INTERP_SYSTEM + "\nHer karakter kendi tonunda, digerlerinden farkli bir cümle kurar.",
+        answer_format="<tek cümle>",
+        parse=parse,
+        fallback=lambda p: generate_omen_interpretation(p, state, omen),
+        temperature=0.8,
+    )
+
+
+async def generate_location_decisions(
+    players: list[Player], state: GameState, locations: dict[str, str],
+) -> list[dict]:
+    """Serbest dolasim konum kararlarini batch olarak uret."""
+    alive_names = get_alive_names(state)
+    cumulative = state.get("cumulative_summary", "")
+    shared = (
+        f"Gun {state.get('round_number', 1)}/{state.get('day_limit', 5)}."
+        + (f"\nONCEKI GUNLER:\n{cumulative}" if cumulative else "")
+    )
+
+    def block(p: Player) -> str:
+        campfire_names = [n for n, loc in locations.items() if loc == "campfire" and n != p.name]
+        home_names = [n for n, loc in locations.items() if loc == "home" and n != p.name]
+        visiting = [(n, loc.split(":")[1]) for n, loc in locations.items()
+                    if loc.startswith("visiting:") and n != p.name]
+        return (
+            f"Ates basinda: {', '.join(campfire_names) or 'kimse'}\n"
+            f"Evinde: {', '.join(home_names) or 'kimse'}\n"
+            f"Ziyarette: {', '.join(f'{n} → {t}' for n, t in visiting) or 'kimse'}"
+        )
+
+    rules = LOCATION_DECISION_SYSTEM.split("NEREYE GIDECEKSIN?", 1)[1].split("SADECE su formatta", 1)[0]
+    return await _batch_decide(
+        players, shared, block,
+        rules="Serbest dolasim zamani. Her karakter nereye gidecegini secer." + rules,
+        answer_format="CAMPFIRE | HOME | VISIT|<isim> | INSTITUTION|<lokasyon_id>",
+        parse=lambda p, raw: _parse_location_decision(
+            p.name, raw, [n for n in alive_names if n != p.name],
+        ),
+        fallback=lambda p: _get_location_decision(p, state, locations),
+        temperature=0.7,
+        private_block=lambda p: f"Duyduklari:\n{_format_campfire_context(state, viewer=p.name)}",
+    )
+
+
 # ══════════════════════════════════════════════════════
 #  MAIN
 # ══════════════════════════════════════════════════════
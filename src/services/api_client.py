@@ -18,12 +18,37 @@ from collections.abc import AsyncGenerator
 
 import httpx
 
+from src.services import scheduler
+
 # ── Config ──────────────────────────────────────────
 _api_base_url: str = os.environ.get("CHARACTER_API_URL", "http://localhost:9000")
 _api_key: str = os.environ.get("CHARACTER_API_KEY", "demo-key-123")
 _TIMEOUT = httpx.Timeout(180.0, connect=10.0)
 _POLL_INTERVAL = 0.5
 
+# ── Connection Pool ─────────────────────────────────
+# Her endpoint ailesi icin ayri, process-wide AsyncClient. Boylece bir
+# campfire turu (reaction + orchestrator + speech + tts) her cagride yeniden
+# TCP+TLS handshake odemez; keep-alive baglantilar tekrar kullanilir.
+# LLM ve voice sicak yol — genis havuz. Images ve job polling dar havuz;
+# uzun suren FLUX isleri konusma trafigini bogmasin.
+_POOL_LIMITS: dict[str, int] = {
+    "llm": 64,
+    "voice": 32,
+    "images": 8,
+    "jobs": 8,
+}
+_KEEPALIVE_EXPIRY = 30.0
+_http2: bool = os.environ.get("CHARACTER_API_HTTP2", "").lower() in ("1", "true", "yes")
+# Binary TTS stream (chunked audio/L16) — eski API container'i icin SSE'ye donulebilir
+_binary_audio: bool = os.environ.get("CHARACTER_API_BINARY_AUDIO", "1").lower() in ("1", "true", "yes")
+_clients: dict[str, httpx.AsyncClient] = {}
+_client_loops: dict[str, asyncio.AbstractEventLoop] = {}
+# configure() / loop degisimiyle birakilan client'lar: suren istekleri bitsin
+# diye okuma timeout'u kadar bekleyip kendi loop'larinda kapanirlar.
+_RETIRE_GRACE_SEC = 180.0
+_retiring: dict[asyncio.Task, httpx.AsyncClient] = {}
+
 
 # ── Exception (ayni isim) ──────────────────────────
 class FalServiceError(Exception):
@@ -61,8 +86,103 @@ def _headers() -> dict:
     return {"Authorization": f"Bearer {_api_key}", "Content-Type": "application/json"}
 
 
-async def _poll_job(client: httpx.AsyncClient, job_id: str) -> dict:
+def _h2_available() -> bool:
+    """HTTP/2 icin h2 paketi kurulu mu? (httpx[http2] opsiyonel extra)"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_client(family: str) -> httpx.AsyncClient:
+    """
+    Endpoint ailesi icin paylasilan AsyncClient dondur (lazy olusturulur).
+
+    Client, olusturuldugu event loop'a baglidir; farkli bir loop'tan
+    (ornegin test script'lerinde ardisik asyncio.run) cagrilirsa eski client
+    kendi loop'unda kapatilir (_retire) ve yenisi acilir.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(family)
+    if client is not None and not client.is_closed and _client_loops.get(family) is loop:
+        return client
+    if client is not None:
+        _retire(client, _client_loops.get(family))
+
+    max_conn = _POOL_LIMITS.get(family, _POOL_LIMITS["jobs"])
+    client = httpx.AsyncClient(
+        timeout=_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=max_conn,
+            max_keepalive_connections=max_conn,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        ),
+        http2=_http2 and _h2_available(),
+    )
+    _clients[family] = client
+    _client_loops[family] = loop
+    return client
+
+
+def _retire(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Birakilan client'i kendi loop'unda, _RETIRE_GRACE_SEC sonra kapat."""
+    if client.is_closed or loop is None or loop.is_closed():
+        return  # loop kapanmis — baglantilari onunla gitti
+
+    async def _close_later() -> None:
+        try:
+            await asyncio.sleep(_RETIRE_GRACE_SEC)
+        finally:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+    def _schedule() -> None:
+        task = loop.create_task(_close_later())
+        _retiring[task] = client
+        task.add_done_callback(lambda t: _retiring.pop(t, None))
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        _schedule()
+    else:
+        loop.call_soon_threadsafe(_schedule)
+
+
+async def aclose() -> None:
+    """Tum havuzlanmis (ve kapanmayi bekleyen) client'lari kapat. App shutdown'da cagirilir."""
+    clients = list(_clients.values())
+    _clients.clear()
+    _client_loops.clear()
+    loop = asyncio.get_running_loop()
+    for task in [t for t in _retiring if t.get_loop() is loop]:
+        task.cancel()  # beklemeyi birak, hemen kapat
+        clients.append(_retiring.pop(task))
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
+
+
+def pool_info() -> dict:
+    """Acik client'larin ozeti — debug / benchmark icin."""
+    return {
+        "http2": _http2 and _h2_available(),
+        "binary_audio": _binary_audio,
+        "limits": dict(_POOL_LIMITS),
+        "open": sorted(f for f, c in _clients.items() if not c.is_closed),
+    }
+
+
+async def _poll_job(job_id: str) -> dict:
     """GET /v1/jobs/{job_id} ile job tamamlanana kadar bekle."""
+    client = _get_client("jobs")
     while True:
         resp = await client.get(f"{_api_base_url}/v1/jobs/{job_id}", headers=_headers())
         resp.raise_for_status()
@@ -76,17 +196,35 @@ async def _poll_job(client: httpx.AsyncClient, job_id: str) -> dict:
 
 
 # ── configure() ────────────────────────────────────
-def configure(fal_key: str = "", api_url: str = "", api_key: str = "") -> None:
+def configure(
+    fal_key: str = "",
+    api_url: str = "",
+    api_key: str = "",
+    http2: bool | None = None,
+    pool_limits: dict[str, int] | None = None,
+) -> None:
     """
     Backward-compatible configure.
     fal_key kabul edilir ama yoksayilir (API kendi icinde halleder).
     api_url ve api_key Character AI API baglantisini ayarlar.
+    http2 ve pool_limits connection pool'u ayarlar; sonraki _get_client
+    cagrisinda yeni ayarlarla client acilir, eskiler _retire ile kapanir.
     """
-    global _api_base_url, _api_key
+    global _api_base_url, _api_key, _http2
     if api_url:
         _api_base_url = api_url
     if api_key:
         _api_key = api_key
+    if http2 is not None:
+        _http2 = http2
+    if pool_limits:
+        _POOL_LIMITS.update({k: int(v) for k, v in pool_limits.items() if int(v) > 0})
+    if http2 is not None or pool_limits:
+        # Eski client'lar mevcut istekleri bitirip kapansin; yenileri yeni ayarla acilsin
+        for family, client in _clients.items():
+            _retire(client, _client_loops.get(family))
+        _clients.clear()
+        _client_loops.clear()
 
 
 # ═══════════════════════════════════════════════════
@@ -100,6 +238,7 @@ async def llm_generate(
     temperature: float = 0.8,
     max_tokens: int | None = None,
     reasoning: bool | None = None,
+    stop: list[str] | None = None,
 ) -> LLMResult:
     """Tam LLM yaniti — API uzerinden."""
     body: dict = {
@@ -112,8 +251,11 @@ async def llm_generate(
         body["max_tokens"] = max_tokens
     if reasoning is not None:
         body["reasoning"] = reasoning
+    if stop:
+        body["stop"] = stop
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+        client = _get_client("llm")
+        async with scheduler.slot("llm"):
             resp = await client.post(
                 f"{_api_base_url}/v1/llm/generate",
                 headers=_headers(),
@@ -138,6 +280,7 @@ async def llm_stream(
     model: str = "gemini-2.5-flash",
     temperature: float = 0.8,
     max_tokens: int | None = None,
+    stop: list[str] | None = None,
 ) -> AsyncGenerator[str, None]:
     """Token token yield — SSE parse."""
     body: dict = {
@@ -148,26 +291,29 @@ async def llm_stream(
     }
     if max_tokens is not None:
         body["max_tokens"] = max_tokens
+    if stop:
+        body["stop"] = stop
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            async with client.stream(
-                "POST", f"{_api_base_url}/v1/llm/stream",
-                headers=_headers(), json=body,
-            ) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if line.startswith("data: "):
-                        payload = line[6:]
-                        if not payload.strip():
-                            continue
-                        try:
-                            data = json.loads(payload)
-                        except json.JSONDecodeError:
-                            continue
-                        if "token" in data:
-                            yield data["token"]
-                        if "output" in data and "token" not in data:
-                            break
+        client = _get_client("llm")
+        async with scheduler.slot("llm") as timer, client.stream(
+            "POST", f"{_api_base_url}/v1/llm/stream",
+            headers=_headers(), json=body,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                timer.first_byte()
+                if line.startswith("data: "):
+                    payload = line[6:]
+                    if not payload.strip():
+                        continue
+                    try:
+                        data = json.loads(payload)
+                    except json.JSONDecodeError:
+                        continue
+                    if "token" in data:
+                        yield data["token"]
+                    if "output" in data and "token" not in data:
+                        break
     except Exception as e:
         raise FalServiceError("llm", str(e)) from e
 
@@ -180,7 +326,8 @@ async def transcribe_audio(audio_bytes: bytes, language: str = "tr") -> Transcri
     """Ham ses bytes'i metne cevirir."""
     body = {"audio_base64": base64.b64encode(audio_bytes).decode("ascii")}
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+        client = _get_client("voice")
+        async with scheduler.slot("voice", "speech"):
             resp = await client.post(
                 f"{_api_base_url}/v1/voice/stt",
                 headers=_headers(),
@@ -196,7 +343,8 @@ async def transcribe_audio_url(audio_url: str, language: str = "tr") -> Transcri
     """URL'deki ses dosyasini metne cevirir."""
     body = {"audio_url": audio_url}
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+        client = _get_client("voice")
+        async with scheduler.slot("voice", "speech"):
             resp = await client.post(
                 f"{_api_base_url}/v1/voice/stt",
                 headers=_headers(),
@@ -209,32 +357,60 @@ async def transcribe_audio_url(audio_url: str, language: str = "tr") -> Transcri
 
 
 # ═══════════════════════════════════════════════════
-#  4. TTS Stream — POST /v1/voice/tts/stream (SSE)
+#  4. TTS Stream — POST /v1/voice/tts/stream/pcm (binary)
+#                  POST /v1/voice/tts/stream (SSE, fallback)
 # ═══════════════════════════════════════════════════
 
 async def tts_stream(text: str, speed: float = 1.0, voice: str = "alloy") -> AsyncGenerator[bytes, None]:
     """PCM16 audio chunk'lari yield eder (16kHz, mono)."""
-    body = {"text": text, "speed": speed, "voice": voice}
+    stream = _tts_stream_pcm if _binary_audio else _tts_stream_sse
+    async for chunk in stream({"text": text, "speed": speed, "voice": voice}):
+        yield chunk
+
+
+async def _tts_stream_pcm(body: dict) -> AsyncGenerator[bytes, None]:
+    """Ham chunked audio/L16 govdesi — chunk'lar ornek (2 byte) sinirina hizalanir."""
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            async with client.stream(
-                "POST", f"{_api_base_url}/v1/voice/tts/stream",
-                headers=_headers(), json=body,
-            ) as resp:
-                resp.raise_for_status()
-                async for line in resp.aiter_lines():
-                    if line.startswith("data: "):
-                        payload = line[6:]
-                        if not payload.strip():
-                            continue
-                        try:
-                            data = json.loads(payload)
-                        except json.JSONDecodeError:
-                            continue
-                        if "audio_base64" in data:
-                            yield base64.b64decode(data["audio_base64"])
-                        if data.get("total_chunks") is not None:
-                            break
+        client = _get_client("voice")
+        async with scheduler.slot("voice", "speech") as timer, client.stream(
+            "POST", f"{_api_base_url}/v1/voice/tts/stream/pcm",
+            headers=_headers(), json=body,
+        ) as resp:
+            resp.raise_for_status()
+            carry = b""
+            async for data in resp.aiter_bytes():
+                timer.first_byte()
+                data = carry + data
+                cut = len(data) - len(data) % 2
+                carry = data[cut:]
+                if cut:
+                    yield data[:cut]
+    except Exception as e:
+        raise FalServiceError("tts", str(e)) from e
+
+
+async def _tts_stream_sse(body: dict) -> AsyncGenerator[bytes, None]:
+    try:
+        client = _get_client("voice")
+        async with scheduler.slot("voice", "speech") as timer, client.stream(
+            "POST", f"{_api_base_url}/v1/voice/tts/stream",
+            headers=_headers(), json=body,
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                timer.first_byte()
+                if line.startswith("data: "):
+                    payload = line[6:]
+                    if not payload.strip():
+                        continue
+                    try:
+                        data = json.loads(payload)
+                    except json.JSONDecodeError:
+                        continue
+                    if "audio_base64" in data:
+                        yield base64.b64decode(data["audio_base64"])
+                    if data.get("total_chunks") is not None:
+                        break
     except Exception as e:
         raise FalServiceError("tts", str(e)) from e
 
@@ -252,13 +428,14 @@ async def tts_generate(
     """Sesi uret, CDN URL dondur. Sync endpoint — job polling yok."""
     body = {"text": text, "speed": speed, "response_format": response_format, "voice": voice}
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+        client = _get_client("voice")
+        async with scheduler.slot("voice", "speech"):
             resp = await client.post(
                 f"{_api_base_url}/v1/voice/tts/sync",
                 headers=_headers(), json=body,
             )
             resp.raise_for_status()
-            result = resp.json()
+        result = resp.json()
         return TTSResult(
             audio_url=result["audio_url"],
             inference_time_ms=result.get("inference_time_ms"),
@@ -270,6 +447,17 @@ async def tts_generate(
         raise FalServiceError("tts", str(e)) from e
 
 
+async def fetch_audio(url: str) -> bytes:
+    """Uretilmis ses dosyasini (CDN URL) indir — replay dikme icin."""
+    try:
+        client = _get_client("voice")
+        resp = await client.get(url)
+        resp.raise_for_status()
+        return resp.content
+    except Exception as e:
+        raise FalServiceError("tts", str(e)) from e
+
+
 # ═══════════════════════════════════════════════════
 #  6. Avatar — POST /v1/images/avatar + job poll
 # ═══════════════════════════════════════════════════
@@ -281,14 +469,15 @@ async def generate_avatar(
     """Karakter icin avatar uret."""
     body = {"description": description, "world_tone": world_tone}
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+        client = _get_client("images")
+        async with scheduler.slot("images", "image"):
             resp = await client.post(
                 f"{_api_base_url}/v1/images/avatar",
                 headers=_headers(), json=body,
             )
             resp.raise_for_status()
             job_data = resp.json()
-            result = await _poll_job(client, job_data["job_id"])
+            result = await _poll_job(job_data["job_id"])
         return AvatarResult(image_url=result["image_url"])
     except FalServiceError:
         raise
@@ -304,14 +493,15 @@ async def generate_background(prompt: str) -> BackgroundResult:
     """Sahne arka plani uret."""
     body = {"prompt": prompt}
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+        client = _get_client("images")
+        async with scheduler.slot("images", "image"):
             resp = await client.post(
                 f"{_api_base_url}/v1/images/background",
                 headers=_headers(), json=body,
             )
             resp.raise_for_status()
             job_data = resp.json()
-            result = await _poll_job(client, job_data["job_id"])
+            result = await _poll_job(job_data["job_id"])
         return BackgroundResult(image_url=result["image_url"])
     except FalServiceError:
         raise
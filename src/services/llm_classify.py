@@ -0,0 +1,221 @@
+"""
+llm_classify.py — Early-Exit Streaming Classifier
+=================================================
+Tepki (WANT/PASS), moderasyon (OK/REMOVE), orkestrator (NEXT|END) ve soz
+borcu (clear/evasive) cagrilari cevabin sadece ilk token'larina bakiyor ama
+llm_generate tum uretimi bekliyordu. classify() ayni istegi llm_stream ile
+atar, karar etiketi gelir gelmez upstream stream'i kapatir (HTTP baglantisi
+kapanir, scheduler slot'u serbest kalir):
+
+  - Etiket prefix ile eslesir (bastaki bosluk / markdown / tirnak atlanir).
+    "WANT" karari icin "W" yetmez — etiketler ayirt edilene kadar beklenir.
+  - pattern verilirse (JSON cevaplar) etiket regex'in 1. grubundan okunur.
+  - reason_labels: bu etiketlerde sebep metni de lazim. Karar hemen doner,
+    stream arka planda satir sonuna kadar okunur; await result.reason()
+    sebebi verir. Diger etiketlerde stream aninda kapanir.
+  - Etiket cikmazsa label=None (cagiran eski fallback'ini uygular);
+    result.reason() ciktinin ilk satirini verir.
+
+Cagri noktasi (site) basina metrik: erken cikis orani, alinan token, karara
+kadar gecen sure ve tahmini kazanilan token / ms. Tahmin icin her sitenin
+ilk cagrisi ve sonra her FULL_SAMPLE_EVERY cagrida bir stream arka planda
+sonuna kadar okunur (karar yine erken doner) — tam uretim uzunlugu / suresi
+bu orneklerden ogrenilir.
+
+API tarafinda ayni helper api/shared/llm_classify.py'de (ayri container).
+
+Kullanim:
+    from src.services import llm_classify
+
+    result = await llm_classify.classify(
+        prompt, system_prompt=REACTION_SYSTEM, labels=("WANT", "PASS"),
+        reason_labels=("WANT",), site="reaction", model=MODEL,
+    )
+    if result.label == "WANT":
+        reason = await result.reason()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+
+from src.services.api_client import llm_stream
+
+_LEADING_NOISE = " \t\r\n*`\"'#>-_["
+_REASON_SEP = "|:-— \t"
+FULL_SAMPLE_EVERY = 20  # tam uretim orneklemesi (tahmini kazanc metrigi icin)
+
+
+@dataclass
+class Classification:
+    label: str | None          # eslesen etiket (None = karar verilemedi)
+    text: str                  # alinan cikti (reason_labels'ta sebep dahil)
+    early: bool = False        # stream uretim bitmeden kapatildi
+    tokens: int = 0            # karara kadar alinan token (chunk) sayisi
+    decision_ms: float = 0.0
+    _tail: asyncio.Task | None = field(default=None, repr=False)
+
+    async def reason(self) -> str:
+        """Etiketten sonraki sebep metni (gerekirse arka plan okumasini bekler)."""
+        if self._tail is not None:
+            self.text = await self._tail
+            self._tail = None
+        body = self.text.lstrip(_LEADING_NOISE)
+        if self.label and body.upper().startswith(self.label.upper()):
+            body = body[len(self.label):]
+        return body.splitlines()[0].strip(_REASON_SEP + "*`\"'") if body.strip() else ""
+
+
+def _match_label(text: str, labels: tuple[str, ...]) -> tuple[str | None, bool]:
+    """(etiket, kesin_mi). Etiket belli degilse (None, False); hicbiri olamazsa (None, True)."""
+    body = text.lstrip(_LEADING_NOISE).upper()
+    if not body:
+        return None, False
+    pending = False
+    for label in labels:
+        upper = label.upper()
+        if body.startswith(upper):
+            return label, True
+        if upper.startswith(body):
+            pending = True
+    return None, not pending
+
+
+# ── Metrics ─────────────────────────────────────────
+_stats: dict[str, dict] = {}
+
+
+def _site(site: str) -> dict:
+    return _stats.setdefault(site, {
+        "started": 0, "calls": 0, "early": 0, "undecided": 0, "tokens": 0, "decision_ms": 0.0,
+        "early_tokens": 0, "early_ms": 0.0,
+        "full_calls": 0, "full_tokens": 0, "full_ms": 0.0,
+    })
+
+
+def _record(site: str, result: Classification) -> None:
+    s = _site(site)
+    s["calls"] += 1
+    s["tokens"] += result.tokens
+    s["decision_ms"] += result.decision_ms
+    if result.label is None:
+        s["undecided"] += 1
+    if result.early:
+        s["early"] += 1
+        s["early_tokens"] += result.tokens
+        s["early_ms"] += result.decision_ms
+
+
+def _record_full(site: str, tokens: int, elapsed_ms: float) -> None:
+    """Sonuna kadar okunan stream — tam uretim uzunlugu / suresi icin ornek."""
+    s = _site(site)
+    s["full_calls"] += 1
+    s["full_tokens"] += tokens
+    s["full_ms"] += elapsed_ms
+
+
+def metrics() -> dict:
+    """Cagri noktasi basina erken cikis ve tahmini kazanilan token / ms."""
+    out = {}
+    for site, s in _stats.items():
+        calls, early, full = s["calls"], s["early"], s["full_calls"]
+        row = {
+            "calls": calls,
+            "early_exits": early,
+            "undecided": s["undecided"],
+            "avg_tokens": round(s["tokens"] / calls, 1) if calls else 0.0,
+            "avg_decision_ms": round(s["decision_ms"] / calls) if calls else 0,
+        }
+        # Tahmin: erken cikan cagri, tam uretimlerin ortalamasi kadar surecekti
+        if full and early:
+            row["est_tokens_saved"] = round(max(0.0, early * s["full_tokens"] / full - s["early_tokens"]))
+            row["est_ms_saved"] = round(max(0.0, early * s["full_ms"] / full - s["early_ms"]))
+        out[site] = row
+    return out
+
+
+# ── Classifier ──────────────────────────────────────
+async def _consume(
+    decision: asyncio.Future, site: str, labels: tuple[str, ...],
+    reason_labels: tuple[str, ...], pattern: re.Pattern | None, sample: bool, **llm_kwargs,
+) -> str:
+    """
+    Stream'i tek task icinde oku (httpx stream'i acan task kapatmali).
+    Karar belli olunca decision'i set et; sebep gerekmiyorsa hemen kapat,
+    gerekiyorsa sebep satiri bitince kapat. sample=True ise sonuna kadar oku.
+    Donen deger: okunan tum metin.
+    """
+    start = time.perf_counter()
+    stream = llm_stream(**llm_kwargs)
+    text = ""
+    tokens = 0
+    try:
+        async for token in stream:
+            text += token
+            tokens += 1
+            if not decision.done():
+                if pattern is not None:
+                    m = pattern.search(text)
+                    decided = m is not None
+                    label = next((lb for lb in labels if m and lb.lower() == m.group(1).lower()), None)
+                else:
+                    label, decided = _match_label(text, labels)
+                if not decided:
+                    continue
+                decision.set_result(Classification(
+                    label=label, text=text, early=True, tokens=tokens,
+                    decision_ms=(time.perf_counter() - start) * 1000,
+                ))
+                if label is not None and label not in reason_labels and not sample:
+                    return text
+            elif "\n" in text.lstrip(_LEADING_NOISE) and not sample:
+                return text
+        if sample:
+            _record_full(site, tokens, (time.perf_counter() - start) * 1000)
+        if not decision.done():
+            decision.set_result(Classification(
+                label=None, text=text, tokens=tokens,
+                decision_ms=(time.perf_counter() - start) * 1000,
+            ))
+        return text
+    except Exception as e:
+        if not decision.done():
+            decision.set_exception(e)
+        return text
+    finally:
+        await stream.aclose()
+
+
+async def classify(
+    prompt: str,
+    system_prompt: str,
+    labels: tuple[str, ...],
+    site: str,
+    model: str = "gemini-2.5-flash",
+    temperature: float = 0.1,
+    max_tokens: int | None = None,
+    reason_labels: tuple[str, ...] = (),
+    pattern: re.Pattern | None = None,
+) -> Classification:
+    """LLM cevabinin karar etiketini stream ederek oku, karar belli olunca stream'i kes."""
+    stats = _site(site)
+    sample = stats["started"] % FULL_SAMPLE_EVERY == 0
+    stats["started"] += 1
+    decision: asyncio.Future = asyncio.get_running_loop().create_future()
+    task = asyncio.create_task(_consume(
+        decision, site, labels, reason_labels, pattern, sample,
+        prompt=prompt, system_prompt=system_prompt,
+        model=model, temperature=temperature, max_tokens=max_tokens,
+    ))
+    try:
+        result: Classification = await asyncio.shield(decision)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if result.label is None or result.label in reason_labels:
+        result._tail = task
+    _record(site, result)
+    return result
@@ -0,0 +1,133 @@
+"""
+prompt_cache.py — Prompt Fragment Cache + Prompt Profile
+========================================================
+CHARACTER_WRAPPER / VISIT_WRAPPER her turda bastan kuruluyordu; oysa dunya
+baglami, surgun listesi, karakter karti ve spotlight parcasi round'da en
+fazla birkac kez degisir.
+
+  - Parcalar state["_prompt_fragments"] icinde: "<tur>" veya "<tur>:<oyuncu>"
+    → metin (JSON uyumlu, state ile kaydedilir).
+  - Her parca turu hangi state anahtarindan uretildigini register() ile
+    bildirir. O anahtari degistiren olay (surgun, yeni round, spotlight,
+    kurum ziyareti) invalidate(state, anahtar) cagirir — sadece o parcalar
+    duser, sonraki prompt yeniden uretir.
+  - Prefetch view'lari (state'in sig kopyasi) detach() ile kendi cache'ini
+    kullanir; gercek state'e tasinan anahtarlar icin invalidate cagrilir.
+
+Cagri noktasi (site) basina prompt profili: prompt boyutu (karakter),
+kurulum suresi ve parca cache isabet orani.
+
+Kullanim:
+    prompt_cache.register("exiled", "messages")
+
+    text = prompt_cache.fragment(state, "exiled", lambda: _render_exiled(state))
+    prompt_cache.invalidate(state, "messages")          # surgun sonrasi
+
+    with prompt_cache.profile("campfire") as prof:
+        prompt = CHARACTER_WRAPPER.format(...)
+        prof.size = len(prompt)
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable
+
+CACHE_KEY = "_prompt_fragments"
+
+# parca turu → uretildigi state anahtari
+_sources: dict[str, str] = {}
+
+
+def register(kind: str, source_key: str) -> None:
+    _sources[kind] = source_key
+
+
+def fragment(state: Any, kind: str, build: Callable[[], str], player: str | None = None) -> str:
+    """Cache'teki parca; yoksa build() ile uret ve sakla."""
+    cache = state.setdefault(CACHE_KEY, {})
+    key = f"{kind}:{player}" if player else kind
+    text = cache.get(key)
+    if text is None:
+        _fragments["misses"] += 1
+        text = cache[key] = build()
+    else:
+        _fragments["hits"] += 1
+    return text
+
+
+def invalidate(state: Any, *source_keys: str, player: str | None = None) -> None:
+    """
+    Degisen state anahtarlarina bagli parcalari dusur. Anahtar verilmezse
+    (yeni round) tum cache temizlenir. player verilirse sadece o oyuncunun parcalari.
+    """
+    cache = state.get(CACHE_KEY)
+    if not cache:
+        return
+    if not source_keys:
+        cache.clear()
+        _fragments["invalidations"] += 1
+        return
+    kinds = {kind for kind, src in _sources.items() if src in source_keys}
+    stale = [
+        key for key in cache
+        if key.split(":", 1)[0] in kinds and (player is None or key.endswith(f":{player}"))
+    ]
+    for key in stale:
+        del cache[key]
+    if stale:
+        _fragments["invalidations"] += 1
+
+
+def detach(view: dict) -> None:
+    """Prefetch view'i gercek state'in cache'ini paylasmasin (sig kopya)."""
+    view.pop(CACHE_KEY, None)
+
+
+# ── Profile ─────────────────────────────────────────
+_fragments = {"hits": 0, "misses": 0, "invalidations": 0}
+_sites: dict[str, dict] = {}
+
+
+class _Build:
+    __slots__ = ("size",)
+
+    def __init__(self):
+        self.size = 0
+
+
+@contextmanager
+def profile(site: str):
+    """Prompt kurulumunu olc: sure + prof.size (karakter)."""
+    build = _Build()
+    start = time.perf_counter()
+    yield build
+    elapsed_us = (time.perf_counter() - start) * 1e6
+    s = _sites.setdefault(site, {"builds": 0, "chars": 0, "max_chars": 0, "build_us": 0.0, "max_build_us": 0.0})
+    s["builds"] += 1
+    s["chars"] += build.size
+    s["max_chars"] = max(s["max_chars"], build.size)
+    s["build_us"] += elapsed_us
+    s["max_build_us"] = max(s["max_build_us"], elapsed_us)
+
+
+def metrics() -> dict:
+    """Site basina ortalama / max prompt boyutu ve kurulum suresi, parca isabet orani."""
+    lookups = _fragments["hits"] + _fragments["misses"]
+    return {
+        "sites": {
+            site: {
+                "builds": s["builds"],
+                "avg_chars": round(s["chars"] / s["builds"]),
+                "max_chars": s["max_chars"],
+                "avg_build_us": round(s["build_us"] / s["builds"], 1),
+                "max_build_us": round(s["max_build_us"], 1),
+            }
+            for site, s in _sites.items() if s["builds"]
+        },
+        "fragments": {
+            **_fragments,
+            "hit_ratio": round(_fragments["hits"] / lookups, 3) if lookups else 0.0,
+        },
+    }
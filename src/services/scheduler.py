@@ -0,0 +1,332 @@
+"""
+scheduler.py — Provider Scheduler (priority lanes + per-game fair queuing)
+===========================================================================
+Tum oyunlar ayni Gemini / fal kapasitesini paylasir. api_client her cagriyi
+buradan bir "slot" alarak yapar:
+
+  - Priority lane'ler: speech > reaction > moderation > summary > image.
+    Bos slot acildiginda her zaman en yuksek oncelikli lane'deki bekleyen
+    istek once gecer (campfire konusmasi, arka plan ozetinin arkasinda
+    beklemez).
+  - Lane icinde game_id bazli weighted fair queuing: 10 oyunculu bir oyunun
+    gather ettigi 9 reaction istegi, diger oyunlarin isteklerini ac birakmaz.
+  - AIMD adaptive concurrency: basarili cagrida limit yavasca artar,
+    429/503 veya latency spike'inda carpimsal olarak duser.
+  - Stream cagrilarinda (llm_stream, tts_stream) slot tuketici iterasyonu
+    boyunca tutulur; olculen latency ilk byte'ta donar (slot.first_byte()),
+    oynatma / tuketici suresi EWMA'ya ve spike kontrolune girmez.
+
+Lane ve game_id contextvar ile tasinir — fonksiyon imzalari degismez:
+
+    from src.services.scheduler import priority, set_game
+
+    set_game(game_id)              # game loop task'inin basinda
+
+    @priority("summary")
+    async def _update_rolling_summary(...): ...
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+# ── Lanes ───────────────────────────────────────────
+LANES: tuple[str, ...] = ("speech", "reaction", "moderation", "summary", "image")
+_LANE_RANK = {name: i for i, name in enumerate(LANES)}
+DEFAULT_LANE = "reaction"
+
+# ── Endpoint ailesi basina baslangic / min / max concurrency ──
+_DEFAULT_LIMITS: dict[str, tuple[int, int, int]] = {
+    "llm": (24, 4, 64),
+    "voice": (12, 2, 32),
+    "images": (4, 1, 8),
+}
+_DECREASE_FACTOR = 0.7
+_DECREASE_COOLDOWN = 2.0   # saniye — ayni spike dalgasinda tekrar tekrar dusme
+_SPIKE_RATIO = 3.0         # latency > EWMA * 3 → spike
+_SPIKE_MIN_MS = 1500.0     # kisa cagrilarda gurultuyu yok say
+_EWMA_ALPHA = 0.2
+
+_current_lane: ContextVar[str] = ContextVar("provider_lane", default=DEFAULT_LANE)
+_current_game: ContextVar[str] = ContextVar("provider_game", default="_global")
+
+
+def set_game(game_id: str) -> None:
+    """Mevcut task (ve ondan turetilen task'lar) icin game_id'yi ayarla."""
+    _current_game.set(game_id or "_global")
+
+
+def current_lane() -> str:
+    return _current_lane.get()
+
+
+def current_game() -> str:
+    return _current_game.get()
+
+
+@asynccontextmanager
+async def lane(name: str):
+    """Blok icindeki provider cagrilarini verilen lane'e al."""
+    token = _current_lane.set(name if name in _LANE_RANK else DEFAULT_LANE)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def priority(name: str):
+    """Async fonksiyon dekoratoru — fonksiyonun tum provider cagrilari bu lane'de."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            token = _current_lane.set(name if name in _LANE_RANK else DEFAULT_LANE)
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                _current_lane.reset(token)
+        return wrapper
+    return decorator
+
+
+class SlotTimer:
+    """slot() blogunun olculen gecikmesi. Stream'lerde first_byte() ile donar."""
+
+    __slots__ = ("start", "first_byte_at")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.first_byte_at: float | None = None
+
+    def first_byte(self) -> None:
+        if self.first_byte_at is None:
+            self.first_byte_at = time.perf_counter()
+
+    def latency_ms(self) -> float:
+        return ((self.first_byte_at or time.perf_counter()) - self.start) * 1000
+
+
+# ── Metrics ─────────────────────────────────────────
+@dataclass
+class _LaneStats:
+    dispatched: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    latency_ewma_ms: float | None = None
+
+    def as_dict(self, depth: int) -> dict:
+        return {
+            "queue_depth": depth,
+            "dispatched": self.dispatched,
+            "avg_wait_ms": round(self.total_wait_ms / self.dispatched, 1) if self.dispatched else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 1),
+            "latency_ewma_ms": round(self.latency_ewma_ms, 1) if self.latency_ewma_ms else None,
+        }
+
+
+@dataclass(order=True)
+class _Waiter:
+    finish: float
+    seq: int
+    lane: str = field(compare=False)
+    game_id: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class ProviderScheduler:
+    """Tek bir endpoint ailesi (llm / voice / images) icin scheduler."""
+
+    def __init__(self, family: str, initial: int, minimum: int, maximum: int):
+        self.family = family
+        self.limit = float(initial)
+        self.min_limit = minimum
+        self.max_limit = maximum
+        self.in_flight = 0
+        self.throttled = 0
+        self.spikes = 0
+        self._last_decrease = 0.0
+        self._seq = itertools.count()
+        self._queues: dict[str, list[_Waiter]] = {name: [] for name in LANES}
+        # WFQ: lane → game_id → son bitis (virtual time); lane → global virtual time
+        self._game_finish: dict[str, dict[str, float]] = {name: {} for name in LANES}
+        self._vtime: dict[str, float] = {name: 0.0 for name in LANES}
+        self._weights: dict[str, float] = {}
+        self._stats: dict[str, _LaneStats] = {name: _LaneStats() for name in LANES}
+
+    # ── Public ──
+    def set_weight(self, game_id: str, weight: float) -> None:
+        self._weights[game_id] = max(0.1, weight)
+
+    async def acquire(self, lane_name: str, game_id: str) -> float:
+        """Slot al. Bekleme suresini (ms) dondurur."""
+        lane_name = lane_name if lane_name in _LANE_RANK else DEFAULT_LANE
+        now = time.perf_counter()
+        if self.in_flight < int(self.limit) and not self._has_waiters_at_or_above(lane_name):
+            self.in_flight += 1
+            self._record_wait(lane_name, 0.0)
+            return 0.0
+
+        finish_map = self._game_finish[lane_name]
+        start = max(self._vtime[lane_name], finish_map.get(game_id, 0.0))
+        finish = start + 1.0 / self._weights.get(game_id, 1.0)
+        finish_map[game_id] = finish
+        waiter = _Waiter(
+            finish=finish, seq=next(self._seq), lane=lane_name, game_id=game_id,
+            enqueued_at=now, future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queues[lane_name], waiter)
+        self._dispatch()  # kuyrukta sadece iptal edilmis kayitlar varsa hemen gecer
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Slot verilmisti ama caller iptal oldu — slotu geri birak
+                self.in_flight -= 1
+                self._dispatch()
+            raise
+        wait_ms = (time.perf_counter() - now) * 1000
+        self._record_wait(lane_name, wait_ms)
+        return wait_ms
+
+    def release(self, lane_name: str, latency_ms: float, throttled: bool = False) -> None:
+        """Slotu birak ve AIMD limitini guncelle."""
+        self.in_flight = max(0, self.in_flight - 1)
+        lane_name = lane_name if lane_name in _LANE_RANK else DEFAULT_LANE
+        st = self._stats[lane_name]
+
+        spike = False
+        if st.latency_ewma_ms is not None and latency_ms > _SPIKE_MIN_MS:
+            spike = latency_ms > st.latency_ewma_ms * _SPIKE_RATIO
+        st.latency_ewma_ms = (
+            latency_ms if st.latency_ewma_ms is None
+            else st.latency_ewma_ms * (1 - _EWMA_ALPHA) + latency_ms * _EWMA_ALPHA
+        )
+
+        if throttled or spike:
+            self.throttled += int(throttled)
+            self.spikes += int(spike)
+            now = time.perf_counter()
+            if now - self._last_decrease >= _DECREASE_COOLDOWN:
+                self.limit = max(float(self.min_limit), self.limit * _DECREASE_FACTOR)
+                self._last_decrease = now
+        else:
+            # Additive increase: ~limit basarili cagrida +1
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / max(self.limit, 1.0))
+
+        self._dispatch()
+
+    def metrics(self) -> dict:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "throttled": self.throttled,
+            "latency_spikes": self.spikes,
+            "lanes": {
+                name: self._stats[name].as_dict(sum(1 for w in self._queues[name] if not w.future.done()))
+                for name in LANES
+            },
+        }
+
+    # ── Internal ──
+    def _has_waiters_at_or_above(self, lane_name: str) -> bool:
+        rank = _LANE_RANK[lane_name]
+        return any(self._queues[name] for name in LANES[: rank + 1])
+
+    def _record_wait(self, lane_name: str, wait_ms: float) -> None:
+        st = self._stats[lane_name]
+        st.dispatched += 1
+        st.total_wait_ms += wait_ms
+        st.max_wait_ms = max(st.max_wait_ms, wait_ms)
+
+    def _dispatch(self) -> None:
+        while self.in_flight < int(self.limit):
+            waiter = self._pop_next()
+            if waiter is None:
+                return
+            self.in_flight += 1
+            waiter.future.set_result(None)
+
+    def _pop_next(self) -> _Waiter | None:
+        for name in LANES:
+            q = self._queues[name]
+            while q:
+                waiter = heapq.heappop(q)
+                if waiter.future.done():
+                    continue  # iptal edilmis
+                self._vtime[name] = waiter.finish
+                if not q:
+                    # Lane bosaldi — eski oyunlarin finish kayitlarini temizle
+                    self._game_finish[name].clear()
+                    self._vtime[name] = 0.0
+                return waiter
+        return None
+
+
+# ── Registry ────────────────────────────────────────
+_schedulers: dict[str, ProviderScheduler] = {}
+
+
+def configure(limits: dict[str, int] | None = None) -> None:
+    """Aile basina baslangic concurrency limitini ayarla (orn. {"llm": 32})."""
+    for family, value in (limits or {}).items():
+        initial, minimum, maximum = _DEFAULT_LIMITS.get(family, (8, 1, 32))
+        value = max(1, int(value))
+        _DEFAULT_LIMITS[family] = (value, min(minimum, value), max(maximum, value))
+        _schedulers.pop(family, None)
+
+
+def get_scheduler(family: str) -> ProviderScheduler:
+    sched = _schedulers.get(family)
+    if sched is None:
+        initial, minimum, maximum = _DEFAULT_LIMITS.get(family, (8, 1, 32))
+        sched = ProviderScheduler(family, initial, minimum, maximum)
+        _schedulers[family] = sched
+    return sched
+
+
+def _is_throttle(exc: BaseException) -> bool:
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        if status in (429, 503):
+            return True
+        exc = exc.__cause__
+    return False
+
+
+@asynccontextmanager
+async def slot(family: str, lane_name: str | None = None):
+    """
+    Provider cagrisini scheduler'dan gecir.
+
+    lane_name verilmezse contextvar'daki lane kullanilir. Stream cagrilari
+    ilk veri geldiginde `timer.first_byte()` der; latency o ana kadar olculur.
+
+        async with scheduler.slot("voice", "speech") as timer, client.stream(...) as resp:
+            async for data in resp.aiter_bytes():
+                timer.first_byte()
+    """
+    name = lane_name or _current_lane.get()
+    sched = get_scheduler(family)
+    await sched.acquire(name, _current_game.get())
+    timer = SlotTimer()
+    throttled = False
+    try:
+        yield timer
+    except Exception as e:
+        throttled = _is_throttle(e)
+        raise
+    finally:
+        sched.release(name, timer.latency_ms(), throttled)
+
+
+def metrics() -> dict:
+    """Tum ailelerin queue depth / wait time / limit metrikleri."""
+    return {family: sched.metrics() for family, sched in _schedulers.items()}
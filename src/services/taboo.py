@@ -0,0 +1,244 @@
+"""
+taboo.py — Yerel Taboo Moderasyonu (Aho-Corasick)
+==================================================
+Moderasyon eskiden her konusmada LLM cagiriyordu; oysa yasakli kelimeler
+(WorldSeed.taboo_words) onceden biliniyor. Bu modul taboo listesini tek bir
+Aho-Corasick otomatina derler ve metni tek geciste tarar:
+
+  - PASS      → hic taboo / supheli ipucu yok, LLM'e gitmez
+  - VIOLATION → net dis-dunya terimi (AI, GPT, internet...), LLM'e gitmez
+  - ESCALATE  → belirsiz: gunluk Turkcede de gecen kelime (oyun, sistem,
+                zeka...) veya kimlik iddiasi / gercek dunya ipucu (Yanki-Dogmus,
+                Et-Can, "ben bir ...", itiraf...) → LLM karar verir
+
+Turkce buyuk/kucuk harf ve aksan duyarsiz: "İnternet", "INTERNET", "ınternet"
+ayni kaliba duser (I/ı/İ → i, ş → s, ğ → g, ü → u, ö → o, ç → c).
+
+Temiz metin (konusmalarin buyuk cogunlugu) otomata hic girmez: tum kaliplarin
+tek regex'i (C hizinda) once aday arar, aday yoksa sonuc bostur.
+
+Sinirlar: kalip kelime basinda baslamali. Kisa kaliplar (<= 3 harf: AI, GPT,
+web) tam kelime ise (apostrof eki serbest: "AI'sin") normal isabettir;
+apostrofsuz ek alirsa ("botsun", "gpt4", "llmler") ek mi yoksa baska kelime
+mi belli degil → "suffix" isabeti, ESCALATE (LLM karar verir). Bilinen
+siradan Turkce kelimeler (SHORT_PREFIX_WORDS: "aile", "ait", ...) atlanir.
+Uzun kaliplar ek alabilir ("telefonla", "modeli").
+
+API tarafinda ayni otomat api/shared/taboo.py'de (ayri container, ortak paket yok).
+
+Kullanim:
+    from src.services import taboo
+
+    verdict = taboo.classify(message, world_seed.taboo_words)
+    if verdict.decision == taboo.PASS: ...
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+PASS = "pass"
+VIOLATION = "violation"
+ESCALATE = "escalate"
+
+# Gunluk Turkcede baska anlami da olan taboo kelimeler — tek baslarina ihlal degil
+AMBIGUOUS_TERMS = frozenset({
+    "oyun", "sistem", "model", "yapay", "zeka", "puan", "bot", "uygulama",
+})
+
+# Taboo listesinde olmasa da net ihlal olan ifadeler
+STRONG_PHRASES = ("yapay zeka", "chatgpt", "openai")
+
+# Kimlik iddiasi / gercek dunya ipuclari — yerel karar verilmez, LLM'e gider.
+# Evren ici kimlik adlari (Yanki-Dogmus, Et-Can) suclamada da gecer; "ben ...-im"
+# iddiasi mi suclama mi kelime listesiyle ayrilamaz → hepsi LLM'e.
+ESCALATE_CUES = (
+    "gercek insan", "insanim", "insan oyuncu", "robot", "makine", "yazilim",
+    "program", "kodlan", "sanal", "dijital", "elektrik", "araba", "ucak",
+    "televizyon", "radyo", "instagram", "twitter", "youtube", "e-posta",
+    "yanki", "dogmus", "et-can", "et can", "etcan", "itiraf", "kimligim",
+    "aslinda ben", "ben bir", "ben de bir", "ben de onlardan",
+)
+
+SHORT_PATTERN_LEN = 3
+
+# Kisa kalipla baslayan siradan Turkce kelimeler — ekli kisa kalip sayilmaz
+SHORT_PREFIX_WORDS = ("aile", "ait", "aid", "botanik")
+
+# str.translate(dict) karakter basina Python lookup'i yapar; replace zinciri C hizinda
+_UPPER_FOLD = (("İ", "i"), ("I", "i"))
+_LOWER_FOLD = (
+    ("ı", "i"), ("ş", "s"), ("ğ", "g"), ("ü", "u"), ("ö", "o"), ("ç", "c"),
+    ("â", "a"), ("î", "i"), ("û", "u"), ("’", "'"), ("‘", "'"),
+)
+
+
+def normalize(text: str) -> str:
+    """Turkce harf katlama + kucuk harf + tek bosluk."""
+    for src, dst in _UPPER_FOLD:
+        text = text.replace(src, dst)
+    text = text.lower()
+    for src, dst in _LOWER_FOLD:
+        text = text.replace(src, dst)
+    return " ".join(text.split())
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum()
+
+
+def _word_at(text: str, start: int) -> str:
+    end = start
+    while end < len(text) and _is_word_char(text[end]):
+        end += 1
+    return text[start:end]
+
+
+@dataclass(frozen=True)
+class TabooHit:
+    term: str      # listedeki orijinal yazim
+    kind: str      # "strong" | "weak" | "cue" | "suffix" (ekli kisa kalip)
+    start: int     # normalize edilmis metindeki konum
+    end: int
+
+
+@dataclass
+class TabooVerdict:
+    decision: str
+    hits: list[TabooHit] = field(default_factory=list)
+
+    @property
+    def reason(self) -> str:
+        strong = [h.term for h in self.hits if h.kind == "strong"]
+        if strong:
+            return f"Dis-dunya terimi: {', '.join(dict.fromkeys(strong))}"
+        return ""
+
+
+class TabooMatcher:
+    """Taboo + ipucu kaliplarinin derlenmis Aho-Corasick otomati."""
+
+    def __init__(self, patterns: dict[str, tuple[str, str]]):
+        # patterns: normalize edilmis kalip → (orijinal yazim, kind)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        self._patterns: list[tuple[str, str, str]] = []
+        for norm, (term, kind) in patterns.items():
+            self._add(norm, term, kind)
+        self._build()
+        # Aday on-filtresi: kelime basinda herhangi bir kalip var mi
+        alternation = "|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+        self._prefilter = re.compile(rf"(?<![^\W_])(?:{alternation})") if patterns else None
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def find(self, text: str) -> list[TabooHit]:
+        """Metindeki tum sinir-gecerli eslesmeler (normalize edilmis metin uzerinde)."""
+        norm = normalize(text)
+        if self._prefilter is None or not self._prefilter.search(norm):
+            return []
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: list[TabooHit] = []
+        node = 0
+        for i, ch in enumerate(norm):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                pattern, term, kind = self._patterns[pid]
+                start = i - len(pattern) + 1
+                if start > 0 and _is_word_char(norm[start - 1]):
+                    continue
+                if len(pattern) <= SHORT_PATTERN_LEN and i + 1 < len(norm) and _is_word_char(norm[i + 1]):
+                    if _word_at(norm, start).startswith(SHORT_PREFIX_WORDS):
+                        continue
+                    kind = "suffix"
+                hits.append(TabooHit(term, kind, start, i + 1))
+        return hits
+
+    # ── Internal ──
+    def _add(self, pattern: str, term: str, kind: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(len(self._patterns))
+        self._patterns.append((pattern, term, kind))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+
+@lru_cache(maxsize=64)
+def _compile(taboo_words: tuple[str, ...]) -> TabooMatcher:
+    patterns: dict[str, tuple[str, str]] = {}
+    for cue in ESCALATE_CUES:
+        patterns[normalize(cue)] = (cue, "cue")
+    for word in taboo_words:
+        norm = normalize(word).strip()
+        if norm:
+            patterns[norm] = (word, "weak" if norm in AMBIGUOUS_TERMS else "strong")
+    for phrase in STRONG_PHRASES:
+        patterns[normalize(phrase)] = (phrase, "strong")
+    return TabooMatcher(patterns)
+
+
+def get_matcher(taboo_words) -> TabooMatcher:
+    """Taboo listesi icin derlenmis matcher (ayni liste tekrar derlenmez)."""
+    return _compile(tuple(taboo_words or ()))
+
+
+# ── Metrics ─────────────────────────────────────────
+_stats = {"checks": 0, PASS: 0, VIOLATION: 0, ESCALATE: 0, "total_us": 0.0}
+
+
+def classify(text: str, taboo_words) -> TabooVerdict:
+    """Metni yerel olarak siniflandir: PASS / VIOLATION / ESCALATE."""
+    start = time.perf_counter()
+    hits = get_matcher(taboo_words).find(text)
+    if any(h.kind == "strong" for h in hits):
+        decision = VIOLATION
+    elif hits:
+        decision = ESCALATE
+    else:
+        decision = PASS
+    _stats["checks"] += 1
+    _stats[decision] += 1
+    _stats["total_us"] += (time.perf_counter() - start) * 1e6
+    return TabooVerdict(decision, hits)
+
+
+def metrics() -> dict:
+    """Yerel karar orani (LLM'e gitmeyen kontroller) ve ortalama tarama suresi."""
+    checks = _stats["checks"]
+    local = _stats[PASS] + _stats[VIOLATION]
+    return {
+        "checks": checks,
+        "pass": _stats[PASS],
+        "violation": _stats[VIOLATION],
+        "escalate": _stats[ESCALATE],
+        "llm_avoided_ratio": round(local / checks, 3) if checks else 0.0,
+        "avg_us": round(_stats["total_us"] / checks, 1) if checks else 0.0,
+    }
@@ -0,0 +1,188 @@
+"""
+token_budget.py — Prompt / Output Token Budget
+==============================================
+Campfire ve 1v1 prompt'lari ozet, history ve kart baglamiyla buyuyordu;
+konusma cagrilarinin neredeyse hicbiri max_tokens vermiyordu — gecikme
+modelin o anki gevezeligine bagliydi.
+
+Cagri noktasi (site) basina butce:
+  - input_tokens: prompt (system + user) tavani. fit() baglami bu tavana
+    sigdirir, oncelik sirasi:
+      1. en eski raw mesajlar (en az MIN_RAW_LINES son mesaj kalir)
+      2. ozet detayi (ozetin en eski cumleleri / maddeleri)
+    Sabit kisim (wrapper, kart, system prompt) tek basina tavani asarsa
+    kirpilacak sey kalmaz → overrun olarak sayilir, cagiran loglar.
+  - max_tokens + stop: limits(site) ile llm_generate / llm_stream'e verilir.
+  - observe(): cikti uzunlugu ve uretim suresi — cap'e dayanan cikti orani
+    ve p50 / p95 gecikme.
+
+Token sayisi tahmindir (CHARS_PER_TOKEN), tokenizer cagrisi yok.
+
+Kullanim:
+    from src.services import token_budget
+
+    token_budget.register("campfire", input_tokens=2800, max_tokens=220, stop=("\\n[",))
+
+    fit = token_budget.fit("campfire", fixed_prompt, lines, summary, system_prompt)
+    if fit.over: print(...)
+    result = await llm_generate(prompt, **token_budget.limits("campfire"))
+    token_budget.observe("campfire", result.output, elapsed_ms)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import deque
+from dataclasses import dataclass
+
+CHARS_PER_TOKEN = 3.5  # Turkce metin icin kaba oran (Gemini ~3-4 karakter / token)
+MIN_RAW_LINES = 2      # kirpma sonrasi en az bu kadar son mesaj kalir
+CAP_RATIO = 0.9        # cikti tahmini max_tokens'in bu oranina ulastiysa "cap'e dayandi"
+_LATENCY_WINDOW = 200  # p95 icin site basina son N uretim suresi
+
+_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+|\s\|\s")  # cumle / madde / "a | b" siniri
+
+
+@dataclass(frozen=True)
+class Budget:
+    input_tokens: int
+    max_tokens: int
+    stop: tuple[str, ...] = ()
+
+
+@dataclass
+class Fit:
+    lines: list[str]            # kalan raw mesaj satirlari (eskiden yeniye)
+    summary: str                # kalan ozet
+    tokens: int                 # tahmini prompt token'i (system dahil)
+    dropped: int = 0            # atilan eski mesaj sayisi
+    summary_cut: bool = False   # ozet kisaltildi mi
+    over: bool = False          # kirpmaya ragmen tavan asildi
+
+
+_budgets: dict[str, Budget] = {}
+
+
+def register(site: str, input_tokens: int, max_tokens: int, stop: tuple[str, ...] = ()) -> Budget:
+    _budgets[site] = Budget(input_tokens, max_tokens, tuple(stop))
+    return _budgets[site]
+
+
+def estimate(text: str) -> int:
+    """Tahmini token sayisi."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def limits(site: str) -> dict:
+    """llm_generate / llm_stream kwargs: max_tokens (+ stop)."""
+    budget = _budgets[site]
+    out: dict = {"max_tokens": budget.max_tokens}
+    if budget.stop:
+        out["stop"] = list(budget.stop)
+    return out
+
+
+def _shrink_summary(summary: str, max_chars: int) -> str:
+    """Ozetin bastan (en eski) cumle / madde sinirindan kesilmis, max_chars'a sigan sonu."""
+    if len(summary) <= max_chars:
+        return summary
+    for m in _BOUNDARY.finditer(summary):
+        if len(summary) - m.end() <= max_chars:
+            return summary[m.end():]
+    return ""
+
+
+def fit(
+    site: str, fixed: str, lines: list[str], summary: str = "", system_prompt: str = "",
+) -> Fit:
+    """
+    lines + summary'yi site'in input butcesine sigdir. fixed: baglam disindaki
+    prompt metni (wrapper + kart + ...). Karakter uzerinden hesaplanir, her
+    adimda prompt yeniden kurulmaz.
+    """
+    s = _site(site)
+    s["calls"] += 1
+    limit = _budgets[site].input_tokens * CHARS_PER_TOKEN
+    avail = limit - len(fixed) - len(system_prompt)
+    line_chars = sum(len(line) + 1 for line in lines)
+
+    dropped = 0
+    while line_chars + len(summary) > avail and len(lines) - dropped > MIN_RAW_LINES:
+        line_chars -= len(lines[dropped]) + 1
+        dropped += 1
+    kept = lines[dropped:] if dropped else lines
+
+    summary_cut = False
+    if summary and line_chars + len(summary) > avail:
+        summary = _shrink_summary(summary, max(0, int(avail - line_chars)))
+        summary_cut = True
+
+    chars = len(fixed) + len(system_prompt) + line_chars + len(summary)
+    tokens = math.ceil(chars / CHARS_PER_TOKEN)
+    over = chars > limit
+
+    s["tokens"] += tokens
+    s["max_tokens_seen"] = max(s["max_tokens_seen"], tokens)
+    if dropped or summary_cut:
+        s["trimmed"] += 1
+        s["dropped_lines"] += dropped
+        s["summary_cuts"] += summary_cut
+    if over:
+        s["overruns"] += 1
+    return Fit(kept, summary, tokens, dropped, summary_cut, over)
+
+
+# ── Metrics ─────────────────────────────────────────
+_stats: dict[str, dict] = {}
+
+
+def _site(site: str) -> dict:
+    return _stats.setdefault(site, {
+        "calls": 0, "tokens": 0, "max_tokens_seen": 0,
+        "trimmed": 0, "dropped_lines": 0, "summary_cuts": 0, "overruns": 0,
+        "outputs": 0, "output_tokens": 0, "capped": 0,
+        "latency_ms": deque(maxlen=_LATENCY_WINDOW),
+    })
+
+
+def observe(site: str, output: str, elapsed_ms: float) -> None:
+    """Uretilen cikti: tahmini token, cap'e dayandi mi, uretim suresi."""
+    s = _site(site)
+    tokens = estimate(output)
+    s["outputs"] += 1
+    s["output_tokens"] += tokens
+    budget = _budgets.get(site)
+    if budget and tokens >= budget.max_tokens * CAP_RATIO:
+        s["capped"] += 1
+    s["latency_ms"].append(elapsed_ms)
+
+
+def _percentile(values, q: float) -> int:
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))]) if ordered else 0
+
+
+def metrics() -> dict:
+    """Site basina butce, ortalama / max prompt token'i, kirpma / overrun, cikti cap orani, p50 / p95."""
+    out = {}
+    for site, s in _stats.items():
+        budget = _budgets.get(site)
+        calls, outputs = s["calls"], s["outputs"]
+        out[site] = {
+            "input_budget": budget.input_tokens if budget else None,
+            "max_tokens": budget.max_tokens if budget else None,
+            "prompts": calls,
+            "avg_prompt_tokens": round(s["tokens"] / calls) if calls else 0,
+            "max_prompt_tokens": s["max_tokens_seen"],
+            "trimmed": s["trimmed"],
+            "dropped_lines": s["dropped_lines"],
+            "summary_cuts": s["summary_cuts"],
+            "overruns": s["overruns"],
+            "outputs": outputs,
+            "avg_output_tokens": round(s["output_tokens"] / outputs, 1) if outputs else 0.0,
+            "capped": s["capped"],
+            "p50_ms": _percentile(s["latency_ms"], 0.5),
+            "p95_ms": _percentile(s["latency_ms"], 0.95),
+        }
+    return out
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test Campfire Index
+===================
+CampfireHistory (src/prototypes/campfire_index.py) sorgularinin eski
+list-comprehension karsiliklariyla ayni sonucu verdigini kontrol eder.
+Ozel (present'li) mesajlar, yarida kesilen konusmalar ve retract
+(history[i] = moderator) dahil. Ag / LLM yok.
+
+Usage:
+    python test_campfire_index.py
+    python -m pytest test_campfire_index.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src" / "prototypes"))
+
+from campfire_index import CONTEXT_TYPES, TRUNCATED_NOTE, CampfireHistory, render_line  # noqa: E402
+
+NAMES = ["Ali", "Bora", "Can", "Deniz", "Ece"]
+VIEWERS = [None, *NAMES, "Yabanci"]
+
+
+def _build(seed: int, n: int = 120) -> list[dict]:
+    rng = random.Random(seed)
+    history = []
+    for i in range(n):
+        kind = rng.choices(["speech", "moderator", "narrator", "system"], weights=[6, 1, 1, 1])[0]
+        entry = {"type": kind, "content": f"mesaj {i}"}
+        if kind == "speech":
+            entry["name"] = rng.choice(NAMES)
+            entry["role_title"] = "Demirci"
+            if rng.random() < 0.1:
+                entry["truncated"] = True
+        if rng.random() < 0.4:
+            # Ozel sahne: sadece katilimcilar duyar
+            entry["present"] = rng.sample(NAMES, rng.randint(1, 3))
+        history.append(entry)
+    return history
+
+
+# ── Eski implementasyonlar (indexten once) ──
+def _old_window(history, viewer, cursor, min_tail, max_tail):
+    all_msgs = [(i, m) for i, m in enumerate(history) if m["type"] in CONTEXT_TYPES]
+    if viewer:
+        all_msgs = [(i, m) for i, m in all_msgs if "present" not in m or viewer in m["present"]]
+    unsummarized = sum(1 for i, _ in all_msgs if i >= cursor)
+    tail = min(max(unsummarized, min_tail), max_tail)
+    return [render_line(m) for _, m in all_msgs[-tail:]]
+
+
+def _old_last_speech(history, names=None):
+    speeches = [m for m in history if m["type"] == "speech" and (names is None or m["name"] in names)]
+    return speeches[-1] if speeches else None
+
+
+def _old_own_speeches(history, name, n):
+    return [m for m in history if m["type"] == "speech" and m["name"] == name][-n:]
+
+
+def _old_speech_count(history, start, end):
+    return sum(1 for m in history[start:end] if m["type"] == "speech")
+
+
+def _assert_equivalent(history: CampfireHistory, plain: list[dict]) -> None:
+    for viewer in VIEWERS:
+        for cursor in (0, len(plain) // 2, len(plain) - 3, len(plain)):
+            assert history.context_window(viewer, cursor, 5, 20) == _old_window(plain, viewer, cursor, 5, 20), (
+                viewer, cursor,
+            )
+    assert history.last_speech() is _old_last_speech(plain)
+    for names in (["Ali"], ["Bora", "Ece"], ["Yabanci"]):
+        assert history.last_speech(names) is _old_last_speech(plain, names), names
+    for name in NAMES:
+        for n in (1, 2, 3):
+            assert history.own_speeches(name, n) == _old_own_speeches(plain, name, n), (name, n)
+    for start, end in ((0, None), (10, 40), (len(plain) - 5, None), (30, 30)):
+        stop = len(plain) if end is None else end
+        assert history.speech_count(start, end) == _old_speech_count(plain, start, stop), (start, end)
+
+
+def test_queries_match_list_scans():
+    for seed in range(5):
+        plain = _build(seed)
+        _assert_equivalent(CampfireHistory(plain), plain)
+
+
+def test_incremental_append_matches():
+    plain = _build(7)
+    history = CampfireHistory(plain[:40])
+    history.context_window("Ali", 0, 5, 20)  # pencere cache'i + izleyici index'i append'ten once kurulsun
+    for entry in plain[40:]:
+        history.append(entry)
+    _assert_equivalent(history, plain)
+
+
+def test_retract_marks_dirty_and_rebuilds():
+    plain = _build(11)
+    history = CampfireHistory(plain)
+    _assert_equivalent(history, plain)
+
+    i = max(j for j, m in enumerate(plain) if m["type"] == "speech" and "present" in m)
+    moderator = {"type": "moderator", "content": "Ocak Yemini titredi.", "present": list(plain[i]["present"])}
+    history[i] = moderator
+    plain[i] = moderator
+    assert history._dirty
+    _assert_equivalent(history, plain)
+    assert not history._dirty
+
+
+def test_truncated_speech_is_marked():
+    history = CampfireHistory([
+        {"type": "speech", "name": "Ali", "role_title": "Demirci", "content": "Ben dun gece", "truncated": True},
+    ])
+    assert history.context_window(None, 0, 5, 20) == [f"[Ali] (Demirci): Ben dun gece{TRUNCATED_NOTE}"]
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    for name, fn in tests:
+        fn()
+        print(f"✅ {name}")
+    print(f"{len(tests)} passed")
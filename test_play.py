@@ -41,15 +41,17 @@ async def main():
                 if ev == "campfire_speech":
                     speaker = d.get("speaker", "?")
                     content = str(d.get("content", ""))[:120]
-                    audio = "AUDIO" if d.get("audio_url") else "NO-AUDIO"
-                    dur = d.get("audio_duration", 0)
-                    print(f"{elapsed} [SPEECH] {speaker}: {content} ({audio}, {dur:.1f}s)")
+                    print(f"{elapsed} [SPEECH] {speaker}: {content} (speech_id={d.get('speech_id')})")
 
                 elif ev == "house_visit_exchange":
                     speaker = d.get("speaker", "?")
                     content = str(d.get("content", ""))[:100]
-                    audio = "AUDIO" if d.get("audio_url") else "NO-AUDIO"
-                    print(f"{elapsed} [VISIT] {speaker}: {content} ({audio})")
+                    print(f"{elapsed} [VISIT] {speaker}: {content} (speech_id={d.get('speech_id')})")
+
+                elif ev == "speech_audio":
+                    dur = d.get("duration", 0) or 0
+                    print(f"{elapsed} [AUDIO] {d.get('speaker')} seg={d.get('segment', 0)} "
+                          f"({dur:.1f}s, speech_id={d.get('speech_id')})")
 
                 elif ev == "phase_change":
                     print(f"\n{elapsed} === PHASE: {d.get('phase')} round={d.get('round')} ===")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test Taboo Fast-Path
+====================
+Yerel taboo otomatinin (src/services/taboo.py + api/shared/taboo.py)
+kararlari. Ag / LLM yok.
+
+Usage:
+    python test_taboo.py
+    python -m pytest test_taboo.py
+"""
+
+from api.shared import taboo as api_taboo
+from src.services import taboo
+
+TABOO_WORDS = [
+    "AI", "LLM", "model", "prompt", "sistem", "bot", "algoritma",
+    "yapay", "zeka", "chatbot", "GPT", "neural", "token",
+    "internet", "telefon", "bilgisayar", "ekran", "uygulama",
+    "web", "sosyal medya", "google", "whatsapp",
+    "oyun", "round", "tur sayisi", "skor", "puan", "NPC", "quest",
+]
+
+MODULES = (taboo, api_taboo)
+
+
+def _decision(module, text: str) -> str:
+    return module.classify(text, TABOO_WORDS).decision
+
+
+def test_suffixed_short_terms_escalate():
+    """Apostrofsuz ekli kisa kaliplar yerel PASS olamaz — LLM'e gider."""
+    for module in MODULES:
+        for text in (
+            "Sen bir botsun",
+            "Bottan farksizsin",
+            "Gpt4 kullaniyorum",
+            "LLMler boyle konusur",
+            "AIlar hep ayni konusur",
+            "Webde okudum",
+            "Npcler gibi davraniyorsun",
+        ):
+            assert _decision(module, text) == module.ESCALATE, (module.__name__, text)
+
+
+def test_identity_claims_escalate():
+    """Dogrudan kimlik iddiasi (MODERATOR_SYSTEM kural 3) yerel PASS olamaz."""
+    for module in MODULES:
+        for text in (
+            "Ben Yankı-Doğmuşum, itiraf ediyorum.",
+            "Ben Et-Can'ım, bana guvenin.",
+            "Aslinda ben sizden biri degilim.",
+            "Ben bir makineyim.",
+            "Kimligimi saklamayacagim artik.",
+        ):
+            assert _decision(module, text) == module.ESCALATE, (module.__name__, text)
+
+
+def test_whole_short_terms_are_violations():
+    for module in MODULES:
+        for text in ("Sen bir AI'sin", "GPT gibi konusuyorsun", "bunu web uzerinden gordum"):
+            assert _decision(module, text) == module.VIOLATION, (module.__name__, text)
+
+
+def test_ordinary_words_with_short_prefix_pass():
+    for module in MODULES:
+        for text in ("Bu ev benim ailemize ait.", "Aidat meselesini sonra konusuruz."):
+            assert _decision(module, text) == module.PASS, (module.__name__, text)
+
+
+def test_clean_speech_passes():
+    for module in MODULES:
+        assert _decision(module, "Dun gece kuyunun yaninda Fenris'i gordum.") == module.PASS
+
+
+def test_suffix_hit_kind():
+    hits = taboo.get_matcher(TABOO_WORDS).find("Sen bir gptsin")
+    assert [(h.term, h.kind) for h in hits] == [("GPT", "suffix")]
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith("test_") and callable(fn)]
+    for name, fn in tests:
+        fn()
+        print(f"✅ {name}")
+    print(f"{len(tests)} passed")